@@ -25,6 +25,7 @@ from typing import TYPE_CHECKING
 from sqlalchemy import and_, or_, select
 from sqlalchemy.orm import lazyload
 
+from airflow._shared.timezones import timezone
 from airflow.models.dagrun import DagRun
 from airflow.models.taskinstance import TaskInstance
 from airflow.utils.session import NEW_SESSION, provide_session
@@ -97,8 +98,11 @@ def set_state(
 
     if commit:
         tis_altered = list(session.scalars(qry_dag.with_for_update()).all())
+        current_time = timezone.utcnow()
         for task_instance in tis_altered:
-            task_instance.set_state(state, session=session)
+            if task_instance.state != state:
+                task_instance._set_state(state, current_time)
+        # The task instances were loaded by the session, so a single flush writes all of them
         session.flush()
     else:
         tis_altered = list(session.scalars(qry_dag).all())
@@ -26,7 +26,9 @@ from urllib.parse import urlsplit
 from fastapi import FastAPI
 from fastapi.routing import Mount
 
+from airflow import settings
 from airflow.api_fastapi.common.dagbag import create_dag_bag
+from airflow.api_fastapi.common.db.read_replica import ReadYourWritesMiddleware
 from airflow.api_fastapi.core_api.app import (
     init_config,
     init_error_handlers,
@@ -140,6 +142,9 @@ def create_app(apps: str = "all") -> FastAPI:
         init_error_handlers(app)
         init_middlewares(app)
 
+    if settings.ReplicaSession is not None:
+        app.add_middleware(ReadYourWritesMiddleware)
+
     init_config(app)
 
     return app
@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 import warnings
 from abc import ABCMeta, abstractmethod
 from collections import defaultdict
@@ -25,6 +26,7 @@ from enum import Enum
 from functools import cache
 from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar
 
+from cachetools import TTLCache
 from jwt import InvalidTokenError
 from sqlalchemy import select
 
@@ -112,6 +114,8 @@ T = TypeVar("T", bound=BaseUser)
 
 COOKIE_NAME_JWT_TOKEN = "_token"
 
+AUTHORIZED_DAG_IDS_CACHE_TTL = conf.getint("api", "authorized_dag_ids_cache_ttl", fallback=10)
+
 
 class BaseAuthManager(Generic[T], LoggingMixin, metaclass=ABCMeta):
     """
@@ -120,6 +124,10 @@ class BaseAuthManager(Generic[T], LoggingMixin, metaclass=ABCMeta):
     Auth managers are responsible for any user management related operation such as login, logout, authz, ...
     """
 
+    # Dags each user has access to, keyed by user id and method. See ``get_cached_authorized_dag_ids``
+    _authorized_dag_ids_cache: TTLCache = TTLCache(maxsize=1024, ttl=max(AUTHORIZED_DAG_IDS_CACHE_TTL, 1))
+    _authorized_dag_ids_cache_lock = threading.Lock()
+
     def init(self) -> None:
         """Run operations when Airflow is initializing."""
         if conf.getboolean("core", "multi_team"):
@@ -604,6 +612,47 @@ class BaseAuthManager(Generic[T], LoggingMixin, metaclass=ABCMeta):
 
         return dag_ids
 
+    def get_cached_authorized_dag_ids(self, *, user: T, method: ResourceMethod = "GET") -> set[str]:
+        """
+        Get Dags the user has access to, reusing the result of recent calls for the same user.
+
+        The result of :meth:`get_authorized_dag_ids` is kept for ``[api] authorized_dag_ids_cache_ttl``
+        seconds, so listing endpoints do not resolve the permissions of every Dag on each request.
+        Permission changes are picked up once the entry expires, or right away in the processes where
+        the auth manager calls :meth:`invalidate_authorized_dag_ids_cache`.
+
+        :param user: the user
+        :param method: the method to filter on
+        """
+        if AUTHORIZED_DAG_IDS_CACHE_TTL <= 0:
+            return self.get_authorized_dag_ids(user=user, method=method)
+
+        key = (user.get_id(), str(method))
+        with self._authorized_dag_ids_cache_lock:
+            dag_ids = self._authorized_dag_ids_cache.get(key)
+        if dag_ids is None:
+            dag_ids = frozenset(self.get_authorized_dag_ids(user=user, method=method))
+            with self._authorized_dag_ids_cache_lock:
+                self._authorized_dag_ids_cache[key] = dag_ids
+        return set(dag_ids)
+
+    @classmethod
+    def invalidate_authorized_dag_ids_cache(cls, user_id: str | None = None) -> None:
+        """
+        Forget the cached Dags of a user, or of all users when ``user_id`` is not given.
+
+        Auth managers managing permissions themselves should call it when permissions or role
+        assignments change. Only the cache of the current process is dropped.
+
+        :param user_id: the id of the user whose permissions changed
+        """
+        with cls._authorized_dag_ids_cache_lock:
+            if user_id is None:
+                cls._authorized_dag_ids_cache.clear()
+                return
+            for key in [key for key in cls._authorized_dag_ids_cache if key[0] == user_id]:
+                cls._authorized_dag_ids_cache.pop(key, None)
+
     def filter_authorized_dag_ids(
         self,
         *,
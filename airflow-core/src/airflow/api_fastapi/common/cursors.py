@@ -24,7 +24,7 @@ from __future__ import annotations
 
 import base64
 import uuid as uuid_mod
-from typing import Any
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
 import msgspec
 from fastapi import HTTPException, status
@@ -33,7 +33,15 @@ from sqlalchemy.sql import Select
 from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.sqltypes import Uuid
 
-from airflow.api_fastapi.common.parameters import SortParam
+from airflow.api_fastapi.common.db.common import apply_filters_to_select
+from airflow.api_fastapi.common.parameters import LimitFilter, SortParam
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy.orm import Session
+
+    from airflow.api_fastapi.core_api.base import OrmClause
 
 
 def _b64url_decode_padded(token: str) -> bytes:
@@ -192,3 +200,73 @@ def apply_cursor_filter(
         resolved = [(name, col, not is_desc) for name, col, is_desc in resolved]
 
     return statement.where(_nested_keyset_predicate(resolved, parsed_values, dialect))
+
+
+class CursorPage(NamedTuple):
+    """A page of rows fetched with keyset pagination, and the tokens pointing to its neighbours."""
+
+    rows: list[Any]
+    next_cursor: str | None
+    previous_cursor: str | None
+
+
+def cursor_paginated_select(
+    *,
+    statement: Select,
+    filters: Sequence[OrmClause | None],
+    order_by: SortParam,
+    limit: LimitFilter,
+    cursor: str,
+    session: Session,
+) -> CursorPage:
+    """
+    Fetch a page of rows with keyset pagination.
+
+    Pages are located by the sort-key values of the boundary rows instead of an
+    ``OFFSET``, so fetching a page costs an index range scan no matter how deep
+    it is, and the total number of entries is not counted.
+
+    :param statement: the statement selecting the rows, without pagination
+    :param filters: the filters to apply to the statement
+    :param order_by: the ordering of the rows, which also gives the keyset
+    :param limit: the number of rows per page
+    :param cursor: empty for the first page, otherwise ``next_cursor`` or
+        ``previous_cursor`` of another page
+    :param session: the session
+    """
+    order_by = order_by.as_keyset()
+    # LimitFilter value is guaranteed to be set to the default value of QueryLimit
+    page_limit = cast("int", limit.value)
+    # Fetch one extra row so we can detect whether a next page exists.
+    cursor_limit = LimitFilter().set_value(page_limit + 1)
+    statement = apply_filters_to_select(statement=statement, filters=[*filters, cursor_limit])
+    statement = order_by.to_orm(statement)
+
+    is_backward = False
+    if cursor:
+        token, is_backward = parse_cursor(cursor)
+        if is_backward:
+            statement = order_by.to_orm(statement, reversed=True)
+        statement = apply_cursor_filter(
+            statement, token, order_by, session.get_bind().dialect.name, is_backward=is_backward
+        )
+
+    fetched = list(session.scalars(statement))
+    has_more = len(fetched) > page_limit
+    rows = fetched[:page_limit]
+
+    if is_backward:
+        rows.reverse()
+        has_prev = has_more
+        has_next = True
+    else:
+        has_prev = bool(cursor)
+        has_next = has_more
+
+    return CursorPage(
+        rows=rows,
+        next_cursor=encode_cursor(rows[-1], order_by) if has_next and rows else None,
+        previous_cursor=(
+            make_backward_cursor(encode_cursor(rows[0], order_by)) if has_prev and rows else None
+        ),
+    )
@@ -23,13 +23,21 @@ Database helpers for Airflow REST API.
 from __future__ import annotations
 
 from collections.abc import AsyncGenerator, Generator, Sequence
+from enum import Enum
 from typing import TYPE_CHECKING, Annotated, Literal, overload
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from airflow.utils.db import get_query_count, get_query_count_async
+from airflow import settings
+from airflow.api_fastapi.common.db.read_replica import use_read_replica
+from airflow.utils.db import (
+    get_query_count,
+    get_query_count_async,
+    get_query_count_estimate,
+    get_query_count_estimate_async,
+)
 from airflow.utils.session import NEW_SESSION, create_session, create_session_async, provide_session
 
 if TYPE_CHECKING:
@@ -46,6 +54,32 @@ def _get_session() -> Generator[Session, None, None]:
 SessionDep = Annotated[Session, Depends(_get_session, scope="function")]
 
 
+def _get_read_session(request: Request) -> Generator[Session, None, None]:
+    if not use_read_replica(request.method, request.cookies):
+        yield from _get_session()
+        return
+    session = settings.ReplicaSession()
+    try:
+        yield session
+    finally:
+        # Nothing to commit, the replica is only read from
+        session.rollback()
+        session.close()
+
+
+# Session of read-only routes, on the read replica of the metadata database when it is configured
+# and recent enough, see ``airflow.api_fastapi.common.db.read_replica``.
+ReadSessionDep = Annotated[Session, Depends(_get_read_session, scope="function")]
+
+
+class TotalEntriesMode(str, Enum):
+    """How ``total_entries`` of a paginated list is computed."""
+
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+    NONE = "none"
+
+
 def apply_filters_to_select(
     *, statement: Select, filters: Sequence[OrmClause | None] | None = None
 ) -> Select:
@@ -77,6 +111,7 @@ async def paginated_select_async(
     limit: OrmClause | None = None,
     session: AsyncSession,
     return_total_entries: Literal[True] = True,
+    total_entries_mode: Literal[TotalEntriesMode.EXACT, TotalEntriesMode.ESTIMATE] = TotalEntriesMode.EXACT,
 ) -> tuple[Select, int]: ...
 
 
@@ -93,6 +128,20 @@ async def paginated_select_async(
 ) -> tuple[Select, None]: ...
 
 
+@overload
+async def paginated_select_async(
+    *,
+    statement: Select,
+    filters: Sequence[OrmClause] | None = None,
+    order_by: OrmClause | None = None,
+    offset: OrmClause | None = None,
+    limit: OrmClause | None = None,
+    session: AsyncSession,
+    return_total_entries: bool = True,
+    total_entries_mode: TotalEntriesMode = TotalEntriesMode.EXACT,
+) -> tuple[Select, int | None]: ...
+
+
 async def paginated_select_async(
     *,
     statement: Select,
@@ -102,6 +151,7 @@ async def paginated_select_async(
     limit: OrmClause | None = None,
     session: AsyncSession,
     return_total_entries: bool = True,
+    total_entries_mode: TotalEntriesMode = TotalEntriesMode.EXACT,
 ) -> tuple[Select, int | None]:
     statement = apply_filters_to_select(
         statement=statement,
@@ -109,8 +159,10 @@ async def paginated_select_async(
     )
 
     total_entries = None
-    if return_total_entries:
+    if return_total_entries and total_entries_mode == TotalEntriesMode.EXACT:
         total_entries = await get_query_count_async(statement, session=session)
+    elif return_total_entries and total_entries_mode == TotalEntriesMode.ESTIMATE:
+        total_entries = await get_query_count_estimate_async(statement, session=session)
 
     statement = apply_filters_to_select(
         statement=statement,
@@ -130,6 +182,7 @@ def paginated_select(
     limit: OrmClause | None = None,
     session: Session = NEW_SESSION,
     return_total_entries: Literal[True] = True,
+    total_entries_mode: Literal[TotalEntriesMode.EXACT, TotalEntriesMode.ESTIMATE] = TotalEntriesMode.EXACT,
 ) -> tuple[Select, int]: ...
 
 
@@ -146,6 +199,20 @@ def paginated_select(
 ) -> tuple[Select, None]: ...
 
 
+@overload
+def paginated_select(
+    *,
+    statement: Select,
+    filters: Sequence[OrmClause] | None = None,
+    order_by: OrmClause | None = None,
+    offset: OrmClause | None = None,
+    limit: OrmClause | None = None,
+    session: Session = NEW_SESSION,
+    return_total_entries: bool = True,
+    total_entries_mode: TotalEntriesMode = TotalEntriesMode.EXACT,
+) -> tuple[Select, int | None]: ...
+
+
 @provide_session
 def paginated_select(
     *,
@@ -156,15 +223,25 @@ def paginated_select(
     limit: OrmClause | None = None,
     session: Session = NEW_SESSION,
     return_total_entries: bool = True,
+    total_entries_mode: TotalEntriesMode = TotalEntriesMode.EXACT,
 ) -> tuple[Select, int | None]:
+    """
+    Apply filters, ordering and pagination to a statement, and count the entries it matches.
+
+    :param return_total_entries: whether to count the entries matched by the filters
+    :param total_entries_mode: whether to count them exactly, estimate them, or skip counting
+    :return: the paginated statement, and the number of entries, or ``None`` if not counted
+    """
     statement = apply_filters_to_select(
         statement=statement,
         filters=filters,
     )
 
     total_entries = None
-    if return_total_entries:
+    if return_total_entries and total_entries_mode == TotalEntriesMode.EXACT:
         total_entries = get_query_count(statement, session=session)
+    elif return_total_entries and total_entries_mode == TotalEntriesMode.ESTIMATE:
+        total_entries = get_query_count_estimate(statement, session=session)
 
     statement = apply_filters_to_select(statement=statement, filters=[order_by, offset, limit])
 
@@ -19,7 +19,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from collections.abc import Sequence
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from sqlalchemy import func, select, tuple_, union_all
@@ -28,7 +28,8 @@ from sqlalchemy.orm.interfaces import LoaderOption
 
 from airflow.models.dag import DagModel
 from airflow.models.dag_version import DagVersion
-from airflow.models.dagrun import DagRun
+from airflow.models.dagrun import DagRun, DagRunNote
+from airflow.models.deadline import Deadline
 from airflow.models.taskinstance import TaskInstance
 from airflow.models.taskinstancehistory import TaskInstanceHistory
 
@@ -137,3 +138,35 @@ def attach_dag_versions_to_runs(dag_runs: Sequence[DagRun], *, session: Session)
 
     for dr in runs_needing_versions:
         dr._prefetched_dag_version_ids = versions_per_run.get((dr.dag_id, dr.run_id), {})
+
+
+def get_dag_runs_version(dag_id: str, *, session: Session) -> tuple[Any, ...]:
+    """
+    Get a version token of the Dag runs of a Dag, to answer conditional GET requests.
+
+    The token changes whenever a run of the Dag is created, updated or deleted, a run note is
+    edited, a deadline of a run is missed, or a version of the Dag is created or updated. It is
+    computed from indexed aggregates in a single query, without loading any run.
+    """
+    runs = (
+        select(func.count(DagRun.id).label("count"), func.max(DagRun.updated_at).label("updated_at"))
+        .where(DagRun.dag_id == dag_id)
+        .subquery()
+    )
+    notes = (
+        select(func.max(DagRunNote.updated_at))
+        .join(DagRun, DagRunNote.dag_run_id == DagRun.id)
+        .where(DagRun.dag_id == dag_id)
+        .scalar_subquery()
+    )
+    missed_deadlines = (
+        select(func.count(Deadline.id))
+        .join(DagRun, Deadline.dagrun_id == DagRun.id)
+        .where(DagRun.dag_id == dag_id, Deadline.missed.is_(True))
+        .scalar_subquery()
+    )
+    dag_versions = (
+        select(func.max(DagVersion.last_updated)).where(DagVersion.dag_id == dag_id).scalar_subquery()
+    )
+    stmt = select(runs.c.count, runs.c.updated_at, notes, missed_deadlines, dag_versions)
+    return tuple(session.execute(stmt).one())
@@ -0,0 +1,174 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Routing of read-only API queries to a read replica of the metadata database.
+
+Read-only routes get their session from ``ReadSessionDep``, which is bound to the replica
+configured with ``[database] sql_alchemy_conn_read_replica`` when:
+
+* the replica lags less than ``[database] read_replica_max_lag`` seconds behind the primary, and
+* the client did not write through the API in the last ``read_replica_max_lag`` seconds.
+  :class:`ReadYourWritesMiddleware` sets a short-lived cookie on the responses of successful
+  writes, and reads carrying it run on the primary.
+
+Otherwise, and when no replica is configured, ``ReadSessionDep`` is a session on the primary.
+
+:meta private:
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from sqlalchemy import text
+
+from airflow import settings
+from airflow.configuration import conf
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+log = logging.getLogger(__name__)
+
+COOKIE_NAME_READ_PRIMARY = "_read_primary"
+
+_SAFE_METHODS = frozenset(["GET", "HEAD", "OPTIONS"])
+
+# Age of the last replayed transaction when the standby has WAL left to replay, 0 when it is caught
+# up. The functions return NULL on a server that is not a standby, which then has no lag either.
+_POSTGRES_LAG_QUERY = text(
+    "SELECT COALESCE(CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END, 0)"
+)
+
+
+def _measure_lag(connection: Connection) -> float | None:
+    """Return the replication lag of the replica in seconds, or None when replication is broken."""
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        return float(connection.execute(_POSTGRES_LAG_QUERY).scalar_one())
+    if dialect == "mysql":
+        status = connection.execute(text("SHOW REPLICA STATUS")).mappings().first()
+        if status is None:
+            # Not a replica
+            return 0.0
+        lag = status.get("Seconds_Behind_Source")
+        return None if lag is None else float(lag)
+    # Other databases, sqlite in particular, have no built-in replication
+    return 0.0
+
+
+class ReplicaLag:
+    """
+    Tracks whether the data read from the replica is at most ``max_lag`` seconds old.
+
+    A replica measured ``lag`` seconds behind at time ``t`` is at most ``lag + (now - t)`` seconds
+    behind, so a measurement holds until the sum reaches ``max_lag``, and the lag is measured
+    again then. While the replica is too far behind, or its lag cannot be measured, it is checked
+    again every ``max_lag`` seconds.
+    """
+
+    def __init__(self, max_lag: float):
+        self.max_lag = max_lag
+        self._fresh_until = 0.0
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    def is_fresh(self) -> bool:
+        now = time.monotonic()
+        if now < self._fresh_until:
+            return True
+        if now < self._next_check:
+            return False
+        # A single request measures the lag, the others meanwhile read from the primary
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            return self._check(now)
+        finally:
+            self._lock.release()
+
+    def _check(self, now: float) -> bool:
+        if settings.replica_engine is None:
+            return False
+        try:
+            with settings.replica_engine.connect() as connection:
+                lag = _measure_lag(connection)
+        except Exception:
+            log.warning("Could not measure the replication lag of the read replica", exc_info=True)
+            lag = None
+        if lag is None or lag >= self.max_lag:
+            log.info("Read replica lags %s seconds behind the primary, reading from the primary", lag)
+            self._fresh_until = 0.0
+            self._next_check = now + self.max_lag
+            return False
+        self._fresh_until = self._next_check = now + self.max_lag - lag
+        return True
+
+
+replica_lag = ReplicaLag(conf.getfloat("database", "read_replica_max_lag"))
+
+
+def use_read_replica(method: str, cookies: dict[str, str]) -> bool:
+    """Whether the queries of a request can run on the read replica."""
+    return (
+        settings.ReplicaSession is not None
+        and method in _SAFE_METHODS
+        and COOKIE_NAME_READ_PRIMARY not in cookies
+        and replica_lag.is_fresh()
+    )
+
+
+class ReadYourWritesMiddleware:
+    """
+    Keep clients that just wrote through the API reading from the primary.
+
+    Successful responses to requests other than GET, HEAD and OPTIONS set a cookie expiring after
+    ``[database] read_replica_max_lag`` seconds. Until then, the replica might not have the changes
+    of the request yet, and ``ReadSessionDep`` gives the requests of the client a session on the
+    primary.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        from airflow.api_fastapi.app import get_cookie_path
+
+        self.app = app
+        self.cookie = (
+            f"{COOKIE_NAME_READ_PRIMARY}=1; Max-Age={math.ceil(replica_lag.max_lag)}; "
+            f"Path={get_cookie_path()}; HttpOnly; SameSite=lax"
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in _SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        cookie = self.cookie
+        if scope.get("scheme") == "https":
+            cookie += "; Secure"
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                message["headers"] = [*message.get("headers", []), (b"set-cookie", cookie.encode("latin-1"))]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
@@ -17,13 +17,20 @@
 
 from __future__ import annotations
 
-from sqlalchemy import Select
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import Select, func, select
 from sqlalchemy.orm import contains_eager, joinedload
 
 from airflow.models import Base
 from airflow.models.dag_version import DagVersion
 from airflow.models.dagrun import DagRun
-from airflow.models.taskinstance import TaskInstance
+from airflow.models.taskinstance import TaskInstance, TaskInstanceNote
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from sqlalchemy.orm import Session
 
 
 def eager_load_TI_and_TIH_for_validation(
@@ -57,3 +64,32 @@ def eager_load_TI_and_TIH_for_validation(
             joinedload(orm_model.rendered_task_instance_fields),
         )
     return query
+
+
+def get_task_instances_version(dag_id: str, run_ids: Collection[str], *, session: Session) -> tuple[Any, ...]:
+    """
+    Get a version token of the task instances of some Dag runs, to answer conditional GET requests.
+
+    The token changes whenever one of the runs or one of their task instances is created, updated
+    or deleted, or a task instance note is edited. It is computed from indexed aggregates in a
+    single query, without loading any task instance.
+    """
+    tis = (
+        select(
+            func.count(TaskInstance.id).label("count"), func.max(TaskInstance.updated_at).label("updated_at")
+        )
+        .where(TaskInstance.dag_id == dag_id, TaskInstance.run_id.in_(run_ids))
+        .subquery()
+    )
+    notes = (
+        select(func.max(TaskInstanceNote.updated_at))
+        .join(TaskInstance, TaskInstanceNote.ti_id == TaskInstance.id)
+        .where(TaskInstance.dag_id == dag_id, TaskInstance.run_id.in_(run_ids))
+        .scalar_subquery()
+    )
+    runs = (
+        select(func.max(DagRun.updated_at))
+        .where(DagRun.dag_id == dag_id, DagRun.run_id.in_(run_ids))
+        .scalar_subquery()
+    )
+    return tuple(session.execute(select(tis.c.count, tis.c.updated_at, notes, runs)).one())
@@ -0,0 +1,74 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Conditional GET support for endpoints polled by the UI.
+
+An endpoint computes a cheap version token of the data it serves (typically row counts and the
+latest ``updated_at`` of the rows involved) and calls :func:`check_etag` before running its
+queries. Clients that already hold the current version get an empty ``304 Not Modified``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+from fastapi import HTTPException, Request, status
+
+
+def get_etag(request: Request, *version: Any) -> str:
+    """
+    Build a weak ETag for the response of ``request``.
+
+    :param request: the request being served; its path, query parameters and ``Accept`` header are
+        part of the ETag
+    :param version: values that change whenever the data served by the endpoint changes
+    """
+    parts = (
+        request.url.path,
+        sorted(request.query_params.multi_items()),
+        request.headers.get("accept", ""),
+        version,
+    )
+    return f'W/"{hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # ``If-None-Match`` uses the weak comparison, which ignores the ``W/`` prefix
+    opaque_tag = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque_tag for tag in if_none_match.split(","))
+
+
+def check_etag(request: Request, *version: Any) -> dict[str, str]:
+    """
+    Handle ``If-None-Match`` for a GET endpoint.
+
+    Raises a ``304 Not Modified`` when the client already holds the current version of the
+    response, and otherwise returns the headers to add to the response.
+
+    :param request: the request being served
+    :param version: values that change whenever the data served by the endpoint changes
+    """
+    etag = get_etag(request, *version)
+    # Responses depend on the permissions of the user, and must be revalidated on every use
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        raise HTTPException(status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return headers
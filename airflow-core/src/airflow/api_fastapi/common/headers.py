@@ -76,6 +76,28 @@ def header_accept_json_or_ndjson_depends(
 HeaderAcceptJsonOrNdjson = Annotated[Mimetype, Depends(header_accept_json_or_ndjson_depends)]
 
 
+def header_accept_json_or_stream_depends(
+    accept: Annotated[
+        str,
+        Header(
+            json_schema_extra={
+                "type": "string",
+                "enum": [Mimetype.JSON, Mimetype.NDJSON, Mimetype.ARROW_STREAM, Mimetype.ANY],
+            }
+        ),
+    ] = Mimetype.ANY,
+) -> Mimetype:
+    # Streaming is opt-in: anything but an explicit streaming format gets the regular JSON response
+    if accept.startswith(Mimetype.NDJSON):
+        return Mimetype.NDJSON
+    if accept.startswith(Mimetype.ARROW_STREAM):
+        return Mimetype.ARROW_STREAM
+    return Mimetype.JSON
+
+
+HeaderAcceptJsonOrStream = Annotated[Mimetype, Depends(header_accept_json_or_stream_depends)]
+
+
 def header_content_type_json_or_form_depends(
     content_type: Annotated[
         str,
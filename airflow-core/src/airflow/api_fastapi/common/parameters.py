@@ -42,7 +42,7 @@ from sqlalchemy.inspection import inspect
 from sqlalchemy.sql.functions import FunctionElement
 
 from airflow._shared.timezones import timezone
-from airflow.api_fastapi.common.db.common import SessionDep
+from airflow.api_fastapi.common.db.common import SessionDep, TotalEntriesMode
 from airflow.api_fastapi.compat import HTTP_422_UNPROCESSABLE_CONTENT
 from airflow.api_fastapi.core_api.base import OrmClause
 from airflow.api_fastapi.core_api.security import GetUserDep
@@ -695,12 +695,25 @@ class SortParam(BaseParam[list[str]]):
         self.allowed_attrs = allowed_attrs
         self.model = model
         self.to_replace = to_replace
+        self.is_keyset = False
         self._cached_resolution: list[tuple[str, ColumnElement, bool]] | None = None
 
     def set_value(self, value: list[str] | None) -> Self:
         self._cached_resolution = None
         return super().set_value(value)
 
+    def as_keyset(self) -> Self:
+        """
+        Break ties on every primary key column instead of the first one only.
+
+        Keyset pagination needs a total ordering, also for models with a composite primary key. It is
+        not the default, as the other primary key columns cannot be added to the ordering of a grouped
+        or distinct select.
+        """
+        self.is_keyset = True
+        self._cached_resolution = None
+        return self
+
     def _resolve(self) -> list[tuple[str, ColumnElement, bool]]:
         """Resolve sort columns as (attr_name, column, is_descending) tuples. Cached after first call."""
         if self._cached_resolution is not None:
@@ -752,12 +765,14 @@ class SortParam(BaseParam[list[str]]):
 
             resolved.append((attr_name, column, order_by_value.startswith("-")))
 
-        primary_key_column = self.get_primary_key_column()
-        pk_name = self.get_primary_key_string()
+        primary_key_columns = (
+            inspect(self.model).primary_key if self.is_keyset else [self.get_primary_key_column()]
+        )
         resolved_column_keys = {getattr(col, "key", None) for _, col, _ in resolved}
-        if pk_name not in resolved_column_keys:
-            pk_desc = bool(order_by_values and order_by_values[0].startswith("-"))
-            resolved.append((pk_name, primary_key_column, pk_desc))
+        pk_desc = bool(order_by_values and order_by_values[0].startswith("-"))
+        for primary_key_column in primary_key_columns:
+            if primary_key_column.name not in resolved_column_keys:
+                resolved.append((primary_key_column.name, primary_key_column, pk_desc))
 
         self._cached_resolution = resolved
         return self._cached_resolution
@@ -1245,6 +1260,22 @@ OptionalDateTimeQuery = Annotated[str | None, AfterValidator(_safe_parse_datetim
 # Dag
 QueryLimit = Annotated[LimitFilter, Depends(LimitFilter.depends)]
 QueryOffset = Annotated[OffsetFilter, Depends(OffsetFilter.depends)]
+QueryCursor = Annotated[
+    str | None,
+    Query(
+        description="Cursor for keyset-based pagination. "
+        "Pass an empty string for the first page, then use ``next_cursor`` from the response. "
+        "When ``cursor`` is provided, ``offset`` is ignored.",
+    ),
+]
+QueryTotalEntriesMode = Annotated[
+    TotalEntriesMode,
+    Query(
+        description="How ``total_entries`` is computed with offset pagination: ``exact`` counts every "
+        "matching entry, ``estimate`` uses the database's estimate where available (PostgreSQL), and "
+        "``none`` skips counting and returns ``null``.",
+    ),
+]
 QueryPausedFilter = Annotated[
     FilterParam[bool | None],
     Depends(filter_param_factory(DagModel.is_paused, bool | None, filter_name="paused")),
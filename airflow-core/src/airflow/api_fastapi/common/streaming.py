@@ -0,0 +1,228 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Streaming of list endpoint results as NDJSON or Arrow IPC.
+
+Instead of building the whole result list before serializing a single JSON document, the rows
+are fetched in chunks with keyset pagination, and each chunk is written to the client as soon
+as it is fetched. Memory use does not depend on the number of rows, and the first rows reach
+the client after a single chunk query.
+"""
+
+from __future__ import annotations
+
+import io
+from collections.abc import Callable, Generator, Mapping, Sequence
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+import pydantic_core
+from fastapi import HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from airflow.api_fastapi.common.cursors import apply_cursor_filter, encode_cursor
+from airflow.api_fastapi.common.db.common import apply_filters_to_select
+from airflow.api_fastapi.common.types import Mimetype
+from airflow.configuration import conf
+from airflow.utils.session import create_session
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+    from pydantic import BaseModel
+    from sqlalchemy.sql import Select
+
+    from airflow.api_fastapi.common.parameters import SortParam
+    from airflow.api_fastapi.core_api.base import OrmClause
+
+STREAMING_MIMETYPES = (Mimetype.NDJSON, Mimetype.ARROW_STREAM)
+
+STREAM_CHUNK_SIZE = conf.getint("api", "list_stream_chunk_size")
+
+streaming_responses_doc: dict[int | str, dict[str, Any]] = {
+    status.HTTP_200_OK: {
+        "description": "Successful Response",
+        "content": {
+            Mimetype.NDJSON: {"schema": {"type": "string"}},
+            Mimetype.ARROW_STREAM: {"schema": {"type": "string", "format": "binary"}},
+        },
+    },
+}
+
+
+def stream_select(
+    *,
+    statement: Select,
+    filters: Sequence[OrmClause | None],
+    order_by: SortParam,
+    response_model: type[BaseModel],
+    mimetype: Mimetype,
+    prepare_rows: Callable[..., None] | None = None,
+    headers: Mapping[str, str] | None = None,
+) -> StreamingResponse:
+    """
+    Stream every row selected by a statement, in NDJSON or Arrow IPC format.
+
+    Rows are fetched ``[api] list_stream_chunk_size`` at a time, each chunk with its own short
+    session, so a slow client does not hold a database connection for the whole stream.
+
+    :param statement: the statement selecting the rows
+    :param filters: the filters to apply to the statement
+    :param order_by: the ordering of the rows, which also gives the keyset of the chunks
+    :param response_model: the model each row is serialized as
+    :param mimetype: ``Mimetype.NDJSON`` or ``Mimetype.ARROW_STREAM``
+    :param prepare_rows: called with the rows of each chunk, and the ``session`` they were loaded
+        in, before they are serialized
+    :param headers: additional headers of the response
+    """
+    order_by = order_by.as_keyset()
+    statement = order_by.to_orm(apply_filters_to_select(statement=statement, filters=filters))
+    chunks = _iter_chunks(statement, order_by, response_model, prepare_rows)
+    if mimetype == Mimetype.ARROW_STREAM:
+        schema, converters = _arrow_schema(response_model)
+        return StreamingResponse(
+            _arrow_stream(chunks, schema, converters), media_type=Mimetype.ARROW_STREAM, headers=headers
+        )
+    return StreamingResponse(_ndjson_stream(chunks), media_type=Mimetype.NDJSON, headers=headers)
+
+
+def _iter_chunks(
+    statement: Select,
+    order_by: SortParam,
+    response_model: type[BaseModel],
+    prepare_rows: Callable[..., None] | None,
+) -> Generator[list[BaseModel], None, None]:
+    token = None
+    while True:
+        with create_session(scoped=False) as session:
+            chunk_statement = statement.limit(STREAM_CHUNK_SIZE)
+            if token is not None:
+                chunk_statement = apply_cursor_filter(
+                    chunk_statement, token, order_by, session.get_bind().dialect.name
+                )
+            rows = list(session.scalars(chunk_statement))
+            if not rows:
+                return
+            if prepare_rows is not None:
+                prepare_rows(rows, session=session)
+            models = [response_model.model_validate(row) for row in rows]
+            # The rows are expired when the session commits, read the keyset of the next chunk first
+            token = encode_cursor(rows[-1], order_by)
+        yield models
+        if len(rows) < STREAM_CHUNK_SIZE:
+            return
+
+
+def _ndjson_stream(chunks: Generator[list[BaseModel], None, None]) -> Generator[str, None, None]:
+    for models in chunks:
+        yield "".join(f"{model.model_dump_json(by_alias=True)}\n" for model in models)
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise HTTPException(
+            status.HTTP_406_NOT_ACCEPTABLE,
+            "Arrow responses require the `pyarrow` package to be installed on the API server",
+        )
+    return pa
+
+
+def _to_string(value: Any) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        return str(value.value)
+    return str(value)
+
+
+def _to_json(value: Any) -> str | None:
+    if value is None:
+        return None
+    return pydantic_core.to_json(value).decode()
+
+
+def _arrow_schema(response_model: type[BaseModel]) -> tuple[pa.Schema, list[Callable[[Any], Any]]]:
+    """
+    Get the Arrow schema of a response model, and the converters of its field values.
+
+    Scalar fields get the matching Arrow type, enums are strings, and nested models, lists and
+    dictionaries are serialized as JSON strings so the schema is the same for every chunk.
+    """
+    pa = _import_pyarrow()
+    json_schema = response_model.model_json_schema(by_alias=True, mode="serialization")
+    definitions = json_schema.get("$defs", {})
+
+    def _arrow_type(property_schema: dict[str, Any]) -> tuple[pa.DataType, Callable[[Any], Any]]:
+        if "$ref" in property_schema:
+            definition = definitions[property_schema["$ref"].rsplit("/", 1)[-1]]
+            return _arrow_type(definition) if "enum" in definition else (pa.string(), _to_json)
+        variants = [variant for variant in property_schema.get("anyOf", []) if variant.get("type") != "null"]
+        if len(variants) == 1:
+            return _arrow_type(variants[0])
+        schema_type = property_schema.get("type")
+        if schema_type == "string" and property_schema.get("format") == "date-time":
+            return pa.timestamp("us", tz="UTC"), lambda value: value
+        if schema_type == "string":
+            return pa.string(), _to_string
+        if schema_type == "integer":
+            return pa.int64(), lambda value: value
+        if schema_type == "number":
+            return pa.float64(), lambda value: value
+        if schema_type == "boolean":
+            return pa.bool_(), lambda value: value
+        return pa.string(), _to_json
+
+    fields = []
+    converters = []
+    for name, property_schema in json_schema["properties"].items():
+        arrow_type, converter = _arrow_type(property_schema)
+        fields.append(pa.field(name, arrow_type))
+        converters.append(converter)
+    return pa.schema(fields), converters
+
+
+def _drain(sink: io.BytesIO) -> bytes:
+    data = sink.getvalue()
+    sink.seek(0)
+    sink.truncate()
+    return data
+
+
+def _arrow_stream(
+    chunks: Generator[list[BaseModel], None, None],
+    schema: pa.Schema,
+    converters: list[Callable[[Any], Any]],
+) -> Generator[bytes, None, None]:
+    import pyarrow as pa
+
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        for models in chunks:
+            rows = [model.model_dump(by_alias=True) for model in models]
+            writer.write_batch(
+                pa.RecordBatch.from_pydict(
+                    {
+                        field.name: [converter(row[field.name]) for row in rows]
+                        for field, converter in zip(schema, converters)
+                    },
+                    schema=schema,
+                )
+            )
+            yield _drain(sink)
+    # The end-of-stream marker, and the schema when there were no rows
+    yield _drain(sink)
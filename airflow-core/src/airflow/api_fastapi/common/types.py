@@ -100,6 +100,7 @@ class Mimetype(str, Enum):
     JSON = "application/json"
     FORM = "application/x-www-form-urlencoded"
     NDJSON = "application/x-ndjson"
+    ARROW_STREAM = "application/vnd.apache.arrow.stream"
     ANY = "*/*"
 
 
@@ -202,7 +202,7 @@ class DAGRunCollectionResponse(BaseModel):
     total_entries: int | None = Field(
         default=None,
         description="Total number of matching items. Populated for offset pagination, "
-        "``null`` when using cursor pagination.",
+        "``null`` when using cursor pagination or when ``total_entries_mode`` is ``none``.",
     )
     next_cursor: str | None = Field(
         default=None,
@@ -48,7 +48,21 @@ class EventLogResponse(BaseModel):
 
 
 class EventLogCollectionResponse(BaseModel):
-    """Event Log Collection Response."""
+    """Event Log Collection Response, supporting both offset and cursor pagination."""
 
     event_logs: Iterable[EventLogResponse]
-    total_entries: int
+    total_entries: int | None = Field(
+        default=None,
+        description="Total number of matching items. Populated for offset pagination, "
+        "``null`` when using cursor pagination or when ``total_entries_mode`` is ``none``.",
+    )
+    next_cursor: str | None = Field(
+        default=None,
+        description="Token pointing to the next page. Populated for cursor pagination, "
+        "``null`` when using offset pagination or when there is no next page.",
+    )
+    previous_cursor: str | None = Field(
+        default=None,
+        description="Token pointing to the previous page. Populated for cursor pagination, "
+        "``null`` when using offset pagination or when on the first page.",
+    )
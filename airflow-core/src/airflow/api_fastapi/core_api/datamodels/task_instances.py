@@ -107,7 +107,7 @@ class TaskInstanceCollectionResponse(BaseModel):
     total_entries: int | None = Field(
         default=None,
         description="Total number of matching items. Populated for offset pagination, "
-        "``null`` when using cursor pagination.",
+        "``null`` when using cursor pagination or when ``total_entries_mode`` is ``none``.",
     )
     next_cursor: str | None = Field(
         default=None,
@@ -226,11 +226,18 @@ class ClearTaskInstancesBody(StrictBaseModel):
     )
     prevent_running_task: bool = False
     note: Annotated[str, StringConstraints(max_length=1000)] | None = None
+    count_only: bool = Field(
+        default=False,
+        description="Only return the number of task instances that would be cleared, in ``total_entries``, "
+        "with an empty ``task_instances`` list. Requires ``dry_run``.",
+    )
 
     @model_validator(mode="before")
     @classmethod
     def validate_model(cls, data: Any) -> Any:
         """Validate clear task instance form."""
+        if data.get("count_only") and not data.get("dry_run", True):
+            raise ValueError("count_only requires dry_run")
         if data.get("only_failed") and data.get("only_running"):
             raise ValidationError("only_failed and only_running both are set to True")
         if data.get("start_date") and data.get("end_date"):
@@ -52,7 +52,7 @@ class HistoricalMetricDataResponse(BaseModel):
 
     dag_run_states: DAGRunStates
     task_instance_states: TaskInstanceStateCount
-    state_count_limit: int
+    state_count_limit: int | None
 
 
 class DashboardDagStatsResponse(BaseModel):
@@ -78,10 +78,24 @@ class XComResponseString(XComResponse):
 
 
 class XComCollectionResponse(BaseModel):
-    """XCom Collection serializer for responses."""
+    """XCom Collection serializer for responses, supporting both offset and cursor pagination."""
 
     xcom_entries: Iterable[XComResponse]
-    total_entries: int
+    total_entries: int | None = Field(
+        default=None,
+        description="Total number of matching items. Populated for offset pagination, "
+        "``null`` when using cursor pagination or when ``total_entries_mode`` is ``none``.",
+    )
+    next_cursor: str | None = Field(
+        default=None,
+        description="Token pointing to the next page. Populated for cursor pagination, "
+        "``null`` when using offset pagination or when there is no next page.",
+    )
+    previous_cursor: str | None = Field(
+        default=None,
+        description="Token pointing to the previous page. Populated for cursor pagination, "
+        "``null`` when using offset pagination or when on the first page.",
+    )
 
 
 def _check_forbidden_xcom_keys(value: Any) -> Any:
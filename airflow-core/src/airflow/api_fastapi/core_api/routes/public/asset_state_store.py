@@ -23,7 +23,7 @@ from fastapi import Depends, HTTPException, status
 from sqlalchemy import select
 
 from airflow._shared.state import AssetScope, AssetStateStoreWriterKind
-from airflow.api_fastapi.common.db.common import SessionDep, paginated_select
+from airflow.api_fastapi.common.db.common import ReadSessionDep, SessionDep, paginated_select
 from airflow.api_fastapi.common.parameters import QueryLimit, QueryOffset
 from airflow.api_fastapi.common.router import AirflowRouter
 from airflow.api_fastapi.core_api.datamodels.asset_state_store import (
@@ -66,7 +66,7 @@ def list_asset_state_store(
     asset_id: AssetIdDep,
     limit: QueryLimit,
     offset: QueryOffset,
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> AssetStateStoreCollectionResponse:
     """List all state store entries for an asset."""
     base = (
@@ -120,7 +120,7 @@ def list_asset_state_store(
 def get_asset_state_store(
     asset_id: AssetIdDep,
     key: str,
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> AssetStateStoreResponse:
     """Get a single asset state store entry."""
     row = session.execute(
@@ -29,7 +29,7 @@ from airflow._shared.timezones import timezone
 from airflow.api_fastapi.app import get_auth_manager
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity, DagDetails
 from airflow.api_fastapi.common.dagbag import DagBagDep, get_latest_version_of_dag
-from airflow.api_fastapi.common.db.common import SessionDep, paginated_select
+from airflow.api_fastapi.common.db.common import ReadSessionDep, SessionDep, paginated_select
 from airflow.api_fastapi.common.parameters import (
     BaseParam,
     FilterParam,
@@ -153,7 +153,7 @@ def get_assets(
         SortParam,
         Depends(SortParam(["id", "name", "uri", "created_at", "updated_at"], AssetModel).dynamic_depends()),
     ],
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> AssetCollectionResponse:
     """Get assets."""
     # Build a query that will be used to retrieve the ID and timestamp of the latest AssetEvent
@@ -261,7 +261,7 @@ def get_asset_aliases(
         SortParam,
         Depends(SortParam(["id", "name"], AssetAliasModel).dynamic_depends()),
     ],
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> AssetAliasCollectionResponse:
     """Get asset aliases."""
     asset_aliases_select, total_entries = paginated_select(
@@ -284,7 +284,7 @@ def get_asset_aliases(
     responses=create_openapi_http_exception_doc([status.HTTP_404_NOT_FOUND]),
     dependencies=[Depends(requires_access_asset_alias(method="GET"))],
 )
-def get_asset_alias(asset_alias_id: int, session: SessionDep):
+def get_asset_alias(asset_alias_id: int, session: ReadSessionDep) -> AssetAliasResponse:
     """Get an asset alias."""
     alias = session.scalar(select(AssetAliasModel).where(AssetAliasModel.id == asset_alias_id))
     if alias is None:
@@ -339,7 +339,7 @@ def get_asset_events(
     name_prefix_pattern: QueryAssetNamePrefixPatternSearch,
     extra_filter: QueryAssetEventExtraFilter,
     timestamp_range: Annotated[RangeFilter, Depends(datetime_range_filter_factory("timestamp", AssetEvent))],
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> AssetEventCollectionResponse:
     """Get asset events."""
     # The regexp partition-key filter bounds the query runtime automatically (its dependency applies
@@ -524,7 +524,7 @@ def materialize_asset(
 def get_asset_queued_events(
     asset_id: int,
     readable_dags_filter: ReadableDagsFilterDep,
-    session: SessionDep,
+    session: ReadSessionDep,
     before: OptionalDateTimeQuery = None,
 ) -> QueuedEventCollectionResponse:
     """Get queued asset events for an asset."""
@@ -562,7 +562,7 @@ def get_asset_queued_events(
 )
 def get_asset(
     asset_id: int,
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> AssetResponse:
     """Get an asset."""
     # Build a subquery to be used to retrieve the latest AssetEvent by matching timestamp
@@ -624,7 +624,7 @@ def get_asset(
 def get_dag_asset_queued_events(
     dag_id: str,
     readable_dags_filter: ReadableDagsFilterDep,
-    session: SessionDep,
+    session: ReadSessionDep,
     before: OptionalDateTimeQuery = None,
 ) -> QueuedEventCollectionResponse:
     """Get queued asset events for a Dag."""
@@ -661,7 +661,7 @@ def get_dag_asset_queued_event(
     dag_id: str,
     asset_id: int,
     readable_dags_filter: ReadableDagsFilterDep,
-    session: SessionDep,
+    session: ReadSessionDep,
     before: OptionalDateTimeQuery = None,
 ) -> QueuedEventResponse:
     """Get a queued asset event for a Dag."""
@@ -28,6 +28,7 @@ from sqlalchemy.orm import joinedload
 from airflow._shared.timezones import timezone
 from airflow.api_fastapi.common.dagbag import resolve_run_on_latest_version
 from airflow.api_fastapi.common.db.common import (
+    ReadSessionDep,
     SessionDep,
     paginated_select,
 )
@@ -95,7 +96,7 @@ def list_backfills(
         SortParam,
         Depends(SortParam(["id"], Backfill).dynamic_depends()),
     ],
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> BackfillCollectionResponse:
     select_stmt, total_entries = paginated_select(
         statement=select(Backfill).where(Backfill.dag_id == dag_id).options(joinedload(Backfill.dag_model)),
@@ -119,7 +120,7 @@ def list_backfills(
 )
 def get_backfill(
     backfill_id: NonNegativeInt,
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> BackfillResponse:
     backfill = session.scalars(
         select(Backfill).where(Backfill.id == backfill_id).options(joinedload(Backfill.dag_model))
@@ -144,7 +145,7 @@ def list_backfill_dag_runs(
         SortParam,
         Depends(SortParam(["id", "sort_ordinal"], BackfillDagRun).dynamic_depends(default="sort_ordinal")),
     ],
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> BackfillDagRunCollectionResponse:
     """List Dag runs associated with a backfill, including skipped slots."""
     backfill = session.get(Backfill, backfill_id)
@@ -27,7 +27,7 @@ from sqlalchemy.exc import IntegrityError
 
 from airflow.api_fastapi.app import get_auth_manager
 from airflow.api_fastapi.auth.managers.models.resource_details import ConnectionDetails
-from airflow.api_fastapi.common.db.common import SessionDep, paginated_select
+from airflow.api_fastapi.common.db.common import ReadSessionDep, SessionDep, paginated_select
 from airflow.api_fastapi.common.parameters import (
     QueryConnectionIdPatternSearch,
     QueryConnectionIdPrefixPatternSearch,
@@ -130,7 +130,7 @@ def delete_connection(
     responses=create_openapi_http_exception_doc([status.HTTP_404_NOT_FOUND]),
 )
 def get_connection_test(
-    session: SessionDep,
+    session: ReadSessionDep,
     user: GetUserDep,
     connection_test_token: Annotated[str, Header(alias="Airflow-Connection-Test-Token")],
 ) -> AsyncConnectionTestResponse:
@@ -169,7 +169,7 @@ def get_connection_test(
 )
 def get_connection(
     connection_id: str,
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> ConnectionResponse:
     """Get a connection entry."""
     connection = session.scalar(select(Connection).filter_by(conn_id=connection_id))
@@ -201,7 +201,7 @@ def get_connections(
         ),
     ],
     readable_connections_filter: ReadableConnectionsFilterDep,
-    session: SessionDep,
+    session: ReadSessionDep,
     connection_id_pattern: QueryConnectionIdPatternSearch,
     connection_id_prefix_pattern: QueryConnectionIdPrefixPatternSearch,
 ) -> ConnectionCollectionResponse:
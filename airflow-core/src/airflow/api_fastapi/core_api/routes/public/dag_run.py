@@ -18,9 +18,9 @@
 from __future__ import annotations
 
 import textwrap
-from typing import Annotated, Literal, cast
+from typing import Annotated, Literal
 
-from fastapi import Depends, HTTPException, Query, Request, status
+from fastapi import Depends, HTTPException, Query, Request, Response, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
@@ -29,24 +29,28 @@ from sqlalchemy.orm import joinedload
 
 from airflow.api_fastapi.app import get_auth_manager
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity, DagDetails
-from airflow.api_fastapi.common.cursors import (
-    apply_cursor_filter,
-    encode_cursor,
-    make_backward_cursor,
-    parse_cursor,
-)
+from airflow.api_fastapi.common.cursors import cursor_paginated_select
 from airflow.api_fastapi.common.dagbag import DagBagDep, get_dag_for_run, get_latest_version_of_dag
-from airflow.api_fastapi.common.db.common import SessionDep, apply_filters_to_select, paginated_select
+from airflow.api_fastapi.common.db.common import (
+    ReadSessionDep,
+    SessionDep,
+    TotalEntriesMode,
+    paginated_select,
+)
 from airflow.api_fastapi.common.db.dag_runs import (
     attach_dag_versions_to_runs,
     eager_load_dag_run_for_list,
+    get_dag_runs_version,
 )
+from airflow.api_fastapi.common.etag import check_etag
+from airflow.api_fastapi.common.headers import HeaderAcceptJsonOrStream
 from airflow.api_fastapi.common.parameters import (
     FilterOptionEnum,
     FilterParam,
     LimitFilter,
     OffsetFilter,
     QueryConsumingAssetPatternSearch,
+    QueryCursor,
     QueryDagRunPartitionKeyPrefixSearch,
     QueryDagRunPartitionKeySearch,
     QueryDagRunRunTypesFilter,
@@ -54,6 +58,7 @@ from airflow.api_fastapi.common.parameters import (
     QueryDagRunVersionFilter,
     QueryLimit,
     QueryOffset,
+    QueryTotalEntriesMode,
     Range,
     RangeFilter,
     SortParam,
@@ -66,6 +71,7 @@ from airflow.api_fastapi.common.parameters import (
     search_param_factory,
 )
 from airflow.api_fastapi.common.router import AirflowRouter
+from airflow.api_fastapi.common.streaming import STREAMING_MIMETYPES, stream_select, streaming_responses_doc
 from airflow.api_fastapi.common.types import Mimetype
 from airflow.api_fastapi.core_api.base import OrmClause
 from airflow.api_fastapi.core_api.datamodels.assets import AssetEventCollectionResponse
@@ -112,6 +118,7 @@ from airflow.exceptions import DagVersionNotFound, ParamValidationError
 from airflow.models import DagModel, DagRun
 from airflow.models.asset import AssetEvent
 from airflow.models.dag_version import DagVersion
+from airflow.models.state_rollup import recompute_state_rollups
 from airflow.utils.state import DagRunState
 from airflow.utils.types import DagRunTriggeredByType, DagRunType
 
@@ -128,7 +135,7 @@ dag_run_at_dag_router = AirflowRouter(tags=["DagRun"], prefix="/dags/{dag_id}")
     ),
     dependencies=[Depends(requires_access_dag(method="GET", access_entity=DagAccessEntity.RUN))],
 )
-def get_dag_run(dag_id: str, dag_run_id: str, session: SessionDep) -> DAGRunResponse:
+def get_dag_run(dag_id: str, dag_run_id: str, session: ReadSessionDep) -> DAGRunResponse:
     dag_run = session.scalar(
         select(DagRun).filter_by(dag_id=dag_id, run_id=dag_run_id).options(joinedload(DagRun.dag_model))
     )
@@ -174,6 +181,7 @@ def delete_dag_run(dag_id: str, dag_run_id: str, session: SessionDep):
         )
 
     session.delete(dag_run)
+    recompute_state_rollups([(dag_id, dag_run.run_after)], session=session)
 
 
 @dag_run_router.patch(
@@ -267,7 +275,7 @@ def bulk_dag_runs(
     ],
 )
 def get_upstream_asset_events(
-    dag_id: str, dag_run_id: str, session: SessionDep
+    dag_id: str, dag_run_id: str, session: ReadSessionDep
 ) -> AssetEventCollectionResponse:
     """If dag run is asset-triggered, return the asset events that triggered it."""
     dag_run: DagRun | None = session.scalar(
@@ -476,13 +484,18 @@ def clear_dag_run_partitions(
 
 @dag_run_router.get(
     "",
-    responses=create_openapi_http_exception_doc([status.HTTP_404_NOT_FOUND]),
+    responses={
+        **create_openapi_http_exception_doc([status.HTTP_404_NOT_FOUND]),
+        **streaming_responses_doc,
+    },
     dependencies=[Depends(requires_access_dag(method="GET", access_entity=DagAccessEntity.RUN))],
+    response_model=DAGRunCollectionResponse,
 )
 def get_dag_runs(
     dag_id: str,
     limit: QueryLimit,
     offset: QueryOffset,
+    accept: HeaderAcceptJsonOrStream,
     run_after: Annotated[RangeFilter, Depends(datetime_range_filter_factory("run_after", DagRun))],
     logical_date: Annotated[RangeFilter, Depends(datetime_range_filter_factory("logical_date", DagRun))],
     start_date_range: Annotated[RangeFilter, Depends(datetime_range_filter_factory("start_date", DagRun))],
@@ -522,8 +535,10 @@ def get_dag_runs(
         ),
     ],
     readable_dag_runs_filter: ReadableDagRunsFilterDep,
-    session: SessionDep,
+    session: ReadSessionDep,
     dag_bag: DagBagDep,
+    request: Request,
+    response: Response,
     run_id_pattern: Annotated[_SearchParam, Depends(search_param_factory(DagRun.run_id, "run_id_pattern"))],
     run_id_prefix_pattern: Annotated[
         _PrefixSearchParam,
@@ -547,13 +562,9 @@ def get_dag_runs(
     partition_key_pattern: QueryDagRunPartitionKeySearch,
     partition_key_prefix_pattern: QueryDagRunPartitionKeyPrefixSearch,
     consuming_asset_pattern: QueryConsumingAssetPatternSearch,
-    cursor: str | None = Query(
-        None,
-        description="Cursor for keyset-based pagination. "
-        "Pass an empty string for the first page, then use ``next_cursor`` from the response. "
-        "When ``cursor`` is provided, ``offset`` is ignored.",
-    ),
-) -> DAGRunCollectionResponse:
+    cursor: QueryCursor = None,
+    total_entries_mode: QueryTotalEntriesMode = TotalEntriesMode.EXACT,
+) -> DAGRunCollectionResponse | StreamingResponse:
     """
     Get all Dag Runs.
 
@@ -561,18 +572,27 @@ def get_dag_runs(
 
     Supports two pagination modes:
 
-    **Offset (default):** use `limit` and `offset` query parameters. Returns `total_entries`.
+    **Offset (default):** use `limit` and `offset` query parameters. Returns `total_entries`, unless
+    `total_entries_mode` is `none`; with `estimate`, it is the database's estimate where available.
 
     **Cursor:** pass `cursor` (empty string for the first page, then `next_cursor` from the response).
     When `cursor` is provided, `offset` is ignored and `total_entries` is not returned.
     ``next_cursor`` is ``null`` when there are no more pages; ``previous_cursor`` is ``null``
     on the first page.
+
+    **Streaming:** with `Accept: application/x-ndjson` (one Dag run per line) or
+    `Accept: application/vnd.apache.arrow.stream` (an Arrow IPC stream), all matching Dag runs
+    are streamed in `order_by` order, and `limit`, `offset`, `cursor` and `total_entries_mode`
+    are ignored.
+
+    When listing the runs of a single Dag, the response carries an ``ETag``, and requests sending
+    it back in ``If-None-Match`` get an empty ``304 Not Modified`` as long as the runs did not change.
     """
-    use_cursor = cursor is not None
     query = select(DagRun).options(*eager_load_dag_run_for_list())
 
     if dag_id != "~":
         get_latest_version_of_dag(dag_bag, dag_id, session)  # Check if the Dag exists.
+        response.headers.update(check_etag(request, *get_dag_runs_version(dag_id, session=session)))
         query = query.filter(DagRun.dag_id == dag_id).options()
 
     # Add join with DagVersion if dag_version filter is active
@@ -603,44 +623,24 @@ def get_dag_runs(
         consuming_asset_pattern,
     ]
 
-    if use_cursor:
-        # Fetch one extra row so we can detect whether a next page exists.
-        page_limit = cast(
-            "int", limit.value
-        )  # LimitFilter value is guaranteed to be set to the default value of QueryLimit
-        cursor_limit = LimitFilter().set_value(page_limit + 1)
-        dag_run_select = apply_filters_to_select(statement=query, filters=[*filters, cursor_limit])
-        dag_run_select = order_by.to_orm(dag_run_select)
-
-        is_backward = False
-        if cursor:
-            token, is_backward = parse_cursor(cursor)
-            if is_backward:
-                dag_run_select = order_by.to_orm(dag_run_select, reversed=True)
-            dag_run_select = apply_cursor_filter(
-                dag_run_select, token, order_by, session.get_bind().dialect.name, is_backward=is_backward
-            )
-
-        fetched = list(session.scalars(dag_run_select))
-        has_more = len(fetched) > page_limit
-        dag_runs = fetched[:page_limit]
-
-        if is_backward:
-            dag_runs.reverse()
-            has_prev = has_more
-            has_next = True
-        else:
-            has_prev = bool(cursor)
-            has_next = has_more
-
-        attach_dag_versions_to_runs(dag_runs, session=session)
+    if accept in STREAMING_MIMETYPES:
+        return stream_select(
+            statement=query,
+            filters=filters,
+            order_by=order_by,
+            response_model=DAGRunResponse,
+            mimetype=accept,
+            prepare_rows=attach_dag_versions_to_runs,
+            headers=response.headers,
+        )
 
+    if cursor is not None:
+        page = cursor_paginated_select(
+            statement=query, filters=filters, order_by=order_by, limit=limit, cursor=cursor, session=session
+        )
+        attach_dag_versions_to_runs(page.rows, session=session)
         return DAGRunCollectionResponse(
-            dag_runs=dag_runs,
-            next_cursor=(encode_cursor(dag_runs[-1], order_by) if has_next and dag_runs else None),
-            previous_cursor=(
-                make_backward_cursor(encode_cursor(dag_runs[0], order_by)) if has_prev and dag_runs else None
-            ),
+            dag_runs=page.rows, next_cursor=page.next_cursor, previous_cursor=page.previous_cursor
         )
 
     dag_run_select, total_entries = paginated_select(
@@ -650,6 +650,7 @@ def get_dag_runs(
         offset=offset,
         limit=limit,
         session=session,
+        total_entries_mode=total_entries_mode,
     )
     dag_runs = list(session.scalars(dag_run_select))
     attach_dag_versions_to_runs(dag_runs, session=session)
@@ -789,7 +790,7 @@ def trigger_dag_run(
 def wait_dag_run_until_finished(
     dag_id: str,
     dag_run_id: str,
-    session: SessionDep,
+    session: ReadSessionDep,
     user: GetUserDep,
     interval: Annotated[float, Query(gt=0.0, description="Seconds to wait between dag run state checks")],
     result_task_ids: Annotated[
@@ -21,7 +21,7 @@ from sqlalchemy import select
 
 from airflow.api_fastapi.app import get_auth_manager
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
-from airflow.api_fastapi.common.db.common import SessionDep
+from airflow.api_fastapi.common.db.common import ReadSessionDep
 from airflow.api_fastapi.common.headers import HeaderAcceptJsonOrText
 from airflow.api_fastapi.common.router import AirflowRouter
 from airflow.api_fastapi.common.types import Mimetype
@@ -58,7 +58,7 @@ dag_sources_router = AirflowRouter(tags=["DagSource"], prefix="/dagSources")
 def get_dag_source(
     accept: HeaderAcceptJsonOrText,
     dag_id: str,
-    session: SessionDep,
+    session: ReadSessionDep,
     user: GetUserDep,
     version_number: int | None = None,
 ):
@@ -94,7 +94,7 @@ def get_dag_source(
             ).all()
         )
         if file_dag_ids:
-            readable_dag_ids = get_auth_manager().get_authorized_dag_ids(user=user)
+            readable_dag_ids = get_auth_manager().get_cached_authorized_dag_ids(user=user)
             if not file_dag_ids.issubset(readable_dag_ids):
                 content = REDACTED_SOURCE
 
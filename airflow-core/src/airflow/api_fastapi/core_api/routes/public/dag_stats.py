@@ -23,7 +23,7 @@ from fastapi import Depends, status
 
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
 from airflow.api_fastapi.common.db.common import (
-    SessionDep,
+    ReadSessionDep,
     paginated_select,
 )
 from airflow.api_fastapi.common.db.dag_runs import dagruns_select_with_state_count
@@ -62,7 +62,7 @@ dag_stats_router = AirflowRouter(tags=["DagStats"], prefix="/dagStats")
 )
 def get_dag_stats(
     readable_dag_runs_filter: ReadableDagRunsFilterDep,
-    session: SessionDep,
+    session: ReadSessionDep,
     dag_ids: Annotated[
         FilterParam[list[str]],
         Depends(filter_param_factory(DagRun.dag_id, list[str], FilterOptionEnum.IN, "dag_ids")),
@@ -24,7 +24,7 @@ from fastapi import Depends
 from sqlalchemy import false, select
 
 from airflow.api_fastapi.common.db.common import (
-    SessionDep,
+    ReadSessionDep,
     paginated_select,
 )
 from airflow.api_fastapi.common.parameters import (
@@ -58,7 +58,7 @@ def get_dag_tags(
     tag_name_pattern: QueryDagTagPatternSearch,
     tag_name_prefix_pattern: QueryDagTagPrefixPatternSearch,
     readable_tags_filter: ReadableTagsFilterDep,
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> DAGTagCollectionResponse:
     """Get all Dag tags."""
     query = (
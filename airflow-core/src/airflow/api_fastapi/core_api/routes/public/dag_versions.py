@@ -24,7 +24,7 @@ from sqlalchemy.orm import joinedload
 
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
 from airflow.api_fastapi.common.dagbag import DagBagDep, get_latest_version_of_dag
-from airflow.api_fastapi.common.db.common import SessionDep, paginated_select
+from airflow.api_fastapi.common.db.common import ReadSessionDep, paginated_select
 from airflow.api_fastapi.common.parameters import (
     FilterParam,
     QueryLimit,
@@ -59,7 +59,7 @@ dag_versions_router = AirflowRouter(tags=["DagVersion"], prefix="/dags/{dag_id}/
 def get_dag_version(
     dag_id: str,
     version_number: int,
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> DagVersionResponse:
     """Get one Dag Version."""
     dag_version = session.scalar(
@@ -88,7 +88,7 @@ def get_dag_version(
 )
 def get_dag_versions(
     dag_id: str,
-    session: SessionDep,
+    session: ReadSessionDep,
     limit: QueryLimit,
     offset: QueryOffset,
     version_number: Annotated[
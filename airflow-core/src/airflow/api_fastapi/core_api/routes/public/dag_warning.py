@@ -25,7 +25,7 @@ from sqlalchemy.orm import joinedload
 
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
 from airflow.api_fastapi.common.db.common import (
-    SessionDep,
+    ReadSessionDep,
     paginated_select,
 )
 from airflow.api_fastapi.common.parameters import (
@@ -62,7 +62,7 @@ def list_dag_warnings(
         Depends(SortParam(["dag_id", "warning_type", "message", "timestamp"], DagWarning).dynamic_depends()),
     ],
     readable_dag_warning_filter: ReadableDagWarningsFilterDep,
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> DAGWarningCollectionResponse:
     """Get a list of Dag warnings."""
     dag_warnings_select, total_entries = paginated_select(
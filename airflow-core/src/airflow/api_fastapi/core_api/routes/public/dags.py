@@ -26,7 +26,12 @@ from sqlalchemy import delete, func, insert, select, update
 
 from airflow.api.common import delete_dag as delete_dag_module
 from airflow.api_fastapi.common.dagbag import DagBagDep, get_latest_version_of_dag
-from airflow.api_fastapi.common.db.common import SessionDep, apply_filters_to_select, paginated_select
+from airflow.api_fastapi.common.db.common import (
+    ReadSessionDep,
+    SessionDep,
+    apply_filters_to_select,
+    paginated_select,
+)
 from airflow.api_fastapi.common.db.dags import generate_dag_with_latest_run_query
 from airflow.api_fastapi.common.parameters import (
     FilterOptionEnum,
@@ -130,7 +135,7 @@ def get_dags(
         ),
     ],
     readable_dags_filter: ReadableDagsFilterDep,
-    session: SessionDep,
+    session: ReadSessionDep,
     is_favorite: QueryFavoriteFilter,
     timetable_type: Annotated[
         FilterParam[list[str] | None],
@@ -196,7 +201,7 @@ def get_dags(
 )
 def get_dag(
     dag_id: str,
-    session: SessionDep,
+    session: ReadSessionDep,
     dag_bag: DagBagDep,
 ) -> DAGResponse:
     """Get basic information about a Dag."""
@@ -223,7 +228,7 @@ def get_dag(
     dependencies=[Depends(requires_access_dag(method="GET"))],
 )
 def get_dag_details(
-    dag_id: str, session: SessionDep, dag_bag: DagBagDep, user: GetUserDep
+    dag_id: str, session: ReadSessionDep, dag_bag: DagBagDep, user: GetUserDep
 ) -> DAGDetailsResponse:
     """Get details of Dag."""
     dag = get_latest_version_of_dag(dag_bag, dag_id, session)
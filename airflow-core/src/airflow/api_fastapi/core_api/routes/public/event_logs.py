@@ -20,18 +20,24 @@ from datetime import datetime
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.orm import joinedload
 
+from airflow.api_fastapi.common.cursors import cursor_paginated_select
 from airflow.api_fastapi.common.db.common import (
-    SessionDep,
+    ReadSessionDep,
+    TotalEntriesMode,
     paginated_select,
 )
+from airflow.api_fastapi.common.headers import HeaderAcceptJsonOrStream
 from airflow.api_fastapi.common.parameters import (
     FilterOptionEnum,
     FilterParam,
+    QueryCursor,
     QueryLimit,
     QueryOffset,
+    QueryTotalEntriesMode,
     SortParam,
     _PrefixSearchParam,
     _SearchParam,
@@ -40,6 +46,8 @@ from airflow.api_fastapi.common.parameters import (
     search_param_factory,
 )
 from airflow.api_fastapi.common.router import AirflowRouter
+from airflow.api_fastapi.common.streaming import STREAMING_MIMETYPES, stream_select, streaming_responses_doc
+from airflow.api_fastapi.core_api.base import OrmClause
 from airflow.api_fastapi.core_api.datamodels.event_logs import (
     EventLogCollectionResponse,
     EventLogResponse,
@@ -61,7 +69,7 @@ event_logs_router = AirflowRouter(tags=["Event Log"], prefix="/eventLogs")
 )
 def get_event_log(
     event_log_id: int,
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> EventLogResponse:
     event_log = session.scalar(
         # Log.dttm is nullable at the DB level, but EventLogResponse.when is a non-optional
@@ -81,12 +89,15 @@ def get_event_log(
 
 @event_logs_router.get(
     "",
+    responses=streaming_responses_doc,
     dependencies=[Depends(requires_access_event_log("GET"))],
+    response_model=EventLogCollectionResponse,
 )
 def get_event_logs(
     limit: QueryLimit,
     offset: QueryOffset,
-    session: SessionDep,
+    accept: HeaderAcceptJsonOrStream,
+    session: ReadSessionDep,
     order_by: Annotated[
         SortParam,
         Depends(
@@ -161,8 +172,27 @@ def get_event_logs(
         Depends(prefix_search_param_factory(Log.event, "event_prefix_pattern")),
     ],
     readable_event_logs_filter: ReadableEventLogsFilterDep,
-) -> EventLogCollectionResponse:
-    """Get all Event Logs."""
+    cursor: QueryCursor = None,
+    total_entries_mode: QueryTotalEntriesMode = TotalEntriesMode.EXACT,
+) -> EventLogCollectionResponse | StreamingResponse:
+    """
+    Get all Event Logs.
+
+    Supports two pagination modes:
+
+    **Offset (default):** use `limit` and `offset` query parameters. Returns `total_entries`, unless
+    `total_entries_mode` is `none`; with `estimate`, it is the database's estimate where available.
+
+    **Cursor:** pass `cursor` (empty string for the first page, then `next_cursor` from the response).
+    When `cursor` is provided, `offset` is ignored and `total_entries` is not returned.
+    ``next_cursor`` is ``null`` when there are no more pages; ``previous_cursor`` is ``null``
+    on the first page.
+
+    **Streaming:** with `Accept: application/x-ndjson` (one Event Log per line) or
+    `Accept: application/vnd.apache.arrow.stream` (an Arrow IPC stream), all matching Event Logs
+    are streamed in `order_by` order, and `limit`, `offset`, `cursor` and `total_entries_mode`
+    are ignored.
+    """
     query = (
         # Log.dttm is nullable at the DB level, but EventLogResponse.when is a non-optional
         # datetime. Rows with dttm=NULL would cause a Pydantic validation error (500), so
@@ -174,39 +204,59 @@ def get_event_logs(
         .where(Log.dttm.is_not(None))
         .options(joinedload(Log.task_instance), joinedload(Log.dag_model))
     )
+    filters: list[OrmClause] = [
+        # Exact match filters
+        dag_id,
+        task_id,
+        run_id,
+        map_index,
+        try_number,
+        owner,
+        event,
+        excluded_events,
+        included_events,
+        before,
+        after,
+        # Pattern search filters
+        dag_id_pattern,
+        dag_id_prefix_pattern,
+        task_id_pattern,
+        task_id_prefix_pattern,
+        run_id_pattern,
+        run_id_prefix_pattern,
+        owner_pattern,
+        owner_prefix_pattern,
+        event_pattern,
+        event_prefix_pattern,
+        # Permission
+        readable_event_logs_filter,
+    ]
+
+    if accept in STREAMING_MIMETYPES:
+        return stream_select(
+            statement=query,
+            filters=filters,
+            order_by=order_by,
+            response_model=EventLogResponse,
+            mimetype=accept,
+        )
+
+    if cursor is not None:
+        page = cursor_paginated_select(
+            statement=query, filters=filters, order_by=order_by, limit=limit, cursor=cursor, session=session
+        )
+        return EventLogCollectionResponse(
+            event_logs=page.rows, next_cursor=page.next_cursor, previous_cursor=page.previous_cursor
+        )
+
     event_logs_select, total_entries = paginated_select(
         statement=query,
         order_by=order_by,
-        filters=[
-            # Exact match filters
-            dag_id,
-            task_id,
-            run_id,
-            map_index,
-            try_number,
-            owner,
-            event,
-            excluded_events,
-            included_events,
-            before,
-            after,
-            # Pattern search filters
-            dag_id_pattern,
-            dag_id_prefix_pattern,
-            task_id_pattern,
-            task_id_prefix_pattern,
-            run_id_pattern,
-            run_id_prefix_pattern,
-            owner_pattern,
-            owner_prefix_pattern,
-            event_pattern,
-            event_prefix_pattern,
-            # Permission
-            readable_event_logs_filter,
-        ],
+        filters=filters,
         offset=offset,
         limit=limit,
         session=session,
+        total_entries_mode=total_entries_mode,
     )
     event_logs = session.scalars(event_logs_select)
 
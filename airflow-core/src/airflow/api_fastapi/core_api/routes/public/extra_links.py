@@ -21,7 +21,7 @@ from fastapi import Depends, HTTPException, status
 from sqlalchemy.sql import select
 
 from airflow.api_fastapi.common.dagbag import DagBagDep, get_dag_for_run_or_latest_version
-from airflow.api_fastapi.common.db.common import SessionDep
+from airflow.api_fastapi.common.db.common import ReadSessionDep
 from airflow.api_fastapi.common.router import AirflowRouter
 from airflow.api_fastapi.core_api.datamodels.extra_links import ExtraLinkCollectionResponse
 from airflow.api_fastapi.core_api.openapi.exceptions import create_openapi_http_exception_doc
@@ -44,7 +44,7 @@ def get_extra_links(
     dag_id: str,
     dag_run_id: str,
     task_id: str,
-    session: SessionDep,
+    session: ReadSessionDep,
     dag_bag: DagBagDep,
     map_index: int = -1,
     try_number: int | None = None,
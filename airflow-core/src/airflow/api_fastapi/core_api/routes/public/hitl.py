@@ -25,7 +25,7 @@ from sqlalchemy.orm import joinedload
 
 from airflow._shared.timezones import timezone
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
-from airflow.api_fastapi.common.db.common import SessionDep, paginated_select
+from airflow.api_fastapi.common.db.common import ReadSessionDep, SessionDep, paginated_select
 from airflow.api_fastapi.common.parameters import (
     QueryHITLDetailBodySearch,
     QueryHITLDetailDagIdPatternSearch,
@@ -256,7 +256,7 @@ def get_hitl_detail(
     dag_id: str,
     dag_run_id: str,
     task_id: str,
-    session: SessionDep,
+    session: ReadSessionDep,
     map_index: int = -1,
 ) -> HITLDetail:
     """Get a Human-in-the-loop detail of a specific task instance."""
@@ -281,7 +281,7 @@ def get_hitl_detail_try_detail(
     dag_id: str,
     dag_run_id: str,
     task_id: str,
-    session: SessionDep,
+    session: ReadSessionDep,
     map_index: int = -1,
     try_number: int | None = None,
 ) -> HITLDetailHistory:
@@ -332,7 +332,7 @@ def get_hitl_details(
             ).dynamic_depends(),
         ),
     ],
-    session: SessionDep,
+    session: ReadSessionDep,
     # permission filter
     readable_ti_filter: ReadableTIFilterDep,
     # ti related filter
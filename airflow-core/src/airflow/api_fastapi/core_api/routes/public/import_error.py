@@ -30,7 +30,7 @@ from airflow.api_fastapi.auth.managers.models.resource_details import (
     DagDetails,
 )
 from airflow.api_fastapi.common.db.common import (
-    SessionDep,
+    ReadSessionDep,
     apply_filters_to_select,
     paginated_select,
 )
@@ -56,6 +56,7 @@ from airflow.api_fastapi.core_api.security import (
 )
 from airflow.models import DagModel
 from airflow.models.errors import ParseImportError
+from airflow.utils.sqlalchemy import in_values
 
 REDACTED_STACKTRACE = "REDACTED - you do not have read permission on all Dags in the file"
 import_error_router = AirflowRouter(tags=["Import Error"], prefix="/importErrors")
@@ -70,7 +71,7 @@ import_error_router = AirflowRouter(tags=["Import Error"], prefix="/importErrors
 )
 def get_import_error(
     import_error_id: int,
-    session: SessionDep,
+    session: ReadSessionDep,
     user: GetUserDep,
 ) -> ImportErrorResponse:
     """Get an import error."""
@@ -83,7 +84,7 @@ def get_import_error(
     session.expunge(error)
 
     auth_manager = get_auth_manager()
-    readable_dag_ids = auth_manager.get_authorized_dag_ids(user=user)
+    readable_dag_ids = auth_manager.get_cached_authorized_dag_ids(user=user)
     # ``ParseImportError.filename`` is a repository-relative path and
     # ``DagModel.fileloc`` is typically the absolute path those files were
     # loaded from, so matching on ``fileloc == filename`` would come back
@@ -149,12 +150,12 @@ def get_import_errors(
     filename_prefix_pattern: QueryParseImportErrorFilenamePrefixPatternSearch,
     filename: QueryParseImportErrorFilenameFilter,
     bundle_name: QueryParseImportErrorBundleNameFilter,
-    session: SessionDep,
+    session: ReadSessionDep,
     user: GetUserDep,
 ) -> ImportErrorCollectionResponse:
     """Get all import errors."""
     auth_manager = get_auth_manager()
-    readable_dag_ids = auth_manager.get_authorized_dag_ids(method="GET", user=user)
+    readable_dag_ids = auth_manager.get_cached_authorized_dag_ids(method="GET", user=user)
 
     # Subquery for files that have any Dags
     files_with_any_dags = select(DagModel.relative_fileloc).distinct().subquery()
@@ -164,7 +165,7 @@ def get_import_errors(
     # the user is allowed to see at all.
     readable_files_cte = (
         select(DagModel.relative_fileloc, DagModel.bundle_name)
-        .where(DagModel.dag_id.in_(readable_dag_ids))
+        .where(in_values(DagModel.dag_id, readable_dag_ids))
         .distinct()
         .cte()
     )
@@ -23,7 +23,7 @@ from sqlalchemy import select
 from sqlalchemy.orm import joinedload
 
 from airflow.api_fastapi.common.db.common import (
-    SessionDep,
+    ReadSessionDep,
     paginated_select,
 )
 from airflow.api_fastapi.common.parameters import (
@@ -82,7 +82,7 @@ def get_jobs(
             ).dynamic_depends(default="id")
         ),
     ],
-    session: SessionDep,
+    session: ReadSessionDep,
     state: Annotated[
         FilterParam[str | None], Depends(filter_param_factory(Job.state, str | None, filter_name="job_state"))
     ],
@@ -29,7 +29,7 @@ from sqlalchemy.orm import joinedload
 from sqlalchemy.sql import select
 
 from airflow.api_fastapi.common.dagbag import DagBagDep
-from airflow.api_fastapi.common.db.common import SessionDep
+from airflow.api_fastapi.common.db.common import ReadSessionDep
 from airflow.api_fastapi.common.headers import HeaderAcceptJsonOrNdjson
 from airflow.api_fastapi.common.router import AirflowRouter
 from airflow.api_fastapi.common.types import Mimetype
@@ -97,7 +97,7 @@ def get_log(
     accept: HeaderAcceptJsonOrNdjson,
     request: Request,
     dag_bag: DagBagDep,
-    session: SessionDep,
+    session: ReadSessionDep,
     full_content: bool = False,
     map_index: int = -1,
     token: str | None = None,
@@ -195,7 +195,7 @@ def get_external_log_url(
     dag_run_id: str,
     task_id: str,
     try_number: PositiveInt,
-    session: SessionDep,
+    session: ReadSessionDep,
     map_index: int = -1,
 ) -> ExternalLogUrlResponse:
     """Get external log URL for a specific task instance."""
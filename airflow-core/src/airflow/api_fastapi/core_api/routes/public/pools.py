@@ -22,7 +22,7 @@ from fastapi import Depends, HTTPException, Query, status
 from sqlalchemy import delete, select
 from sqlalchemy.engine import CursorResult
 
-from airflow.api_fastapi.common.db.common import SessionDep, paginated_select
+from airflow.api_fastapi.common.db.common import ReadSessionDep, SessionDep, paginated_select
 from airflow.api_fastapi.common.parameters import (
     QueryLimit,
     QueryOffset,
@@ -83,7 +83,7 @@ def delete_pool(
 )
 def get_pool(
     pool_name: str,
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> PoolResponse:
     """Get a pool."""
     pool = session.scalar(select(Pool).where(Pool.pool == pool_name))
@@ -107,7 +107,7 @@ def get_pools(
     pool_name_pattern: QueryPoolNamePatternSearch,
     pool_name_prefix_pattern: QueryPoolNamePrefixPatternSearch,
     readable_pools_filter: ReadablePoolsFilterDep,
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> PoolCollectionResponse:
     """Get all pools entries."""
     pools_select, total_entries = paginated_select(
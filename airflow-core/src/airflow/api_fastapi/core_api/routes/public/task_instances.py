@@ -21,18 +21,14 @@ from collections.abc import Sequence
 from typing import Annotated, Literal, cast
 
 import structlog
-from fastapi import Depends, HTTPException, Query, status
+from fastapi import Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import or_, select
 from sqlalchemy.orm import joinedload
 from sqlalchemy.sql.selectable import Select
 
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
-from airflow.api_fastapi.common.cursors import (
-    apply_cursor_filter,
-    encode_cursor,
-    make_backward_cursor,
-    parse_cursor,
-)
+from airflow.api_fastapi.common.cursors import cursor_paginated_select
 from airflow.api_fastapi.common.dagbag import (
     DagBagDep,
     get_dag_for_run,
@@ -40,13 +36,24 @@ from airflow.api_fastapi.common.dagbag import (
     get_latest_version_of_dag,
     resolve_run_on_latest_version,
 )
-from airflow.api_fastapi.common.db.common import SessionDep, apply_filters_to_select, paginated_select
-from airflow.api_fastapi.common.db.task_instances import eager_load_TI_and_TIH_for_validation
+from airflow.api_fastapi.common.db.common import (
+    ReadSessionDep,
+    SessionDep,
+    TotalEntriesMode,
+    paginated_select,
+)
+from airflow.api_fastapi.common.db.task_instances import (
+    eager_load_TI_and_TIH_for_validation,
+    get_task_instances_version,
+)
+from airflow.api_fastapi.common.etag import check_etag
+from airflow.api_fastapi.common.headers import HeaderAcceptJsonOrStream
 from airflow.api_fastapi.common.parameters import (
     FilterOptionEnum,
     FilterParam,
     LimitFilter,
     OffsetFilter,
+    QueryCursor,
     QueryLimit,
     QueryOffset,
     QueryTIDagVersionFilter,
@@ -68,6 +75,7 @@ from airflow.api_fastapi.common.parameters import (
     QueryTITaskDisplayNamePrefixPatternSearch,
     QueryTITaskGroupFilter,
     QueryTITryNumberFilter,
+    QueryTotalEntriesMode,
     Range,
     RangeFilter,
     SortParam,
@@ -80,6 +88,7 @@ from airflow.api_fastapi.common.parameters import (
     search_param_factory,
 )
 from airflow.api_fastapi.common.router import AirflowRouter
+from airflow.api_fastapi.common.streaming import STREAMING_MIMETYPES, stream_select, streaming_responses_doc
 from airflow.api_fastapi.core_api.base import OrmClause
 from airflow.api_fastapi.core_api.datamodels.common import BulkBody, BulkResponse
 from airflow.api_fastapi.core_api.datamodels.task_instance_history import (
@@ -110,6 +119,7 @@ from airflow.api_fastapi.core_api.services.public.task_instances import (
 from airflow.api_fastapi.logging.decorators import action_logging
 from airflow.exceptions import AirflowClearRunningTaskException, TaskNotFound
 from airflow.models import Base, DagRun
+from airflow.models.state_rollup import recompute_state_rollups
 from airflow.models.taskinstance import TaskInstance as TI, clear_task_instances
 from airflow.models.taskinstancehistory import TaskInstanceHistory as TIH
 from airflow.ti_deps.dep_context import DepContext
@@ -132,7 +142,7 @@ def get_task_instance(
     dag_id: str,
     dag_run_id: str,
     task_id: str,
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> TaskInstanceResponse:
     """Get task instance."""
     query = (
@@ -227,7 +237,7 @@ def get_mapped_task_instances(
             ).dynamic_depends(default="map_index")
         ),
     ],
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> TaskInstanceCollectionResponse:
     """Get list of mapped task instances."""
     query = eager_load_TI_and_TIH_for_validation(
@@ -304,7 +314,7 @@ def get_task_instance_dependencies(
     dag_id: str,
     dag_run_id: str,
     task_id: str,
-    session: SessionDep,
+    session: ReadSessionDep,
     dag_bag: DagBagDep,
     map_index: int = -1,
 ) -> TaskDependencyCollectionResponse:
@@ -357,7 +367,7 @@ def get_task_instance_tries(
     dag_id: str,
     dag_run_id: str,
     task_id: str,
-    session: SessionDep,
+    session: ReadSessionDep,
     map_index: int = -1,
 ) -> TaskInstanceHistoryCollectionResponse:
     """Get list of task instances history."""
@@ -400,7 +410,7 @@ def get_mapped_task_instance_tries(
     dag_id: str,
     dag_run_id: str,
     task_id: str,
-    session: SessionDep,
+    session: ReadSessionDep,
     map_index: int,
 ) -> TaskInstanceHistoryCollectionResponse:
     return get_task_instance_tries(
@@ -422,7 +432,7 @@ def get_mapped_task_instance(
     dag_run_id: str,
     task_id: str,
     map_index: int,
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> TaskInstanceResponse:
     """Get task instance."""
     query = (
@@ -445,13 +455,20 @@ def get_mapped_task_instance(
 
 @task_instances_router.get(
     task_instances_prefix,
-    responses=create_openapi_http_exception_doc([status.HTTP_400_BAD_REQUEST, status.HTTP_404_NOT_FOUND]),
+    responses={
+        **create_openapi_http_exception_doc([status.HTTP_400_BAD_REQUEST, status.HTTP_404_NOT_FOUND]),
+        **streaming_responses_doc,
+    },
     dependencies=[Depends(requires_access_dag(method="GET", access_entity=DagAccessEntity.TASK_INSTANCE))],
+    response_model=TaskInstanceCollectionResponse,
 )
 def get_task_instances(
     dag_id: str,
     dag_run_id: str,
     dag_bag: DagBagDep,
+    request: Request,
+    response: Response,
+    accept: HeaderAcceptJsonOrStream,
     task_id: Annotated[FilterParam[str | None], Depends(filter_param_factory(TI.task_id, str | None))],
     run_after_range: Annotated[RangeFilter, Depends(datetime_range_filter_factory("run_after", TI))],
     logical_date_range: Annotated[RangeFilter, Depends(datetime_range_filter_factory("logical_date", TI))],
@@ -522,14 +539,10 @@ def get_task_instances(
         ),
     ],
     readable_ti_filter: ReadableTIFilterDep,
-    session: SessionDep,
-    cursor: str | None = Query(
-        None,
-        description="Cursor for keyset-based pagination. "
-        "Pass an empty string for the first page, then use ``next_cursor`` from the response. "
-        "When ``cursor`` is provided, ``offset`` is ignored.",
-    ),
-) -> TaskInstanceCollectionResponse:
+    session: ReadSessionDep,
+    cursor: QueryCursor = None,
+    total_entries_mode: QueryTotalEntriesMode = TotalEntriesMode.EXACT,
+) -> TaskInstanceCollectionResponse | StreamingResponse:
     """
     Get list of task instances.
 
@@ -538,14 +551,23 @@ def get_task_instances(
 
     Supports two pagination modes:
 
-    **Offset (default):** use `limit` and `offset` query parameters. Returns `total_entries`.
+    **Offset (default):** use `limit` and `offset` query parameters. Returns `total_entries`, unless
+    `total_entries_mode` is `none`; with `estimate`, it is the database's estimate where available.
 
     **Cursor:** pass `cursor` (empty string for the first page, then `next_cursor` from the response).
     When `cursor` is provided, `offset` is ignored and `total_entries` is not returned.
     ``next_cursor`` is ``null`` when there are no more pages; ``previous_cursor`` is ``null``
     on the first page.
+
+    **Streaming:** with `Accept: application/x-ndjson` (one task instance per line) or
+    `Accept: application/vnd.apache.arrow.stream` (an Arrow IPC stream), all matching task
+    instances are streamed in `order_by` order, and `limit`, `offset`, `cursor` and
+    `total_entries_mode` are ignored.
+
+    When listing the task instances of a single Dag run, the response carries an ``ETag``, and
+    requests sending it back in ``If-None-Match`` get an empty ``304 Not Modified`` as long as
+    the run and its task instances did not change.
     """
-    use_cursor = cursor is not None
     dag_run = None
     query = eager_load_TI_and_TIH_for_validation(select(TI))
     if dag_run_id != "~":
@@ -560,6 +582,8 @@ def get_task_instances(
                 status.HTTP_404_NOT_FOUND,
                 f"DagRun with dag_id: `{dag_id}` and run_id: `{dag_run_id}` was not found",
             )
+        version = get_task_instances_version(dag_id, [dag_run_id], session=session)
+        response.headers.update(check_etag(request, *version))
         query = query.where(TI.run_id == dag_run_id)
     if dag_id != "~":
         dag = get_dag_for_run_or_latest_version(dag_bag, dag_run, dag_id, session)
@@ -601,50 +625,22 @@ def get_task_instances(
         rendered_map_index_prefix_pattern,
     ]
 
-    if use_cursor:
-        # Fetch one extra row so we can detect whether a next page exists.
-        page_limit = cast(
-            "int", limit.value
-        )  # LimitFilter value is guaranteed to be set to the default value of QueryLimit
-        cursor_limit = LimitFilter().set_value(page_limit + 1)
-        task_instance_select = apply_filters_to_select(statement=query, filters=[*filters, cursor_limit])
-        task_instance_select = order_by.to_orm(task_instance_select)
-
-        is_backward = False
-        if cursor:
-            token, is_backward = parse_cursor(cursor)
-            if is_backward:
-                task_instance_select = order_by.to_orm(task_instance_select, reversed=True)
-            task_instance_select = apply_cursor_filter(
-                task_instance_select,
-                token,
-                order_by,
-                session.get_bind().dialect.name,
-                is_backward=is_backward,
-            )
-
-        fetched = list(session.scalars(task_instance_select))
-        has_more = len(fetched) > page_limit
-        task_instances = fetched[:page_limit]
-
-        if is_backward:
-            task_instances.reverse()
-            has_prev = has_more
-            has_next = True
-        else:
-            has_prev = bool(cursor)
-            has_next = has_more
+    if accept in STREAMING_MIMETYPES:
+        return stream_select(
+            statement=query,
+            filters=filters,
+            order_by=order_by,
+            response_model=TaskInstanceResponse,
+            mimetype=accept,
+            headers=response.headers,
+        )
 
+    if cursor is not None:
+        page = cursor_paginated_select(
+            statement=query, filters=filters, order_by=order_by, limit=limit, cursor=cursor, session=session
+        )
         return TaskInstanceCollectionResponse(
-            task_instances=task_instances,
-            next_cursor=(
-                encode_cursor(task_instances[-1], order_by) if has_next and task_instances else None
-            ),
-            previous_cursor=(
-                make_backward_cursor(encode_cursor(task_instances[0], order_by))
-                if has_prev and task_instances
-                else None
-            ),
+            task_instances=page.rows, next_cursor=page.next_cursor, previous_cursor=page.previous_cursor
         )
 
     task_instance_select, total_entries = paginated_select(
@@ -654,6 +650,7 @@ def get_task_instances(
         offset=offset,
         limit=limit,
         session=session,
+        total_entries_mode=total_entries_mode,
     )
     task_instances = list(session.scalars(task_instance_select))
     return TaskInstanceCollectionResponse(
@@ -780,7 +777,7 @@ def get_task_instance_try_details(
     dag_run_id: str,
     task_id: str,
     task_try_number: int,
-    session: SessionDep,
+    session: ReadSessionDep,
     map_index: int = -1,
 ) -> TaskInstanceHistoryResponse:
     """Get task instance details by try number."""
@@ -816,7 +813,7 @@ def get_mapped_task_instance_try_details(
     dag_run_id: str,
     task_id: str,
     task_try_number: int,
-    session: SessionDep,
+    session: ReadSessionDep,
     map_index: int,
 ) -> TaskInstanceHistoryResponse:
     return get_task_instance_try_details(
@@ -969,6 +966,9 @@ def post_clear_task_instances(
                 user=user,
             )
 
+    if body.count_only:
+        return TaskInstanceCollectionResponse(task_instances=[], total_entries=len(task_instances))
+
     # Eagerly load rendered_task_instance_fields for serialization (lazy='raise' prevents lazy access).
     # dag.clear() returns TIs without this relationship loaded; re-query with joinedload.
     # populate_existing=True ensures the joinedload updates TIs already in the identity map.
@@ -1279,3 +1279,4 @@ def delete_task_instance(
         )
 
     session.delete(task_instance)
+    recompute_state_rollups([(dag_id, task_instance.dag_run.run_after)], session=session)
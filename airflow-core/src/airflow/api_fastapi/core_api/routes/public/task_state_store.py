@@ -25,7 +25,7 @@ from sqlalchemy import select
 
 from airflow._shared.state import TaskScope
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
-from airflow.api_fastapi.common.db.common import SessionDep, paginated_select
+from airflow.api_fastapi.common.db.common import ReadSessionDep, SessionDep, paginated_select
 from airflow.api_fastapi.common.parameters import QueryLimit, QueryOffset
 from airflow.api_fastapi.common.router import AirflowRouter
 from airflow.api_fastapi.core_api.datamodels.task_state_store import (
@@ -99,7 +99,7 @@ def list_task_state_store(
     task_id: str,
     limit: QueryLimit,
     offset: QueryOffset,
-    session: SessionDep,
+    session: ReadSessionDep,
     map_index: Annotated[int, Query(ge=-1)] = -1,
 ) -> TaskStateStoreCollectionResponse:
     """List all task state store entries for a task instance."""
@@ -146,7 +146,7 @@ def get_task_state_store(
     dag_run_id: str,
     task_id: str,
     key: str,
-    session: SessionDep,
+    session: ReadSessionDep,
     map_index: Annotated[int, Query(ge=-1)] = -1,
 ) -> TaskStateStoreResponse:
     """Get a single task state store entry."""
@@ -23,7 +23,7 @@ from fastapi import Depends, HTTPException, status
 
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
 from airflow.api_fastapi.common.dagbag import DagBagDep, get_latest_version_of_dag
-from airflow.api_fastapi.common.db.common import SessionDep
+from airflow.api_fastapi.common.db.common import ReadSessionDep
 from airflow.api_fastapi.common.router import AirflowRouter
 from airflow.api_fastapi.core_api.datamodels.tasks import TaskCollectionResponse, TaskResponse
 from airflow.api_fastapi.core_api.openapi.exceptions import create_openapi_http_exception_doc
@@ -69,7 +69,7 @@ _SORTABLE_TASK_FIELDS = {
 def get_tasks(
     dag_id: str,
     dag_bag: DagBagDep,
-    session: SessionDep,
+    session: ReadSessionDep,
     order_by: str = "task_id",
 ) -> TaskCollectionResponse:
     """Get tasks for Dag."""
@@ -102,7 +102,7 @@ def get_tasks(
     ),
     dependencies=[Depends(requires_access_dag(method="GET", access_entity=DagAccessEntity.TASK))],
 )
-def get_task(dag_id: str, task_id, session: SessionDep, dag_bag: DagBagDep) -> TaskResponse:
+def get_task(dag_id: str, task_id, session: ReadSessionDep, dag_bag: DagBagDep) -> TaskResponse:
     """Get simplified representation of a task."""
     dag = get_latest_version_of_dag(dag_bag, dag_id, session)
     try:
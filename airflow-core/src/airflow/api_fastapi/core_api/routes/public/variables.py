@@ -21,7 +21,7 @@ from typing import Annotated
 from fastapi import Depends, HTTPException, Query, status
 from sqlalchemy import delete, select
 
-from airflow.api_fastapi.common.db.common import SessionDep, paginated_select
+from airflow.api_fastapi.common.db.common import ReadSessionDep, SessionDep, paginated_select
 from airflow.api_fastapi.common.parameters import (
     QueryLimit,
     QueryOffset,
@@ -80,7 +80,7 @@ def delete_variable(
 )
 def get_variable(
     variable_key: str,
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> VariableResponse:
     """Get a variable entry."""
     variable = session.scalar(select(Variable).where(Variable.key == variable_key).limit(1))
@@ -110,7 +110,7 @@ def get_variables(
         ),
     ],
     readable_variables_filter: ReadableVariablesFilterDep,
-    session: SessionDep,
+    session: ReadSessionDep,
     variable_key_pattern: QueryVariableKeyPatternSearch,
     variable_key_prefix_pattern: QueryVariableKeyPrefixPatternSearch,
 ) -> VariableCollectionResponse:
@@ -20,16 +20,26 @@ import copy
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import and_, delete, select
 from sqlalchemy.orm import joinedload
 
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
+from airflow.api_fastapi.common.cursors import cursor_paginated_select
 from airflow.api_fastapi.common.dagbag import DagBagDep, get_dag_for_run_or_latest_version
-from airflow.api_fastapi.common.db.common import SessionDep, paginated_select
+from airflow.api_fastapi.common.db.common import (
+    ReadSessionDep,
+    SessionDep,
+    TotalEntriesMode,
+    paginated_select,
+)
+from airflow.api_fastapi.common.headers import HeaderAcceptJsonOrStream
 from airflow.api_fastapi.common.parameters import (
     FilterParam,
+    QueryCursor,
     QueryLimit,
     QueryOffset,
+    QueryTotalEntriesMode,
     QueryXComDagDisplayNamePatternSearch,
     QueryXComDagDisplayNamePrefixPatternSearch,
     QueryXComKeyPatternSearch,
@@ -44,9 +54,12 @@ from airflow.api_fastapi.common.parameters import (
     filter_param_factory,
 )
 from airflow.api_fastapi.common.router import AirflowRouter
+from airflow.api_fastapi.common.streaming import STREAMING_MIMETYPES, stream_select, streaming_responses_doc
+from airflow.api_fastapi.core_api.base import OrmClause
 from airflow.api_fastapi.core_api.datamodels.xcom import (
     XComCollectionResponse,
     XComCreateBody,
+    XComResponse,
     XComResponseNative,
     XComResponseString,
     XComUpdateBody,
@@ -79,7 +92,7 @@ def get_xcom_entry(
     task_id: str,
     dag_run_id: str,
     xcom_key: str,
-    session: SessionDep,
+    session: ReadSessionDep,
     map_index: Annotated[int, Query(ge=-1)] = -1,
     deserialize: Annotated[bool, Query()] = False,
     stringify: Annotated[bool, Query()] = False,
@@ -140,13 +153,17 @@ def get_xcom_entry(
 
 @xcom_router.get(
     "",
-    responses=create_openapi_http_exception_doc(
-        [
-            status.HTTP_400_BAD_REQUEST,
-            status.HTTP_404_NOT_FOUND,
-        ]
-    ),
+    responses={
+        **create_openapi_http_exception_doc(
+            [
+                status.HTTP_400_BAD_REQUEST,
+                status.HTTP_404_NOT_FOUND,
+            ]
+        ),
+        **streaming_responses_doc,
+    },
     dependencies=[Depends(requires_access_dag(method="GET", access_entity=DagAccessEntity.XCOM))],
+    response_model=XComCollectionResponse,
 )
 def get_xcom_entries(
     dag_id: str,
@@ -154,8 +171,9 @@ def get_xcom_entries(
     task_id: str,
     limit: QueryLimit,
     offset: QueryOffset,
+    accept: HeaderAcceptJsonOrStream,
     readable_xcom_filter: ReadableXComFilterDep,
-    session: SessionDep,
+    session: ReadSessionDep,
     xcom_key_pattern: QueryXComKeyPatternSearch,
     xcom_key_prefix_pattern: QueryXComKeyPrefixPatternSearch,
     dag_display_name_pattern: QueryXComDagDisplayNamePatternSearch,
@@ -182,11 +200,28 @@ def get_xcom_entries(
     ],
     xcom_key: Annotated[str | None, Query()] = None,
     map_index: Annotated[int | None, Query(ge=-1)] = None,
-) -> XComCollectionResponse:
+    cursor: QueryCursor = None,
+    total_entries_mode: QueryTotalEntriesMode = TotalEntriesMode.EXACT,
+) -> XComCollectionResponse | StreamingResponse:
     """
     Get all XCom entries.
 
     This endpoint allows specifying `~` as the dag_id, dag_run_id, task_id to retrieve XCom entries for all Dags.
+
+    Supports two pagination modes:
+
+    **Offset (default):** use `limit` and `offset` query parameters. Returns `total_entries`, unless
+    `total_entries_mode` is `none`; with `estimate`, it is the database's estimate where available.
+
+    **Cursor:** pass `cursor` (empty string for the first page, then `next_cursor` from the response).
+    When `cursor` is provided, `offset` is ignored and `total_entries` is not returned.
+    ``next_cursor`` is ``null`` when there are no more pages; ``previous_cursor`` is ``null``
+    on the first page.
+
+    **Streaming:** with `Accept: application/x-ndjson` (one XCom entry per line) or
+    `Accept: application/vnd.apache.arrow.stream` (an Arrow IPC stream), all matching XCom entries
+    are streamed in `order_by` order, and `limit`, `offset`, `cursor` and `total_entries_mode`
+    are ignored.
     """
     query = select(XComModel)
     if dag_id != "~":
@@ -206,26 +241,46 @@ def get_xcom_entries(
     if xcom_key is not None:
         query = query.where(XComModel.key == xcom_key)
 
+    filters: list[OrmClause] = [
+        readable_xcom_filter,
+        xcom_key_pattern,
+        xcom_key_prefix_pattern,
+        dag_display_name_pattern,
+        dag_display_name_prefix_pattern,
+        run_id_pattern,
+        run_id_prefix_pattern,
+        task_id_pattern,
+        task_id_prefix_pattern,
+        map_index_filter,
+        logical_date_range,
+        run_after_range,
+    ]
+
+    if accept in STREAMING_MIMETYPES:
+        return stream_select(
+            statement=query,
+            filters=filters,
+            order_by=order_by,
+            response_model=XComResponse,
+            mimetype=accept,
+        )
+
+    if cursor is not None:
+        page = cursor_paginated_select(
+            statement=query, filters=filters, order_by=order_by, limit=limit, cursor=cursor, session=session
+        )
+        return XComCollectionResponse(
+            xcom_entries=page.rows, next_cursor=page.next_cursor, previous_cursor=page.previous_cursor
+        )
+
     query, total_entries = paginated_select(
         statement=query,
-        filters=[
-            readable_xcom_filter,
-            xcom_key_pattern,
-            xcom_key_prefix_pattern,
-            dag_display_name_pattern,
-            dag_display_name_prefix_pattern,
-            run_id_pattern,
-            run_id_prefix_pattern,
-            task_id_pattern,
-            task_id_prefix_pattern,
-            map_index_filter,
-            logical_date_range,
-            run_after_range,
-        ],
+        filters=filters,
         order_by=order_by,
         offset=offset,
         limit=limit,
         session=session,
+        total_entries_mode=total_entries_mode,
     )
     return XComCollectionResponse(xcom_entries=session.scalars(query), total_entries=total_entries)
 
@@ -22,7 +22,7 @@ import structlog
 from fastapi import Depends, HTTPException, status
 from sqlalchemy import ColumnElement, and_, case, exists, func, select, true
 
-from airflow.api_fastapi.common.db.common import SessionDep
+from airflow.api_fastapi.common.db.common import ReadSessionDep
 from airflow.api_fastapi.common.partition_helpers import load_partitioned_timetable
 from airflow.api_fastapi.common.router import AirflowRouter
 from airflow.api_fastapi.core_api.datamodels.ui.assets import (
@@ -55,7 +55,7 @@ assets_router = AirflowRouter(tags=["Asset"])
 )
 def next_run_assets(
     dag_id: str,
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> NextRunAssetsResponse:
     dag_model = DagModel.get_dagmodel(dag_id, session=session)
     if dag_model is None:
@@ -22,7 +22,7 @@ from fastapi import Depends, status
 from sqlalchemy import select
 from sqlalchemy.orm import joinedload
 
-from airflow.api_fastapi.common.db.common import SessionDep, paginated_select
+from airflow.api_fastapi.common.db.common import ReadSessionDep, paginated_select
 from airflow.api_fastapi.common.parameters import (
     FilterOptionEnum,
     FilterParam,
@@ -57,7 +57,7 @@ def list_backfills_ui(
         Depends(SortParam(["id"], Backfill).dynamic_depends()),
     ],
     readable_backfills_filter: ReadableBackfillsFilterDep,
-    session: SessionDep,
+    session: ReadSessionDep,
     dag_id: Annotated[FilterParam[str | None], Depends(filter_param_factory(Backfill.dag_id, str | None))],
     active: Annotated[
         FilterParam[bool | None],
@@ -22,7 +22,7 @@ from fastapi import Depends
 
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
 from airflow.api_fastapi.common.dagbag import DagBagDep, get_latest_version_of_dag
-from airflow.api_fastapi.common.db.common import SessionDep
+from airflow.api_fastapi.common.db.common import ReadSessionDep
 from airflow.api_fastapi.common.parameters import RangeFilter, datetime_range_filter_factory
 from airflow.api_fastapi.common.router import AirflowRouter
 from airflow.api_fastapi.core_api.datamodels.ui.calendar import (
@@ -56,7 +56,7 @@ calendar_router = AirflowRouter(prefix="/calendar", tags=["Calendar"])
 )
 def get_calendar(
     dag_id: str,
-    session: SessionDep,
+    session: ReadSessionDep,
     dag_bag: DagBagDep,
     logical_date: Annotated[RangeFilter, Depends(datetime_range_filter_factory("logical_date", DagRun))],
     partition_date: Annotated[RangeFilter, Depends(datetime_range_filter_factory("partition_date", DagRun))],
@@ -90,7 +90,7 @@ def get_calendar(
 )
 def get_calendar_deadlines(
     dag_id: str,
-    session: SessionDep,
+    session: ReadSessionDep,
     deadline_time: Annotated[RangeFilter, Depends(datetime_range_filter_factory("deadline_time", Deadline))],
     granularity: Literal["hourly", "daily"] = "daily",
 ) -> CalendarDeadlineCollectionResponse:
@@ -0,0 +1,84 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from fastapi import Depends
+from fastapi.responses import StreamingResponse
+
+from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
+from airflow.api_fastapi.common.router import AirflowRouter
+from airflow.api_fastapi.core_api.datamodels.ui.change_feed import ChangeEventCollection
+from airflow.api_fastapi.core_api.security import AuthManagerDep, GetUserDep, requires_access_dag
+from airflow.api_fastapi.core_api.services.ui.change_feed import get_change_feed
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+change_feed_router = AirflowRouter(tags=["Change Feed"], prefix="/changes")
+
+
+@change_feed_router.get(
+    "",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {"text/event-stream": {"schema": {"type": "string"}}},
+            "description": (
+                "Server-sent events. Each ``message`` event holds a ``ChangeEventCollection``; a "
+                "``resync`` event means changes were missed and the client should reload its data."
+            ),
+        },
+    },
+    dependencies=[
+        Depends(requires_access_dag(method="GET", access_entity=DagAccessEntity.TASK_INSTANCE)),
+        Depends(requires_access_dag(method="GET", access_entity=DagAccessEntity.RUN)),
+    ],
+)
+def get_changes(user: GetUserDep, auth_manager: AuthManagerDep) -> StreamingResponse:
+    """
+    Stream the state changes of Dag runs and task instances the user can read.
+
+    The stream lets the UI update incrementally instead of polling. Changes are detected by a single
+    poller per API server process, every ``[api] change_feed_poll_interval`` seconds, and a comment
+    line is sent when there is nothing to publish so proxies keep the connection open.
+    """
+
+    async def _stream() -> AsyncGenerator[str, None]:
+        async for batch in get_change_feed().subscribe():
+            if batch is None:
+                yield "event: resync\ndata: {}\n\n"
+                continue
+            events = []
+            if batch:
+                # Served from the cache of the auth manager, so permission changes apply to open streams
+                readable_dag_ids = await asyncio.to_thread(
+                    auth_manager.get_cached_authorized_dag_ids, user=user
+                )
+                events = [event for event in batch if event.dag_id in readable_dag_ids]
+            if not events:
+                yield ": keepalive\n\n"
+                continue
+            yield f"data: {ChangeEventCollection(events=events).model_dump_json()}\n\n"
+
+    return StreamingResponse(
+        _stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -21,7 +21,7 @@ from fastapi import Depends, HTTPException, status
 from sqlalchemy import select
 
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
-from airflow.api_fastapi.common.db.common import SessionDep
+from airflow.api_fastapi.common.db.common import ReadSessionDep
 from airflow.api_fastapi.common.router import AirflowRouter
 from airflow.api_fastapi.core_api.datamodels.ui.dag_runs import DagRunStatsResponse
 from airflow.api_fastapi.core_api.openapi.exceptions import create_openapi_http_exception_doc
@@ -38,7 +38,7 @@ dag_runs_router = AirflowRouter(prefix="/dags/{dag_id}/dagRuns", tags=["DagRun"]
     responses=create_openapi_http_exception_doc([status.HTTP_404_NOT_FOUND]),
     dependencies=[Depends(requires_access_dag(method="GET", access_entity=DagAccessEntity.RUN))],
 )
-def get_dag_run_stats(dag_id: str, dag_run_id: str, session: SessionDep) -> DagRunStatsResponse:
+def get_dag_run_stats(dag_id: str, dag_run_id: str, session: ReadSessionDep) -> DagRunStatsResponse:
     """Get duration statistics for a DAG based on its historical completed runs."""
     if not session.scalar(select(DagRun.id).filter_by(dag_id=dag_id, run_id=dag_run_id)):
         raise HTTPException(
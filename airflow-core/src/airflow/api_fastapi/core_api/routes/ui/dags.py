@@ -25,7 +25,7 @@ from sqlalchemy.orm import defaultload
 
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
 from airflow.api_fastapi.common.db.common import (
-    SessionDep,
+    ReadSessionDep,
     paginated_select,
 )
 from airflow.api_fastapi.common.db.dags import generate_dag_with_latest_run_query
@@ -132,7 +132,7 @@ def get_dags(
     asset_dependency: QueryAssetDependencyFilter,
     has_pending_actions: QueryPendingActionsFilter,
     readable_dags_filter: ReadableDagsFilterDep,
-    session: SessionDep,
+    session: ReadSessionDep,
     user: GetUserDep,
     dag_runs_limit: int = 10,
 ) -> DAGWithLatestDagRunsCollectionResponse:
@@ -280,7 +280,7 @@ def get_dags(
     responses=create_openapi_http_exception_doc([status.HTTP_404_NOT_FOUND]),
     dependencies=[Depends(requires_access_dag(method="GET", access_entity=DagAccessEntity.RUN))],
 )
-def get_latest_run_info(dag_id: str, session: SessionDep) -> DAGRunLightResponse | None:
+def get_latest_run_info(dag_id: str, session: ReadSessionDep) -> DAGRunLightResponse | None:
     """Get latest run."""
     if dag_id == "~":
         raise HTTPException(
@@ -317,7 +317,7 @@ def get_latest_run_info(dag_id: str, session: SessionDep) -> DAGRunLightResponse
     operation_id="get_dag_run_state_counts_ui",
 )
 def get_dag_run_state_counts(
-    session: SessionDep,
+    session: ReadSessionDep,
     readable_dags_filter: ReadableDagsFilterDep,
     dag_ids: Annotated[list[str], Query(min_length=1, max_length=conf.getint("api", "maximum_page_limit"))],
 ) -> DAGsRunStateCountsCollectionResponse:
@@ -16,15 +16,17 @@
 # under the License.
 from __future__ import annotations
 
-from typing import cast
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, cast
 
 from fastapi import Depends, status
-from sqlalchemy import func, literal, select, union_all
+from sqlalchemy import and_, func, literal, select, union_all
 from sqlalchemy.sql.expression import case, false
 
 from airflow._shared.timezones import timezone
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
-from airflow.api_fastapi.common.db.common import SessionDep
+from airflow.api_fastapi.common.db.common import ReadSessionDep
 from airflow.api_fastapi.common.parameters import DateTimeQuery, OptionalDateTimeQuery
 from airflow.api_fastapi.common.router import AirflowRouter
 from airflow.api_fastapi.core_api.datamodels.ui.dashboard import (
@@ -33,14 +35,26 @@ from airflow.api_fastapi.core_api.datamodels.ui.dashboard import (
 )
 from airflow.api_fastapi.core_api.openapi.exceptions import create_openapi_http_exception_doc
 from airflow.api_fastapi.core_api.security import ReadableDagsFilterDep, requires_access_dag
+from airflow.configuration import conf
 from airflow.models.dag import DagModel
 from airflow.models.dagrun import DagRun
+from airflow.models.state_rollup import (
+    NO_STATUS,
+    StateRollup,
+    ceil_bucket,
+    floor_bucket,
+    get_state_rollup_coverage,
+)
 from airflow.models.taskinstance import TaskInstance
+from airflow.utils.sqlalchemy import in_values
 from airflow.utils.state import DagRunState, TaskInstanceState
 
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
 dashboard_router = AirflowRouter(tags=["Dashboard"], prefix="/dashboard")
 
-# Cap for state counts — avoids counting millions of rows.
+# Cap for state counts when the state rollups cannot be used — avoids counting millions of rows.
 # The UI shows "N+" when the returned count equals this value.
 STATE_COUNT_CAP = 1000
 
@@ -54,7 +68,7 @@ STATE_COUNT_CAP = 1000
     ],
 )
 def historical_metrics(
-    session: SessionDep,
+    session: ReadSessionDep,
     start_date: DateTimeQuery,
     readable_dags_filter: ReadableDagsFilterDep,
     end_date: OptionalDateTimeQuery = None,
@@ -64,6 +78,12 @@ def historical_metrics(
     permitted_dag_ids = cast("set[str]", readable_dags_filter.value)
 
     end_bound = end_date if end_date is not None else current_time
+    rollup_range = _get_rollup_range(start_date, end_bound, session=session)
+    if rollup_range is not None:
+        return _rollup_historical_metrics(
+            start_date, end_bound, rollup_range, permitted_dag_ids, session=session
+        )
+
     dag_run_filters = [
         DagRun.run_after >= start_date,
         DagRun.run_after <= end_bound,
@@ -102,28 +122,106 @@ def historical_metrics(
         join=TaskInstance.dag_run,
     )
 
+    return _historical_metrics_response(
+        {row.state: row.cnt for row in dag_run_state_counts},
+        {row.state: row.cnt for row in ti_state_counts},
+        state_count_limit=STATE_COUNT_CAP,
+    )
+
+
+def _historical_metrics_response(
+    dag_run_counts: dict[str, int], ti_counts: dict[str, int], *, state_count_limit: int | None
+) -> HistoricalMetricDataResponse:
     return HistoricalMetricDataResponse.model_validate(
         {
             "dag_run_states": {
                 **{dag_run_state.value: 0 for dag_run_state in DagRunState},
-                **{row.state: row.cnt for row in dag_run_state_counts},
+                **dag_run_counts,
             },
             "task_instance_states": {
-                "no_status": 0,
+                NO_STATUS: 0,
                 **{ti_state.value: 0 for ti_state in TaskInstanceState},
-                **{row.state: row.cnt for row in ti_state_counts},
+                **ti_counts,
             },
-            "state_count_limit": STATE_COUNT_CAP,
+            "state_count_limit": state_count_limit,
         }
     )
 
 
+def _get_rollup_range(
+    start_date: datetime, end_date: datetime, *, session: Session
+) -> tuple[datetime, datetime] | None:
+    """
+    Return the whole hours of ``[start_date, end_date]`` that can be counted from the state rollups.
+
+    The rest of the range is at most an hour on each side, plus the runs since the last refresh of the
+    rollups, and is counted from the ``dag_run`` and ``task_instance`` tables without a cap. Ranges that
+    start before the rollups' coverage are not counted from the rollups at all.
+    """
+    refresh_interval = conf.getfloat("scheduler", "state_rollup_refresh_interval")
+    if refresh_interval <= 0:
+        return None
+    coverage = get_state_rollup_coverage(max_age=timedelta(seconds=2 * refresh_interval), session=session)
+    if coverage is None:
+        return None
+    covered_from, covered_until = coverage
+    start = ceil_bucket(start_date)
+    end = min(floor_bucket(end_date), covered_until)
+    if start < covered_from or start >= end:
+        return None
+    return start, end
+
+
+def _rollup_historical_metrics(
+    start_date: datetime,
+    end_date: datetime,
+    rollup_range: tuple[datetime, datetime],
+    permitted_dag_ids: set[str],
+    *,
+    session: Session,
+) -> HistoricalMetricDataResponse:
+    rollup_start, rollup_end = rollup_range
+    counts: dict[str, dict[str, int]] = {"dag_run": defaultdict(int), "task_instance": defaultdict(int)}
+    rollup_rows = session.execute(
+        select(StateRollup.kind, StateRollup.state, func.sum(StateRollup.count))
+        .where(
+            StateRollup.bucket >= rollup_start,
+            StateRollup.bucket < rollup_end,
+            in_values(StateRollup.dag_id, permitted_dag_ids),
+        )
+        .group_by(StateRollup.kind, StateRollup.state)
+    )
+    for kind, state, count in rollup_rows:
+        counts[kind][state] += count
+
+    dag_id_filter = in_values(DagRun.dag_id, permitted_dag_ids)
+    for edge_filter in (
+        and_(DagRun.run_after >= start_date, DagRun.run_after < rollup_start),
+        and_(DagRun.run_after >= rollup_end, DagRun.run_after <= end_date),
+    ):
+        dag_run_rows = session.execute(
+            select(DagRun.state, func.count()).where(edge_filter, dag_id_filter).group_by(DagRun.state)
+        )
+        for state, count in dag_run_rows:
+            counts["dag_run"][state] += count
+        ti_rows = session.execute(
+            select(TaskInstance.state, func.count())
+            .join(TaskInstance.dag_run)
+            .where(edge_filter, dag_id_filter)
+            .group_by(TaskInstance.state)
+        )
+        for state, count in ti_rows:
+            counts["task_instance"][state or NO_STATUS] += count
+
+    return _historical_metrics_response(counts["dag_run"], counts["task_instance"], state_count_limit=None)
+
+
 @dashboard_router.get(
     "/dag_stats",
     dependencies=[Depends(requires_access_dag(method="GET"))],
 )
 def dag_stats(
-    session: SessionDep,
+    session: ReadSessionDep,
     readable_dags_filter: ReadableDagsFilterDep,
 ) -> DashboardDagStatsResponse:
     """Return basic Dag stats with counts of Dags in various states."""
@@ -24,7 +24,7 @@ from sqlalchemy import select
 from sqlalchemy.orm import contains_eager, noload
 
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
-from airflow.api_fastapi.common.db.common import SessionDep, paginated_select
+from airflow.api_fastapi.common.db.common import ReadSessionDep, paginated_select
 from airflow.api_fastapi.common.parameters import (
     FilterParam,
     QueryLimit,
@@ -69,7 +69,7 @@ deadlines_router = AirflowRouter(prefix="/dags/{dag_id}", tags=["Deadlines"])
 def get_deadlines(
     dag_id: str,
     dag_run_id: str,
-    session: SessionDep,
+    session: ReadSessionDep,
     limit: QueryLimit,
     offset: QueryOffset,
     readable_dag_runs_filter: ReadableDagRunsFilterDep,
@@ -159,7 +159,7 @@ def get_deadlines(
 )
 def get_dag_deadline_alerts(
     dag_id: str,
-    session: SessionDep,
+    session: ReadSessionDep,
     limit: QueryLimit,
     offset: QueryOffset,
     order_by: Annotated[
@@ -23,7 +23,7 @@ from fastapi import Depends, status
 from fastapi.exceptions import HTTPException
 
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
-from airflow.api_fastapi.common.db.common import SessionDep
+from airflow.api_fastapi.common.db.common import ReadSessionDep
 from airflow.api_fastapi.common.router import AirflowRouter
 from airflow.api_fastapi.core_api.datamodels.ui.common import BaseGraphResponse
 from airflow.api_fastapi.core_api.openapi.exceptions import create_openapi_http_exception_doc
@@ -47,7 +47,7 @@ dependencies_router = AirflowRouter(tags=["Dependencies"])
     dependencies=[Depends(requires_access_dag("GET", DagAccessEntity.DEPENDENCIES))],
 )
 def get_dependencies(
-    session: SessionDep,
+    session: ReadSessionDep,
     readable_dags_filter: ReadableDagsFilterDep,
     node_id: str | None = None,
     dependency_type: Literal["scheduling", "data"] = "scheduling",
@@ -21,7 +21,7 @@ from fastapi import Depends, HTTPException, status
 from sqlalchemy import or_, select, union_all
 
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
-from airflow.api_fastapi.common.db.common import SessionDep
+from airflow.api_fastapi.common.db.common import ReadSessionDep
 from airflow.api_fastapi.common.router import AirflowRouter
 from airflow.api_fastapi.core_api.datamodels.ui.gantt import GanttResponse, GanttTaskInstance
 from airflow.api_fastapi.core_api.openapi.exceptions import create_openapi_http_exception_doc
@@ -58,7 +58,7 @@ gantt_router = AirflowRouter(prefix="/gantt", tags=["Gantt"])
 def get_gantt_data(
     dag_id: str,
     run_id: str,
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> GanttResponse:
     """Get all task instance tries for Gantt chart."""
     # Exclude mapped tasks (use grid summaries) and UP_FOR_RETRY (already in history)
@@ -17,20 +17,24 @@
 
 from __future__ import annotations
 
+import itertools
 from collections.abc import Generator, Iterable
+from operator import attrgetter
 from typing import TYPE_CHECKING, Annotated, Any
 from uuid import UUID
 
 import structlog
-from fastapi import Depends, HTTPException, Query, status
+from fastapi import Depends, HTTPException, Query, Request, Response, status
 from fastapi.responses import StreamingResponse
-from sqlalchemy import exists, select
+from sqlalchemy import exists, func, select
 from sqlalchemy.orm import Session, joinedload, load_only
 
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
 from airflow.api_fastapi.common.dagbag import DagBagDep
-from airflow.api_fastapi.common.db.common import SessionDep, paginated_select
-from airflow.api_fastapi.common.db.dag_runs import attach_dag_versions_to_runs
+from airflow.api_fastapi.common.db.common import ReadSessionDep, paginated_select
+from airflow.api_fastapi.common.db.dag_runs import attach_dag_versions_to_runs, get_dag_runs_version
+from airflow.api_fastapi.common.db.task_instances import get_task_instances_version
+from airflow.api_fastapi.common.etag import check_etag
 from airflow.api_fastapi.common.parameters import (
     QueryDagRunRunTypesFilter,
     QueryDagRunStateFilter,
@@ -56,9 +60,12 @@ from airflow.api_fastapi.core_api.openapi.exceptions import create_openapi_http_
 from airflow.api_fastapi.core_api.security import requires_access_dag
 from airflow.api_fastapi.core_api.services.ui.grid import (
     GridNodeAgg,
-    _find_aggregates,
     _get_aggs_for_node,
     _merge_node_dicts,
+    build_grid_plan,
+    get_grid_plan,
+    get_grid_summary_cache,
+    summarize_grid_plan,
 )
 from airflow.api_fastapi.core_api.services.ui.task_group import (
     get_task_group_children_getter,
@@ -70,12 +77,17 @@ from airflow.models.deadline import Deadline
 from airflow.models.serialized_dag import SerializedDagModel
 from airflow.models.taskinstance import TaskInstance, TaskInstanceNote
 from airflow.utils.session import create_session
+from airflow.utils.state import State
 
 if TYPE_CHECKING:
     from airflow.models.dagbag import DBDagBag
     from airflow.serialization.definitions.dag import SerializedDAG
 
 log = structlog.get_logger(logger_name=__name__)
+
+# Number of Dag runs whose task instance summaries are loaded with a single query
+TI_SUMMARIES_RUN_CHUNK_SIZE = 50
+
 grid_router = AirflowRouter(prefix="/grid", tags=["Grid"])
 
 
@@ -132,7 +144,7 @@ def _get_serdag(
 )
 def get_dag_structure(
     dag_id: str,
-    session: SessionDep,
+    session: ReadSessionDep,
     offset: QueryOffset,
     limit: QueryLimit,
     order_by: Annotated[
@@ -260,7 +272,9 @@ def get_dag_structure(
 )
 def get_grid_runs(
     dag_id: str,
-    session: SessionDep,
+    session: ReadSessionDep,
+    request: Request,
+    response: Response,
     offset: QueryOffset,
     limit: QueryLimit,
     order_by: Annotated[
@@ -284,6 +298,7 @@ def get_grid_runs(
     triggering_user_prefix: QueryDagRunTriggeringUserPrefixSearch,
 ) -> list[GridRunsResponse]:
     """Get info about a run for the grid."""
+    response.headers.update(check_etag(request, *get_dag_runs_version(dag_id, session=session)))
     # Retrieve, sort the previous Dag Runs
     has_missed_deadline = (
         exists()
@@ -388,14 +403,15 @@ def _build_ti_summaries(
     serdag = _get_serdag(dag_bag, dag_id, dag_version_id, session)
     if TYPE_CHECKING:
         assert serdag
+    plan = (
+        get_grid_plan(dag_version_id, serdag)
+        if dag_version_id is not None
+        else build_grid_plan(serdag.task_group)
+    )
 
     def get_node_summaries() -> Iterable[dict[str, Any]]:
         yielded_task_ids: set[str] = set()
-        for node, _ in _find_aggregates(
-            node=serdag.task_group,
-            parent_node=None,
-            ti_details=ti_details,
-        ):
+        for node in summarize_grid_plan(plan, ti_details):
             if node["type"] in {"task", "mapped_task"}:
                 yielded_task_ids.add(node["task_id"])
                 if node["type"] == "task":
@@ -455,22 +471,31 @@ def _build_ti_summaries(
 def get_grid_ti_summaries_stream(
     dag_id: str,
     dag_bag: DagBagDep,
+    request: Request,
     run_ids: Annotated[list[str] | None, Query()] = None,
 ) -> StreamingResponse:
     """
     Stream TI summaries for multiple Dag runs as NDJSON (one JSON line per run).
 
-    Each line is a serialized ``GridTISummaries`` object emitted as soon as that
-    run's task instances have been processed, so the client can render columns
-    progressively without waiting for all runs to complete.
+    Each line is a serialized ``GridTISummaries`` object. Runs are processed in chunks
+    of ``TI_SUMMARIES_RUN_CHUNK_SIZE``, with a single task instance query per chunk,
+    and the lines of a chunk are emitted as soon as it has been processed, so the
+    client can render columns progressively without waiting for all runs to complete.
 
     The serialized Dag structure is served from the app-wide ``DBDagBag`` cache
-    (keyed by ``dag_version_id``), which avoids repeated deserialization across
-    runs of the same version *and* across requests.
+    (keyed by ``dag_version_id``), and the task group traversal is planned once per
+    Dag version. The summaries of finished runs are cached until the run, one of its
+    task instances or their notes change.
+
+    Clients sending the ``ETag`` of their previous response in ``If-None-Match`` get an
+    empty ``304 Not Modified`` when none of the runs or their task instances changed.
     """
+    with create_session(scoped=False) as session:
+        version = get_task_instances_version(dag_id, run_ids or [], session=session)
+    headers = check_etag(request, *version)
 
     def _generate() -> Generator[str, None, None]:
-        # Each iteration opens and closes its own DB session so the connection is
+        # Each chunk opens and closes its own DB session so the connection is
         # released between yields.  This prevents a slow client from holding a
         # database connection open for the entire stream duration.
         # See https://github.com/apache/airflow/issues/65010.
@@ -481,34 +506,87 @@ def get_grid_ti_summaries_stream(
             .correlate(TaskInstance)
             .label("has_note")
         )
+        ti_of_run = (TaskInstance.dag_id == DagRun.dag_id, TaskInstance.run_id == DagRun.run_id)
+        ti_count = select(func.count(TaskInstance.id)).where(*ti_of_run).correlate(DagRun).scalar_subquery()
+        ti_updated_at = (
+            select(func.max(TaskInstance.updated_at)).where(*ti_of_run).correlate(DagRun).scalar_subquery()
+        )
+        note_updated_at = (
+            select(func.max(TaskInstanceNote.updated_at))
+            .join(TaskInstance, TaskInstanceNote.ti_id == TaskInstance.id)
+            .where(*ti_of_run)
+            .correlate(DagRun)
+            .scalar_subquery()
+        )
+        summary_cache = get_grid_summary_cache()
+        requested_run_ids = run_ids or []
 
-        for run_id in run_ids or []:
+        for chunk_start in range(0, len(requested_run_ids), TI_SUMMARIES_RUN_CHUNK_SIZE):
+            chunk = requested_run_ids[chunk_start : chunk_start + TI_SUMMARIES_RUN_CHUNK_SIZE]
+            lines: dict[str, str] = {}
             with create_session(scoped=False) as session:
-                tis = session.execute(
-                    select(
-                        TaskInstance.task_id,
-                        TaskInstance.state,
-                        TaskInstance.dag_version_id,
-                        TaskInstance.start_date,
-                        TaskInstance.end_date,
-                        DagVersion.version_number,
-                        has_note_subq,
+                # A cached summary is only served while neither the run, nor one of its task instances
+                # or their notes changed since it was computed, on whichever API server the change was
+                # made.
+                run_tokens = {
+                    run_id: tuple(token)
+                    for run_id, *token in session.execute(
+                        select(
+                            DagRun.run_id,
+                            DagRun.state,
+                            DagRun.updated_at,
+                            DagRun.clear_number,
+                            ti_count,
+                            ti_updated_at,
+                            note_updated_at,
+                        ).where(DagRun.dag_id == dag_id, DagRun.run_id.in_(chunk))
                     )
-                    .outerjoin(DagVersion, TaskInstance.dag_version_id == DagVersion.id)
-                    .where(TaskInstance.dag_id == dag_id)
-                    .where(TaskInstance.run_id == run_id)
-                    .order_by(TaskInstance.task_id)
-                    .execution_options(yield_per=1000)
-                )
-                summary = _build_ti_summaries(
-                    dag_id,
-                    run_id,
-                    tis,
-                    session,
-                    dag_bag=dag_bag,
-                )
-            if summary is None:
-                continue
-            yield GridTISummaries.model_validate(summary).model_dump_json() + "\n"
-
-    return StreamingResponse(content=_generate(), media_type="application/x-ndjson")
+                }
+                to_fetch = []
+                for run_id in chunk:
+                    token = run_tokens.get(run_id)
+                    if token is not None and (line := summary_cache.get(dag_id, run_id, token)):
+                        lines[run_id] = line
+                    else:
+                        to_fetch.append(run_id)
+
+                if to_fetch:
+                    # Materialized before building the summaries: resolving the Dag of a run issues
+                    # more queries on the same connection, which an unbuffered cursor would not allow.
+                    tis = session.execute(
+                        select(
+                            TaskInstance.run_id,
+                            TaskInstance.task_id,
+                            TaskInstance.state,
+                            TaskInstance.dag_version_id,
+                            TaskInstance.start_date,
+                            TaskInstance.end_date,
+                            DagVersion.version_number,
+                            has_note_subq,
+                        )
+                        .outerjoin(DagVersion, TaskInstance.dag_version_id == DagVersion.id)
+                        .where(TaskInstance.dag_id == dag_id)
+                        .where(TaskInstance.run_id.in_(to_fetch))
+                        .order_by(TaskInstance.run_id, TaskInstance.task_id)
+                    ).all()
+                    for run_id, run_tis in itertools.groupby(tis, key=attrgetter("run_id")):
+                        summary = _build_ti_summaries(
+                            dag_id,
+                            run_id,
+                            run_tis,
+                            session,
+                            dag_bag=dag_bag,
+                        )
+                        if summary is None:
+                            continue
+                        line = GridTISummaries.model_validate(summary).model_dump_json() + "\n"
+                        lines[run_id] = line
+                        token = run_tokens.get(run_id)
+                        if token is not None and token[0] in State.finished_dr_states:
+                            summary_cache.set(dag_id, run_id, token, line)
+
+            for run_id in chunk:
+                if run_id in lines:
+                    yield lines[run_id]
+
+    return StreamingResponse(content=_generate(), media_type="application/x-ndjson", headers=headers)
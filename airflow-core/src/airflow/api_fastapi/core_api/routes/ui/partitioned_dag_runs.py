@@ -22,7 +22,11 @@ import structlog
 from fastapi import Depends, HTTPException, status
 from sqlalchemy import and_, select
 
-from airflow.api_fastapi.common.db.common import SessionDep, apply_filters_to_select, paginated_select
+from airflow.api_fastapi.common.db.common import (
+    ReadSessionDep,
+    apply_filters_to_select,
+    paginated_select,
+)
 from airflow.api_fastapi.common.parameters import (
     QueryLimit,
     QueryOffset,
@@ -245,7 +249,7 @@ def _build_response(row, required_count: int, received_count: int) -> Partitione
     dependencies=[Depends(requires_access_asset(method="GET"))],
 )
 def get_partitioned_dag_runs(
-    session: SessionDep,
+    session: ReadSessionDep,
     limit: QueryLimit,
     offset: QueryOffset,
     readable_dags_filter: ReadableDagsFilterDep,
@@ -360,7 +364,7 @@ def get_partitioned_dag_runs(
 def get_pending_partitioned_dag_run(
     dag_id: str,
     partition_key: str,
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> PartitionedDagRunDetailResponse:
     """Return full details for pending PartitionedDagRun."""
     # partition_key is a query param, not a path segment: it is a free-form key
@@ -21,7 +21,7 @@ from sqlalchemy import select
 from sqlalchemy.orm import joinedload
 
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
-from airflow.api_fastapi.common.db.common import SessionDep
+from airflow.api_fastapi.common.db.common import ReadSessionDep
 from airflow.api_fastapi.common.parameters import QueryIncludeDownstream, QueryIncludeUpstream
 from airflow.api_fastapi.common.router import AirflowRouter
 from airflow.api_fastapi.core_api.datamodels.ui.structure import StructureDataResponse
@@ -55,7 +55,7 @@ structure_router = AirflowRouter(tags=["Structure"], prefix="/structure")
     ],
 )
 def structure_data(
-    session: SessionDep,
+    session: ReadSessionDep,
     dag_id: str,
     readable_dags_filter: ReadableDagsFilterDep,
     include_upstream: QueryIncludeUpstream = False,
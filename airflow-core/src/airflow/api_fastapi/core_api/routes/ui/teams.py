@@ -21,7 +21,7 @@ from typing import Annotated
 from fastapi import Depends, HTTPException, status
 from sqlalchemy import select
 
-from airflow.api_fastapi.common.db.common import SessionDep, paginated_select
+from airflow.api_fastapi.common.db.common import ReadSessionDep, paginated_select
 from airflow.api_fastapi.common.parameters import (
     QueryLimit,
     QueryOffset,
@@ -51,7 +51,7 @@ def list_teams(
         Depends(SortParam(["name"], Team).dynamic_depends()),
     ],
     readable_teams_filter: ReadableTeamsFilterDep,
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> TeamCollectionResponse:
     if not conf.getboolean("core", "multi_team"):
         raise HTTPException(
@@ -77,6 +77,7 @@ from airflow.models.log import Log
 from airflow.models.taskinstance import TaskInstance as TI
 from airflow.models.team import Team
 from airflow.models.xcom import XComModel
+from airflow.utils.sqlalchemy import in_values
 
 if TYPE_CHECKING:
     from sqlalchemy.sql import Select
@@ -247,21 +248,21 @@ class PermittedDagFilter(OrmClause[set[str]]):
 
     def to_orm(self, select: Select) -> Select:
         # self.value may be None (OrmClause holds Optional), ensure we pass an Iterable to in_
-        return select.where(DagModel.dag_id.in_(self.value or set()))
+        return select.where(in_values(DagModel.dag_id, self.value))
 
 
 class PermittedDagRunFilter(PermittedDagFilter):
     """A parameter that filters the permitted dag runs for the user."""
 
     def to_orm(self, select: Select) -> Select:
-        return select.where(DagRun.dag_id.in_(self.value or set()))
+        return select.where(in_values(DagRun.dag_id, self.value))
 
 
 class PermittedDagWarningFilter(PermittedDagFilter):
     """A parameter that filters the permitted dag warnings for the user."""
 
     def to_orm(self, select: Select) -> Select:
-        return select.where(DagWarning.dag_id.in_(self.value or set()))
+        return select.where(in_values(DagWarning.dag_id, self.value))
 
 
 class PermittedEventLogFilter(PermittedDagFilter):
@@ -270,42 +271,42 @@ class PermittedEventLogFilter(PermittedDagFilter):
     def to_orm(self, select: Select) -> Select:
         # Event Logs not related to Dags have dag_id as None and are always returned.
         # return select.where(Log.dag_id.in_(self.value or set()) or Log.dag_id.is_(None))
-        return select.where(or_(Log.dag_id.in_(self.value or set()), Log.dag_id.is_(None)))
+        return select.where(or_(in_values(Log.dag_id, self.value), Log.dag_id.is_(None)))
 
 
 class PermittedTIFilter(PermittedDagFilter):
     """A parameter that filters the permitted task instances for the user."""
 
     def to_orm(self, select: Select) -> Select:
-        return select.where(TI.dag_id.in_(self.value or set()))
+        return select.where(in_values(TI.dag_id, self.value))
 
 
 class PermittedXComFilter(PermittedDagFilter):
     """A parameter that filters the permitted XComs for the user."""
 
     def to_orm(self, select: Select) -> Select:
-        return select.where(XComModel.dag_id.in_(self.value or set()))
+        return select.where(in_values(XComModel.dag_id, self.value))
 
 
 class PermittedTagFilter(PermittedDagFilter):
     """A parameter that filters the permitted dag tags for the user."""
 
     def to_orm(self, select: Select) -> Select:
-        return select.where(DagTag.dag_id.in_(self.value or set()))
+        return select.where(in_values(DagTag.dag_id, self.value))
 
 
 class PermittedDagVersionFilter(PermittedDagFilter):
     """A parameter that filters the permitted dag versions for the user."""
 
     def to_orm(self, select: Select) -> Select:
-        return select.where(DagVersion.dag_id.in_(self.value or set()))
+        return select.where(in_values(DagVersion.dag_id, self.value))
 
 
 class PermittedBackfillFilter(PermittedDagFilter):
     """A parameter that filters the permitted backfills for the user."""
 
     def to_orm(self, select: Select) -> Select:
-        return select.where(Backfill.dag_id.in_(self.value or set()))
+        return select.where(in_values(Backfill.dag_id, self.value))
 
 
 def permitted_dag_filter_factory(
@@ -322,7 +323,7 @@ def permitted_dag_filter_factory(
         user: GetUserDep,
         auth_manager: AuthManagerDep,
     ) -> PermittedDagFilter:
-        authorized_dags: set[str] = auth_manager.get_authorized_dag_ids(user=user, method=method)
+        authorized_dags: set[str] = auth_manager.get_cached_authorized_dag_ids(user=user, method=method)
         return filter_class(authorized_dags)
 
     return depends_permitted_dags_filter
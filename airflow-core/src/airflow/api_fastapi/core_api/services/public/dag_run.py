@@ -59,6 +59,7 @@ from airflow.api_fastapi.core_api.datamodels.task_instances import NewTaskRespon
 from airflow.api_fastapi.core_api.services.public.common import BulkService
 from airflow.listeners.listener import get_listener_manager
 from airflow.models.dagrun import DagRun, clear_partition_runs
+from airflow.models.state_rollup import recompute_state_rollups
 from airflow.models.taskinstance import TaskInstance
 from airflow.models.xcom import XCOM_RETURN_KEY, XComModel
 from airflow.utils.session import create_session_async
@@ -442,6 +443,7 @@ class BulkDagRunService(BulkService[BulkDAGRunBody]):
                 else to_delete_keys
             )
 
+            deleted_runs = []
             for dag_id, run_id in sorted(delete_keys):
                 dag_run = dag_run_map[(dag_id, run_id)]
                 if dag_run.state not in deletable_states:
@@ -456,6 +458,8 @@ class BulkDagRunService(BulkService[BulkDAGRunBody]):
                     )
                     continue
                 self.session.delete(dag_run)
+                deleted_runs.append((dag_id, dag_run.run_after))
                 results.success.append(f"{dag_id}.{run_id}")
+            recompute_state_rollups(deleted_runs, session=self.session)
         except HTTPException as e:
             results.errors.append({"error": f"{e.detail}", "status_code": e.status_code})
@@ -51,6 +51,7 @@ from airflow.api_fastapi.core_api.services.public.common import BulkService
 from airflow.configuration import conf
 from airflow.listeners.listener import get_listener_manager
 from airflow.models.dag import DagModel
+from airflow.models.state_rollup import recompute_state_rollups
 from airflow.models.taskinstance import TaskInstance as TI
 from airflow.serialization.definitions.dag import SerializedDAG
 from airflow.state.metastore import _get_db_backend
@@ -608,6 +609,7 @@ class BulkTaskInstanceService(BulkService[BulkTaskInstanceBody]):
             action.entities, results, method="DELETE", action_name=action.action.value
         )
 
+        deleted_tis: list[TI] = []
         try:
             # Handle deletion of specific (dag_id, dag_run_id, task_id, map_index) tuples
             if delete_specific_map_index_task_keys:
@@ -628,6 +630,7 @@ class BulkTaskInstanceService(BulkService[BulkTaskInstanceBody]):
                 for task_key in matched_task_keys:
                     dag_id, run_id, task_id, map_index = task_key
                     self.session.delete(task_instances_map[task_key])
+                    deleted_tis.append(task_instances_map[task_key])
                     results.success.append(f"{dag_id}.{run_id}.{task_id}[{map_index}]")
 
             # Handle deletion of all map indexes for certain (dag_id, dag_run_id, task_id) tuples
@@ -664,7 +667,11 @@ class BulkTaskInstanceService(BulkService[BulkTaskInstanceBody]):
 
                     for ti in all_task_instances:
                         self.session.delete(ti)
+                        deleted_tis.append(ti)
                         results.success.append(f"{dag_id}.{run_id}.{task_id}[{ti.map_index}]")
 
         except HTTPException as e:
             results.errors.append({"error": f"{e.detail}", "status_code": e.status_code})
+        recompute_state_rollups(
+            {(ti.dag_id, ti.dag_run.run_after) for ti in deleted_tis}, session=self.session
+        )
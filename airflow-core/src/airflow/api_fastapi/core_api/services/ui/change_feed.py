@@ -0,0 +1,226 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Change feed pushing Dag run and task instance state changes to the UI.
+
+Each API server process runs a single poller while clients are subscribed, so the database load does
+not grow with the number of open browser tabs. The poller only looks at active Dag runs (queued or
+running, or updated since the previous poll) and their task instances, which keeps every poll on
+indexed columns regardless of the size of the history.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+import attrs
+import structlog
+from sqlalchemy import or_, select, tuple_
+
+from airflow._shared.timezones import timezone
+from airflow.api_fastapi.core_api.datamodels.ui.change_feed import ChangeEvent
+from airflow.configuration import conf
+from airflow.models.dagrun import DagRun
+from airflow.models.taskinstance import TaskInstance
+from airflow.utils.helpers import chunks
+from airflow.utils.session import create_session_async
+from airflow.utils.state import State
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+log = structlog.get_logger(logger_name=__name__)
+
+# Rows are looked up a bit before the latest change seen, so changes committed by transactions that
+# started before it are not missed. Changes already published are recognized and skipped.
+CHANGE_FEED_LOOKBACK = timedelta(seconds=30)
+
+# Number of Dag runs whose task instances are looked up with a single query
+CHANGE_FEED_RUN_CHUNK_SIZE = 500
+
+# Batches buffered for a subscriber before it is told to resynchronize instead
+CHANGE_FEED_QUEUE_SIZE = 100
+
+
+@attrs.define
+class ChangeFeed:
+    """
+    Poll the database for Dag run and task instance state changes and fan them out to subscribers.
+
+    Subscribers receive one batch of events per poll, possibly empty, or ``None`` when they fell behind
+    and missed events, in which case they should reload their data.
+    """
+
+    interval: float
+    _subscribers: set[asyncio.Queue[list[ChangeEvent] | None]] = attrs.field(factory=set, init=False)
+    _poller: asyncio.Task | None = attrs.field(default=None, init=False)
+    # Active and recently updated Dag runs by primary key, with the last update published for them
+    _runs: dict[int, datetime | None] = attrs.field(factory=dict, init=False)
+    # Last update published for the task instances of these Dag runs, by Dag run primary key
+    _tis: dict[int, dict[UUID, datetime | None]] = attrs.field(factory=dict, init=False)
+    _since: datetime | None = attrs.field(default=None, init=False)
+
+    async def subscribe(self) -> AsyncGenerator[list[ChangeEvent] | None, None]:
+        """Yield the batches of events published from now on, until the consumer stops iterating."""
+        queue: asyncio.Queue[list[ChangeEvent] | None] = asyncio.Queue(maxsize=CHANGE_FEED_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        self._ensure_poller()
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._subscribers.discard(queue)
+            if not self._subscribers and self._poller is not None:
+                self._poller.cancel()
+                self._poller = None
+
+    def _ensure_poller(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._poller is not None and not self._poller.done() and self._poller.get_loop() is loop:
+            return
+        self._reset()
+        self._poller = loop.create_task(self._run())
+
+    def _reset(self) -> None:
+        self._runs.clear()
+        self._tis.clear()
+        self._since = None
+
+    async def _run(self) -> None:
+        while self._subscribers:
+            try:
+                events = await self.poll()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                log.exception("Failed to poll the change feed")
+                events = None
+                self._reset()
+            self.publish(events)
+            await asyncio.sleep(self.interval)
+
+    def publish(self, events: list[ChangeEvent] | None) -> None:
+        """Hand a batch of events to every subscriber, asking the ones that fell behind to resync."""
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(events)
+            except asyncio.QueueFull:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+
+    async def poll(self) -> list[ChangeEvent]:
+        """
+        Look for the changes made since the previous poll.
+
+        The first poll only records the current state of the active Dag runs and publishes nothing.
+        """
+        priming = self._since is None
+        start = self._since or timezone.utcnow()
+        since = start - CHANGE_FEED_LOOKBACK
+        events: list[ChangeEvent] = []
+        async with create_session_async() as session:
+            runs = (
+                await session.execute(
+                    select(DagRun.id, DagRun.dag_id, DagRun.run_id, DagRun.state, DagRun.updated_at).where(
+                        or_(
+                            DagRun.state.in_(State.unfinished_dr_states),
+                            # Runs that started and finished between two polls
+                            DagRun.updated_at > since,
+                            DagRun.id.in_(list(self._runs)),
+                        )
+                    )
+                )
+            ).all()
+            run_pks = {(run.dag_id, run.run_id): run.id for run in runs}
+            tis: list[Any] = []
+            for chunk in chunks(list(run_pks), CHANGE_FEED_RUN_CHUNK_SIZE):
+                tis.extend(
+                    await session.execute(
+                        select(
+                            TaskInstance.id,
+                            TaskInstance.dag_id,
+                            TaskInstance.run_id,
+                            TaskInstance.task_id,
+                            TaskInstance.map_index,
+                            TaskInstance.state,
+                            TaskInstance.updated_at,
+                        ).where(
+                            tuple_(TaskInstance.dag_id, TaskInstance.run_id).in_(chunk),
+                            TaskInstance.updated_at > since,
+                        )
+                    )
+                )
+
+        latest = start
+        for run in runs:
+            if self._runs.get(run.id, ...) != run.updated_at:
+                events.append(
+                    ChangeEvent(
+                        kind="dag_run",
+                        dag_id=run.dag_id,
+                        run_id=run.run_id,
+                        state=run.state,
+                        updated_at=run.updated_at,
+                    )
+                )
+            latest = _latest(latest, run.updated_at)
+        for ti in tis:
+            published = self._tis.setdefault(run_pks[(ti.dag_id, ti.run_id)], {})
+            if published.get(ti.id, ...) != ti.updated_at:
+                published[ti.id] = ti.updated_at
+                events.append(
+                    ChangeEvent(
+                        kind="task_instance",
+                        dag_id=ti.dag_id,
+                        run_id=ti.run_id,
+                        task_id=ti.task_id,
+                        map_index=ti.map_index,
+                        state=ti.state,
+                        updated_at=ti.updated_at,
+                    )
+                )
+            latest = _latest(latest, ti.updated_at)
+
+        # Dag runs that finished are followed as long as the next poll looks them up again, so their
+        # changes already published are recognized
+        next_since = latest - CHANGE_FEED_LOOKBACK
+        self._runs = {
+            run.id: run.updated_at
+            for run in runs
+            if run.state in State.unfinished_dr_states
+            or (run.updated_at is not None and run.updated_at > next_since)
+        }
+        self._tis = {run_pk: published for run_pk, published in self._tis.items() if run_pk in self._runs}
+        self._since = latest
+        return [] if priming else events
+
+
+def _latest(current: datetime, other: datetime | None) -> datetime:
+    if other is not None and other > current:
+        return other
+    return current
+
+
+@functools.cache
+def get_change_feed() -> ChangeFeed:
+    """Return the change feed of this API server, configured from ``[api]``."""
+    return ChangeFeed(interval=max(conf.getfloat("api", "change_feed_poll_interval", fallback=2.0), 0.1))
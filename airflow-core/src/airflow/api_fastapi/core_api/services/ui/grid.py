@@ -17,21 +17,29 @@
 
 from __future__ import annotations
 
+import functools
 from collections import Counter
-from collections.abc import Iterable, Mapping
+from collections.abc import Hashable, Iterable, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from threading import RLock
+from typing import TYPE_CHECKING, Any
 
 import structlog
+from cachetools import LRUCache, TTLCache
 
 from airflow.api_fastapi.common.parameters import state_priority
 from airflow.api_fastapi.core_api.services.ui.task_group import get_task_group_children_getter
-from airflow.models.taskmap import TaskMap
+from airflow.configuration import conf
 from airflow.serialization.definitions.baseoperator import SerializedBaseOperator
 from airflow.serialization.definitions.mappedoperator import SerializedMappedOperator
 from airflow.serialization.definitions.taskgroup import SerializedTaskGroup
 
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from airflow.serialization.definitions.dag import SerializedDAG
+
 log = structlog.get_logger(logger_name=__name__)
 
 
@@ -141,65 +149,138 @@ def _get_aggs_for_node(summary: GridNodeAgg) -> dict[str, Any]:
     }
 
 
-def _find_aggregates(
-    node: SerializedTaskGroup | SerializedBaseOperator | TaskMap,
-    parent_node: SerializedTaskGroup | SerializedBaseOperator | TaskMap | None,
-    ti_details: Mapping[str, GridNodeAgg],
-) -> Iterable[tuple[dict[str, Any], GridNodeAgg]]:
-    """Recursively fill the Task Group Map."""
-    node_id = node.node_id
-    parent_id = parent_node.node_id if parent_node else None
-    # Do not mutate ti_details by accidental key creation
-    summary = ti_details.get(node_id)
-    if summary is None:
-        summary = GridNodeAgg()
-
-    if node is None:
-        return
-    if isinstance(node, SerializedMappedOperator):
-        mapped_summary = summary.with_placeholder_state()
-        yield (
-            {
-                "task_id": node_id,
-                "task_display_name": node.task_display_name,
-                "type": "mapped_task",
-                "parent_id": parent_id,
-                **_get_aggs_for_node(mapped_summary),
-            },
-            mapped_summary,
-        )
+@dataclass(frozen=True)
+class GridPlanNode:
+    """One node of a flattened task group tree, see :func:`build_grid_plan`."""
 
-        return
-    if isinstance(node, SerializedTaskGroup):
-        children_summary = GridNodeAgg()
-        for child in get_task_group_children_getter()(node):
-            for child_node, child_summary in _find_aggregates(
-                node=child, parent_node=node, ti_details=ti_details
-            ):
-                if child_node["parent_id"] == node_id:
-                    children_summary.merge(child_summary)
-                yield child_node, child_summary
-        if node_id:
-            yield (
-                {
-                    "task_id": node_id,
-                    "task_display_name": node_id,
-                    "type": "group",
-                    "parent_id": parent_id,
-                    **_get_aggs_for_node(children_summary),
-                },
-                children_summary,
+    task_id: str
+    task_display_name: str
+    type: str
+    parent_id: str | None
+    # Positions, in the plan, of the direct children of a group
+    children: tuple[int, ...] = ()
+
+
+def build_grid_plan(task_group: SerializedTaskGroup) -> list[GridPlanNode]:
+    """
+    Flatten a task group tree into the list of grid nodes, in the order they are returned.
+
+    Groups come after their children, so the summaries of a run can be computed with a single pass
+    over the plan instead of walking the tree again for every run.
+    """
+    plan: list[GridPlanNode] = []
+    get_children = get_task_group_children_getter()
+
+    def visit(node: Any, parent_id: str | None) -> int | None:
+        node_id = node.node_id
+        if isinstance(node, SerializedMappedOperator):
+            plan.append(GridPlanNode(node_id, node.task_display_name, "mapped_task", parent_id))
+        elif isinstance(node, SerializedTaskGroup):
+            children = tuple(
+                index for child in get_children(node) if (index := visit(child, node_id)) is not None
             )
-        return
-    if isinstance(node, SerializedBaseOperator):
-        yield (
-            {
-                "task_id": node_id,
-                "task_display_name": node.task_display_name,
-                "type": "task",
-                "parent_id": parent_id,
-                **_get_aggs_for_node(summary),
-            },
-            summary,
-        )
-        return
+            if not node_id:
+                return None
+            plan.append(GridPlanNode(node_id, node_id, "group", parent_id, children))
+        elif isinstance(node, SerializedBaseOperator):
+            plan.append(GridPlanNode(node_id, node.task_display_name, "task", parent_id))
+        else:
+            return None
+        return len(plan) - 1
+
+    visit(task_group, None)
+    return plan
+
+
+def summarize_grid_plan(
+    plan: Iterable[GridPlanNode], ti_details: Mapping[str, GridNodeAgg]
+) -> Iterable[dict[str, Any]]:
+    """Aggregate the task instance summaries of a run over a plan built by :func:`build_grid_plan`."""
+    summaries: list[GridNodeAgg] = []
+    for node in plan:
+        if node.type == "group":
+            summary = GridNodeAgg()
+            for child in node.children:
+                summary.merge(summaries[child])
+        else:
+            # Do not mutate ti_details by accidental key creation
+            summary = ti_details.get(node.task_id)
+            if summary is None:
+                summary = GridNodeAgg()
+            if node.type == "mapped_task":
+                summary = summary.with_placeholder_state()
+        summaries.append(summary)
+        yield {
+            "task_id": node.task_id,
+            "task_display_name": node.task_display_name,
+            "type": node.type,
+            "parent_id": node.parent_id,
+            **_get_aggs_for_node(summary),
+        }
+
+
+_grid_plans: LRUCache[UUID | str, tuple[SerializedDAG, list[GridPlanNode]]] = LRUCache(maxsize=64)
+_grid_plans_lock = RLock()
+
+
+def get_grid_plan(dag_version_id: UUID | str, dag: SerializedDAG) -> list[GridPlanNode]:
+    """Return the grid plan of a Dag version, building it only the first time the version is seen."""
+    with _grid_plans_lock:
+        cached = _grid_plans.get(dag_version_id)
+    # A version can be re-serialized in place, the plan is only reused for the very same Dag object
+    if cached is not None and cached[0] is dag:
+        return cached[1]
+    plan = build_grid_plan(dag.task_group)
+    with _grid_plans_lock:
+        _grid_plans[dag_version_id] = (dag, plan)
+    return plan
+
+
+class GridSummaryCache:
+    """
+    Cache of the grid task instance summaries of finished Dag runs.
+
+    Entries are stored with a token describing the state of the run and of its task instances when
+    they were computed, and are only served while the run still has the same token, so changes made
+    through any API server or by the scheduler and workers are picked up on the next request.
+
+    :param maxsize: Maximum number of runs kept. 0 disables the cache.
+    :param ttl: Time-to-live of the entries, in seconds. 0 disables the TTL.
+    """
+
+    def __init__(self, maxsize: int, ttl: int) -> None:
+        self._entries: LRUCache[tuple[str, str], tuple[Hashable, str]] | None = None
+        if maxsize > 0:
+            self._entries = TTLCache(maxsize=maxsize, ttl=ttl) if ttl > 0 else LRUCache(maxsize=maxsize)
+        # cachetools caches are not thread-safe and the streaming endpoint runs in a thread pool
+        self._lock = RLock()
+
+    def get(self, dag_id: str, run_id: str, token: Hashable) -> str | None:
+        if self._entries is None:
+            return None
+        with self._lock:
+            entry = self._entries.get((dag_id, run_id))
+        if entry is None or entry[0] != token:
+            return None
+        return entry[1]
+
+    def set(self, dag_id: str, run_id: str, token: Hashable, summary: str) -> None:
+        if self._entries is None:
+            return
+        with self._lock:
+            self._entries[(dag_id, run_id)] = (token, summary)
+
+    def clear(self) -> None:
+        if self._entries is None:
+            return
+        with self._lock:
+            self._entries.clear()
+
+
+@functools.cache
+def get_grid_summary_cache() -> GridSummaryCache:
+    """Return the grid summary cache of this API server, configured from ``[api]``."""
+    return GridSummaryCache(
+        maxsize=max(conf.getint("api", "grid_summary_cache_size", fallback=256), 0),
+        ttl=max(conf.getint("api", "grid_summary_cache_ttl", fallback=600), 0),
+    )
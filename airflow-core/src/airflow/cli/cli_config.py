@@ -533,6 +533,14 @@ ARG_DB_CLEANUP_TIMESTAMP = Arg(
     type=parsedate,
     required=True,
 )
+ARG_DB_STATE_ROLLUP_START_DATE = Arg(
+    ("--start-date",),
+    help="The date or timestamp from which the Dag runs should be counted in the state rollups.\n"
+    "If no timezone info is supplied then dates are assumed to be in airflow default timezone.\n"
+    "Example: '2022-01-01 00:00:00+01:00'",
+    type=parsedate,
+    required=True,
+)
 ARG_DB_DRY_RUN = Arg(
     ("--dry-run",),
     help="Perform a dry run",
@@ -1046,6 +1054,20 @@ ARG_CAPACITY = Arg(
     type=positive_int(allow_zero=False),
     help="The maximum number of triggers that a Triggerer will run at one time.",
 )
+ARG_TRIGGERER_RUNNERS = Arg(
+    ("--runners",),
+    type=positive_int(allow_zero=False),
+    help=(
+        "The number of processes, each with its own event loop, the triggerer runs triggers in. "
+        "The capacity is split between them."
+    ),
+)
+ARG_TRIGGERS_LIMIT = Arg(
+    ("--limit",),
+    default=10,
+    type=positive_int(allow_zero=False),
+    help="The number of triggers to list.",
+)
 ARG_QUEUES = Arg(
     ("--queues",),
     type=string_list_type,
@@ -1802,6 +1824,12 @@ DB_COMMANDS = (
         func=lazy_load_command("airflow.cli.commands.db_command.drop_archived"),
         args=(ARG_DB_TABLES, ARG_YES),
     ),
+    ActionCommand(
+        name="backfill-state-rollups",
+        help="Compute the state rollups used by the dashboard for Dag runs before they were maintained",
+        func=lazy_load_command("airflow.cli.commands.db_command.backfill_state_rollups"),
+        args=(ARG_DB_STATE_ROLLUP_START_DATE,),
+    ),
 )
 CONNECTIONS_COMMANDS = (
     ActionCommand(
@@ -2037,6 +2065,19 @@ CONFIG_COMMANDS = (
     ),
 )
 
+TRIGGERS_COMMANDS = (
+    ActionCommand(
+        name="top",
+        help="List the triggers using the most CPU time",
+        description=(
+            "List the triggers using the most CPU time across all triggerers, as last reported by the "
+            "triggerer running them every [triggerer] load_report_interval seconds."
+        ),
+        func=lazy_load_command("airflow.cli.commands.trigger_command.triggers_top"),
+        args=(ARG_TRIGGERS_LIMIT, ARG_OUTPUT, ARG_VERBOSE),
+    ),
+)
+
 JOBS_COMMANDS = (
     ActionCommand(
         name="check",
@@ -2163,6 +2204,11 @@ core_commands: list[CLICommand] = [
         help="Manage jobs",
         subcommands=JOBS_COMMANDS,
     ),
+    GroupCommand(
+        name="triggers",
+        help="Inspect triggers",
+        subcommands=TRIGGERS_COMMANDS,
+    ),
     GroupCommand(
         name="db",
         help="Database operations",
@@ -2244,6 +2290,7 @@ core_commands: list[CLICommand] = [
             ARG_STDERR,
             ARG_LOG_FILE,
             ARG_CAPACITY,
+            ARG_TRIGGERER_RUNNERS,
             ARG_VERBOSE,
             ARG_SKIP_SERVE_LOGS,
             ARG_DEV,
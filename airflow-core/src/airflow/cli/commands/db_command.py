@@ -390,3 +390,13 @@ def drop_archived(args):
         table_names=args.tables,
         needs_confirm=not args.yes,
     )
+
+
+@cli_utils.action_cli(check_db=False)
+@providers_configuration_loaded
+def backfill_state_rollups(args):
+    """Compute the state rollups of past Dag runs."""
+    from airflow.models.state_rollup import backfill_state_rollups as _backfill_state_rollups
+
+    covered_from = _backfill_state_rollups(args.start_date)
+    print(f"State rollups now cover the Dag runs since {covered_from.isoformat()}")
@@ -0,0 +1,58 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Triggers sub-commands."""
+
+from __future__ import annotations
+
+from sqlalchemy import select
+
+from airflow.cli.simple_table import AirflowConsole
+from airflow.models.trigger import Trigger
+from airflow.utils import cli as cli_utils
+from airflow.utils.providers_configuration_loader import providers_configuration_loaded
+from airflow.utils.session import NEW_SESSION, provide_session
+
+NO_TRIGGER_LOADS_MSG = "No trigger load recorded yet."
+
+
+@cli_utils.action_cli
+@providers_configuration_loaded
+@provide_session
+def triggers_top(args, *, session=NEW_SESSION):
+    """List the triggers using the most CPU time, as last reported by the triggerers running them."""
+    triggers = session.scalars(
+        select(Trigger).where(Trigger.load.is_not(None)).order_by(Trigger.load.desc()).limit(args.limit)
+    ).all()
+    if not triggers:
+        print(NO_TRIGGER_LOADS_MSG)
+        return
+    AirflowConsole().print_as(
+        data=triggers,
+        output=args.output,
+        mapper=lambda trigger: {
+            "id": trigger.id,
+            "classpath": trigger.classpath,
+            "triggerer_id": trigger.triggerer_id,
+            "load (cpu s/min)": round(trigger.load, 3),
+            "task_instance": (
+                f"{ti.dag_id}/{ti.run_id}/{ti.task_id}/{ti.map_index}"
+                if (ti := trigger.task_instance)
+                else None
+            ),
+        },
+    )
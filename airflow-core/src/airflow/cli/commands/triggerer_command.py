@@ -18,10 +18,13 @@
 
 from __future__ import annotations
 
+import logging
+import signal
 from collections.abc import Generator
 from contextlib import contextmanager
 from functools import partial
 from multiprocessing import Process
+from multiprocessing.connection import wait
 
 from airflow.cli.commands.daemon_utils import run_command_with_daemon_option
 from airflow.configuration import conf
@@ -33,6 +36,8 @@ from airflow.utils.memray_utils import MemrayTraceComponents, enable_memray_trac
 from airflow.utils.process_utils import set_component_mp_start_method
 from airflow.utils.providers_configuration_loader import providers_configuration_loaded
 
+log = logging.getLogger(__name__)
+
 
 @contextmanager
 def _serve_logs(skip_serve_logs: bool = False) -> Generator[None, None, None]:
@@ -51,6 +56,84 @@ def _serve_logs(skip_serve_logs: bool = False) -> Generator[None, None, None]:
             sub_proc.terminate()
 
 
+def _run_triggerer_job(
+    capacity: int | None,
+    triggerer_heartrate: float,
+    queues: set[str] | None,
+    team_name: str | None,
+) -> None:
+    triggerer_job_runner = TriggererJobRunner(
+        job=Job(heartrate=triggerer_heartrate), capacity=capacity, queues=queues, team_name=team_name
+    )
+    run_job(job=triggerer_job_runner.job, execute_callable=triggerer_job_runner._execute)
+
+
+def _split_capacity(capacity: int, runners: int) -> list[int]:
+    """Split the capacity of the triggerer as evenly as possible between its runner processes."""
+    if runners > capacity:
+        raise AirflowConfigException(
+            f"Cannot start {runners} triggerer runners with a total capacity of {capacity}."
+        )
+    return [capacity // runners + (1 if i < capacity % runners else 0) for i in range(runners)]
+
+
+def _exit_on_signal(signum, frame) -> None:
+    """Leave the wait for the runner processes, so that they are stopped before the triggerer exits."""
+    log.info("Received %s, stopping the triggerer processes", signal.Signals(signum).name)
+    raise SystemExit(0)
+
+
+def _run_triggerer_jobs(
+    capacity: int | None,
+    triggerer_heartrate: float,
+    queues: set[str] | None,
+    team_name: str | None,
+    runners: int,
+) -> None:
+    """
+    Run several triggerer jobs, each in its own process with its own event loop.
+
+    Each process is a regular triggerer job, so triggers are spread between them, health checked and
+    reassigned when one dies exactly like between triggerers running on different hosts. If any of the
+    processes exits, the others are stopped too and the command exits with a non-zero code, so the
+    whole triggerer gets restarted. SIGTERM and SIGINT stop all the processes before the command exits,
+    so that none of them is left running and holding triggers.
+    """
+    if capacity is None:
+        capacity = conf.getint("triggerer", "capacity")
+    processes = [
+        Process(
+            target=_run_triggerer_job,
+            args=(runner_capacity, triggerer_heartrate, queues, team_name),
+            name=f"triggerer-runner-{i}",
+        )
+        for i, runner_capacity in enumerate(_split_capacity(capacity, runners))
+    ]
+    for process in processes:
+        process.start()
+    previous_handlers = {
+        signum: signal.signal(signum, _exit_on_signal) for signum in (signal.SIGTERM, signal.SIGINT)
+    }
+    try:
+        exited = wait([process.sentinel for process in processes])
+        exitcode = 0
+        for process in processes:
+            if process.sentinel in exited:
+                log.error("Triggerer process %s exited with code %s", process.name, process.exitcode)
+                exitcode = exitcode or process.exitcode or 1
+    finally:
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join(timeout=conf.getint("triggerer", "on_kill_timeout", fallback=30))
+            if process.is_alive():
+                process.kill()
+    raise SystemExit(exitcode)
+
+
 @enable_memray_trace(component=MemrayTraceComponents.triggerer)
 def triggerer_run(
     skip_serve_logs: bool,
@@ -58,13 +141,14 @@ def triggerer_run(
     triggerer_heartrate: float,
     queues: set[str] | None = None,
     team_name: str | None = None,
+    runners: int = 1,
 ):
     set_component_mp_start_method("triggerer")
     with _serve_logs(skip_serve_logs):
-        triggerer_job_runner = TriggererJobRunner(
-            job=Job(heartrate=triggerer_heartrate), capacity=capacity, queues=queues, team_name=team_name
-        )
-        run_job(job=triggerer_job_runner.job, execute_callable=triggerer_job_runner._execute)
+        if runners > 1:
+            _run_triggerer_jobs(capacity, triggerer_heartrate, queues, team_name, runners)
+        else:
+            _run_triggerer_job(capacity, triggerer_heartrate, queues, team_name)
 
 
 @cli_utils.action_cli
@@ -95,13 +179,14 @@ def triggerer(args):
 
     queues = set(args.queues) if args.queues else None
     triggerer_heartrate = conf.getfloat("triggerer", "JOB_HEARTBEAT_SEC")
+    runners = args.runners or conf.getint("triggerer", "runners", fallback=1)
 
     if cli_utils.should_enable_hot_reload(args):
         from airflow.cli.hot_reload import run_with_reloader
 
         run_with_reloader(
             lambda: triggerer_run(
-                args.skip_serve_logs, args.capacity, triggerer_heartrate, queues, team_name
+                args.skip_serve_logs, args.capacity, triggerer_heartrate, queues, team_name, runners
             ),
             process_name="triggerer",
         )
@@ -111,7 +196,7 @@ def triggerer(args):
         args=args,
         process_name="triggerer",
         callback=lambda: triggerer_run(
-            args.skip_serve_logs, args.capacity, triggerer_heartrate, queues, team_name
+            args.skip_serve_logs, args.capacity, triggerer_heartrate, queues, team_name, runners
         ),
         should_setup_logging=True,
     )
@@ -20,6 +20,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from typing import Literal
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
@@ -43,6 +44,9 @@ class RunTrigger(BaseModel):
     dag_data: dict | None = (
         None  # Serialized DagModel in dict format so it can be deserialized in trigger subprocess.
     )
+    # Dag version of ``dag_data``. The payload of a version is only sent with the first trigger of that
+    # version, later triggers carry the version id alone and reuse the Dag already loaded by the runner.
+    dag_version_id: UUID | None = None
     dag_run_data: dict | None = (
         None  # Serialized DagRun data in dict format so it can be deserialized in trigger subprocess.
     )
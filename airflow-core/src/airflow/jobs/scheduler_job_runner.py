@@ -104,6 +104,7 @@ from airflow.models.dagrun import DagRun
 from airflow.models.dagwarning import DagWarning, DagWarningType
 from airflow.models.pool import normalize_pool_name_for_stats
 from airflow.models.serialized_dag import SerializedDagModel
+from airflow.models.state_rollup import refresh_state_rollups
 from airflow.models.taskinstance import TaskInstance
 from airflow.models.taskinstancekey import TaskInstanceKey
 from airflow.models.team import Team
@@ -334,6 +335,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         self._scheduler_use_job_schedule = conf.getboolean("scheduler", "use_job_schedule", fallback=True)
         self._parallelism = conf.getint("core", "parallelism")
         self._multi_team = conf.getboolean("core", "multi_team")
+        self._prioritize_resumed_tasks = conf.getboolean(
+            "scheduler", "prioritize_resumed_deferred_tasks", fallback=False
+        )
         self._dag_tags_in_metrics = conf.getboolean("metrics", "dag_tags_in_metrics", fallback=False)
         self._max_partition_dag_runs_per_loop = MAX_PARTITION_DAG_RUNS_PER_LOOP
         self._dag_id_to_team_name: dict[str, str | None] = {}
@@ -594,6 +598,17 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
         pool_num_starving_tasks: dict[str, int] = Counter()
 
+        # Tasks resuming from deferral are identified by their next_method. When enabled, they are
+        # examined ahead of other scheduled tasks, whatever their priority.
+        resumed_first = (
+            case((TI.next_method.is_not(None), 0), else_=1) if self._prioritize_resumed_tasks else None
+        )
+        ti_order_by = [-TI.priority_weight, DR.logical_date, TI.map_index]
+        resumed_first_columns = []
+        if resumed_first is not None:
+            ti_order_by.insert(0, resumed_first)
+            resumed_first_columns.append(resumed_first.label("resumed_first_for_ordering"))
+
         for loop_count in itertools.count(start=1):
             num_starved_pools = len(starved_pools)
             num_starved_dags = len(starved_dags)
@@ -627,7 +642,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 .where(
                     func.coalesce(dr_task_concurrency_subquery.c.task_per_dr_count, 0) < DM.max_active_tasks
                 )
-                .order_by(-TI.priority_weight, DR.logical_date, TI.map_index)
+                .order_by(*ti_order_by)
             )
 
             # Starvation filters should be applied before computing the row_num based on the
@@ -655,7 +670,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     func.row_number()
                     .over(
                         partition_by=[TI.dag_id, TI.run_id],
-                        order_by=[-TI.priority_weight, DR.logical_date, TI.map_index],
+                        order_by=ti_order_by,
                     )
                     .label("row_num"),
                     DM.max_active_tasks.label("dr_max_active_tasks"),
@@ -663,6 +678,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     TI.priority_weight.label("priority_weight_for_ordering"),
                     DR.logical_date.label("logical_date_for_ordering"),
                     TI.map_index.label("map_index_for_ordering"),
+                    *resumed_first_columns,
                 )
             ).subquery()
 
@@ -680,6 +696,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 .where(ranked_query.c.row_num <= ranked_query.c.dr_max_active_tasks)
                 # Add the order_by columns from the ranked query for sqlite.
                 .order_by(
+                    *(ranked_query.c[column.name] for column in resumed_first_columns),
                     -ranked_query.c.priority_weight_for_ordering,
                     ranked_query.c.logical_date_for_ordering,
                     ranked_query.c.map_index_for_ordering,
@@ -1805,6 +1822,10 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             action=self._reap_stale_connection_tests,
         )
 
+        state_rollup_refresh_interval = conf.getfloat("scheduler", "state_rollup_refresh_interval")
+        if state_rollup_refresh_interval > 0:
+            timers.call_regular_interval(state_rollup_refresh_interval, refresh_state_rollups)
+
         idle_count = 0
 
         for loop_count in itertools.count(start=1):
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import asyncio
 import functools
+import heapq
 import logging
 import math
 import os
@@ -26,14 +27,14 @@ import signal
 import sys
 import threading
 import time
-from collections import deque
-from collections.abc import Callable, Generator, Hashable, Iterable, Iterator
+from collections import defaultdict, deque
+from collections.abc import Callable, Coroutine, Generator, Hashable, Iterable, Iterator
 from contextlib import contextmanager, suppress
 from datetime import datetime
 from socket import socket
 from traceback import format_exception
 from typing import TYPE_CHECKING, Annotated, Any, BinaryIO, ClassVar, Literal, NamedTuple, TextIO, TypedDict
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import anyio
 import attrs
@@ -50,6 +51,7 @@ from airflow._shared.module_loading import import_string
 from airflow._shared.observability.metrics import stats
 from airflow._shared.timezones import timezone
 from airflow.configuration import conf
+from airflow.exceptions import AirflowConfigException
 from airflow.executors import workloads
 from airflow.executors.workloads.task import TaskInstanceDTO
 from airflow.jobs.base_job_runner import BaseJobRunner
@@ -130,6 +132,7 @@ from airflow.sdk.execution_time.task_runner import RuntimeTaskInstance
 from airflow.serialization.serialized_objects import DagSerialization
 from airflow.triggers.base import BaseEventTrigger, BaseTrigger, DiscrimatedTriggerEvent, TriggerEvent
 from airflow.triggers.shared_stream import SharedStreamManager
+from airflow.triggers.timer import TriggerTimer
 from airflow.utils.helpers import log_filename_template_renderer, prune_dict
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.session import create_session, provide_session
@@ -144,6 +147,7 @@ if TYPE_CHECKING:
     from airflow.sdk.api.client import Client
     from airflow.sdk.definitions.context import Context
     from airflow.sdk.types import RuntimeTaskInstanceProtocol as RuntimeTI
+    from airflow.serialization.definitions.dag import SerializedDAG
 
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
@@ -179,6 +183,59 @@ def _make_trigger_span(
     return tracer.start_as_current_span(span_name, attributes=attributes, context=parent_context)
 
 
+class _MeteredCoroutine:
+    """
+    Drive a coroutine one step at a time, reporting the CPU and wall time each step takes.
+
+    A step runs the coroutine from one suspension point to the next, i.e. one go of a
+    trigger running on the event loop.
+    """
+
+    def __init__(self, coro: Coroutine[Any, Any, Any], on_step: Callable[[float, float], None]) -> None:
+        self._coro = coro
+        self._on_step = on_step
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        coro = self._coro
+        value: Any = None
+        exc: BaseException | None = None
+        while True:
+            start, cpu_start = time.monotonic(), time.thread_time()
+            try:
+                yielded = coro.send(value) if exc is None else coro.throw(exc)
+            except StopIteration as e:
+                return e.value
+            finally:
+                self._on_step(time.thread_time() - cpu_start, time.monotonic() - start)
+            try:
+                value, exc = (yield yielded), None
+            except GeneratorExit:
+                coro.close()
+                raise
+            except BaseException as e:
+                value, exc = None, e
+
+
+async def _metered(coro: Coroutine[Any, Any, Any], on_step: Callable[[float, float], None]) -> Any:
+    return await _MeteredCoroutine(coro, on_step)
+
+
+def _get_event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return the event loop factory configured for the trigger runner, or None for the default loop."""
+    factory_path = conf.get("triggerer", "event_loop_factory", fallback="")
+    if not factory_path:
+        return None
+    if sys.version_info < (3, 11):
+        raise AirflowConfigException("[triggerer] event_loop_factory requires Python 3.11 or later")
+    try:
+        return import_string(factory_path)
+    except ImportError as e:
+        raise AirflowConfigException(
+            f"Cannot import the event loop factory {factory_path!r} set in [triggerer] event_loop_factory, "
+            "is the package providing it installed?"
+        ) from e
+
+
 __all__ = [
     "TriggerRunner",
     "TriggerRunnerSupervisor",
@@ -332,12 +389,16 @@ class messages:
         # Format of list[str] is the exc traceback format
         failures: list[tuple[int, list[str] | None]] | None = None
         finished: list[int] | None = None
+        # Load of the running triggers, in CPU seconds per minute; only sent once per report interval
+        loads: list[tuple[int, float]] | None = None
 
     class TriggerStateSync(BaseModel):
         type: Literal["TriggerStateSync"] = "TriggerStateSync"
 
         to_create: list[workloads.RunTrigger]
         to_cancel: set[int]
+        # Dag versions no running trigger uses any more; the runner drops the Dags it loaded for them.
+        dags_released: list[UUID] | None = None
         # Seqs of shared-stream trigger events the supervisor has persisted
         # since the previous sync; the runner releases the matching broker
         # advances on receipt.
@@ -491,6 +552,8 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
 
     health_check_threshold = conf.getint("triggerer", "triggerer_health_check_threshold")
     runner_health_check_threshold = conf.getfloat("triggerer", "runner_health_check_threshold")
+    # Clamped to 1, a batch size below that would never drain ``events``.
+    event_batch_size = max(1, conf.getint("triggerer", "event_batch_size", fallback=500))
 
     runner: TriggerRunner | None = None
     stop: bool = False
@@ -528,6 +591,17 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
     # Outbound queue of failed triggers
     failed_triggers: deque[tuple[int, list[str] | None]] = attrs.field(factory=deque, init=False)
 
+    # IDs of the triggers using each Dag version already sent to the async process. The serialized Dag of a
+    # version is only sent with the first trigger of that version, and released once none of them run.
+    dag_version_triggers: dict[UUID, set[int]] = attrs.field(factory=dict, init=False)
+    trigger_dag_versions: dict[int, UUID] = attrs.field(factory=dict, init=False)
+
+    # Dag versions to tell the async process to forget when it next checks in
+    released_dag_versions: deque[UUID] = attrs.field(factory=deque, init=False)
+
+    # Trigger loads reported by the async process, waiting to be persisted
+    trigger_loads: list[tuple[int, float]] = attrs.field(factory=list, init=False)
+
     def is_alive(self) -> bool:
         # Set by `_service_subprocess` in the loop
         return self._exit_code is None
@@ -590,9 +664,14 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                 self.events.extend(msg.events)
             if msg.failures:
                 self.failed_triggers.extend(msg.failures)
+                for id, _ in msg.failures:
+                    self._release_dag_version(id)
+            if msg.loads:
+                self.trigger_loads.extend(msg.loads)
             for id in msg.finished or ():
                 self.running_triggers.discard(id)
                 self.cancelling_triggers.discard(id)
+                self._release_dag_version(id)
                 if factory := self.logger_cache.pop(id, None):
                     try:
                         factory.upload_to_remote()
@@ -608,10 +687,15 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
             while self.persisted_event_seqs:
                 events_persisted.append(self.persisted_event_seqs.popleft())
 
+            dags_released: list[UUID] = []
+            while self.released_dag_versions:
+                dags_released.append(self.released_dag_versions.popleft())
+
             response = messages.TriggerStateSync(
                 to_create=[],
                 to_cancel=self.cancelling_triggers,
                 events_persisted=events_persisted or None,
+                dags_released=dags_released or None,
             )
 
             # Pull out of these dequeues in a thread-safe manner
@@ -715,6 +799,7 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
 
         self.handle_events()
         self.handle_failed_triggers()
+        self.handle_trigger_loads()
         self.clean_unused()
         self.heartbeat()
 
@@ -764,20 +849,27 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
     def handle_events(self):
         """Dispatch outbound events to the Trigger model which pushes them to the relevant task instances."""
         while self.events:
-            entry = self.events.popleft()
-            # Tell the model to wake up its tasks
-            self.on_trigger_event(trigger_id=entry.trigger_id, event=entry.event)
-            # Only reached when on_trigger_event returned, i.e. the event was
-            # persisted; a raise above leaves the seq unconfirmed so the
+            batch = [self.events.popleft() for _ in range(min(len(self.events), self.event_batch_size))]
+            # Tell the model to wake up their tasks
+            self.on_trigger_events(batch)
+            # Only reached when on_trigger_events returned, i.e. the whole batch
+            # was persisted; a raise above leaves the seqs unconfirmed so the
             # bound shared-stream advance fails out and the broker redelivers.
-            if entry.persist_seq is not None:
-                self.persisted_event_seqs.append(entry.persist_seq)
-            # Emit stat event
-            stats.incr("triggers.succeeded", tags=prune_dict({"team_name": self.team_name}))
-
-    def on_trigger_event(self, trigger_id: int, event: TriggerEvent) -> None:
-        """Record that a trigger fired an event."""
-        Trigger.submit_event(trigger_id=trigger_id, event=event)
+            for entry in batch:
+                if entry.persist_seq is not None:
+                    self.persisted_event_seqs.append(entry.persist_seq)
+                # Emit stat event
+                stats.incr("triggers.succeeded", tags=prune_dict({"team_name": self.team_name}))
+
+    def on_trigger_events(self, entries: list[TriggerEventEntry]) -> None:
+        """Record that triggers fired events, all in a single transaction."""
+        Trigger.submit_events([(entry.trigger_id, entry.event) for entry in entries])
+
+    def handle_trigger_loads(self) -> None:
+        """Persist the load measured for running triggers, so that assignment can balance it."""
+        if self.trigger_loads:
+            loads, self.trigger_loads = self.trigger_loads, []
+            Trigger.update_loads(loads)
 
     def clean_unused(self) -> None:
         """Remove triggers that are no longer needed."""
@@ -875,13 +967,11 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
             ti=ser_ti,  # type: ignore
         )
 
-        serialized_dag_model = dag_bag.get_serialized_dag_model(
-            version_id=trigger.task_instance.dag_version_id,
-            session=session,
-        )
+        dag_version_id = trigger.task_instance.dag_version_id
+        dag = dag_bag.get_dag(version_id=dag_version_id, session=session)
 
-        if serialized_dag_model:
-            task = serialized_dag_model.dag.get_task(trigger.task_instance.task_id)
+        if dag:
+            task = dag.get_task(trigger.task_instance.task_id)
 
             # When a TaskInstance of a Trigger contains a task with start_from_trigger enabled,
             # it means we need to load the SerializedDagModel so we can build a RuntimeTaskInstance later on which
@@ -890,13 +980,31 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                 log.info("Start from trigger enabled for task %s", task.task_id)
                 dag_run = trigger.task_instance.get_dagrun(session=session)
 
+                # The async process keeps the Dags it was sent, so only the first trigger of a
+                # version carries the serialized Dag; the others reference it by version id.
+                dag_data = None
+                if dag_version_id not in self.dag_version_triggers:
+                    serialized_dag_model = dag_bag.get_serialized_dag_model(
+                        version_id=dag_version_id, session=session
+                    )
+                    if serialized_dag_model is None:
+                        log.warning(
+                            "Serialized Dag of the trigger's task disappeared, skipping the trigger",
+                            ti_id=trigger.task_instance.id,
+                        )
+                        return None
+                    dag_data = serialized_dag_model.data
+                self.dag_version_triggers.setdefault(dag_version_id, set()).add(trigger.id)
+                self.trigger_dag_versions[trigger.id] = dag_version_id
+
                 return workloads.RunTrigger(
                     id=trigger.id,
                     classpath=trigger.classpath,
                     encrypted_kwargs=trigger.encrypted_kwargs,
                     ti=ser_ti,
                     timeout_after=trigger.task_instance.trigger_timeout,
-                    dag_data=serialized_dag_model.data,
+                    dag_data=dag_data,
+                    dag_version_id=dag_version_id,
                     dag_run_data=dag_run.dag_run_data.model_dump(exclude_unset=True),
                 )
         return workloads.RunTrigger(
@@ -907,6 +1015,16 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
             timeout_after=trigger.task_instance.trigger_timeout,
         )
 
+    def _release_dag_version(self, trigger_id: int) -> None:
+        """Forget that ``trigger_id`` uses its Dag version, releasing the version if it was the last user."""
+        if (dag_version_id := self.trigger_dag_versions.pop(trigger_id, None)) is None:
+            return
+        trigger_ids = self.dag_version_triggers[dag_version_id]
+        trigger_ids.discard(trigger_id)
+        if not trigger_ids:
+            del self.dag_version_triggers[dag_version_id]
+            self.released_dag_versions.append(dag_version_id)
+
     def fetch_trigger_details(self, trigger_ids: set[int], *, session: Session) -> dict[int, Trigger]:
         """Fetch trigger rows by ID."""
         return Trigger.bulk_fetch(trigger_ids, session=session)
@@ -922,6 +1040,15 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
         with create_session() as session:
             new_triggers = self.fetch_trigger_details(new_trigger_ids, session=session)
             trigger_ids_with_non_task_associations = self.fetch_non_task_trigger_ids(session=session)
+            # Load the Dag of every version the new triggers need in one go, rather than once per trigger
+            dag_bag.get_dags(
+                {
+                    trigger.task_instance.dag_version_id
+                    for trigger in new_triggers.values()
+                    if trigger.task_instance is not None and trigger.task_instance.dag_version_id
+                },
+                session=session,
+            )
             to_create: list[workloads.RunTrigger] = []
             for new_trigger_id in new_trigger_ids:
                 # Check it didn't vanish in the meantime
@@ -1181,6 +1308,12 @@ class TriggerRunner:
     # Outbound queue of failed triggers
     failed_triggers: deque[tuple[int, BaseException | None]]
 
+    # CPU time spent running each trigger since the last load report
+    trigger_cpu_time: defaultdict[int, float]
+
+    # Dags sent by the supervisor for start_from_trigger tasks, by Dag version
+    dags: dict[UUID, SerializedDAG]
+
     # Team associated with this triggerer instance.
     team_name: str | None
 
@@ -1201,6 +1334,11 @@ class TriggerRunner:
         self.to_cancel = deque()
         self.events = deque()
         self.failed_triggers = deque()
+        self.trigger_cpu_time = defaultdict(float)
+        self.dags = {}
+        self.load_report_interval = conf.getfloat("triggerer", "load_report_interval", fallback=60.0)
+        self.hot_triggers_count = conf.getint("triggerer", "hot_triggers_count", fallback=5)
+        self._last_load_report = time.monotonic()
         self.team_name = None
         self.job_id = None
         self._stop_event = None
@@ -1213,6 +1351,7 @@ class TriggerRunner:
         self.blocked_main_thread_warning_threshold = conf.getfloat(
             "triggerer", "blocked_main_thread_warning_threshold"
         )
+        self._timer = TriggerTimer()
 
     def _handle_signal(self, signum, frame) -> None:
         """Handle termination signals gracefully."""
@@ -1229,7 +1368,11 @@ class TriggerRunner:
         try:
             signal.signal(signal.SIGINT, self._handle_signal)
             signal.signal(signal.SIGTERM, self._handle_signal)
-            asyncio.run(self.arun())
+            if loop_factory := _get_event_loop_factory():
+                with asyncio.Runner(loop_factory=loop_factory) as runner:
+                    runner.run(self.arun())
+            else:
+                asyncio.run(self.arun())
         finally:
             if prev_ctx is None:
                 os.environ.pop("_AIRFLOW_PROCESS_CONTEXT", None)
@@ -1324,14 +1467,32 @@ class TriggerRunner:
 
         await self.comms_decoder.start_reader()
 
+    def get_workload_dag(self, workload: workloads.RunTrigger) -> SerializedDAG | None:
+        """
+        Return the Dag of a ``start_from_trigger`` workload, or None for other workloads.
+
+        The supervisor only sends the serialized Dag of a version with the first trigger of that
+        version, so it is kept until the supervisor releases the version.
+        """
+        if workload.dag_data is not None:
+            dag = DagSerialization.from_dict(workload.dag_data)
+            if workload.dag_version_id is not None:
+                self.dags[workload.dag_version_id] = dag
+            return dag
+        if workload.dag_version_id is not None:
+            if (dag := self.dags.get(workload.dag_version_id)) is None:
+                raise RuntimeError(f"Dag version {workload.dag_version_id} was not sent by the supervisor")
+            return dag
+        return None
+
     @classmethod
     def create_runtime_ti(
-        cls, task_instance: TaskInstanceDTO, encoded_dag: dict, dag_run_data: dict
+        cls, task_instance: TaskInstanceDTO, dag: SerializedDAG, dag_run_data: dict
     ) -> RuntimeTaskInstance:
         from airflow.api_fastapi.execution_api.datamodels.taskinstance import DagRun as DRDataModel
         from airflow.sdk.api.datamodels._generated import TIRunContext
 
-        task = DagSerialization.from_dict(encoded_dag).get_task(task_instance.task_id)
+        task = dag.get_task(task_instance.task_id)
 
         # I need to recreate a TaskInstance from task_runner before invoking get_template_context (airflow.executors.workloads.TaskInstance)
         return RuntimeTaskInstance.model_construct(
@@ -1359,6 +1520,16 @@ class TriggerRunner:
             if trigger_id in self.triggers:
                 self.log.warning("Trigger %s had insertion attempted twice", trigger_id)
                 continue
+            # Load the Dag first: when it was sent along with this trigger, the next triggers of the same
+            # Dag version rely on it being kept even if this one fails.
+            try:
+                dag = self.get_workload_dag(workload)
+            except BaseException as e:
+                self.log.error(
+                    "Trigger failed to load its Dag", error=e, dag_version_id=workload.dag_version_id
+                )
+                self.failed_triggers.append((trigger_id, e))
+                continue
             try:
                 trigger_class = self.get_trigger_by_classpath(workload.classpath)
             except BaseException as e:
@@ -1385,8 +1556,8 @@ class TriggerRunner:
                     trigger_name = f"{ti.dag_id}/{ti.run_id}/{ti.task_id}/{ti.map_index}/{ti.try_number} (ID {trigger_id})"
                     trigger_instance = trigger_class(**deserialised_kwargs)
 
-                    if workload.dag_data:
-                        runtime_ti = self.create_runtime_ti(ti, workload.dag_data, workload.dag_run_data)
+                    if dag is not None and workload.dag_run_data is not None:
+                        runtime_ti = self.create_runtime_ti(ti, dag, workload.dag_run_data)
                         context = runtime_ti.get_template_context()
                         trigger_instance.task_instance = runtime_ti
                     else:
@@ -1417,7 +1588,10 @@ class TriggerRunner:
 
             self.triggers[trigger_id] = {
                 "task": asyncio.create_task(
-                    self.run_trigger(trigger_id, trigger_instance, workload.timeout_after, context),
+                    _metered(
+                        self.run_trigger(trigger_id, trigger_instance, workload.timeout_after, context),
+                        functools.partial(self._record_step, trigger_id),
+                    ),
                     name=trigger_name,
                 ),
                 "is_watcher": isinstance(trigger_instance, BaseEventTrigger),
@@ -1496,6 +1670,49 @@ class TriggerRunner:
             await asyncio.sleep(0)
         return finished_ids
 
+    def _record_step(self, trigger_id: int, cpu_time: float, wall_time: float) -> None:
+        self.trigger_cpu_time[trigger_id] += cpu_time
+        if wall_time > self.blocked_main_thread_warning_threshold:
+            # Unlike the watchdog, we know exactly which trigger held the event loop here
+            self.log.warning(
+                "Trigger blocked the triggerer's async thread for %.2f seconds (%.2f seconds of CPU time) "
+                "in a single step, it should await rather than block.",
+                wall_time,
+                cpu_time,
+                trigger_id=trigger_id,
+                name=details["name"] if (details := self.triggers.get(trigger_id)) else None,
+            )
+
+    def collect_trigger_loads(self) -> list[tuple[int, float]] | None:
+        """Return the load of each running trigger, in CPU seconds per minute, once per report interval."""
+        now = time.monotonic()
+        elapsed = now - self._last_load_report
+        if self.load_report_interval <= 0 or elapsed < self.load_report_interval:
+            return None
+        self._last_load_report = now
+        loads = [
+            (trigger_id, self.trigger_cpu_time.get(trigger_id, 0.0) * 60 / elapsed)
+            for trigger_id in self.triggers
+        ]
+        self.trigger_cpu_time.clear()
+        tags = prune_dict({"team_name": self.team_name})
+        for _, load in loads:
+            stats.timing("triggerer.trigger_cpu_time", load * 1000, tags=tags)
+        if self.hot_triggers_count and loads:
+            hot_triggers = heapq.nlargest(self.hot_triggers_count, loads, key=lambda entry: entry[1])
+            self.log.info(
+                "Triggers using the most CPU time",
+                triggers=[
+                    {
+                        "trigger_id": trigger_id,
+                        "name": self.triggers[trigger_id]["name"],
+                        "load": round(load, 3),
+                    }
+                    for trigger_id, load in hot_triggers
+                ],
+            )
+        return loads or None
+
     def process_trigger_events(self, finished_ids: list[int]) -> messages.TriggerStateChanges:
         # Copy out of our dequeues in threadsafe manner to sync state with parent
         events_to_send: list[TriggerEventEntry] = []
@@ -1513,6 +1730,7 @@ class TriggerRunner:
             events=events_to_send if events_to_send else None,
             finished=finished_ids if finished_ids else None,
             failures=failures_to_send if failures_to_send else None,
+            loads=self.collect_trigger_loads(),
         )
 
     def sanitize_trigger_events(self, msg: messages.TriggerStateChanges) -> messages.TriggerStateChanges:
@@ -1541,6 +1759,7 @@ class TriggerRunner:
             events=events_to_send if events_to_send else None,
             finished=msg.finished,
             failures=msg.failures,
+            loads=msg.loads,
         )
 
     async def sync_state_to_supervisor(self, finished_ids: list[int]) -> None:
@@ -1554,6 +1773,8 @@ class TriggerRunner:
             resp = await self.asend(self.sanitize_trigger_events(msg))
 
         if resp:
+            for dag_version_id in resp.dags_released or ():
+                self.dags.pop(dag_version_id, None)
             self.to_create.extend(resp.to_create)
             self.to_cancel.extend(resp.to_cancel)
             if resp.events_persisted:
@@ -1591,6 +1812,11 @@ class TriggerRunner:
             # We allow a generous amount of buffer room for now, since it might
             # be a busy event loop.
             time_elapsed = time.monotonic() - last_run
+            stats.timing(
+                "triggerer.event_loop_lag",
+                max(time_elapsed - 0.1, 0) * 1000,
+                tags=prune_dict({"team_name": self.team_name}),
+            )
             if time_elapsed > self.blocked_main_thread_warning_threshold:
                 await self.log.ainfo(
                     "Triggerer's async thread was blocked for %.2f seconds, "
@@ -1660,6 +1886,10 @@ class TriggerRunner:
                     )
                     event_stream = event_trigger.filter_shared_stream(shared_stream)
                 else:
+                    # Time-based triggers wait on the shared timer rather than polling the clock
+                    # themselves, and only start running once their moment has passed.
+                    if isinstance(moment := trigger.timer_moment(), datetime):
+                        await self._timer.wait_until(moment)
                     event_stream = trigger.run()
 
                 async for event in event_stream:
@@ -0,0 +1,50 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Add ``load`` column to ``trigger`` table.
+
+Revision ID: 304f5f7ba0e5
+Revises: 7a98f1b7dbd3
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "304f5f7ba0e5"
+down_revision = "7a98f1b7dbd3"
+branch_labels = None
+depends_on = None
+airflow_version = "3.4.0"
+
+
+def upgrade():
+    """Add ``load`` column in trigger table."""
+    with op.batch_alter_table("trigger") as batch_op:
+        batch_op.add_column(sa.Column("load", sa.Float(), nullable=True))
+
+
+def downgrade():
+    """Remove ``load`` column from trigger table."""
+    with op.batch_alter_table("trigger") as batch_op:
+        batch_op.drop_column("load")
@@ -0,0 +1,72 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Add ``state_rollup`` tables and index on ``dag_run.updated_at``.
+
+Revision ID: 9c3d5e7f1a2b
+Revises: 304f5f7ba0e5
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+from airflow.migrations.db_types import StringID
+from airflow.utils.sqlalchemy import UtcDateTime
+
+# revision identifiers, used by Alembic.
+revision = "9c3d5e7f1a2b"
+down_revision = "304f5f7ba0e5"
+branch_labels = None
+depends_on = None
+airflow_version = "3.4.0"
+
+
+def upgrade():
+    """Create state_rollup and state_rollup_watermark tables, and index dag_run.updated_at."""
+    op.create_table(
+        "state_rollup",
+        sa.Column("dag_id", StringID(), nullable=False),
+        sa.Column("bucket", UtcDateTime(timezone=True), nullable=False),
+        sa.Column("kind", sa.String(20), nullable=False),
+        sa.Column("state", sa.String(20), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("dag_id", "bucket", "kind", "state", name=op.f("state_rollup_pkey")),
+    )
+    op.create_index(op.f("idx_state_rollup_bucket"), "state_rollup", ["bucket"])
+    op.create_table(
+        "state_rollup_watermark",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("covered_from", UtcDateTime(timezone=True), nullable=False),
+        sa.Column("refreshed_at", UtcDateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id", name=op.f("state_rollup_watermark_pkey")),
+    )
+    # Each refresh of the rollups looks up the Dag runs updated since the previous one
+    op.create_index("idx_dag_run_updated_at", "dag_run", ["updated_at"])
+
+
+def downgrade():
+    """Drop state_rollup and state_rollup_watermark tables, and the index on dag_run.updated_at."""
+    op.drop_index("idx_dag_run_updated_at", table_name="dag_run")
+    op.drop_table("state_rollup_watermark")
+    op.drop_index(op.f("idx_state_rollup_bucket"), table_name="state_rollup")
+    op.drop_table("state_rollup")
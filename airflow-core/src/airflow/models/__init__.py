@@ -73,6 +73,7 @@ def import_all_models():
     import airflow.models.errors
     import airflow.models.revoked_token
     import airflow.models.serialized_dag
+    import airflow.models.state_rollup
     import airflow.models.task_state_store
     import airflow.models.taskinstancehistory
     import airflow.models.tasklog
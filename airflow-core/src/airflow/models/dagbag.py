@@ -35,7 +35,7 @@ from airflow.models.base import Base, StringID
 from airflow.models.dag_version import DagVersion
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Collection, Generator
 
     from sqlalchemy.orm import Session
 
@@ -178,6 +178,30 @@ class DBDagBag:
         """Get a dag by its version id, using cache if enabled."""
         return self._get_dag(version_id=version_id, session=session)
 
+    def get_dags(
+        self, version_ids: Collection[UUID | str], session: Session
+    ) -> dict[UUID | str, SerializedDAG]:
+        """
+        Get the dags for several version ids, using cache if enabled.
+
+        The versions missing from the cache are loaded with a single query, instead of one query per
+        version. Version ids without a serialized DAG are left out of the result.
+        """
+        from airflow.models.serialized_dag import SerializedDagModel
+
+        with self._lock:
+            missing = [version_id for version_id in version_ids if version_id not in self._dags]
+        if missing:
+            for serdag in session.scalars(
+                select(SerializedDagModel).where(SerializedDagModel.dag_version_id.in_(missing))
+            ):
+                self._read_dag(serdag)
+        return {
+            version_id: dag
+            for version_id in version_ids
+            if (dag := self._get_dag(version_id=version_id, session=session)) is not None
+        }
+
     def get_serialized_dag_model(self, version_id: UUID | str, session: Session) -> SerializedDagModel | None:
         """
         Return the SerializedDagModel for a given dag version id.
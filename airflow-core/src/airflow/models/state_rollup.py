@@ -0,0 +1,329 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Hourly rollups of Dag run and task instance states.
+
+The dashboard counts Dag runs and task instances per state over arbitrary time ranges. Counting them on
+the fly gets slower as the history grows, so the counts are kept per Dag, per hour of the Dag runs'
+``run_after`` and per state, and maintained incrementally by the scheduler.
+
+Rollups cover every hour from ``StateRollupWatermark.covered_from`` on, and reflect the Dag runs
+updated before ``StateRollupWatermark.refreshed_at``. Each refresh recomputes the hours of the Dag runs
+updated since the previous one from the ``dag_run`` and ``task_instance`` tables, so rollups stay exact
+when runs are cleared or marked, instead of drifting like counters would. Deleted rows do not update any
+Dag run, so the code deleting Dag runs or task instances recomputes the affected hours itself with
+:func:`recompute_state_rollups`, or :func:`recompute_state_rollups_before` for ``airflow db clean``.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+import structlog
+from sqlalchemy import Index, Integer, String, delete, func, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Mapped, mapped_column
+
+from airflow._shared.timezones import timezone
+from airflow.models.base import Base, StringID
+from airflow.models.dagrun import DagRun
+from airflow.models.taskinstance import TaskInstance
+from airflow.utils.session import NEW_SESSION, provide_session
+from airflow.utils.sqlalchemy import UtcDateTime, with_row_locks
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy.orm import Session
+
+log = structlog.get_logger(__name__)
+
+BUCKET_SIZE = timedelta(hours=1)
+
+# Dag runs updated slightly before the previous refresh are looked at again, so changes committed by
+# transactions that started before it are not missed.
+REFRESH_LOOKBACK = timedelta(minutes=1)
+
+# Hours of a Dag that are less than this apart are recomputed with a single query
+MAX_SPAN_GAP = timedelta(days=1)
+
+# Hours of a Dag recomputed with a single query when backfilling
+BACKFILL_SPAN = timedelta(days=30)
+
+NO_STATUS = "no_status"
+
+
+class StateRollup(Base):
+    """Number of Dag runs or task instances of a Dag in a state, for the Dag runs of one hour."""
+
+    __tablename__ = "state_rollup"
+
+    dag_id: Mapped[str] = mapped_column(StringID(), primary_key=True)
+    # Start of the hour the ``run_after`` of the Dag runs falls in
+    bucket: Mapped[datetime] = mapped_column(UtcDateTime, primary_key=True)
+    # ``dag_run`` or ``task_instance``
+    kind: Mapped[str] = mapped_column(String(20), primary_key=True)
+    state: Mapped[str] = mapped_column(String(20), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    __table_args__ = (Index("idx_state_rollup_bucket", bucket),)
+
+
+class StateRollupWatermark(Base):
+    """Single row recording which hours :class:`StateRollup` covers, and how fresh it is."""
+
+    __tablename__ = "state_rollup_watermark"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    covered_from: Mapped[datetime] = mapped_column(UtcDateTime, nullable=False)
+    refreshed_at: Mapped[datetime] = mapped_column(UtcDateTime, nullable=False)
+
+
+def floor_bucket(value: datetime) -> datetime:
+    """Return the start of the hour ``value`` falls in."""
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def ceil_bucket(value: datetime) -> datetime:
+    """Return the start of the first hour starting at or after ``value``."""
+    bucket = floor_bucket(value)
+    return bucket if bucket == value else bucket + BUCKET_SIZE
+
+
+def _spans(buckets: Iterable[datetime]) -> list[tuple[datetime, datetime]]:
+    """Group hours into ``[start, end)`` ranges, merging the ones less than ``MAX_SPAN_GAP`` apart."""
+    spans: list[tuple[datetime, datetime]] = []
+    for bucket in sorted(set(buckets)):
+        if spans and bucket - spans[-1][1] < MAX_SPAN_GAP:
+            spans[-1] = (spans[-1][0], bucket + BUCKET_SIZE)
+        else:
+            spans.append((bucket, bucket + BUCKET_SIZE))
+    return spans
+
+
+def _recompute(dag_id: str, start: datetime, end: datetime, *, session: Session) -> None:
+    """Replace the rollups of a Dag for the hours in ``[start, end)`` with counts from the source tables."""
+    counts: dict[tuple[datetime, str, str], int] = defaultdict(int)
+    run_filter = (DagRun.dag_id == dag_id, DagRun.run_after >= start, DagRun.run_after < end)
+    run_rows = session.execute(
+        select(DagRun.run_after, DagRun.state, func.count())
+        .where(*run_filter)
+        .group_by(DagRun.run_after, DagRun.state)
+    )
+    for run_after, state, count in run_rows:
+        counts[(floor_bucket(run_after), "dag_run", state or NO_STATUS)] += count
+    ti_rows = session.execute(
+        select(DagRun.run_after, TaskInstance.state, func.count())
+        .select_from(TaskInstance)
+        .join(TaskInstance.dag_run)
+        .where(*run_filter)
+        .group_by(DagRun.run_after, TaskInstance.state)
+    )
+    for run_after, state, count in ti_rows:
+        counts[(floor_bucket(run_after), "task_instance", state or NO_STATUS)] += count
+
+    session.execute(
+        delete(StateRollup).where(
+            StateRollup.dag_id == dag_id, StateRollup.bucket >= start, StateRollup.bucket < end
+        )
+    )
+    if counts:
+        session.execute(
+            insert(StateRollup),
+            [
+                {"dag_id": dag_id, "bucket": bucket, "kind": kind, "state": state, "count": count}
+                for (bucket, kind, state), count in counts.items()
+            ],
+        )
+
+
+def _recompute_updated(
+    updated_after: datetime, start: datetime, end: datetime | None = None, *, session: Session
+) -> int:
+    """
+    Recompute the hours in ``[start, end)`` of the Dag runs updated after ``updated_after``.
+
+    :return: the number of Dags recomputed
+    """
+    run_filter = [DagRun.updated_at > updated_after - REFRESH_LOOKBACK, DagRun.run_after >= start]
+    if end is not None:
+        run_filter.append(DagRun.run_after < end)
+    buckets_by_dag: dict[str, set[datetime]] = defaultdict(set)
+    for dag_id, run_after in session.execute(select(DagRun.dag_id, DagRun.run_after).where(*run_filter)):
+        buckets_by_dag[dag_id].add(floor_bucket(run_after))
+    for dag_id, buckets in buckets_by_dag.items():
+        for span_start, span_end in _spans(buckets):
+            _recompute(dag_id, span_start, span_end, session=session)
+    return len(buckets_by_dag)
+
+
+def _lock_watermark(session: Session, *, skip_locked: bool) -> StateRollupWatermark | None:
+    return session.scalar(with_row_locks(select(StateRollupWatermark), session, skip_locked=skip_locked))
+
+
+def _initialize(now: datetime, *, session: Session) -> StateRollupWatermark | None:
+    """Start covering the current hour, returning ``None`` if another process just did it."""
+    watermark = StateRollupWatermark(id=1, covered_from=floor_bucket(now), refreshed_at=now)
+    try:
+        with session.begin_nested():
+            session.add(watermark)
+    except IntegrityError:
+        return None
+    dag_ids = session.scalars(
+        select(DagRun.dag_id).where(DagRun.run_after >= watermark.covered_from).distinct()
+    )
+    for dag_id in dag_ids.all():
+        _recompute(dag_id, watermark.covered_from, floor_bucket(now) + BUCKET_SIZE, session=session)
+    return watermark
+
+
+@provide_session
+def refresh_state_rollups(*, session: Session = NEW_SESSION) -> None:
+    """
+    Bring the rollups up to date with the Dag runs updated since the previous refresh.
+
+    The first refresh starts covering the current hour; older hours can be added with
+    :func:`backfill_state_rollups`. Refreshes running concurrently, e.g. in several schedulers, are
+    skipped.
+    """
+    now = timezone.utcnow()
+    watermark = _lock_watermark(session, skip_locked=True)
+    if watermark is None:
+        if session.scalar(select(func.count(StateRollupWatermark.id))):
+            log.debug("State rollups are being refreshed by another process")
+            return
+        if _initialize(now, session=session) is not None:
+            log.info("Started maintaining state rollups", covered_from=floor_bucket(now))
+        return
+
+    dag_count = _recompute_updated(watermark.refreshed_at, watermark.covered_from, session=session)
+    watermark.refreshed_at = now
+    log.debug("Refreshed state rollups", dags=dag_count)
+
+
+def recompute_state_rollups(runs: Iterable[tuple[str, datetime]], *, session: Session) -> None:
+    """
+    Recompute the hours of some Dag runs, after they or some of their task instances were deleted.
+
+    The deletions must be done in ``session``, they are flushed before counting.
+
+    :param runs: the ``dag_id`` and ``run_after`` of the Dag runs
+    :param session: the session
+    """
+    runs = list(runs)
+    if not runs:
+        return
+    session.flush()
+    # Locked, so that a concurrent refresh does not rewrite the same rollups
+    watermark = _lock_watermark(session, skip_locked=False)
+    if watermark is None:
+        return
+    buckets_by_dag: dict[str, set[datetime]] = defaultdict(set)
+    for dag_id, run_after in runs:
+        if run_after >= watermark.covered_from:
+            buckets_by_dag[dag_id].add(floor_bucket(run_after))
+    for dag_id, buckets in buckets_by_dag.items():
+        for start, end in _spans(buckets):
+            _recompute(dag_id, start, end, session=session)
+
+
+@provide_session
+def recompute_state_rollups_before(end: datetime, *, session: Session = NEW_SESSION) -> None:
+    """
+    Recompute all the hours before the one of ``end``, after old Dag runs or task instances were purged.
+
+    Dag runs start after their ``run_after``, so the Dag runs and task instances that started before
+    ``end`` all fall in these hours. Each Dag is committed separately.
+
+    :param end: the date before which rows were purged
+    :param session: the session
+    """
+    end = ceil_bucket(end)
+    dag_ids = session.scalars(select(StateRollup.dag_id).where(StateRollup.bucket < end).distinct()).all()
+    for dag_id in dag_ids:
+        watermark = _lock_watermark(session, skip_locked=False)
+        if watermark is None:
+            return
+        span_start = watermark.covered_from
+        while span_start < end:
+            span_end = min(span_start + BACKFILL_SPAN, end)
+            _recompute(dag_id, span_start, span_end, session=session)
+            span_start = span_end
+        session.commit()
+    log.info("Recomputed state rollups", end=end, dags=len(dag_ids))
+
+
+@provide_session
+def backfill_state_rollups(start_date: datetime, *, session: Session = NEW_SESSION) -> datetime:
+    """
+    Extend the rollups back to the hour of ``start_date``, computing them from the existing Dag runs.
+
+    Each Dag is committed separately, and the new hours are only used once all of them are computed.
+
+    :param start_date: the date from which the rollups should cover the Dag runs
+    :return: the start of the first hour the rollups now cover
+    """
+    watermark = _lock_watermark(session, skip_locked=False) or _initialize(timezone.utcnow(), session=session)
+    session.commit()
+    if watermark is None:
+        watermark = _lock_watermark(session, skip_locked=False)
+        session.commit()
+    if TYPE_CHECKING:
+        assert watermark
+    start, end = floor_bucket(start_date), watermark.covered_from
+    if start >= end:
+        return end
+
+    backfill_started = timezone.utcnow()
+    dag_ids = session.scalars(
+        select(DagRun.dag_id).where(DagRun.run_after >= start, DagRun.run_after < end).distinct()
+    ).all()
+    for dag_id in dag_ids:
+        span_start = start
+        while span_start < end:
+            span_end = min(span_start + BACKFILL_SPAN, end)
+            _recompute(dag_id, span_start, span_end, session=session)
+            span_start = span_end
+        session.commit()
+        log.info("Backfilled state rollups", dag_id=dag_id, start=start, end=end)
+
+    watermark = _lock_watermark(session, skip_locked=False)
+    if TYPE_CHECKING:
+        assert watermark
+    watermark.covered_from = min(watermark.covered_from, start)
+    # Refreshes only looked at the hours already covered: recompute the new hours of the Dag runs
+    # updated while they were backfilled. Later updates are picked up by the next refreshes.
+    _recompute_updated(backfill_started, start, end, session=session)
+    session.commit()
+    return watermark.covered_from
+
+
+def get_state_rollup_coverage(*, max_age: timedelta, session: Session) -> tuple[datetime, datetime] | None:
+    """
+    Return the range of hours ``[start, end)`` for which the rollups can be used.
+
+    :param max_age: how long ago the rollups must have been refreshed to be used
+    :param session: the session
+    :return: the range of hours, or ``None`` if the rollups are not maintained or too stale
+    """
+    watermark = session.scalar(select(StateRollupWatermark))
+    if watermark is None or watermark.refreshed_at < timezone.utcnow() - max_age:
+        return None
+    return watermark.covered_from, floor_bucket(watermark.refreshed_at)
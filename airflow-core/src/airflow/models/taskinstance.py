@@ -100,6 +100,7 @@ from airflow.task.priority_strategy import validate_and_load_priority_weight_str
 from airflow.ti_deps.dep_context import DepContext
 from airflow.ti_deps.dependencies_deps import REQUEUEABLE_DEPS, RUNNING_DEPS
 from airflow.ti_deps.deps.ready_to_reschedule import ReadyToRescheduleDep
+from airflow.utils.helpers import chunks
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.net import get_hostname
 from airflow.utils.platform import getuser
@@ -378,30 +379,44 @@ def clear_task_instances(
     """
     from airflow.exceptions import AirflowClearRunningTaskException
     from airflow.models.dagbag import DBDagBag
+    from airflow.models.taskinstancehistory import RECORD_TIS_CHUNK_SIZE, TaskInstanceHistory
 
     scheduler_dagbag = DBDagBag(load_op_links=False)
+    if prevent_running_task and any(ti.state == TaskInstanceState.RUNNING for ti in tis):
+        # Prevents the task from re-running and clearing when prevent_running_task from the frontend and the tas is running is True.
+        raise AirflowClearRunningTaskException(
+            "AirflowClearRunningTaskException: Disable 'prevent_running_task' to proceed, or wait until the task is not running, queued, or scheduled state."
+        )
+
+    # Same as prepare_db_for_next_try for each task instance, with a constant number of queries
+    # per chunk of task instances rather than several per task instance.
+    TaskInstanceHistory.record_tis(tis, session=session)
+    for ti_ids in chunks([ti.id for ti in tis], RECORD_TIS_CHUNK_SIZE):
+        session.execute(delete(TaskReschedule).where(TaskReschedule.ti_id.in_(ti_ids)))
+
+    # The serialized dag of each run and the latest dag version of each dag, looked up once
+    # rather than once per task instance.
+    ti_dags: dict[tuple[str, str], SerializedDAG | None] = {}
+    latest_dag_versions: dict[str, DagVersion | None] = {}
     for ti in tis:
-        ti.prepare_db_for_next_try(session)
+        ti.id = uuid7()
 
         if ti.state == TaskInstanceState.RUNNING:
-            if prevent_running_task:
-                raise AirflowClearRunningTaskException(
-                    "AirflowClearRunningTaskException: Disable 'prevent_running_task' to proceed, or wait until the task is not running, queued, or scheduled state."
-                )
-                # Prevents the task from re-running and clearing when prevent_running_task from the frontend and the tas is running is True.
-
             ti.state = TaskInstanceState.RESTARTING
         # If a task is cleared when running and the prevent_running_task is false,
         # set its state to RESTARTING so that
         # the task is terminated and becomes eligible for retry.
         else:
             dr = ti.dag_run
-            if run_on_latest_version:
-                ti_dag = scheduler_dagbag.get_latest_version_of_dag(ti.dag_id, session=session)
-            else:
-                ti_dag = scheduler_dagbag.get_dag_for_run(dag_run=dr, session=session)
-            if not ti_dag:
-                log.warning("No serialized dag found for dag '%s'", dr.dag_id)
+            if (ti.dag_id, ti.run_id) not in ti_dags:
+                if run_on_latest_version:
+                    ti_dag = scheduler_dagbag.get_latest_version_of_dag(ti.dag_id, session=session)
+                else:
+                    ti_dag = scheduler_dagbag.get_dag_for_run(dag_run=dr, session=session)
+                if not ti_dag:
+                    log.warning("No serialized dag found for dag '%s'", dr.dag_id)
+                ti_dags[(ti.dag_id, ti.run_id)] = ti_dag
+            ti_dag = ti_dags[(ti.dag_id, ti.run_id)]
             task_id = ti.task_id
             if ti_dag and ti_dag.has_task(task_id):
                 task = ti_dag.get_task(task_id)
@@ -420,8 +435,9 @@ def clear_task_instances(
             ti.clear_next_method_args()
             # Match DagVersion to latest serialized DAG when run_on_latest_version.
             if run_on_latest_version:
-                latest_dag_version = DagVersion.get_latest_version(ti.dag_id, session=session)
-                if latest_dag_version is not None:
+                if ti.dag_id not in latest_dag_versions:
+                    latest_dag_versions[ti.dag_id] = DagVersion.get_latest_version(ti.dag_id, session=session)
+                if (latest_dag_version := latest_dag_versions[ti.dag_id]) is not None:
                     ti.dag_version_id = latest_dag_version.id
             session.merge(ti)
 
@@ -1011,17 +1027,26 @@ class TaskInstance(Base, LoggingMixin, BaseWorkload):
             return False
 
         current_time = timezone.utcnow()
-        self.log.debug("Setting task state for %s to %s", self, state)
         if self not in session:
             self.refresh_from_db(session=session)
+        self._set_state(state, current_time)
+        session.merge(self)
+        session.flush()
+        return True
+
+    def _set_state(self, state: str | None, current_time: datetime) -> None:
+        """
+        Set the state of a TaskInstance, and the dates it implies, without writing it to the database.
+
+        Callers setting the state of many task instances of a session flush the session once, rather
+        than once per task instance as :meth:`set_state` does.
+        """
+        self.log.debug("Setting task state for %s to %s", self, state)
         self.state = state
         self.start_date = self.start_date or current_time
         if self.state in State.finished or self.state == TaskInstanceState.UP_FOR_RETRY:
             self.end_date = self.end_date or current_time
             self.duration = (self.end_date - self.start_date).total_seconds()
-        session.merge(self)
-        session.flush()
-        return True
 
     @property
     def is_premature(self) -> bool:
@@ -17,6 +17,7 @@
 # under the License.
 from __future__ import annotations
 
+from collections import defaultdict
 from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
@@ -33,7 +34,8 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     Uuid,
-    func,
+    and_,
+    or_,
     select,
 )
 from sqlalchemy.dialects import postgresql
@@ -44,6 +46,7 @@ from airflow._shared.timezones import timezone
 from airflow.models.base import Base, StringID
 from airflow.models.hitl import HITLDetail
 from airflow.models.hitl_history import HITLDetailHistory
+from airflow.utils.helpers import chunks
 from airflow.utils.session import NEW_SESSION, provide_session
 from airflow.utils.sqlalchemy import (
     ExecutorConfigType,
@@ -53,12 +56,17 @@ from airflow.utils.sqlalchemy import (
 from airflow.utils.state import State, TaskInstanceState
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from sqlalchemy.orm.session import Session
 
     from airflow.models import DagRun
     from airflow.models.taskinstance import TaskInstance
     from airflow.models.taskinstancekey import TaskInstanceKey
 
+# Number of task instances recorded with one query in TaskInstanceHistory.record_tis
+RECORD_TIS_CHUNK_SIZE = 1000
+
 
 class TaskInstanceHistory(Base):
     """
@@ -193,31 +201,67 @@ class TaskInstanceHistory(Base):
     @provide_session
     def record_ti(ti: TaskInstance, *, session: Session = NEW_SESSION) -> None:
         """Record a TaskInstance to TaskInstanceHistory."""
-        exists_q = session.scalar(
-            select(func.count(TaskInstanceHistory.task_id)).where(
-                TaskInstanceHistory.dag_id == ti.dag_id,
-                TaskInstanceHistory.task_id == ti.task_id,
-                TaskInstanceHistory.run_id == ti.run_id,
-                TaskInstanceHistory.map_index == ti.map_index,
-                TaskInstanceHistory.try_number == ti.try_number,
+        TaskInstanceHistory.record_tis([ti], session=session)
+
+    @staticmethod
+    def record_tis(tis: Collection[TaskInstance], *, session: Session) -> None:
+        """
+        Record TaskInstances to TaskInstanceHistory.
+
+        The tries already recorded are skipped. Tries that did not finish are recorded as failed.
+        This runs two queries per ``RECORD_TIS_CHUNK_SIZE`` task instances, rather than two per
+        task instance for a loop calling :meth:`record_ti`.
+        """
+        for chunk in chunks(list(tis), RECORD_TIS_CHUNK_SIZE):
+            task_ids_by_run: dict[tuple[str, str], set[str]] = defaultdict(set)
+            for ti in chunk:
+                task_ids_by_run[(ti.dag_id, ti.run_id)].add(ti.task_id)
+            recorded = set(
+                session.execute(
+                    select(
+                        TaskInstanceHistory.dag_id,
+                        TaskInstanceHistory.task_id,
+                        TaskInstanceHistory.run_id,
+                        TaskInstanceHistory.map_index,
+                        TaskInstanceHistory.try_number,
+                    ).where(
+                        or_(
+                            *(
+                                and_(
+                                    TaskInstanceHistory.dag_id == dag_id,
+                                    TaskInstanceHistory.run_id == run_id,
+                                    TaskInstanceHistory.task_id.in_(task_ids),
+                                )
+                                for (dag_id, run_id), task_ids in task_ids_by_run.items()
+                            )
+                        )
+                    )
+                ).all()
+            )
+
+            to_record = []
+            for ti in chunk:
+                if (ti.dag_id, ti.task_id, ti.run_id, ti.map_index, ti.try_number) in recorded:
+                    continue
+                ti_history_state = ti.state
+                if ti.state not in State.finished:
+                    ti_history_state = TaskInstanceState.FAILED
+                    # Callers that know when the try actually ended (e.g. the Execution API
+                    # retry path) pre-set end_date and duration; only stamp archive time when unset.
+                    if ti.end_date is None:
+                        ti.end_date = timezone.utcnow()
+                        ti.set_duration()
+                session.add(TaskInstanceHistory(ti, state=ti_history_state))
+                to_record.append(ti.id)
+            if not to_record:
+                continue
+
+            session.add_all(
+                HITLDetailHistory(ti_hitl_detail)
+                for ti_hitl_detail in session.scalars(
+                    select(HITLDetail).where(HITLDetail.ti_id.in_(to_record))
+                )
             )
-        )
-        if exists_q:
-            return
-        ti_history_state = ti.state
-        if ti.state not in State.finished:
-            ti_history_state = TaskInstanceState.FAILED
-            # Callers that know when the try actually ended (e.g. the Execution API
-            # retry path) pre-set end_date and duration; only stamp archive time when unset.
-            if ti.end_date is None:
-                ti.end_date = timezone.utcnow()
-                ti.set_duration()
-        ti_history = TaskInstanceHistory(ti, state=ti_history_state)
-        session.add(ti_history)
-
-        ti_hitl_detail = session.scalar(select(HITLDetail).where(HITLDetail.ti_id == ti.id))
-        if ti_hitl_detail is not None:
-            session.add(HITLDetailHistory(ti_hitl_detail))
 
     @provide_session
     def get_dagrun(self, *, session: Session = NEW_SESSION) -> DagRun:
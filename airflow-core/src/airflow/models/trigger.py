@@ -18,13 +18,14 @@ from __future__ import annotations
 
 import datetime
 import logging
-from collections.abc import Iterable
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
 from enum import Enum
 from functools import singledispatch
 from traceback import format_exception
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import ForeignKey, Integer, String, Text, delete, func, or_, select, update
+from sqlalchemy import Float, ForeignKey, Integer, String, Text, bindparam, delete, func, or_, select, update
 from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import Mapped, Session, mapped_column, relationship, selectinload
 from sqlalchemy.sql.functions import coalesce
@@ -99,6 +100,8 @@ class Trigger(Base):
     created_date: Mapped[datetime.datetime] = mapped_column(UtcDateTime, nullable=False)
     triggerer_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
     queue: Mapped[str | None] = mapped_column(String(256), nullable=True)
+    # Measured cost of running the trigger, in CPU seconds per minute, as last reported by its triggerer.
+    load: Mapped[float | None] = mapped_column(Float, nullable=True)
 
     # Denormalized from dag_bundle_team to keep the triggerer's ~1s polling queries join-free,
     # especially since it's eventually consistent and trigger rows are ephemeral.
@@ -303,6 +306,61 @@ class Trigger(Base):
         if trigger.callback:
             trigger.callback.handle_event(event, session)
 
+    @classmethod
+    @provide_session
+    def submit_events(
+        cls, events: Sequence[tuple[int, TriggerEvent]], *, session: Session = NEW_SESSION
+    ) -> None:
+        """
+        Fire several events in a single transaction.
+
+        Equivalent to calling :meth:`submit_event` for each ``(trigger_id, event)`` pair in order, but
+        the deferred task instances and the triggers of the whole batch are each loaded with one query
+        instead of one per event.
+        """
+        trigger_ids = {trigger_id for trigger_id, _ in events}
+        if not trigger_ids:
+            return
+
+        deferred_tis: defaultdict[int, list[TaskInstance]] = defaultdict(list)
+        for task_instance in session.scalars(
+            select(TaskInstance).where(
+                TaskInstance.trigger_id.in_(trigger_ids), TaskInstance.state == TaskInstanceState.DEFERRED
+            )
+        ):
+            deferred_tis[task_instance.trigger_id].append(task_instance)
+
+        triggers = {
+            trigger.id: trigger
+            for trigger in session.scalars(
+                select(cls)
+                .where(cls.id.in_(trigger_ids))
+                .options(
+                    selectinload(cls.asset_watchers).selectinload(AssetWatcherModel.asset),
+                    selectinload(cls.callback),
+                )
+            )
+        }
+
+        for trigger_id, event in events:
+            # Resume deferred tasks. Only the first event of a trigger can find them deferred, exactly
+            # like when submitting the events one by one.
+            for task_instance in deferred_tis.pop(trigger_id, ()):
+                handle_event_submit(event, task_instance=task_instance, session=session)
+
+            if (trigger := triggers.get(trigger_id)) is None:
+                # Already deleted for some reason
+                continue
+            # Send an event to assets
+            for asset in trigger.assets:
+                AssetManager.register_asset_change(
+                    asset=asset.to_serialized(),
+                    extra={"from_trigger": True, "payload": event.payload},
+                    session=session,
+                )
+            if trigger.callback:
+                trigger.callback.handle_event(event, session)
+
     @classmethod
     @provide_session
     def submit_failure(cls, trigger_id, exc=None, *, session: Session = NEW_SESSION) -> None:
@@ -338,6 +396,24 @@ class Trigger(Base):
             task_instance.state = TaskInstanceState.SCHEDULED
             task_instance.scheduled_dttm = timezone.utcnow()
 
+    @classmethod
+    @provide_session
+    def update_loads(cls, loads: Sequence[tuple[int, float]], *, session: Session = NEW_SESSION) -> None:
+        """
+        Record the load of running triggers, as measured by the triggerer running them.
+
+        Triggers deleted in the meantime, e.g. by ``clean_unused`` on another triggerer, are skipped.
+        This is a Core executemany rather than an ORM bulk update by primary key, which would raise
+        ``StaleDataError`` when fewer rows than reported are matched.
+        """
+        if not loads:
+            return
+        table = cls.__table__
+        session.execute(
+            update(table).where(table.c.id == bindparam("b_id")).values(load=bindparam("b_load")),
+            [{"b_id": trigger_id, "b_load": load} for trigger_id, load in loads],
+        )
+
     @classmethod
     @provide_session
     def ids_for_triggerer(
@@ -405,6 +481,7 @@ class Trigger(Base):
             Job.latest_heartbeat > timezone.utcnow() - datetime.timedelta(seconds=health_check_threshold),
             Job.job_type == "TriggererJob",
         )
+        capacity = cls._load_weighted_capacity(triggerer_id, capacity, alive_triggerer_ids, session=session)
 
         # Find triggers who do NOT have an alive triggerer_id, and then assign
         # up to `capacity` of those to us.
@@ -425,6 +502,41 @@ class Trigger(Base):
 
         session.commit()
 
+    @classmethod
+    def _load_weighted_capacity(
+        cls, triggerer_id: int, capacity: int, alive_triggerer_ids: Select, *, session: Session
+    ) -> int:
+        """
+        Scale down how many triggers a triggerer picks up when it runs more than its share of the load.
+
+        A triggerer whose running triggers cost more than the average over all alive triggerers only
+        takes a proportional part of its free capacity, leaving the rest to less loaded triggerers.
+        It always takes at least one trigger, so unassigned triggers are never left behind.
+        """
+        loads = dict(
+            session.execute(
+                select(cls.triggerer_id, func.sum(cls.load))
+                .where(cls.triggerer_id.in_(alive_triggerer_ids), cls.load.is_not(None))
+                .group_by(cls.triggerer_id)
+            ).all()
+        )
+        own_load = loads.get(triggerer_id) or 0.0
+        if own_load <= 0:
+            return capacity
+        alive_count = session.scalar(select(func.count()).select_from(alive_triggerer_ids.subquery()))
+        average_load = sum(loads.values()) / max(alive_count or 0, 1)
+        if own_load <= average_load:
+            return capacity
+        weighted_capacity = max(1, int(capacity * average_load / own_load))
+        log.debug(
+            "Triggerer %s runs a load of %.2f against an average of %.2f, assigning at most %d triggers",
+            triggerer_id,
+            own_load,
+            average_load,
+            weighted_capacity,
+        )
+        return weighted_capacity
+
     @classmethod
     def get_sorted_triggers(
         cls,
@@ -104,6 +104,7 @@ class XComModel(TaskInstanceDependencies):
         passive_deletes="all",
     )
     logical_date = association_proxy("dag_run", "logical_date")
+    run_after = association_proxy("dag_run", "run_after")
 
     task = relationship(
         "TaskInstance",
@@ -114,6 +114,7 @@ SIMPLE_LOG_FORMAT = conf.get("logging", "simple_log_format")
 
 SQL_ALCHEMY_CONN: str | None = None
 SQL_ALCHEMY_CONN_ASYNC: str | None = None
+SQL_ALCHEMY_CONN_READ_REPLICA: str | None = None
 PLUGINS_FOLDER: str | None = None
 DAGS_FOLDER: str = os.path.expanduser(conf.get_mandatory_value("core", "DAGS_FOLDER"))
 
@@ -126,6 +127,11 @@ Session: scoped_session | None = None
 NonScopedSession: sessionmaker | None = None
 async_engine: AsyncEngine | None = None
 AsyncSession: Callable[..., SAAsyncSession] | None = None
+# Engine and non scoped sessions of the read replica of the metadata database, only set when
+# ``[database] sql_alchemy_conn_read_replica`` is. The API server runs the queries of read-only
+# requests on it, see ``airflow.api_fastapi.common.db.read_replica``.
+replica_engine: Engine | None = None
+ReplicaSession: sessionmaker | None = None
 
 
 def get_engine():
@@ -260,6 +266,7 @@ def configure_vars():
     """Configure Global Variables from airflow.cfg."""
     global SQL_ALCHEMY_CONN
     global SQL_ALCHEMY_CONN_ASYNC
+    global SQL_ALCHEMY_CONN_READ_REPLICA
     global DAGS_FOLDER
     global PLUGINS_FOLDER
 
@@ -268,6 +275,9 @@ def configure_vars():
         SQL_ALCHEMY_CONN_ASYNC = conf.get("database", "sql_alchemy_conn_async")
     else:
         SQL_ALCHEMY_CONN_ASYNC = _get_async_conn_uri_from_sync(sync_uri=SQL_ALCHEMY_CONN)
+    SQL_ALCHEMY_CONN_READ_REPLICA = (
+        conf.get("database", "sql_alchemy_conn_read_replica", fallback=None) or None
+    )
 
     DAGS_FOLDER = os.path.expanduser(conf.get("core", "DAGS_FOLDER"))
 
@@ -441,6 +451,29 @@ def _configure_async_session() -> None:
     )
 
 
+def _configure_read_replica_session(
+    engine_args: dict[str, Any], connect_args: dict[str, Any], session_maker: Callable[..., sessionmaker]
+) -> None:
+    """Configure the engine and sessions of the read replica, with the same arguments as the primary."""
+    from airflow._shared.secrets_masker import mask_secret
+
+    global replica_engine, ReplicaSession
+
+    if not SQL_ALCHEMY_CONN_READ_REPLICA:
+        replica_engine = None
+        ReplicaSession = None
+        return
+
+    replica_engine = create_metadata_engine(
+        SQL_ALCHEMY_CONN_READ_REPLICA,
+        engine_args=engine_args,
+        connect_args=connect_args,
+    )
+    mask_secret(replica_engine.url.password)
+    setup_event_handlers(replica_engine)
+    ReplicaSession = session_maker(replica_engine)
+
+
 def configure_orm(disable_connection_pool=False, pool_class=None):
     """Configure ORM using SQLAlchemy."""
     from airflow._shared.secrets_masker import mask_secret
@@ -494,6 +527,7 @@ def configure_orm(disable_connection_pool=False, pool_class=None):
         raise RuntimeError("Engine must be initialized before creating a session")
     NonScopedSession = _session_maker(engine)
     Session = scoped_session(NonScopedSession)
+    _configure_read_replica_session(engine_args, connect_args, _session_maker)
 
     if register_at_fork := getattr(os, "register_at_fork", None):
         # https://docs.sqlalchemy.org/en/20/core/pooling.html#using-connection-pools-with-multiprocessing-or-os-fork
@@ -503,6 +537,8 @@ def configure_orm(disable_connection_pool=False, pool_class=None):
                 engine.dispose(close=False)
             if async_engine := _globals.get("async_engine"):
                 async_engine.sync_engine.dispose(close=False)
+            if replica_engine := _globals.get("replica_engine"):
+                replica_engine.dispose(close=False)
 
         # Won't work on Windows
         register_at_fork(after_in_child=clean_in_fork)
@@ -612,13 +648,14 @@ def prepare_engine_args(disable_connection_pool=False, pool_class=None):
 
 def dispose_orm(do_log: bool = True):
     """Properly close pooled database connections."""
-    global Session, engine, NonScopedSession, async_engine, AsyncSession
+    global Session, engine, NonScopedSession, async_engine, AsyncSession, replica_engine, ReplicaSession
 
     _globals = globals()
     if (
         _globals.get("engine") is None
         and _globals.get("Session") is None
         and _globals.get("async_engine") is None
+        and _globals.get("replica_engine") is None
     ):
         return
 
@@ -642,6 +679,11 @@ def dispose_orm(do_log: bool = True):
         async_engine = None
         AsyncSession = None
 
+    if "replica_engine" in _globals and replica_engine is not None:
+        replica_engine.dispose()
+        replica_engine = None
+        ReplicaSession = None
+
 
 def reconfigure_orm(disable_connection_pool=False, pool_class=None):
     """Properly close database connections and re-configure ORM."""
@@ -20,7 +20,7 @@ import abc
 import json
 from collections.abc import AsyncIterator, Hashable
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Annotated, Any
 
 import structlog
@@ -187,6 +187,19 @@ class BaseTrigger(abc.ABC, Templater, LoggingMixin):
         raise NotImplementedError("Triggers must implement run()")
         yield  # To convince Mypy this is an async iterator.
 
+    def timer_moment(self) -> datetime | None:
+        """
+        Return the moment this trigger waits for, if it only waits for a moment in time.
+
+        Triggers returning a datetime are parked on a timer shared by all time-based
+        triggers in the triggerer until that moment, rather than each polling the clock
+        on its own, and :meth:`run` is only started once the moment has passed. It must
+        then yield its event straight away.
+
+        Returning ``None`` (the default) runs the trigger through :meth:`run` right away.
+        """
+        return None
+
     async def cleanup(self) -> None:
         """
         Cleanup the trigger.
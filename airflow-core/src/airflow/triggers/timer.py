@@ -0,0 +1,110 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Shared timer for time-based triggers in the triggerer.
+
+Triggers that only wait for a moment in time (for example ``DateTimeTrigger``
+and ``TimeDeltaTrigger``) declare that moment through
+:meth:`~airflow.triggers.base.BaseTrigger.timer_moment`. Instead of letting
+each of them poll the clock in its own loop, the triggerer parks them on a
+:class:`TriggerTimer`: a single heap of deadlines served by one task, which
+sleeps until the earliest deadline and then releases every trigger that is
+due in one batch. Deadlines are rounded up to the timer resolution, so
+triggers waiting for the same second are woken by the same tick.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from contextlib import suppress
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+
+class TriggerTimer:
+    """
+    Heap of deadlines that wakes waiting triggers in batches.
+
+    :param resolution: Granularity, in seconds, deadlines are rounded up to. Triggers whose deadlines
+        fall within the same interval are released together.
+    :param max_sleep: Longest time, in seconds, the timer sleeps before re-reading the wall clock, so
+        that a clock change is picked up within that delay.
+    """
+
+    def __init__(self, *, resolution: float = 1.0, max_sleep: float = 60.0) -> None:
+        self.resolution = resolution
+        self.max_sleep = max_sleep
+        self._heap: list[tuple[float, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+        self._cancelled = 0
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def wait_until(self, moment: datetime) -> None:
+        """Wait until the wall clock reaches ``moment``, rounded up to the timer resolution."""
+        deadline = math.ceil(moment.timestamp() / self.resolution) * self.resolution
+        if deadline <= time.time():
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._heap, (deadline, next(self._counter), waiter))
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run(), name="trigger-timer")
+        elif self._heap[0][2] is waiter and self._wakeup is not None:
+            # New earliest deadline, the timer has to wake up sooner than it planned to
+            self._wakeup.set()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.cancelled():
+                self._discard_cancelled()
+            raise
+
+    def _discard_cancelled(self) -> None:
+        # Cancelled waiters are left in the heap and skipped once due, unless they make up most of it
+        self._cancelled += 1
+        if self._cancelled > len(self._heap) // 2:
+            self._heap = [entry for entry in self._heap if not entry[2].done()]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+    def _fire_due(self, now: float) -> None:
+        while self._heap and self._heap[0][0] <= now:
+            _, _, waiter = heapq.heappop(self._heap)
+            if waiter.done():
+                self._cancelled = max(self._cancelled - 1, 0)
+            else:
+                waiter.set_result(None)
+
+    async def _run(self) -> None:
+        wakeup = self._wakeup
+        if TYPE_CHECKING:
+            assert wakeup is not None
+        while self._heap:
+            now = time.time()
+            self._fire_due(now)
+            if not self._heap:
+                break
+            wakeup.clear()
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(wakeup.wait(), min(self._heap[0][0] - now, self.max_sleep))
@@ -2259,6 +2259,12 @@ export const $ClearTaskInstancesBody = {
                 }
             ],
             title: 'Note'
+        },
+        count_only: {
+            type: 'boolean',
+            title: 'Count Only',
+            description: 'Only return the number of task instances that would be cleared, in ``total_entries``, with an empty ``task_instances`` list. Requires ``dry_run``.',
+            default: false
         }
     },
     additionalProperties: false,
@@ -3629,7 +3635,7 @@ export const $DAGRunCollectionResponse = {
                 }
             ],
             title: 'Total Entries',
-            description: 'Total number of matching items. Populated for offset pagination, ``null`` when using cursor pagination.'
+            description: 'Total number of matching items. Populated for offset pagination, ``null`` when using cursor pagination or when ``total_entries_mode`` is ``none``.'
         },
         next_cursor: {
             anyOf: [
@@ -4756,14 +4762,46 @@ export const $EventLogCollectionResponse = {
             title: 'Event Logs'
         },
         total_entries: {
-            type: 'integer',
-            title: 'Total Entries'
+            anyOf: [
+                {
+                    type: 'integer'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'Total Entries',
+            description: 'Total number of matching items. Populated for offset pagination, ``null`` when using cursor pagination or when ``total_entries_mode`` is ``none``.'
+        },
+        next_cursor: {
+            anyOf: [
+                {
+                    type: 'string'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'Next Cursor',
+            description: 'Token pointing to the next page. Populated for cursor pagination, ``null`` when using offset pagination or when there is no next page.'
+        },
+        previous_cursor: {
+            anyOf: [
+                {
+                    type: 'string'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'Previous Cursor',
+            description: 'Token pointing to the previous page. Populated for cursor pagination, ``null`` when using offset pagination or when on the first page.'
         }
     },
     type: 'object',
-    required: ['event_logs', 'total_entries'],
+    required: ['event_logs'],
     title: 'EventLogCollectionResponse',
-    description: 'Event Log Collection Response.'
+    description: 'Event Log Collection Response, supporting both offset and cursor pagination.'
 } as const;
 
 export const $EventLogResponse = {
@@ -6554,7 +6592,7 @@ export const $TaskInstanceCollectionResponse = {
                 }
             ],
             title: 'Total Entries',
-            description: 'Total number of matching items. Populated for offset pagination, ``null`` when using cursor pagination.'
+            description: 'Total number of matching items. Populated for offset pagination, ``null`` when using cursor pagination or when ``total_entries_mode`` is ``none``.'
         },
         next_cursor: {
             anyOf: [
@@ -7989,6 +8027,13 @@ export const $TimeDelta = {
     description: 'TimeDelta can be used to interact with datetime.timedelta objects.'
 } as const;
 
+export const $TotalEntriesMode = {
+    type: 'string',
+    enum: ['exact', 'estimate', 'none'],
+    title: 'TotalEntriesMode',
+    description: 'How ``total_entries`` of a paginated list is computed.'
+} as const;
+
 export const $TriggerDAGRunPostBody = {
     properties: {
         dag_run_id: {
@@ -8387,14 +8432,46 @@ export const $XComCollectionResponse = {
             title: 'Xcom Entries'
         },
         total_entries: {
-            type: 'integer',
-            title: 'Total Entries'
+            anyOf: [
+                {
+                    type: 'integer'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'Total Entries',
+            description: 'Total number of matching items. Populated for offset pagination, ``null`` when using cursor pagination or when ``total_entries_mode`` is ``none``.'
+        },
+        next_cursor: {
+            anyOf: [
+                {
+                    type: 'string'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'Next Cursor',
+            description: 'Token pointing to the next page. Populated for cursor pagination, ``null`` when using offset pagination or when there is no next page.'
+        },
+        previous_cursor: {
+            anyOf: [
+                {
+                    type: 'string'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'Previous Cursor',
+            description: 'Token pointing to the previous page. Populated for cursor pagination, ``null`` when using offset pagination or when on the first page.'
         }
     },
     type: 'object',
-    required: ['xcom_entries', 'total_entries'],
+    required: ['xcom_entries'],
     title: 'XComCollectionResponse',
-    description: 'XCom Collection serializer for responses.'
+    description: 'XCom Collection serializer for responses, supporting both offset and cursor pagination.'
 } as const;
 
 export const $XComCreateBody = {
@@ -10105,7 +10182,14 @@ export const $HistoricalMetricDataResponse = {
             '$ref': '#/components/schemas/TaskInstanceStateCount'
         },
         state_count_limit: {
-            type: 'integer',
+            anyOf: [
+                {
+                    type: 'integer'
+                },
+                {
+                    type: 'null'
+                }
+            ],
             title: 'State Count Limit'
         }
     },
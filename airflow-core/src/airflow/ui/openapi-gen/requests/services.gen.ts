@@ -91,7 +91,7 @@ export class AssetService {
      * Get an asset alias.
      * @param data The data for the request.
      * @param data.assetAliasId
-     * @returns unknown Successful Response
+     * @returns AssetAliasResponse Successful Response
      * @throws ApiError
      */
     public static getAssetAlias(data: GetAssetAliasData): CancelablePromise<GetAssetAliasResponse> {
@@ -1059,15 +1059,22 @@ export class DagRunService {
      *
      * Supports two pagination modes:
      *
-     * **Offset (default):** use `limit` and `offset` query parameters. Returns `total_entries`.
+     * **Offset (default):** use `limit` and `offset` query parameters. Returns `total_entries`, unless
+     * `total_entries_mode` is `none`; with `estimate`, it is the database's estimate where available.
      *
      * **Cursor:** pass `cursor` (empty string for the first page, then `next_cursor` from the response).
      * When `cursor` is provided, `offset` is ignored and `total_entries` is not returned.
      * ``next_cursor`` is ``null`` when there are no more pages; ``previous_cursor`` is ``null``
      * on the first page.
+     *
+     * **Streaming:** with `Accept: application/x-ndjson` (one Dag run per line) or
+     * `Accept: application/vnd.apache.arrow.stream` (an Arrow IPC stream), all matching Dag runs
+     * are streamed in `order_by` order, and `limit`, `offset`, `cursor` and `total_entries_mode`
+     * are ignored.
      * @param data The data for the request.
      * @param data.dagId
      * @param data.cursor Cursor for keyset-based pagination. Pass an empty string for the first page, then use ``next_cursor`` from the response. When ``cursor`` is provided, ``offset`` is ignored.
+     * @param data.totalEntriesMode How ``total_entries`` is computed with offset pagination: ``exact`` counts every matching entry, ``estimate`` uses the database's estimate where available (PostgreSQL), and ``none`` skips counting and returns ``null``.
      * @param data.limit
      * @param data.offset
      * @param data.runAfterGte
@@ -1117,6 +1124,7 @@ export class DagRunService {
      * **Performance note:** this full-match pattern is evaluated as ``ILIKE '%term%'`` and most of the time prevents the database from using B-tree indexes, which can be very slow on large tables. Prefer the equivalent ``partition_key_prefix_pattern`` parameter when possible.
      * @param data.partitionKeyPrefixPattern Prefix match — returns items whose value starts with the given string (case-sensitive, index-friendly). The pipe `|` is part of the prefix, not an OR separator. Use `~` to match all. Wildcard characters (`%`, `_`) are treated as literal characters. Trailing non-alphanumeric characters in the prefix are stripped before matching so the range scan stays index-compatible under locale-aware collations — e.g. `test_` effectively matches items starting with `test`, and `s3://` matches items starting with `s3`.
      * @param data.consumingAssetPattern Filter by consuming asset name or URI using pattern matching
+     * @param data.accept
      * @returns DAGRunCollectionResponse Successful Response
      * @throws ApiError
      */
@@ -1127,8 +1135,12 @@ export class DagRunService {
             path: {
                 dag_id: data.dagId
             },
+            headers: {
+                accept: data.accept
+            },
             query: {
                 cursor: data.cursor,
+                total_entries_mode: data.totalEntriesMode,
                 limit: data.limit,
                 offset: data.offset,
                 run_after_gte: data.runAfterGte,
@@ -2083,7 +2095,24 @@ export class EventLogService {
     /**
      * Get Event Logs
      * Get all Event Logs.
+     *
+     * Supports two pagination modes:
+     *
+     * **Offset (default):** use `limit` and `offset` query parameters. Returns `total_entries`, unless
+     * `total_entries_mode` is `none`; with `estimate`, it is the database's estimate where available.
+     *
+     * **Cursor:** pass `cursor` (empty string for the first page, then `next_cursor` from the response).
+     * When `cursor` is provided, `offset` is ignored and `total_entries` is not returned.
+     * ``next_cursor`` is ``null`` when there are no more pages; ``previous_cursor`` is ``null``
+     * on the first page.
+     *
+     * **Streaming:** with `Accept: application/x-ndjson` (one Event Log per line) or
+     * `Accept: application/vnd.apache.arrow.stream` (an Arrow IPC stream), all matching Event Logs
+     * are streamed in `order_by` order, and `limit`, `offset`, `cursor` and `total_entries_mode`
+     * are ignored.
      * @param data The data for the request.
+     * @param data.cursor Cursor for keyset-based pagination. Pass an empty string for the first page, then use ``next_cursor`` from the response. When ``cursor`` is provided, ``offset`` is ignored.
+     * @param data.totalEntriesMode How ``total_entries`` is computed with offset pagination: ``exact`` counts every matching entry, ``estimate`` uses the database's estimate where available (PostgreSQL), and ``none`` skips counting and returns ``null``.
      * @param data.limit
      * @param data.offset
      * @param data.orderBy Attributes to order by, multi criteria sort is supported. Prefix with `-` for descending order. Supported attributes: `id, dttm, dag_id, task_id, run_id, event, logical_date, owner, extra, when, event_log_id`
@@ -2118,6 +2147,7 @@ export class EventLogService {
      * @param data.runIdPrefixPattern Prefix match — returns items whose value starts with the given string (case-sensitive, index-friendly). Use the pipe `|` operator for OR logic (e.g. `dag1|dag2`). Use `~` to match all. Wildcard characters (`%`, `_`) are treated as literal characters. Trailing non-alphanumeric characters in the prefix are stripped before matching so the range scan stays index-compatible under locale-aware collations — e.g. `test_` effectively matches items starting with `test`, and `s3://` matches items starting with `s3`.
      * @param data.ownerPrefixPattern Prefix match — returns items whose value starts with the given string (case-sensitive, index-friendly). Use the pipe `|` operator for OR logic (e.g. `dag1|dag2`). Use `~` to match all. Wildcard characters (`%`, `_`) are treated as literal characters. Trailing non-alphanumeric characters in the prefix are stripped before matching so the range scan stays index-compatible under locale-aware collations — e.g. `test_` effectively matches items starting with `test`, and `s3://` matches items starting with `s3`.
      * @param data.eventPrefixPattern Prefix match — returns items whose value starts with the given string (case-sensitive, index-friendly). Use the pipe `|` operator for OR logic (e.g. `dag1|dag2`). Use `~` to match all. Wildcard characters (`%`, `_`) are treated as literal characters. Trailing non-alphanumeric characters in the prefix are stripped before matching so the range scan stays index-compatible under locale-aware collations — e.g. `test_` effectively matches items starting with `test`, and `s3://` matches items starting with `s3`.
+     * @param data.accept
      * @returns EventLogCollectionResponse Successful Response
      * @throws ApiError
      */
@@ -2125,7 +2155,12 @@ export class EventLogService {
         return __request(OpenAPI, {
             method: 'GET',
             url: '/api/v2/eventLogs',
+            headers: {
+                accept: data.accept
+            },
             query: {
+                cursor: data.cursor,
+                total_entries_mode: data.totalEntriesMode,
                 limit: data.limit,
                 offset: data.offset,
                 order_by: data.orderBy,
@@ -2657,16 +2692,23 @@ export class TaskInstanceService {
      *
      * Supports two pagination modes:
      *
-     * **Offset (default):** use `limit` and `offset` query parameters. Returns `total_entries`.
+     * **Offset (default):** use `limit` and `offset` query parameters. Returns `total_entries`, unless
+     * `total_entries_mode` is `none`; with `estimate`, it is the database's estimate where available.
      *
      * **Cursor:** pass `cursor` (empty string for the first page, then `next_cursor` from the response).
      * When `cursor` is provided, `offset` is ignored and `total_entries` is not returned.
      * ``next_cursor`` is ``null`` when there are no more pages; ``previous_cursor`` is ``null``
      * on the first page.
+     *
+     * **Streaming:** with `Accept: application/x-ndjson` (one task instance per line) or
+     * `Accept: application/vnd.apache.arrow.stream` (an Arrow IPC stream), all matching task
+     * instances are streamed in `order_by` order, and `limit`, `offset`, `cursor` and
+     * `total_entries_mode` are ignored.
      * @param data The data for the request.
      * @param data.dagId
      * @param data.dagRunId
      * @param data.cursor Cursor for keyset-based pagination. Pass an empty string for the first page, then use ``next_cursor`` from the response. When ``cursor`` is provided, ``offset`` is ignored.
+     * @param data.totalEntriesMode How ``total_entries`` is computed with offset pagination: ``exact`` counts every matching entry, ``estimate`` uses the database's estimate where available (PostgreSQL), and ``none`` skips counting and returns ``null``.
      * @param data.taskId
      * @param data.runAfterGte
      * @param data.runAfterGt
@@ -2732,6 +2774,7 @@ export class TaskInstanceService {
      * @param data.limit
      * @param data.offset
      * @param data.orderBy Attributes to order by, multi criteria sort is supported. Prefix with `-` for descending order. Supported attributes: `id, state, duration, start_date, end_date, map_index, try_number, logical_date, run_after, data_interval_start, data_interval_end, rendered_map_index, operator`
+     * @param data.accept
      * @returns TaskInstanceCollectionResponse Successful Response
      * @throws ApiError
      */
@@ -2743,8 +2786,12 @@ export class TaskInstanceService {
                 dag_id: data.dagId,
                 dag_run_id: data.dagRunId
             },
+            headers: {
+                accept: data.accept
+            },
             query: {
                 cursor: data.cursor,
+                total_entries_mode: data.totalEntriesMode,
                 task_id: data.taskId,
                 run_after_gte: data.runAfterGte,
                 run_after_gt: data.runAfterGt,
@@ -4176,12 +4223,29 @@ export class XcomService {
      * Get all XCom entries.
      *
      * This endpoint allows specifying `~` as the dag_id, dag_run_id, task_id to retrieve XCom entries for all Dags.
+     *
+     * Supports two pagination modes:
+     *
+     * **Offset (default):** use `limit` and `offset` query parameters. Returns `total_entries`, unless
+     * `total_entries_mode` is `none`; with `estimate`, it is the database's estimate where available.
+     *
+     * **Cursor:** pass `cursor` (empty string for the first page, then `next_cursor` from the response).
+     * When `cursor` is provided, `offset` is ignored and `total_entries` is not returned.
+     * ``next_cursor`` is ``null`` when there are no more pages; ``previous_cursor`` is ``null``
+     * on the first page.
+     *
+     * **Streaming:** with `Accept: application/x-ndjson` (one XCom entry per line) or
+     * `Accept: application/vnd.apache.arrow.stream` (an Arrow IPC stream), all matching XCom entries
+     * are streamed in `order_by` order, and `limit`, `offset`, `cursor` and `total_entries_mode`
+     * are ignored.
      * @param data The data for the request.
      * @param data.dagId
      * @param data.dagRunId
      * @param data.taskId
      * @param data.xcomKey
      * @param data.mapIndex
+     * @param data.cursor Cursor for keyset-based pagination. Pass an empty string for the first page, then use ``next_cursor`` from the response. When ``cursor`` is provided, ``offset`` is ignored.
+     * @param data.totalEntriesMode How ``total_entries`` is computed with offset pagination: ``exact`` counts every matching entry, ``estimate`` uses the database's estimate where available (PostgreSQL), and ``none`` skips counting and returns ``null``.
      * @param data.limit
      * @param data.offset
      * @param data.xcomKeyPattern SQL LIKE expression — use `%` / `_` wildcards (e.g. `%customer_%`). Use the pipe `|` operator for OR logic (e.g. `dag1 | dag2`). Regular expressions are **not** supported.
@@ -4210,6 +4274,7 @@ export class XcomService {
      * @param data.runAfterLte
      * @param data.runAfterLt
      * @param data.orderBy Attributes to order by, multi criteria sort is supported. Prefix with `-` for descending order. Supported attributes: `key, dag_id, run_id, task_id, map_index, timestamp, run_after`
+     * @param data.accept
      * @returns XComCollectionResponse Successful Response
      * @throws ApiError
      */
@@ -4222,9 +4287,14 @@ export class XcomService {
                 dag_run_id: data.dagRunId,
                 task_id: data.taskId
             },
+            headers: {
+                accept: data.accept
+            },
             query: {
                 xcom_key: data.xcomKey,
                 map_index: data.mapIndex,
+                cursor: data.cursor,
+                total_entries_mode: data.totalEntriesMode,
                 limit: data.limit,
                 offset: data.offset,
                 xcom_key_pattern: data.xcomKeyPattern,
@@ -709,6 +709,10 @@ export type ClearTaskInstancesBody = {
     run_on_latest_version?: boolean | null;
     prevent_running_task?: boolean;
     note?: string | null;
+    /**
+     * Only return the number of task instances that would be cleared, in ``total_entries``, with an empty ``task_instances`` list. Requires ``dry_run``.
+     */
+    count_only?: boolean;
 };
 
 /**
@@ -1001,7 +1005,7 @@ export type DAGRunClearBody = {
 export type DAGRunCollectionResponse = {
     dag_runs: Array<DAGRunResponse>;
     /**
-     * Total number of matching items. Populated for offset pagination, ``null`` when using cursor pagination.
+     * Total number of matching items. Populated for offset pagination, ``null`` when using cursor pagination or when ``total_entries_mode`` is ``none``.
      */
     total_entries?: number | null;
     /**
@@ -1259,11 +1263,22 @@ export type DryRunBackfillResponse = {
 };
 
 /**
- * Event Log Collection Response.
+ * Event Log Collection Response, supporting both offset and cursor pagination.
  */
 export type EventLogCollectionResponse = {
     event_logs: Array<EventLogResponse>;
-    total_entries: number;
+    /**
+     * Total number of matching items. Populated for offset pagination, ``null`` when using cursor pagination or when ``total_entries_mode`` is ``none``.
+     */
+    total_entries?: number | null;
+    /**
+     * Token pointing to the next page. Populated for cursor pagination, ``null`` when using offset pagination or when there is no next page.
+     */
+    next_cursor?: string | null;
+    /**
+     * Token pointing to the previous page. Populated for cursor pagination, ``null`` when using offset pagination or when on the first page.
+     */
+    previous_cursor?: string | null;
 };
 
 /**
@@ -1755,7 +1770,7 @@ export type TaskInletAssetReference = {
 export type TaskInstanceCollectionResponse = {
     task_instances: Array<TaskInstanceResponse>;
     /**
-     * Total number of matching items. Populated for offset pagination, ``null`` when using cursor pagination.
+     * Total number of matching items. Populated for offset pagination, ``null`` when using cursor pagination or when ``total_entries_mode`` is ``none``.
      */
     total_entries?: number | null;
     /**
@@ -2000,6 +2015,11 @@ export type TimeDelta = {
     microseconds: number;
 };
 
+/**
+ * How ``total_entries`` of a paginated list is computed.
+ */
+export type TotalEntriesMode = 'exact' | 'estimate' | 'none';
+
 /**
  * Trigger Dag Run Serializer for POST body.
  */
@@ -2098,11 +2118,22 @@ export type VersionInfo = {
 };
 
 /**
- * XCom Collection serializer for responses.
+ * XCom Collection serializer for responses, supporting both offset and cursor pagination.
  */
 export type XComCollectionResponse = {
     xcom_entries: Array<XComResponse>;
-    total_entries: number;
+    /**
+     * Total number of matching items. Populated for offset pagination, ``null`` when using cursor pagination or when ``total_entries_mode`` is ``none``.
+     */
+    total_entries?: number | null;
+    /**
+     * Token pointing to the next page. Populated for cursor pagination, ``null`` when using offset pagination or when there is no next page.
+     */
+    next_cursor?: string | null;
+    /**
+     * Token pointing to the previous page. Populated for cursor pagination, ``null`` when using offset pagination or when on the first page.
+     */
+    previous_cursor?: string | null;
 };
 
 /**
@@ -2575,7 +2606,7 @@ export type GridTISummaries = {
 export type HistoricalMetricDataResponse = {
     dag_run_states: DAGRunStates;
     task_instance_states: TaskInstanceStateCount;
-    state_count_limit: number;
+    state_count_limit: number | null;
 };
 
 /**
@@ -2881,7 +2912,7 @@ export type GetAssetAliasData = {
     assetAliasId: number;
 };
 
-export type GetAssetAliasResponse = unknown;
+export type GetAssetAliasResponse = AssetAliasResponse;
 
 export type GetAssetEventsData = {
     assetId?: number | null;
@@ -3170,6 +3201,7 @@ export type BulkDagRunsData = {
 export type BulkDagRunsResponse = BulkResponse;
 
 export type GetDagRunsData = {
+    accept?: 'application/json' | 'application/x-ndjson' | 'application/vnd.apache.arrow.stream' | '*/*';
     bundleVersion?: string | null;
     confContains?: string;
     /**
@@ -3240,6 +3272,10 @@ export type GetDagRunsData = {
     startDateLt?: string | null;
     startDateLte?: string | null;
     state?: Array<(string)>;
+    /**
+     * How ``total_entries`` is computed with offset pagination: ``exact`` counts every matching entry, ``estimate`` uses the database's estimate where available (PostgreSQL), and ``none`` skips counting and returns ``null``.
+     */
+    totalEntriesMode?: TotalEntriesMode;
     /**
      * SQL LIKE expression — use `%` / `_` wildcards (e.g. `%customer_%`). Use the pipe `|` operator for OR logic (e.g. `dag1 | dag2`). Regular expressions are **not** supported.
      *
@@ -3591,8 +3627,13 @@ export type GetEventLogData = {
 export type GetEventLogResponse = EventLogResponse;
 
 export type GetEventLogsData = {
+    accept?: 'application/json' | 'application/x-ndjson' | 'application/vnd.apache.arrow.stream' | '*/*';
     after?: string | null;
     before?: string | null;
+    /**
+     * Cursor for keyset-based pagination. Pass an empty string for the first page, then use ``next_cursor`` from the response. When ``cursor`` is provided, ``offset`` is ignored.
+     */
+    cursor?: string | null;
     dagId?: string | null;
     /**
      * SQL LIKE expression — use `%` / `_` wildcards (e.g. `%customer_%`). Use the pipe `|` operator for OR logic (e.g. `dag1 | dag2`). Regular expressions are **not** supported.
@@ -3657,6 +3698,10 @@ export type GetEventLogsData = {
      * Prefix match — returns items whose value starts with the given string (case-sensitive, index-friendly). Use the pipe `|` operator for OR logic (e.g. `dag1|dag2`). Use `~` to match all. Wildcard characters (`%`, `_`) are treated as literal characters. Trailing non-alphanumeric characters in the prefix are stripped before matching so the range scan stays index-compatible under locale-aware collations — e.g. `test_` effectively matches items starting with `test`, and `s3://` matches items starting with `s3`.
      */
     taskIdPrefixPattern?: string | null;
+    /**
+     * How ``total_entries`` is computed with offset pagination: ``exact`` counts every matching entry, ``estimate`` uses the database's estimate where available (PostgreSQL), and ``none`` skips counting and returns ``null``.
+     */
+    totalEntriesMode?: TotalEntriesMode;
     tryNumber?: number | null;
 };
 
@@ -3843,6 +3888,7 @@ export type PatchTaskInstanceByMapIndexData = {
 export type PatchTaskInstanceByMapIndexResponse = TaskInstanceCollectionResponse;
 
 export type GetTaskInstancesData = {
+    accept?: 'application/json' | 'application/x-ndjson' | 'application/vnd.apache.arrow.stream' | '*/*';
     /**
      * Cursor for keyset-based pagination. Pass an empty string for the first page, then use ``next_cursor`` from the response. When ``cursor`` is provided, ``offset`` is ignored.
      */
@@ -3956,6 +4002,10 @@ export type GetTaskInstancesData = {
      */
     taskGroupId?: string | null;
     taskId?: string | null;
+    /**
+     * How ``total_entries`` is computed with offset pagination: ``exact`` counts every matching entry, ``estimate`` uses the database's estimate where available (PostgreSQL), and ``none`` skips counting and returns ``null``.
+     */
+    totalEntriesMode?: TotalEntriesMode;
     tryNumber?: Array<(number)>;
     updatedAtGt?: string | null;
     updatedAtGte?: string | null;
@@ -4418,6 +4468,11 @@ export type DeleteXcomEntryData = {
 export type DeleteXcomEntryResponse = void;
 
 export type GetXcomEntriesData = {
+    accept?: 'application/json' | 'application/x-ndjson' | 'application/vnd.apache.arrow.stream' | '*/*';
+    /**
+     * Cursor for keyset-based pagination. Pass an empty string for the first page, then use ``next_cursor`` from the response. When ``cursor`` is provided, ``offset`` is ignored.
+     */
+    cursor?: string | null;
     /**
      * SQL LIKE expression — use `%` / `_` wildcards (e.g. `%customer_%`). Use the pipe `|` operator for OR logic (e.g. `dag1 | dag2`). Regular expressions are **not** supported.
      *
@@ -4467,6 +4522,10 @@ export type GetXcomEntriesData = {
      * Prefix match — returns items whose value starts with the given string (case-sensitive, index-friendly). Use the pipe `|` operator for OR logic (e.g. `dag1|dag2`). Use `~` to match all. Wildcard characters (`%`, `_`) are treated as literal characters. Trailing non-alphanumeric characters in the prefix are stripped before matching so the range scan stays index-compatible under locale-aware collations — e.g. `test_` effectively matches items starting with `test`, and `s3://` matches items starting with `s3`.
      */
     taskIdPrefixPattern?: string | null;
+    /**
+     * How ``total_entries`` is computed with offset pagination: ``exact`` counts every matching entry, ``estimate`` uses the database's estimate where available (PostgreSQL), and ``none`` skips counting and returns ``null``.
+     */
+    totalEntriesMode?: TotalEntriesMode;
     xcomKey?: string | null;
     /**
      * SQL LIKE expression — use `%` / `_` wildcards (e.g. `%customer_%`). Use the pipe `|` operator for OR logic (e.g. `dag1 | dag2`). Regular expressions are **not** supported.
@@ -4859,7 +4918,7 @@ export type $OpenApiTs = {
                 /**
                  * Successful Response
                  */
-                200: unknown;
+                200: AssetAliasResponse;
                 /**
                  * Unauthorized
                  */
@@ -27,7 +27,8 @@ type DagRunMetricsProps = {
   readonly dagRunStates: DAGRunStates;
   readonly endDate?: string;
   readonly startDate: string;
-  readonly stateCountLimit: number;
+  // Null when the counts are exact, e.g. when they come from the state rollups.
+  readonly stateCountLimit: number | null;
 };
 
 const DAGRUN_STATES: Array<keyof DAGRunStates> = ["queued", "running", "success", "failed"];
@@ -38,7 +39,8 @@ export const DagRunMetrics = ({ dagRunStates, endDate, startDate, stateCountLimi
   // When any state hit the API's STATE_COUNT_CAP, the summed total is only a
   // lower bound, so per-state percentages computed from it are wrong (#67336).
   // Suppress percentages for the whole group in that case.
-  const isTotalTruncated = Object.values(dagRunStates).some((count) => count >= stateCountLimit);
+  const isCapped = (count: number) => stateCountLimit !== null && count >= stateCountLimit;
+  const isTotalTruncated = Object.values(dagRunStates).some(isCapped);
 
   return (
     <Box borderRadius={5} borderWidth={1} p={4}>
@@ -50,7 +52,7 @@ export const DagRunMetrics = ({ dagRunStates, endDate, startDate, stateCountLimi
       <Stack gap={4}>
         {DAGRUN_STATES.map((state) => (
           <MetricSection
-            capped={dagRunStates[state] >= stateCountLimit}
+            capped={isCapped(dagRunStates[state])}
             endDate={endDate}
             isTotalTruncated={isTotalTruncated}
             key={state}
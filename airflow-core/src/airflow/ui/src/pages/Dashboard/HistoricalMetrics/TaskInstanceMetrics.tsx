@@ -26,7 +26,8 @@ import { MetricSection } from "./MetricSection";
 type TaskInstanceMetricsProps = {
   readonly endDate?: string;
   readonly startDate: string;
-  readonly stateCountLimit: number;
+  // Null when the counts are exact, e.g. when they come from the state rollups.
+  readonly stateCountLimit: number | null;
   readonly taskInstanceStates: TaskInstanceStateCount;
 };
 
@@ -58,7 +59,8 @@ export const TaskInstanceMetrics = ({
   // When any state hit the API's STATE_COUNT_CAP, the summed total is only a
   // lower bound, so per-state percentages computed from it are wrong (#67336).
   // Suppress percentages for the whole group in that case.
-  const isTotalTruncated = Object.values(taskInstanceStates).some((count) => count >= stateCountLimit);
+  const isCapped = (count: number) => stateCountLimit !== null && count >= stateCountLimit;
+  const isTotalTruncated = Object.values(taskInstanceStates).some(isCapped);
 
   return (
     <Box borderRadius={5} borderWidth={1} mt={2} p={4}>
@@ -73,7 +75,7 @@ export const TaskInstanceMetrics = ({
         ).map((state) =>
           taskInstanceStates[state] > 0 ? (
             <MetricSection
-              capped={taskInstanceStates[state] >= stateCountLimit}
+              capped={isCapped(taskInstanceStates[state])}
               endDate={endDate}
               isTotalTruncated={isTotalTruncated}
               key={state}
@@ -272,7 +272,7 @@ export const XCom = () => {
         onStateChange={setTableURLState}
         showRowCountHeading={false}
         skeletonCount={undefined}
-        total={data ? data.total_entries : 0}
+        total={data?.total_entries ?? 0}
       />
     </Box>
   );
@@ -0,0 +1,120 @@
+/*!
+ * Licensed to the Apache Software Foundation (ASF) under one
+ * or more contributor license agreements.  See the NOTICE file
+ * distributed with this work for additional information
+ * regarding copyright ownership.  The ASF licenses this file
+ * to you under the Apache License, Version 2.0 (the
+ * "License"); you may not use this file except in compliance
+ * with the License.  You may obtain a copy of the License at
+ *
+ *   http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing,
+ * software distributed under the License is distributed on an
+ * "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+ * KIND, either express or implied.  See the License for the
+ * specific language governing permissions and limitations
+ * under the License.
+ */
+import { useEffect, useRef, useSyncExternalStore } from "react";
+
+import { OpenAPI } from "openapi/requests/core/OpenAPI";
+
+export type ChangeEvent = {
+  dag_id: string;
+  kind: "dag_run" | "task_instance";
+  map_index: number | null;
+  run_id: string;
+  state: string | null;
+  task_id: string | null;
+  updated_at: string | null;
+};
+
+// Called with `undefined` when changes were missed, in which case the data should be reloaded
+type ChangeListener = (events: Array<ChangeEvent> | undefined) => void;
+
+const changeListeners = new Set<ChangeListener>();
+const connectionListeners = new Set<() => void>();
+let eventSource: EventSource | undefined;
+let isConnected = false;
+let hasConnected = false;
+
+const setConnected = (connected: boolean) => {
+  if (isConnected !== connected) {
+    isConnected = connected;
+    connectionListeners.forEach((listener) => listener());
+  }
+};
+
+const notify = (events: Array<ChangeEvent> | undefined) => {
+  changeListeners.forEach((listener) => listener(events));
+};
+
+const openFeed = () => {
+  hasConnected = false;
+  eventSource = new EventSource(`${OpenAPI.BASE}/ui/changes`);
+  eventSource.addEventListener("open", () => {
+    setConnected(true);
+    // Changes made while reconnecting were not published
+    if (hasConnected) {
+      notify(undefined);
+    }
+    hasConnected = true;
+  });
+  eventSource.addEventListener("message", (event: MessageEvent<string>) => {
+    notify((JSON.parse(event.data) as { events: Array<ChangeEvent> }).events);
+  });
+  eventSource.addEventListener("resync", () => notify(undefined));
+  // The browser reconnects on its own, unless the server refused the stream, e.g. an older API server.
+  // Either way, subscribers poll until the feed is connected again.
+  eventSource.addEventListener("error", () => setConnected(false));
+};
+
+const closeFeed = () => {
+  eventSource?.close();
+  eventSource = undefined;
+  setConnected(false);
+};
+
+const subscribeChanges = (listener: ChangeListener) => {
+  changeListeners.add(listener);
+  if (eventSource === undefined) {
+    openFeed();
+  }
+
+  return () => {
+    changeListeners.delete(listener);
+    if (changeListeners.size === 0) {
+      closeFeed();
+    }
+  };
+};
+
+const subscribeConnection = (listener: () => void) => {
+  connectionListeners.add(listener);
+
+  return () => {
+    connectionListeners.delete(listener);
+  };
+};
+
+const getIsConnected = () => isConnected;
+
+/**
+ * Subscribes to the state changes of Dag runs and task instances pushed by the API server.
+ *
+ * All the subscribers of a page share a single server-sent events connection to `/ui/changes`.
+ * Returns whether the feed is connected: while it is, `onChanges` is called with every change, so
+ * callers can refresh their data on changes instead of polling it.
+ */
+export const useChangeFeed = (onChanges: ChangeListener) => {
+  const onChangesRef = useRef(onChanges);
+
+  useEffect(() => {
+    onChangesRef.current = onChanges;
+  }, [onChanges]);
+
+  useEffect(() => subscribeChanges((events) => onChangesRef.current(events)), []);
+
+  return useSyncExternalStore(subscribeConnection, getIsConnected);
+};
@@ -16,10 +16,14 @@
  * specific language governing permissions and limitations
  * under the License.
  */
-import { useDagServiceGetDagsUi } from "openapi/queries";
-import type { DagRunState } from "openapi/requests/types.gen";
+import { useQueryClient } from "@tanstack/react-query";
+
+import { useDagServiceGetDagsUi, useDagServiceGetDagsUiKey } from "openapi/queries";
+import type { DAGWithLatestDagRunsCollectionResponse, DagRunState } from "openapi/requests/types.gen";
 import { isStatePending, useAutoRefresh } from "src/utils";
 
+import { useChangeFeed } from "./useChangeFeed";
+
 export const useDags = ({
   advancedSearch = false,
   dagDisplayNamePattern,
@@ -57,8 +61,27 @@ export const useDags = ({
   tagsMatchMode?: "all" | "any";
   teams?: Array<string>;
 }) => {
+  const queryClient = useQueryClient();
   const refetchInterval = useAutoRefresh({});
 
+  // While the change feed is connected, the lists showing a Dag whose runs changed are reloaded
+  // instead of polled
+  const isFeedConnected = useChangeFeed((events) => {
+    const dagIds = new Set(events?.filter((event) => event.kind === "dag_run").map((event) => event.dag_id));
+
+    if (events === undefined || dagIds.size > 0) {
+      void queryClient.invalidateQueries({
+        predicate: (query) =>
+          events === undefined ||
+          ((query.state.data as DAGWithLatestDagRunsCollectionResponse | undefined)?.dags.some((dag) =>
+            dagIds.has(dag.dag_id),
+          ) ??
+            false),
+        queryKey: [useDagServiceGetDagsUiKey],
+      });
+    }
+  });
+
   const { data, error, isFetching, isLoading } = useDagServiceGetDagsUi(
     {
       ...(advancedSearch
@@ -82,6 +105,7 @@ export const useDags = ({
     undefined,
     {
       refetchInterval: (query) =>
+        !isFeedConnected &&
         query.state.data?.dags.some(
           (dag) => !dag.is_paused && dag.latest_dag_runs.some((dr) => isStatePending(dr.state)),
         )
@@ -16,12 +16,15 @@
  * specific language governing permissions and limitations
  * under the License.
  */
+import { useQueryClient } from "@tanstack/react-query";
 import { useParams } from "react-router-dom";
 
-import { useGridServiceGetGridRuns } from "openapi/queries";
+import { useGridServiceGetGridRuns, useGridServiceGetGridRunsKey } from "openapi/queries";
 import type { DagRunState, DagRunType } from "openapi/requests/types.gen";
 import { isStatePending, useAutoRefresh } from "src/utils";
 
+import { useChangeFeed } from "./useChangeFeed";
+
 export const useGridRuns = ({
   dagRunState,
   limit,
@@ -40,9 +43,17 @@ export const useGridRuns = ({
   triggeringUser?: string | undefined;
 }) => {
   const { dagId = "" } = useParams();
+  const queryClient = useQueryClient();
 
   const refetchInterval = useAutoRefresh({ dagId });
 
+  // While the change feed is connected, the runs are reloaded when one of them changes instead of polled
+  const isFeedConnected = useChangeFeed((events) => {
+    if (events === undefined || events.some((event) => event.kind === "dag_run" && event.dag_id === dagId)) {
+      void queryClient.invalidateQueries({ queryKey: [useGridServiceGetGridRunsKey, { dagId }] });
+    }
+  });
+
   const { data: GridRuns, ...rest } = useGridServiceGetGridRuns(
     {
       dagId,
@@ -59,7 +70,7 @@ export const useGridRuns = ({
     {
       placeholderData: (prev) => prev,
       refetchInterval: (query) =>
-        query.state.data?.some((run) => isStatePending(run.state)) && refetchInterval,
+        !isFeedConnected && query.state.data?.some((run) => isStatePending(run.state)) && refetchInterval,
     },
   );
 
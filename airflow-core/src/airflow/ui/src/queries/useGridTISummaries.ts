@@ -28,6 +28,8 @@ import type { GridTISummaries, TaskInstanceState } from "openapi/requests";
 import { OpenAPI } from "openapi/requests/core/OpenAPI";
 import { isStatePending, useAutoRefresh } from "src/utils";
 
+import { useChangeFeed } from "./useChangeFeed";
+
 const GRID_MUTATION_WATCHED_KEYS = new Set([
   useTaskInstanceServiceGetTaskInstancesKey,
   useGridServiceGetGridRunsKey,
@@ -42,7 +44,8 @@ const GRID_MUTATION_WATCHED_KEYS = new Set([
  * rather than waiting for the entire payload.  This eliminates the N+1 request
  * pattern without loading all runs into one large query.
  *
- * Auto-refreshes while any run is still in a pending state.
+ * Re-streams when the change feed reports a change of one of the runs or of their task instances,
+ * or, when the feed is not connected, periodically while any run is still in a pending state.
  */
 export const useGridTiSummariesStream = ({
   dagId,
@@ -63,6 +66,15 @@ export const useGridTiSummariesStream = ({
   // Stable key so the effect only re-fires when the run list actually changes.
   const runIdsKey = runIds.join(",");
 
+  const isFeedConnected = useChangeFeed((events) => {
+    if (
+      events === undefined ||
+      events.some((event) => event.dag_id === dagId && runIds.includes(event.run_id))
+    ) {
+      setRefreshTick((tick) => tick + 1);
+    }
+  });
+
   // Stream (or re-stream) whenever the run list or refresh tick changes.
   useEffect(() => {
     if (!dagId || runIds.length === 0) {
@@ -138,9 +150,9 @@ export const useGridTiSummariesStream = ({
     // eslint-disable-next-line react-hooks/exhaustive-deps -- runIdsKey (stable join) intentionally replaces runIds array to avoid spurious re-streams
   }, [dagId, runIdsKey, refreshTick]);
 
-  // Trigger a re-stream periodically while active runs are in flight.
+  // Trigger a re-stream periodically while active runs are in flight, unless the change feed reports changes.
   useEffect(() => {
-    if (!hasActiveRuns || typeof baseRefetchInterval !== "number") {
+    if (isFeedConnected || !hasActiveRuns || typeof baseRefetchInterval !== "number") {
       return undefined;
     }
 
@@ -153,7 +165,7 @@ export const useGridTiSummariesStream = ({
     }, baseRefetchInterval);
 
     return () => clearInterval(timer);
-  }, [hasActiveRuns, baseRefetchInterval]);
+  }, [isFeedConnected, hasActiveRuns, baseRefetchInterval]);
 
   // Re-stream whenever a mutation invalidates a grid-related query (TI states,
   // run states, or grid structure).  Invalidation events only fire from explicit
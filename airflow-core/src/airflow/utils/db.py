@@ -61,7 +61,7 @@ from airflow.models import import_all_models
 from airflow.utils import helpers
 from airflow.utils.db_manager import RunDBManager
 from airflow.utils.session import NEW_SESSION, provide_session
-from airflow.utils.sqlalchemy import get_dialect_name
+from airflow.utils.sqlalchemy import ExplainJson, get_dialect_name
 
 _USE_PSYCOPG3: bool
 try:
@@ -117,7 +117,7 @@ _REVISION_HEADS_MAP: dict[str, str] = {
     "3.1.8": "509b94a1042d",
     "3.2.0": "1d6611b6ab7c",
     "3.3.0": "d2f4e1b3c5a7",
-    "3.4.0": "7a98f1b7dbd3",
+    "3.4.0": "9c3d5e7f1a2b",
 }
 
 # Prefix used to identify tables holding data moved during migration.
@@ -1780,6 +1780,41 @@ async def get_query_count_async(statement: Select, *, session: AsyncSession) ->
     return result or 0
 
 
+def _plan_rows(plan: Any) -> int:
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def get_query_count_estimate(query_stmt: Select, *, session: Session) -> int:
+    """
+    Get an estimate of the count of a query.
+
+    On PostgreSQL, this is the number of rows the query planner expects the
+    statement to return, which only costs planning the statement rather than
+    scanning the rows it matches. Other backends give no estimate reliable
+    enough for filtered and joined statements, and get the exact count.
+
+    :meta private:
+    """
+    if get_dialect_name(session) != "postgresql":
+        return get_query_count(query_stmt, session=session)
+    return _plan_rows(session.scalar(ExplainJson(query_stmt.order_by(None))))
+
+
+async def get_query_count_estimate_async(statement: Select, *, session: AsyncSession) -> int:
+    """
+    Get an estimate of the count of a query.
+
+    See :func:`get_query_count_estimate`.
+
+    :meta private:
+    """
+    if session.get_bind().dialect.name != "postgresql":
+        return await get_query_count_async(statement, session=session)
+    return _plan_rows(await session.scalar(ExplainJson(statement.order_by(None))))
+
+
 def check_query_exists(query_stmt: Select, *, session: Session) -> bool:
     """
     Check whether there is at least one row matching a query.
@@ -734,6 +734,19 @@ def run_cleanup(
         else:
             logger.warning("Table %s not found.  Skipping.", table_name)
 
+    # The state rollups of the dashboard still count the purged Dag runs and task instances
+    if (
+        not dry_run
+        and {"dag_run", "task_instance"} & set(effective_table_names)
+        and "state_rollup" in existing_tables
+    ):
+        from airflow.models.state_rollup import recompute_state_rollups_before
+
+        with _suppress_with_logging("state_rollup", session) as ctx:
+            recompute_state_rollups_before(clean_before_timestamp, session=session)
+        if ctx.failed:
+            failed_tables.append("state_rollup")
+
     if failed_tables:
         if error_on_cleanup_failure:
             raise RuntimeError(
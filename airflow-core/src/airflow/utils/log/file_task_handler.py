@@ -40,6 +40,7 @@ from typing_extensions import NotRequired
 from airflow.configuration import conf
 from airflow.executors.executor_loader import ExecutorLoader
 from airflow.utils.helpers import parse_template_string, render_template
+from airflow.utils.log.log_index import LOG_INDEX_SUFFIX, LogIndex
 from airflow.utils.log.log_stream_accumulator import LogStreamAccumulator
 from airflow.utils.log.logging_mixin import SetContextPropagate
 from airflow.utils.log.non_caching_file_handler import NonCachingRotatingFileHandler
@@ -106,6 +107,9 @@ class LogMetadata(TypedDict):
 
     end_of_log: bool
     log_pos: NotRequired[int]
+    # Position reached in each log source by the previous read, which the next read resumes from: a byte
+    # offset for local and served log files, a number of lines for remote and executor logs
+    log_positions: NotRequired[dict[str, int]]
     # the following attributes are used for Elasticsearch and OpenSearch log handlers
     offset: NotRequired[str | int]
     # Ensure a string here. Large offset numbers will get JSON.parsed incorrectly
@@ -166,7 +170,7 @@ def _set_task_deferred_context_var():
         h.ctx_task_deferred = True
 
 
-def _fetch_logs_from_service(url: str, log_relative_path: str) -> Response:
+def _fetch_logs_from_service(url: str, log_relative_path: str, offset: int = 0) -> Response:
     # Import occurs in function scope for perf. Ref: https://github.com/apache/airflow/pull/21438
     import requests
 
@@ -184,12 +188,10 @@ def _fetch_logs_from_service(url: str, log_relative_path: str) -> Response:
         valid_for=conf.getint("webserver", "log_request_clock_grace", fallback=30),
         audience="task-instance-logs",
     )
-    response = requests.get(
-        url,
-        timeout=timeout,
-        headers={"Authorization": generator.generate({"filename": log_relative_path})},
-        stream=True,
-    )
+    headers = {"Authorization": generator.generate({"filename": log_relative_path})}
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+    response = requests.get(url, timeout=timeout, headers=headers, stream=True)
     response.encoding = "utf-8"
     return response
 
@@ -247,6 +249,106 @@ def _stream_lines_by_chunk(
         yield from buffer.split("\n")
 
 
+def _stream_lines_from_offset(
+    log_io: IO[bytes],
+    log_positions: dict[str, int],
+    source: str,
+    offset: int = 0,
+    end_of_log: bool = False,
+) -> RawLogStream:
+    """
+    Stream lines from a binary file-like IO object positioned at a byte offset, and close it.
+
+    ``log_positions[source]`` is kept at the offset following the last line read, for the next read to
+    resume from. A last incomplete line, i.e. one still being written, is held back for the next read
+    unless the log has ended.
+
+    :param log_io: A binary file-like IO object to read from, positioned at ``offset``.
+    :param log_positions: The position reached in each log source.
+    :param source: The log source read from.
+    :param offset: The byte offset of ``log_io`` in the log source.
+    :param end_of_log: Whether nothing will be written to the log source anymore.
+    :return: A generator that yields individual lines.
+    """
+    log_positions[source] = offset
+    buffer = b""
+    try:
+        while chunk := log_io.read(CHUNK_SIZE):
+            buffer += chunk
+            end = buffer.rfind(b"\n") + 1
+            if end:
+                # Lines are split on bytes, which never splits a UTF-8 encoded character
+                yield from buffer[: end - 1].decode("utf-8", errors="replace").split("\n")
+                log_positions[source] += end
+                buffer = buffer[end:]
+    except Exception as e:
+        logger.error("Error reading log stream: %s", e)
+    finally:
+        log_io.close()
+    if buffer and end_of_log:
+        yield buffer.decode("utf-8", errors="replace")
+        log_positions[source] += len(buffer)
+
+
+def _stream_local_log_from_position(
+    path: str,
+    source: str,
+    log_positions: dict[str, int],
+    since: datetime | None,
+    end_of_log: bool = False,
+) -> RawLogStream:
+    """
+    Stream lines from a local log file, from the position reached in it by a previous read.
+
+    A log file without a position, i.e. a new log file or one truncated or rotated since the previous read,
+    is read from ``since``, located with the index of the log file. The index is only loaded and updated
+    then, a read from a position reads the new lines once.
+
+    :param path: The path of the log file.
+    :param source: The log source, in ``log_positions``.
+    :param log_positions: The position reached in each log source.
+    :param since: The timestamp from which to read the log file if it has no position.
+    :param end_of_log: Whether nothing will be written to the log file anymore.
+    :return: A generator that yields individual lines.
+    """
+    offset = log_positions.get(source)
+    if offset is not None and offset > os.stat(path).st_size:
+        # The log file was truncated or rotated since the previous read
+        offset = None
+    log_io = open(path, "rb")
+    if offset is None and since is not None:
+        offset = LogIndex.load(path).seek_timestamp(since).offset
+        log_io.seek(offset)
+        return _stream_lines_since(
+            _stream_lines_from_offset(log_io, log_positions, source, offset, end_of_log), since
+        )
+    log_io.seek(offset or 0)
+    return _stream_lines_from_offset(log_io, log_positions, source, offset or 0, end_of_log)
+
+
+def _stream_lines_from_line(
+    log_stream: RawLogStream,
+    log_positions: dict[str, int],
+    source: str,
+) -> RawLogStream:
+    """
+    Stream lines from a log stream, skipping the lines already read from the source.
+
+    The skipped lines are not parsed. ``log_positions[source]`` is kept at the number of lines read.
+
+    :param log_stream: The stream of lines of the log source, from its first line.
+    :param log_positions: The position reached in each log source.
+    :param source: The log source read from.
+    :return: A generator that yields the lines following the position of the source.
+    """
+    line_num = log_positions.get(source, 0)
+    log_positions[source] = 0
+    for line in log_stream:
+        log_positions[source] += 1
+        if log_positions[source] > line_num:
+            yield line
+
+
 def _log_stream_to_parsed_log_stream(
     log_stream: RawLogStream,
 ) -> ParsedLogStream:
@@ -278,6 +380,22 @@ def _log_stream_to_parsed_log_stream(
         idx += 1
 
 
+def _parse_line_timestamp(line: str) -> datetime | None:
+    """Return the timestamp of a log line, structured or not, if it has one."""
+    parsed_log = next(_log_stream_to_parsed_log_stream(log_line for log_line in [line]), None)
+    return parsed_log[0] if parsed_log else None
+
+
+def _stream_lines_since(log_stream: RawLogStream, since: datetime) -> RawLogStream:
+    """Stream lines from a log stream, skipping the first lines while they were logged before ``since``."""
+    for line in log_stream:
+        timestamp = _parse_line_timestamp(line)
+        if timestamp and timestamp >= since:
+            yield line
+            break
+    yield from log_stream
+
+
 def _create_sort_key(timestamp: datetime | None, line_num: int) -> int:
     """
     Create a sort key for log record, to be used in K-way merge.
@@ -396,6 +514,23 @@ def _interleave_logs(*log_streams: RawLogStream) -> StructuredLogStream:
     del parsed_log_streams
 
 
+def _track_last_timestamped_log(
+    log_stream: LogHandlerOutputStream,
+    last_log_container: list[StructuredLogMessage | None],
+) -> StructuredLogStream:
+    """
+    Stream logs, keeping the last log with a timestamp in a container.
+
+    :param log_stream: the stream of logs
+    :param last_log_container: a container to store the last log with a timestamp
+    :return: the stream of logs
+    """
+    for log in log_stream:
+        if log.timestamp:
+            last_log_container[0] = log
+        yield log
+
+
 def _is_logs_stream_like(log) -> bool:
     """Check if the logs are stream-like."""
     return isinstance(log, (chain, islice, GeneratorType))
@@ -595,17 +730,41 @@ class FileTaskHandler(logging.Handler):
                                   which was retrieved in previous calls, this
                                   part will be skipped and only following test
                                   returned to be added to tail.
+                         log_positions: Position reached in each log source by
+                                  previous calls, from which each source is
+                                  read, rather than read from its start and
+                                  skipped up to log_pos. An empty dict reads
+                                  the sources from their start.
         :return: log message as a string and metadata.
                  Following attributes are used in metadata:
                  end_of_log: Boolean, True if end of log is reached or False
                              if further calls might get more log text.
                              This is determined by the status of the TaskInstance
                  log_pos: (absolute) Char position to which the log is retrieved
+                 log_positions: Position reached in each log source, if given
+                             in the metadata passed
+                 last_log_timestamp: Timestamp of the last log message read, if
+                             log_positions was given in the metadata passed
         """
         # Task instance here might be different from task instance when
         # initializing the handler. Thus explicitly getting log location
         # is needed to get correct log path.
         worker_log_rel_path = self._render_filename(ti, try_number)
+        # Checked before reading, so that the lines logged until the end are read when it is reached
+        end_of_log = ti.try_number != try_number or ti.state not in (
+            TaskInstanceState.RUNNING,
+            TaskInstanceState.DEFERRED,
+        )
+        log_positions: dict[str, int] | None = None
+        position_args: tuple = ()
+        if metadata and "log_positions" in metadata:
+            log_positions = dict(metadata["log_positions"])
+            # Log files without a position yet, e.g. new trigger or rotated log files, are read from the
+            # last message already read rather than from their start
+            since = (
+                pendulum.parse(metadata["last_log_timestamp"]) if "last_log_timestamp" in metadata else None
+            )
+            position_args = (log_positions, since, end_of_log)
         sources: LogSourceInfo = []
         source_list: list[str] = []
         remote_logs: list[RawLogStream] = []
@@ -628,6 +787,11 @@ class FileTaskHandler(logging.Handler):
             else:
                 # If the logs are in a different format, raise an error
                 raise TypeError("Logs should be either a list of strings or a generator of log lines.")
+            if log_positions is not None:
+                remote_logs = [
+                    _stream_lines_from_line(log_stream, log_positions, f"remote:{idx}")
+                    for idx, log_stream in enumerate(remote_logs)
+                ]
             # Extend LogSourceInfo
             source_list.extend(sources)
 
@@ -646,14 +810,19 @@ class FileTaskHandler(logging.Handler):
             if sources:
                 source_list.extend(sources)
                 has_executor_log = True
+            if log_positions is not None:
+                executor_logs = [
+                    _stream_lines_from_line(log_stream, log_positions, f"executor:{idx}")
+                    for idx, log_stream in enumerate(executor_logs)
+                ]
 
         if not (remote_logs and ti.state not in State.unfinished):
             # when finished, if we have remote logs, no need to check local
             worker_log_full_path = Path(self.local_base, worker_log_rel_path)
-            sources, local_logs = self._read_from_local(worker_log_full_path)
+            sources, local_logs = self._read_from_local(worker_log_full_path, *position_args)
             source_list.extend(sources)
         if ti.state in (TaskInstanceState.RUNNING, TaskInstanceState.DEFERRED) and not has_executor_log:
-            sources, served_logs = self._read_from_logs_server(ti, worker_log_rel_path)
+            sources, served_logs = self._read_from_logs_server(ti, worker_log_rel_path, *position_args)
             source_list.extend(sources)
         elif (ti.state not in State.unfinished or ti.state in _STATES_WITH_COMPLETED_ATTEMPT) and not (
             local_logs or remote_logs
@@ -661,7 +830,7 @@ class FileTaskHandler(logging.Handler):
             # ordinarily we don't check served logs, with the assumption that users set up
             # remote logging or shared drive for logs for persistence, but that's not always true
             # so even if task is done, if no local logs or remote logs are found, we'll check the worker
-            sources, served_logs = self._read_from_logs_server(ti, worker_log_rel_path)
+            sources, served_logs = self._read_from_logs_server(ti, worker_log_rel_path, *position_args)
             source_list.extend(sources)
 
         out_stream: LogHandlerOutputStream = _interleave_logs(
@@ -670,6 +839,9 @@ class FileTaskHandler(logging.Handler):
             *executor_logs,
             *served_logs,
         )
+        last_log_container: list[StructuredLogMessage | None] = [None]
+        if log_positions is not None:
+            out_stream = _track_last_timestamped_log(out_stream, last_log_container)
 
         # Log message source details are grouped: they are not relevant for most users and can
         # distract them from finding the root cause of their errors
@@ -678,15 +850,27 @@ class FileTaskHandler(logging.Handler):
             *[StructuredLogMessage(event=source) for source in source_list],
             StructuredLogMessage(event="::endgroup::"),
         ]
-        end_of_log = ti.try_number != try_number or ti.state not in (
-            TaskInstanceState.RUNNING,
-            TaskInstanceState.DEFERRED,
-        )
 
         with LogStreamAccumulator(out_stream, HEAP_DUMP_SIZE) as stream_accumulator:
             log_pos = stream_accumulator.total_lines
             out_stream = stream_accumulator.stream
 
+            if metadata and log_positions is not None:
+                # the sources were read from their positions: all the lines read are new
+                out_metadata: LogMetadata = {
+                    "end_of_log": end_of_log,
+                    "log_pos": metadata.get("log_pos", 0) + log_pos,
+                    "log_positions": log_positions,
+                }
+                if (last_log := last_log_container[0]) and last_log.timestamp:
+                    out_metadata["last_log_timestamp"] = last_log.timestamp.isoformat()
+                elif "last_log_timestamp" in metadata:
+                    out_metadata["last_log_timestamp"] = metadata["last_log_timestamp"]
+                if not metadata["log_positions"]:
+                    # first time reading log, add messages before interleaved log stream
+                    out_stream = chain(header, out_stream)
+                return out_stream, out_metadata
+
             # skip log stream until the last position
             if metadata and "log_pos" in metadata:
                 out_stream = islice(out_stream, metadata["log_pos"], None)
@@ -877,7 +1061,20 @@ class FileTaskHandler(logging.Handler):
     def _read_from_local(
         self,
         worker_log_path: Path,
+        log_positions: dict[str, int] | None = None,
+        since: datetime | None = None,
+        end_of_log: bool = False,
     ) -> StreamingLogResponse:
+        """
+        Read the local log files of a task instance try.
+
+        :param worker_log_path: path of the log file, the files whose name starts with it are read too
+        :param log_positions: if given, the byte offset reached in each file by a previous read, from which
+            the file is read, and which is kept at the offset reached by this read
+        :param since: the timestamp from which to read the files without a position, if given
+        :param end_of_log: whether nothing will be logged to the files anymore, in which case their last
+            incomplete lines are read too
+        """
         sources: LogSourceInfo = []
         log_streams: list[RawLogStream] = []
         # The glob below can match symlinks as well as regular files, so
@@ -885,7 +1082,11 @@ class FileTaskHandler(logging.Handler):
         # log folder. Canonicalising ``self.local_base`` once up front makes
         # the containment check compare two already-resolved paths.
         base_log_folder = os.path.realpath(self.local_base)
-        paths = sorted(worker_log_path.parent.glob(worker_log_path.name + "*"))
+        paths = sorted(
+            path
+            for path in worker_log_path.parent.glob(worker_log_path.name + "*")
+            if not path.name.endswith(LOG_INDEX_SUFFIX)
+        )
         if not paths:
             return sources, log_streams
 
@@ -905,7 +1106,12 @@ class FileTaskHandler(logging.Handler):
             # successful ``open`` so ``sources`` and ``log_streams`` stay
             # aligned.
             try:
-                log_stream = _stream_lines_by_chunk(open(resolved_path, encoding="utf-8"))
+                if log_positions is None:
+                    log_stream = _stream_lines_by_chunk(open(resolved_path, encoding="utf-8"))
+                else:
+                    log_stream = _stream_local_log_from_position(
+                        resolved_path, os.fspath(path), log_positions, since, end_of_log
+                    )
             except OSError:
                 continue
             sources.append(os.fspath(path))
@@ -916,7 +1122,23 @@ class FileTaskHandler(logging.Handler):
         self,
         ti: TaskInstance | TaskInstanceHistory,
         worker_log_rel_path: str,
+        log_positions: dict[str, int] | None = None,
+        since: datetime | None = None,
+        end_of_log: bool = False,
     ) -> StreamingLogResponse:
+        """
+        Read the log file of a task instance try served by the worker or triggerer that ran it.
+
+        :param ti: task instance object
+        :param worker_log_rel_path: path of the log file, relative to the base log folder
+        :param log_positions: if given, the byte offset reached in the served log file by a previous read,
+            from which the file is requested, and which is kept at the offset reached by this read
+        :param since: the timestamp from which to read the local log files without a position, if given,
+            when they are read instead of the served log file
+        :param end_of_log: whether nothing will be logged to the log file anymore, in which case its last
+            incomplete line is read too
+        """
+        position_args = () if log_positions is None else (log_positions, since, end_of_log)
         sources: LogSourceInfo = []
         log_streams: list[RawLogStream] = []
         try:
@@ -929,7 +1151,14 @@ class FileTaskHandler(logging.Handler):
                     f"Please check your `hostname_callable` configuration."
                 )
                 return sources, log_streams
-            response = _fetch_logs_from_service(url, rel_path)
+            offset = log_positions.get(url, 0) if log_positions is not None else 0
+            response = _fetch_logs_from_service(url, rel_path, offset)
+            if response.status_code == 416:
+                # Nothing was logged since the previous read, unless the log file was truncated
+                size = response.headers.get("Content-Range", "").rpartition("/")[2]
+                if size.isdigit() and int(size) < offset:
+                    offset = 0
+                    response = _fetch_logs_from_service(url, rel_path)
             if response.status_code == 403:
                 sources.append(
                     "!!!! Please make sure that all your Airflow components (e.g. "
@@ -945,7 +1174,9 @@ class FileTaskHandler(logging.Handler):
                 # and the original worker's logs are no longer accessible.
                 # Fall back to local filesystem read if available.
                 worker_log_full_path = Path(self.local_base, worker_log_rel_path)
-                fallback_sources, fallback_streams = self._read_from_local(worker_log_full_path)
+                fallback_sources, fallback_streams = self._read_from_local(
+                    worker_log_full_path, *position_args
+                )
                 if fallback_sources:
                     sources.extend(fallback_sources)
                     log_streams.extend(fallback_streams)
@@ -956,15 +1187,27 @@ class FileTaskHandler(logging.Handler):
                         f"are no longer accessible. "
                         f"Consider configuring remote logging (S3, GCS, etc.) for log persistence."
                     )
+            elif response.status_code == 416 and log_positions is not None:
+                sources.append(url)
+                log_positions[url] = offset
             else:
                 # Check if the resource was properly fetched
                 response.raise_for_status()
 
                 if int(response.headers.get("Content-Length", 0)) > 0:
                     sources.append(url)
-                    log_streams.append(
-                        _stream_lines_by_chunk(io.TextIOWrapper(cast("IO[bytes]", response.raw)))
-                    )
+                    raw = cast("IO[bytes]", response.raw)
+                    if log_positions is None:
+                        log_streams.append(_stream_lines_by_chunk(io.TextIOWrapper(raw)))
+                    else:
+                        if response.status_code != 206:
+                            # The log server ignored the requested range: skip what was already read
+                            remaining = offset
+                            while remaining > 0 and (skipped := raw.read(min(remaining, CHUNK_SIZE))):
+                                remaining -= len(skipped)
+                        log_streams.append(
+                            _stream_lines_from_offset(raw, log_positions, url, offset, end_of_log)
+                        )
         except Exception as e:
             from requests.exceptions import InvalidURL
 
@@ -0,0 +1,175 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Sparse line and timestamp index of task log files, to seek in them without reading them whole."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from bisect import bisect_left
+from contextlib import suppress
+from itertools import accumulate
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+LOG_INDEX_SUFFIX = ".index"
+"""Suffix of the sidecar file holding the index of a log file, next to the log file."""
+LOG_INDEX_INTERVAL = 1000
+"""Number of lines between two entries of a log index."""
+READ_SIZE = 1024 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+class LogIndexEntry(NamedTuple):
+    """Position of a line of a log file."""
+
+    line: int
+    offset: int
+    timestamp: float | None
+    """POSIX timestamp of the line, or of the last line before it that has one."""
+
+
+def _line_timestamp(line: bytes) -> float | None:
+    """Return the POSIX timestamp of a log line, structured or not, if it has one."""
+    # avoid circular import
+    from airflow.utils.log.file_task_handler import _parse_line_timestamp
+
+    timestamp = _parse_line_timestamp(line.decode("utf-8", errors="replace"))
+    return timestamp.timestamp() if timestamp else None
+
+
+class LogIndex:
+    """
+    Sparse index of the lines of a log file, with the byte offset and timestamp of every ``interval`` lines.
+
+    The index is extended incrementally as lines are appended to the log file, and saved next to it in a
+    sidecar file named after it with the :data:`LOG_INDEX_SUFFIX` suffix, so that readers of a large log
+    file can seek to a line or a timestamp by reading at most ``interval`` lines, rather than the whole file.
+
+    :param log_path: path of the log file
+    :param interval: number of lines between two entries of the index
+    """
+
+    def __init__(self, log_path: str | os.PathLike[str], interval: int = LOG_INDEX_INTERVAL) -> None:
+        self.log_path = Path(log_path)
+        self.interval = interval
+        self.entries: list[LogIndexEntry] = []
+        self.lines = 0
+        """Number of complete lines indexed."""
+        self.size = 0
+        """Byte offset following the last complete line indexed."""
+
+    @property
+    def index_path(self) -> Path:
+        return self.log_path.with_name(self.log_path.name + LOG_INDEX_SUFFIX)
+
+    @classmethod
+    def load(cls, log_path: str | os.PathLike[str]) -> LogIndex:
+        """
+        Load the index of a log file from its sidecar file, and index the lines appended since it was saved.
+
+        The index is built from the start of the log file if it has no sidecar file yet, or if the sidecar
+        file cannot be read.
+        """
+        index = cls(log_path)
+        with suppress(OSError, ValueError, KeyError, TypeError):
+            data = json.loads(index.index_path.read_bytes())
+            index.interval = data["interval"]
+            index.lines = data["lines"]
+            index.size = data["size"]
+            index.entries = [LogIndexEntry(*entry) for entry in data["entries"]]
+        # The index of a log file shorter than ``interval`` lines has a single entry, it is not worth saving
+        if index.update() and index.lines >= index.interval:
+            index.save()
+        return index
+
+    def update(self) -> bool:
+        """Index the lines appended to the log file since the last update, return whether there were any."""
+        try:
+            size = self.log_path.stat().st_size
+        except OSError:
+            return False
+        if size < self.size:
+            # The log file was truncated or replaced: index it from the start again
+            self.entries, self.lines, self.size = [], 0, 0
+        if size == self.size:
+            return False
+
+        lines = self.lines
+        with open(self.log_path, "rb") as log_file:
+            log_file.seek(self.size)
+            buffer = b""
+            while chunk := log_file.read(READ_SIZE):
+                buffer += chunk
+                end = buffer.rfind(b"\n") + 1
+                if end:
+                    self._index_lines(buffer[: end - 1].split(b"\n"))
+                    buffer = buffer[end:]
+        return self.lines > lines
+
+    def _index_lines(self, lines: list[bytes]) -> None:
+        """Add the entries of complete lines following the last line indexed."""
+        # ``starts[i] + i`` is the offset of the i-th line from the first, counting the newlines before it
+        starts = list(accumulate(map(len, lines), initial=0))
+        last_timestamp = self.entries[-1].timestamp if self.entries else None
+        for i in range(-self.lines % self.interval, len(lines), self.interval):
+            timestamp = _line_timestamp(lines[i]) or last_timestamp
+            self.entries.append(LogIndexEntry(self.lines + i, self.size + starts[i] + i, timestamp))
+            last_timestamp = timestamp
+        self.lines += len(lines)
+        self.size += starts[-1] + len(lines)
+
+    def save(self) -> None:
+        """Write the index to its sidecar file, if the folder of the log file is writable."""
+        data = {"interval": self.interval, "lines": self.lines, "size": self.size, "entries": self.entries}
+        tmp_name: str | None = None
+        try:
+            # Write to a hidden temporary file first, so that readers never see a partially written index
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.log_path.parent, prefix=".", suffix=LOG_INDEX_SUFFIX, delete=False
+            ) as index_file:
+                tmp_name = index_file.name
+                json.dump(data, index_file, separators=(",", ":"))
+            os.replace(tmp_name, self.index_path)
+        except OSError as e:
+            logger.debug("Could not save the index of %s: %s", self.log_path, e)
+            if tmp_name:
+                with suppress(OSError):
+                    os.remove(tmp_name)
+
+    def seek_line(self, line: int) -> LogIndexEntry:
+        """Return the last indexed position at or before a line number."""
+        if not self.entries or line <= 0:
+            return LogIndexEntry(0, 0, None)
+        return self.entries[min(line // self.interval, len(self.entries) - 1)]
+
+    def seek_timestamp(self, timestamp: datetime) -> LogIndexEntry:
+        """
+        Return the last indexed position before a timestamp.
+
+        The lines logged at or after the timestamp follow that position, assuming the lines of the log
+        file are ordered by timestamp, as lines appended to a log are.
+        """
+        i = bisect_left(self.entries, timestamp.timestamp(), key=lambda entry: entry.timestamp or 0.0)
+        return self.entries[i - 1] if i else LogIndexEntry(0, 0, None)
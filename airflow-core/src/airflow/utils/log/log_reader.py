@@ -96,6 +96,10 @@ class TaskLogReader:
             # one message + tell the caller it's the end so stream stops
             return msg, {"end_of_log": True}
 
+        if "log_pos" not in metadata:
+            # Read the log sources from the position reached in each of them by the previous read, rather
+            # than read them from their start again to skip the lines before ``log_pos``
+            metadata.setdefault("log_positions", {})
         return self.log_handler.read(ti, try_number, metadata=metadata)
 
     def read_log_stream(
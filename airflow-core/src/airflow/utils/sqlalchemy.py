@@ -22,16 +22,16 @@ import copy
 import datetime
 import json
 import logging
-from collections.abc import Generator
+from collections.abc import Collection, Generator
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import TIMESTAMP, PickleType, String, event, nullsfirst, text
 from sqlalchemy.dialects import mysql
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.compiler import compiles
-from sqlalchemy.sql.expression import ColumnElement
+from sqlalchemy.sql.expression import ClauseElement, ColumnElement, Executable
 from sqlalchemy.sql.functions import FunctionElement
-from sqlalchemy.types import JSON, NullType, Text, TypeDecorator
+from sqlalchemy.types import JSON, Boolean, NullType, Text, TypeDecorator
 
 from airflow._shared.timezones.timezone import make_naive, utc
 from airflow.configuration import conf
@@ -236,6 +236,72 @@ def _default_json_contains(element, compiler, **kw):
     return compiler.process(and_(*clauses), **kw)
 
 
+#: Number of values above which :func:`in_values` sends them to PostgreSQL as a single array parameter.
+IN_VALUES_ARRAY_THRESHOLD = 1000
+
+
+class InValues(ColumnElement):
+    """
+    Dialect-aware ``column IN (values)`` check meant for large sets of string values.
+
+    Compiles to ``column = ANY(:values)`` on PostgreSQL, which binds all values as a single array
+    parameter, so the statement text does not grow with the number of values and the server does
+    not have to parse thousands of placeholders. Other dialects get a regular ``IN``.
+    """
+
+    inherit_cache = False
+    type = Boolean()
+
+    def __init__(self, column, values: Collection[str]):
+        self.column = column
+        self.values = values
+
+
+@compiles(InValues, "postgresql")
+def _pg_in_values(element, compiler, **kw):
+    from sqlalchemy import any_, bindparam
+    from sqlalchemy.dialects.postgresql import ARRAY
+
+    param = bindparam(None, list(element.values), type_=ARRAY(String()))
+    return compiler.process(element.column == any_(param), **kw)
+
+
+@compiles(InValues)
+def _default_in_values(element, compiler, **kw):
+    return compiler.process(element.column.in_(list(element.values)), **kw)
+
+
+def in_values(column, values: Collection[str] | None) -> ColumnElement[bool]:
+    """
+    Build a ``column IN (values)`` clause, using :class:`InValues` when there are many values.
+
+    :param column: the column to filter on
+    :param values: the values the column may take; ``None`` or empty matches nothing
+    """
+    values = values or ()
+    if len(values) > IN_VALUES_ARRAY_THRESHOLD:
+        return InValues(column, values)
+    return column.in_(values)
+
+
+class ExplainJson(Executable, ClauseElement):
+    """
+    ``EXPLAIN (FORMAT JSON)`` of a statement, returning the plan PostgreSQL would use to run it.
+
+    The statement is planned, not run. Only PostgreSQL is supported.
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(ExplainJson, "postgresql")
+def _pg_explain_json(element, compiler, **kw):
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kw)}"
+
+
 class UtcDateTime(TypeDecorator):
     """
     Similar to :class:`~sqlalchemy.types.TIMESTAMP` with ``timezone=True`` option, with some differences.
@@ -25,11 +25,14 @@ from airflow.api.common.mark_tasks import (
     find_task_relatives,
     set_dag_run_state_to_failed,
     set_dag_run_state_to_success,
+    set_state,
 )
 from airflow.models.dagrun import DagRun
 from airflow.providers.standard.operators.empty import EmptyOperator
 from airflow.utils.state import DagRunState, State, TaskInstanceState
 
+from tests_common.test_utils.asserts import count_queries
+
 if TYPE_CHECKING:
     from airflow.models.taskinstance import TaskInstance
     from airflow.serialization.definitions.dag import SerializedDAG
@@ -150,3 +153,26 @@ def test_find_task_relatives_upstream_still_includes_setups(dag_maker: DagMaker[
 
     assert "normal_t" in relatives
     assert "setup_t" in relatives
+
+
+def test_set_state_query_count_does_not_depend_on_task_instances(dag_maker: DagMaker[SerializedDAG]):
+    def set_state_queries_count(num_tasks: int) -> int:
+        with dag_maker(f"test_set_state_query_count_{num_tasks}") as dag:
+            for i in range(num_tasks):
+                EmptyOperator(task_id=f"task_{i}")
+        dr = dag_maker.create_dagrun()
+        dag_maker.session.flush()
+
+        with count_queries() as result:
+            updated_tis = set_state(
+                tasks=list(dag.tasks), run_id=dr.run_id, commit=True, session=dag_maker.session
+            )
+        assert len(updated_tis) == num_tasks
+        for ti in dr.get_task_instances(session=dag_maker.session):
+            assert ti.state == TaskInstanceState.SUCCESS
+            assert ti.start_date is not None
+            assert ti.end_date is not None
+            assert ti.duration is not None
+        return sum(result.values())
+
+    assert set_state_queries_count(num_tasks=20) == set_state_queries_count(num_tasks=2)
@@ -528,6 +528,55 @@ class TestBaseAuthManager:
         result = auth_manager.get_authorized_dag_ids(user=user, session=session)
         assert result == expected
 
+    @pytest.fixture
+    def clean_authorized_dag_ids_cache(self):
+        BaseAuthManager.invalidate_authorized_dag_ids_cache()
+        yield
+        BaseAuthManager.invalidate_authorized_dag_ids_cache()
+
+    @pytest.mark.usefixtures("clean_authorized_dag_ids_cache")
+    def test_get_cached_authorized_dag_ids(self, auth_manager):
+        user = BaseAuthManagerUserTest(name="test")
+        other_user = BaseAuthManagerUserTest(name="other")
+        with patch.object(auth_manager, "get_authorized_dag_ids", return_value={"dag1"}) as mock_get:
+            assert auth_manager.get_cached_authorized_dag_ids(user=user) == {"dag1"}
+            assert auth_manager.get_cached_authorized_dag_ids(user=user) == {"dag1"}
+            assert mock_get.call_count == 1
+
+            auth_manager.get_cached_authorized_dag_ids(user=user, method="PUT")
+            auth_manager.get_cached_authorized_dag_ids(user=other_user)
+            assert mock_get.call_count == 3
+
+    @pytest.mark.usefixtures("clean_authorized_dag_ids_cache")
+    def test_get_cached_authorized_dag_ids_returns_copy(self, auth_manager):
+        user = BaseAuthManagerUserTest(name="test")
+        with patch.object(auth_manager, "get_authorized_dag_ids", return_value={"dag1"}):
+            auth_manager.get_cached_authorized_dag_ids(user=user).add("dag2")
+            assert auth_manager.get_cached_authorized_dag_ids(user=user) == {"dag1"}
+
+    @pytest.mark.usefixtures("clean_authorized_dag_ids_cache")
+    def test_invalidate_authorized_dag_ids_cache_for_user(self, auth_manager):
+        user = BaseAuthManagerUserTest(name="test")
+        other_user = BaseAuthManagerUserTest(name="other")
+        with patch.object(auth_manager, "get_authorized_dag_ids", return_value={"dag1"}) as mock_get:
+            auth_manager.get_cached_authorized_dag_ids(user=user)
+            auth_manager.get_cached_authorized_dag_ids(user=other_user)
+            BaseAuthManager.invalidate_authorized_dag_ids_cache(user_id="test")
+            auth_manager.get_cached_authorized_dag_ids(user=user)
+            auth_manager.get_cached_authorized_dag_ids(user=other_user)
+            assert mock_get.call_count == 3
+
+    @pytest.mark.usefixtures("clean_authorized_dag_ids_cache")
+    def test_get_cached_authorized_dag_ids_disabled(self, auth_manager):
+        user = BaseAuthManagerUserTest(name="test")
+        with (
+            patch("airflow.api_fastapi.auth.managers.base_auth_manager.AUTHORIZED_DAG_IDS_CACHE_TTL", 0),
+            patch.object(auth_manager, "get_authorized_dag_ids", return_value={"dag1"}) as mock_get,
+        ):
+            auth_manager.get_cached_authorized_dag_ids(user=user)
+            auth_manager.get_cached_authorized_dag_ids(user=user)
+            assert mock_get.call_count == 2
+
     @pytest.mark.parametrize(
         ("access_per_connection", "access_per_team", "rows", "expected"),
         [
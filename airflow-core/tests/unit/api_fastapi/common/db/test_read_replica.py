@@ -0,0 +1,210 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from airflow import settings
+from airflow.api_fastapi.common.db import read_replica
+from airflow.api_fastapi.common.db.common import _get_read_session
+from airflow.api_fastapi.common.db.read_replica import (
+    COOKIE_NAME_READ_PRIMARY,
+    ReadYourWritesMiddleware,
+    ReplicaLag,
+    use_read_replica,
+)
+
+from tests_common.test_utils.db import clear_db_pools
+
+
+@pytest.fixture
+def clock():
+    with mock.patch.object(read_replica, "time") as mock_time:
+        mock_time.monotonic.return_value = 1000.0
+        yield mock_time.monotonic
+
+
+@pytest.fixture
+def replica_engine():
+    # The metadata database stands in for its replica
+    with mock.patch.object(settings, "replica_engine", settings.engine):
+        yield settings.engine
+
+
+class TestReplicaLag:
+    @pytest.mark.db_test
+    def test_sqlite_has_no_lag(self, replica_engine):
+        with replica_engine.connect() as connection:
+            assert read_replica._measure_lag(connection) == 0.0
+
+    @pytest.mark.usefixtures("replica_engine")
+    @mock.patch.object(read_replica, "_measure_lag", return_value=2.0)
+    def test_measurement_holds_until_max_lag_could_be_reached(self, mock_measure_lag, clock):
+        replica_lag = ReplicaLag(max_lag=5)
+
+        assert replica_lag.is_fresh()
+        clock.return_value += 2.5
+        assert replica_lag.is_fresh()
+        assert mock_measure_lag.call_count == 1
+
+        # The replica could now be 5 seconds behind, and is measured again
+        mock_measure_lag.return_value = 6.0
+        clock.return_value += 0.5
+        assert not replica_lag.is_fresh()
+        assert mock_measure_lag.call_count == 2
+
+    @pytest.mark.usefixtures("replica_engine")
+    @pytest.mark.parametrize(
+        "measure_lag",
+        [
+            pytest.param({"return_value": 10.0}, id="too-far-behind"),
+            pytest.param({"return_value": None}, id="replication-broken"),
+            pytest.param({"side_effect": OSError("connection refused")}, id="unreachable"),
+        ],
+    )
+    def test_replica_not_fresh_is_checked_again_after_max_lag(self, measure_lag, clock):
+        replica_lag = ReplicaLag(max_lag=5)
+
+        with mock.patch.object(read_replica, "_measure_lag", **measure_lag) as mock_measure_lag:
+            assert not replica_lag.is_fresh()
+            clock.return_value += 4
+            assert not replica_lag.is_fresh()
+            assert mock_measure_lag.call_count == 1
+
+            mock_measure_lag.side_effect = None
+            mock_measure_lag.return_value = 0.0
+            clock.return_value += 1
+            assert replica_lag.is_fresh()
+            assert mock_measure_lag.call_count == 2
+
+
+class TestUseReadReplica:
+    @pytest.fixture(autouse=True)
+    def _fresh_replica(self):
+        with (
+            mock.patch.object(settings, "ReplicaSession", mock.MagicMock()),
+            mock.patch.object(read_replica.replica_lag, "is_fresh", return_value=True),
+        ):
+            yield
+
+    def test_read_request(self):
+        assert use_read_replica("GET", {})
+
+    def test_no_replica(self):
+        with mock.patch.object(settings, "ReplicaSession", None):
+            assert not use_read_replica("GET", {})
+
+    def test_write_request(self):
+        assert not use_read_replica("POST", {})
+
+    def test_client_wrote_recently(self):
+        assert not use_read_replica("GET", {COOKIE_NAME_READ_PRIMARY: "1"})
+
+    def test_replica_too_far_behind(self):
+        with mock.patch.object(read_replica.replica_lag, "is_fresh", return_value=False):
+            assert not use_read_replica("GET", {})
+
+
+@pytest.mark.db_test
+class TestReadSessionDep:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        clear_db_pools()
+        replica_session = mock.MagicMock(wraps=settings.NonScopedSession)
+        with (
+            mock.patch.object(settings, "ReplicaSession", replica_session),
+            mock.patch.object(read_replica.replica_lag, "is_fresh", return_value=True),
+        ):
+            self.replica_session = replica_session
+            yield
+        clear_db_pools()
+
+    def test_read_route_uses_replica(self, test_client):
+        response = test_client.get("/api/v2/pools")
+
+        assert response.status_code == 200
+        assert response.json()["total_entries"] == 1
+        self.replica_session.assert_called_once()
+
+    def test_read_route_uses_primary_after_write(self, test_client):
+        test_client.cookies.set(COOKIE_NAME_READ_PRIMARY, "1")
+
+        response = test_client.get("/api/v2/pools")
+
+        assert response.status_code == 200
+        self.replica_session.assert_not_called()
+
+    def test_write_route_uses_primary(self, test_client):
+        response = test_client.post("/api/v2/pools", json={"name": "replica_pool", "slots": 1})
+
+        assert response.status_code == 201
+        self.replica_session.assert_not_called()
+
+
+def _dependency_calls(dependant):
+    for sub_dependant in dependant.dependencies:
+        yield sub_dependant.call
+        yield from _dependency_calls(sub_dependant)
+
+
+def test_execution_api_routes_use_primary():
+    """Tasks read what other clients just wrote, e.g. the XComs pushed by their upstream tasks."""
+    from airflow.api_fastapi.execution_api.routes import execution_api_router
+
+    xcom_routes = [route for route in execution_api_router.routes if "/xcoms/" in route.path]
+    assert xcom_routes
+    for route in execution_api_router.routes:
+        assert _get_read_session not in set(_dependency_calls(route.dependant)), route.path
+
+
+class TestReadYourWritesMiddleware:
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+
+        @app.get("/read")
+        def read():
+            return {}
+
+        @app.post("/write")
+        def write():
+            return {}
+
+        @app.post("/fail")
+        def fail():
+            raise HTTPException(400, "Bad request")
+
+        app.add_middleware(ReadYourWritesMiddleware)
+        return TestClient(app)
+
+    def test_successful_write_sets_cookie(self, client):
+        response = client.post("/write")
+
+        assert response.headers["set-cookie"] == (
+            f"{COOKIE_NAME_READ_PRIMARY}=1; Max-Age=5; Path=/; HttpOnly; SameSite=lax"
+        )
+
+    @pytest.mark.parametrize(("method", "path"), [("GET", "/read"), ("POST", "/fail")])
+    def test_no_cookie(self, client, method, path):
+        response = client.request(method, path)
+
+        assert "set-cookie" not in response.headers
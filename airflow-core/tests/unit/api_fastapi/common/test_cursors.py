@@ -32,6 +32,7 @@ from airflow.api_fastapi.common.cursors import apply_cursor_filter, decode_curso
 from airflow.api_fastapi.common.parameters import SortParam
 from airflow.models.dagrun import DagRun
 from airflow.models.taskinstance import TaskInstance
+from airflow.models.xcom import XComModel
 
 
 def _msgpack_cursor_token(payload: object) -> str:
@@ -179,6 +180,29 @@ class TestCursorPagination:
         assert len(resolved) == 1
         assert resolved[0][0] == "id"
 
+    def test_sort_param_composite_pk_tie_breakers(self):
+        """Every primary key column of a keyset breaks ties, so cursors of composite-PK models are unique."""
+        sp = SortParam(["key", "timestamp"], XComModel)
+        sp.set_value(["-timestamp"])
+        sp.as_keyset().to_orm(select(XComModel))
+
+        resolved = [(name, is_desc) for name, _, is_desc in sp.get_resolved_columns()]
+        assert resolved == [
+            ("timestamp", True),
+            ("dag_run_id", True),
+            ("task_id", True),
+            ("map_index", True),
+            ("key", True),
+        ]
+
+    def test_sort_param_composite_pk_first_column_only_without_keyset(self):
+        """Outside keysets only the first primary key column is a tie-breaker, it can be grouped on."""
+        sp = SortParam(["key", "timestamp"], XComModel)
+        sp.set_value(["-timestamp"])
+
+        resolved = [(name, is_desc) for name, _, is_desc in sp.get_resolved_columns()]
+        assert resolved == [("timestamp", True), ("dag_run_id", True)]
+
     def test_apply_cursor_filter_null_value_does_not_raise(self):
         """Cursor tokens with None values (nullable sort columns) must not crash.
 
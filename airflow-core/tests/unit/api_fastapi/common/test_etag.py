@@ -0,0 +1,78 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from airflow.api_fastapi.common.etag import check_etag, get_etag
+
+
+def _request(query_string: str = "", if_none_match: str | None = None, accept: str | None = None) -> Request:
+    headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    if accept is not None:
+        headers.append((b"accept", accept.encode()))
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/grid/runs/dag",
+            "query_string": query_string.encode(),
+            "headers": headers,
+        }
+    )
+
+
+class TestEtag:
+    def test_etag_depends_on_version_and_query(self):
+        etag = get_etag(_request("limit=5"), 1, "2024-01-01")
+        assert etag.startswith('W/"')
+        assert get_etag(_request("limit=5"), 1, "2024-01-01") == etag
+        assert get_etag(_request("limit=6"), 1, "2024-01-01") != etag
+        assert get_etag(_request("limit=5"), 2, "2024-01-01") != etag
+
+    def test_etag_ignores_query_parameter_order(self):
+        assert get_etag(_request("a=1&b=2"), 1) == get_etag(_request("b=2&a=1"), 1)
+
+    def test_etag_depends_on_accept_header(self):
+        etag = get_etag(_request(), 1)
+        assert get_etag(_request(accept="application/x-ndjson"), 1) != etag
+        assert get_etag(_request(accept="application/json"), 1) != get_etag(
+            _request(accept="application/x-ndjson"), 1
+        )
+
+    def test_check_etag_returns_headers(self):
+        headers = check_etag(_request(), 1)
+        assert headers == {"ETag": get_etag(_request(), 1), "Cache-Control": "private, no-cache"}
+
+    @pytest.mark.parametrize(
+        "if_none_match",
+        ["{etag}", "{strong_etag}", '"other", {etag}', "*"],
+    )
+    def test_check_etag_not_modified(self, if_none_match):
+        etag = get_etag(_request(), 1)
+        header = if_none_match.format(etag=etag, strong_etag=etag.removeprefix("W/"))
+        with pytest.raises(HTTPException) as exc_info:
+            check_etag(_request(if_none_match=header), 1)
+        assert exc_info.value.status_code == 304
+        assert exc_info.value.headers["ETag"] == etag
+
+    def test_check_etag_modified(self):
+        etag = get_etag(_request(), 1)
+        headers = check_etag(_request(if_none_match=etag), 2)
+        assert headers["ETag"] != etag
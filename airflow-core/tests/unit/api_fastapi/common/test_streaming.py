@@ -0,0 +1,119 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from enum import Enum
+from unittest import mock
+
+import pytest
+from fastapi import HTTPException
+from pydantic import BaseModel, Field
+
+from airflow.api_fastapi.common.streaming import _arrow_schema, _arrow_stream, _ndjson_stream
+
+pa = pytest.importorskip("pyarrow")
+
+
+class _Color(str, Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class _Nested(BaseModel):
+    name: str
+
+
+class _Row(BaseModel):
+    id: int
+    when: datetime | None
+    color: _Color | None
+    ratio: float
+    enabled: bool
+    nested: _Nested | None
+    tags: list[str]
+    extra: dict[str, int] | None = None
+    alias_field: str = Field(serialization_alias="aliased")
+
+
+def _row(i: int, **kwargs) -> _Row:
+    fields = {
+        "id": i,
+        "when": datetime(2024, 1, i, tzinfo=timezone.utc),
+        "color": _Color.RED,
+        "ratio": i / 2,
+        "enabled": bool(i % 2),
+        "nested": _Nested(name=f"n{i}"),
+        "tags": ["a", "b"],
+        "alias_field": f"value{i}",
+    }
+    return _Row(**{**fields, **kwargs})
+
+
+class TestStreaming:
+    def test_arrow_schema(self):
+        schema, _ = _arrow_schema(_Row)
+        assert schema == pa.schema(
+            [
+                pa.field("id", pa.int64()),
+                pa.field("when", pa.timestamp("us", tz="UTC")),
+                pa.field("color", pa.string()),
+                pa.field("ratio", pa.float64()),
+                pa.field("enabled", pa.bool_()),
+                pa.field("nested", pa.string()),
+                pa.field("tags", pa.string()),
+                pa.field("extra", pa.string()),
+                pa.field("aliased", pa.string()),
+            ]
+        )
+
+    def test_arrow_stream(self):
+        schema, converters = _arrow_schema(_Row)
+        chunks = iter([[_row(1), _row(2)], [_row(3, when=None, color=None, nested=None, extra={"x": 1})]])
+        table = pa.ipc.open_stream(b"".join(_arrow_stream(chunks, schema, converters))).read_all()
+
+        assert table.num_rows == 3
+        assert table.column("id").to_pylist() == [1, 2, 3]
+        assert table.column("when").to_pylist()[:2] == [
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+            datetime(2024, 1, 2, tzinfo=timezone.utc),
+        ]
+        assert table.column("color").to_pylist() == ["red", "red", None]
+        assert table.column("nested").to_pylist() == ['{"name":"n1"}', '{"name":"n2"}', None]
+        assert table.column("tags").to_pylist()[0] == '["a","b"]'
+        assert table.column("extra").to_pylist() == [None, None, '{"x":1}']
+        assert table.column("aliased").to_pylist() == ["value1", "value2", "value3"]
+
+    def test_arrow_stream_without_rows(self):
+        schema, converters = _arrow_schema(_Row)
+        table = pa.ipc.open_stream(b"".join(_arrow_stream(iter([]), schema, converters))).read_all()
+        assert table.num_rows == 0
+        assert table.schema == schema
+
+    def test_arrow_schema_without_pyarrow(self):
+        with mock.patch.dict("sys.modules", {"pyarrow": None}):
+            with pytest.raises(HTTPException) as exc_info:
+                _arrow_schema(_Row)
+        assert exc_info.value.status_code == 406
+
+    def test_ndjson_stream(self):
+        chunks = list(_ndjson_stream(iter([[_row(1), _row(2)], [_row(3)]])))
+        assert len(chunks) == 2
+        lines = "".join(chunks).splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [1, 2, 3]
+        assert json.loads(lines[0])["aliased"] == "value1"
@@ -28,6 +28,7 @@ from fastapi.routing import Mount
 from fastapi.testclient import TestClient
 
 from airflow.api_fastapi.app import create_app
+from airflow.api_fastapi.auth.managers.base_auth_manager import BaseAuthManager
 from airflow.api_fastapi.auth.managers.simple.user import SimpleAuthManagerUser
 from airflow.dag_processing.bundles.manager import DagBundlesManager
 from airflow.models import Connection
@@ -77,6 +78,17 @@ def _shared_api_app():
         return create_app()
 
 
+@pytest.fixture(autouse=True)
+def _clear_authorized_dag_ids_cache():
+    """
+    Forget the Dags users were found to be authorized for.
+
+    Auth managers cache them for a few seconds, so without this a Dag created by a test could be
+    missing from the responses of a later one.
+    """
+    BaseAuthManager.invalidate_authorized_dag_ids_cache()
+
+
 def _mounted_fastapi_apps(app: FastAPI) -> list[FastAPI]:
     """Return ``app`` and every FastAPI app mounted under it, recursively (``/execution``, ``/auth``, ...)."""
     apps = [app]
@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+import json
 import math
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
@@ -449,7 +450,7 @@ class TestGetDagRuns:
     def test_return_correct_results_with_order_by(self, test_client, order_by, expected_order):
         # Test ascending order
 
-        with assert_queries_count(7):
+        with assert_queries_count(8):
             response = test_client.get("/dags/test_dag1/dagRuns", params={"order_by": order_by})
 
         assert response.status_code == 200
@@ -573,6 +574,24 @@ class TestGetDagRuns:
         second_page_ids = {(r["dag_id"], r["dag_run_id"]) for r in body2["dag_runs"]}
         assert first_page_ids.isdisjoint(second_page_ids)
 
+    @pytest.mark.parametrize("order_by", ["id", "-run_after"])
+    @pytest.mark.usefixtures("configure_git_connection_for_dag_bundle")
+    @mock.patch("airflow.api_fastapi.common.streaming.STREAM_CHUNK_SIZE", 3)
+    def test_ndjson_stream(self, test_client, order_by):
+        response = test_client.get(
+            "/dags/~/dagRuns",
+            params={"limit": 1, "order_by": order_by},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        dag_runs = [json.loads(line) for line in response.text.splitlines()]
+
+        expected = test_client.get("/dags/~/dagRuns", params={"order_by": order_by}).json()["dag_runs"]
+        assert len(dag_runs) == 4
+        assert dag_runs == expected
+        assert all(dag_run["dag_versions"] for dag_run in dag_runs)
+
     @pytest.mark.parametrize(
         "order_by",
         ["id", "dag_run_id", "logical_date", "-run_after"],
@@ -1616,6 +1635,18 @@ class TestDeleteDagRun:
         assert response.status_code == 204
         _check_last_log(session, dag_id=DAG1_ID, event="delete_dag_run", logical_date=None)
 
+    def test_delete_dag_run_recomputes_state_rollups(self, test_client, session):
+        run_after = session.scalar(
+            select(DagRun.run_after).where(DagRun.dag_id == DAG1_ID, DagRun.run_id == DAG1_RUN1_ID)
+        )
+        with mock.patch(
+            "airflow.api_fastapi.core_api.routes.public.dag_run.recompute_state_rollups"
+        ) as mock_recompute:
+            response = test_client.delete(f"/dags/{DAG1_ID}/dagRuns/{DAG1_RUN1_ID}")
+
+        assert response.status_code == 204
+        mock_recompute.assert_called_once_with([(DAG1_ID, run_after)], session=mock.ANY)
+
     def test_delete_dag_run_not_found(self, test_client):
         response = test_client.delete(f"/dags/{DAG1_ID}/dagRuns/invalid")
         assert response.status_code == 404
@@ -201,7 +201,7 @@ class TestGetDAGSource:
     def test_source_is_redacted_when_caller_cannot_read_all_dags_in_file(
         self, mock_get_auth_manager, test_client, test_dag, colocated_unreadable_dag
     ):
-        mock_get_auth_manager.return_value.get_authorized_dag_ids.return_value = {TEST_DAG_ID}
+        mock_get_auth_manager.return_value.get_cached_authorized_dag_ids.return_value = {TEST_DAG_ID}
 
         response: Response = test_client.get(
             f"{API_PREFIX}/{TEST_DAG_ID}", headers={"Accept": "application/json"}
@@ -214,13 +214,15 @@ class TestGetDAGSource:
             "version_number": 1,
             "dag_display_name": TEST_DAG_DISPLAY_NAME,
         }
-        mock_get_auth_manager.return_value.get_authorized_dag_ids.assert_called_once_with(user=mock.ANY)
+        mock_get_auth_manager.return_value.get_cached_authorized_dag_ids.assert_called_once_with(
+            user=mock.ANY
+        )
 
     @mock.patch("airflow.api_fastapi.core_api.routes.public.dag_sources.get_auth_manager")
     def test_source_is_returned_when_caller_can_read_all_dags_in_file(
         self, mock_get_auth_manager, test_client, test_dag, colocated_unreadable_dag
     ):
-        mock_get_auth_manager.return_value.get_authorized_dag_ids.return_value = {
+        mock_get_auth_manager.return_value.get_cached_authorized_dag_ids.return_value = {
             TEST_DAG_ID,
             colocated_unreadable_dag.dag_id,
         }
@@ -17,10 +17,13 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from unittest import mock
 
 import pendulum
 import pytest
+from sqlalchemy.dialects import postgresql
 
+from airflow.api_fastapi.common.db.common import paginated_select
 from airflow.models.dag import DagModel, DagTag
 from airflow.models.dagrun import DagRun
 from airflow.providers.standard.operators.empty import EmptyOperator
@@ -283,6 +286,28 @@ class TestDagTags(TestDagEndpoint):
         }
         assert res_json == expected
 
+    @pytest.mark.parametrize("order_by", ["name", "-name"])
+    def test_get_dag_tags_orders_by_grouped_column_only(self, test_client, order_by):
+        """The tags are grouped by name, the ordering cannot include the rest of DagTag's primary key."""
+        statements = []
+
+        def spy_paginated_select(**kwargs):
+            statement, total_entries = paginated_select(**kwargs)
+            statements.append(statement)
+            return statement, total_entries
+
+        with mock.patch(
+            "airflow.api_fastapi.core_api.routes.public.dag_tags.paginated_select",
+            side_effect=spy_paginated_select,
+        ):
+            response = test_client.get("/dagTags", params={"order_by": order_by})
+
+        assert response.status_code == 200
+        sql = str(statements[0].compile(dialect=postgresql.dialect()))
+        order_by_clause = sql.split("ORDER BY", 1)[1].split("LIMIT", 1)[0]
+        assert "dag_tag.name" in order_by_clause
+        assert "dag_id" not in order_by_clause
+
     def test_should_respond_401(self, unauthenticated_test_client):
         response = unauthenticated_test_client.get("/dagTags")
         assert response.status_code == 401
@@ -16,6 +16,7 @@
 # under the License.
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
 from unittest import mock
 
@@ -424,6 +425,77 @@ class TestGetEventLogs(TestEventLogsEndpoint):
         for event_log, expected_event in zip(resp_json["event_logs"], expected_events):
             assert event_log["event"] == expected_event
 
+    def test_get_event_logs_cursor_pagination(self, test_client):
+        response = test_client.get("/eventLogs", params={"limit": 3, "order_by": "-id", "cursor": ""})
+        assert response.status_code == 200
+        first_page = response.json()
+        assert first_page["total_entries"] is None
+        assert first_page["previous_cursor"] is None
+        assert first_page["next_cursor"] is not None
+
+        response = test_client.get(
+            "/eventLogs", params={"limit": 3, "order_by": "-id", "cursor": first_page["next_cursor"]}
+        )
+        assert response.status_code == 200
+        second_page = response.json()
+        assert second_page["next_cursor"] is None
+        assert second_page["previous_cursor"] is not None
+        events = [event_log["event"] for event_log in first_page["event_logs"] + second_page["event_logs"]]
+        assert events == [
+            EVENT_WITH_OWNER_AND_TASK_INSTANCE,
+            TASK_INSTANCE_EVENT,
+            EVENT_WITH_OWNER,
+            EVENT_NORMAL,
+        ]
+
+    @pytest.mark.parametrize(("total_entries_mode", "expected_total_entries"), [("exact", 4), ("none", None)])
+    def test_get_event_logs_total_entries_mode(self, test_client, total_entries_mode, expected_total_entries):
+        response = test_client.get(
+            "/eventLogs", params={"limit": 2, "total_entries_mode": total_entries_mode}
+        )
+        assert response.status_code == 200
+        resp_json = response.json()
+        assert resp_json["total_entries"] == expected_total_entries
+        assert len(resp_json["event_logs"]) == 2
+
+    @mock.patch("airflow.api_fastapi.common.streaming.STREAM_CHUNK_SIZE", 3)
+    def test_get_event_logs_ndjson_stream(self, test_client):
+        response = test_client.get(
+            "/eventLogs", params={"order_by": "-id", "limit": 1}, headers={"Accept": "application/x-ndjson"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        event_logs = [json.loads(line) for line in response.text.splitlines()]
+
+        # All matching entries are streamed, across several chunks, and serialized as in JSON responses
+        expected = test_client.get("/eventLogs", params={"order_by": "-id"}).json()["event_logs"]
+        assert event_logs == expected
+        assert [event_log["event"] for event_log in event_logs] == [
+            EVENT_WITH_OWNER_AND_TASK_INSTANCE,
+            TASK_INSTANCE_EVENT,
+            EVENT_WITH_OWNER,
+            EVENT_NORMAL,
+        ]
+
+    def test_get_event_logs_arrow_stream(self, test_client):
+        pa = pytest.importorskip("pyarrow")
+        response = test_client.get(
+            "/eventLogs",
+            params={"event": EVENT_WITH_OWNER_AND_TASK_INSTANCE},
+            headers={"Accept": "application/vnd.apache.arrow.stream"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+        table = pa.ipc.open_stream(response.content).read_all()
+
+        assert table.schema.field("event_log_id").type == pa.int64()
+        assert table.schema.field("when").type == pa.timestamp("us", tz="UTC")
+        [event_log] = table.to_pylist()
+        assert event_log["event"] == EVENT_WITH_OWNER_AND_TASK_INSTANCE
+        assert event_log["dag_id"] == DAG_ID
+        assert event_log["owner"] == OWNER
+        assert event_log["when"].tzinfo is not None
+
     def test_should_raises_401_unauthenticated(self, unauthenticated_test_client):
         response = unauthenticated_test_client.get("/eventLogs")
         assert response.status_code == 401
@@ -132,14 +132,14 @@ def import_errors(*, session: Session = NEW_SESSION) -> list[ParseImportError]:
     return _import_errors
 
 
-def set_mock_auth_manager__get_authorized_dag_ids(
-    mock_auth_manager: mock.Mock, get_authorized_dag_ids_return_value: set[str] | None = None
+def set_mock_auth_manager__get_cached_authorized_dag_ids(
+    mock_auth_manager: mock.Mock, get_cached_authorized_dag_ids_return_value: set[str] | None = None
 ) -> mock.Mock:
-    if get_authorized_dag_ids_return_value is None:
-        get_authorized_dag_ids_return_value = set()
-    mock_get_authorized_dag_ids = mock_auth_manager.return_value.get_authorized_dag_ids
-    mock_get_authorized_dag_ids.return_value = get_authorized_dag_ids_return_value
-    return mock_get_authorized_dag_ids
+    if get_cached_authorized_dag_ids_return_value is None:
+        get_cached_authorized_dag_ids_return_value = set()
+    mock_get_cached_authorized_dag_ids = mock_auth_manager.return_value.get_cached_authorized_dag_ids
+    mock_get_cached_authorized_dag_ids.return_value = get_cached_authorized_dag_ids_return_value
+    return mock_get_cached_authorized_dag_ids
 
 
 def set_mock_auth_manager__batch_is_authorized_dag(
@@ -202,7 +202,7 @@ class TestGetImportError:
             import_errors[prepared_import_error_idx] if prepared_import_error_idx is not None else None
         )
         import_error_id = import_error.id if import_error else IMPORT_ERROR_NON_EXISTED_ID
-        set_mock_auth_manager__get_authorized_dag_ids(mock_get_auth_manager, permitted_dag_model_all)
+        set_mock_auth_manager__get_cached_authorized_dag_ids(mock_get_auth_manager, permitted_dag_model_all)
         response = test_client.get(f"/importErrors/{import_error_id}")
         assert response.status_code == expected_status_code
         if expected_status_code != 200:
@@ -228,11 +228,13 @@ class TestGetImportError:
     ):
         import_error_id = import_errors[0].id
         # Mock auth_manager
-        mock_get_authorized_dag_ids = set_mock_auth_manager__get_authorized_dag_ids(mock_get_auth_manager)
+        mock_get_cached_authorized_dag_ids = set_mock_auth_manager__get_cached_authorized_dag_ids(
+            mock_get_auth_manager
+        )
         # Act
         response = test_client.get(f"/importErrors/{import_error_id}")
         # Assert
-        mock_get_authorized_dag_ids.assert_called_once_with(user=mock.ANY)
+        mock_get_cached_authorized_dag_ids.assert_called_once_with(user=mock.ANY)
         assert response.status_code == 403
         assert response.json() == {"detail": "You do not have read permission on any of the Dags in the file"}
 
@@ -246,7 +248,7 @@ class TestGetImportError:
         import_errors,
     ):
         import_error_id = import_errors[0].id
-        set_mock_auth_manager__get_authorized_dag_ids(mock_get_auth_manager, permitted_dag_model_all)
+        set_mock_auth_manager__get_cached_authorized_dag_ids(mock_get_auth_manager, permitted_dag_model_all)
         # Act
         response = test_client.get(f"/importErrors/{import_error_id}")
         # Assert
@@ -269,7 +271,7 @@ class TestGetImportError:
         returns the raw error rather than redacting it.
         """
         import_error_id = import_errors[0].id
-        set_mock_auth_manager__get_authorized_dag_ids(mock_get_auth_manager, set())
+        set_mock_auth_manager__get_cached_authorized_dag_ids(mock_get_auth_manager, set())
 
         response = test_client.get(f"/importErrors/{import_error_id}")
 
@@ -370,7 +372,7 @@ class TestGetImportErrors:
         expected_filenames,
         permitted_dag_model_all,
     ):
-        set_mock_auth_manager__get_authorized_dag_ids(mock_get_auth_manager, permitted_dag_model_all)
+        set_mock_auth_manager__get_cached_authorized_dag_ids(mock_get_auth_manager, permitted_dag_model_all)
         set_mock_auth_manager__batch_is_authorized_dag(mock_get_auth_manager, True)
 
         with assert_queries_count(5):
@@ -405,7 +407,7 @@ class TestGetImportErrors:
         permitted_dag_model_all,
     ):
         """Test that the exact ``filename`` filter returns only the matching file."""
-        set_mock_auth_manager__get_authorized_dag_ids(mock_get_auth_manager, permitted_dag_model_all)
+        set_mock_auth_manager__get_cached_authorized_dag_ids(mock_get_auth_manager, permitted_dag_model_all)
         set_mock_auth_manager__batch_is_authorized_dag(mock_get_auth_manager, True)
 
         response = test_client.get("/importErrors", params={"filename": filename})
@@ -433,7 +435,7 @@ class TestGetImportErrors:
         permitted_dag_model_all,
     ):
         """Test that the ``bundle_name`` filter returns only errors from the matching bundle."""
-        set_mock_auth_manager__get_authorized_dag_ids(mock_get_auth_manager, permitted_dag_model_all)
+        set_mock_auth_manager__get_cached_authorized_dag_ids(mock_get_auth_manager, permitted_dag_model_all)
         set_mock_auth_manager__batch_is_authorized_dag(mock_get_auth_manager, True)
 
         response = test_client.get("/importErrors", params={"bundle_name": bundle_name})
@@ -477,7 +479,7 @@ class TestGetImportErrors:
         )
         session.commit()
 
-        set_mock_auth_manager__get_authorized_dag_ids(
+        set_mock_auth_manager__get_cached_authorized_dag_ids(
             mock_get_auth_manager, permitted_dag_model_all | {other_dag.dag_id}
         )
         set_mock_auth_manager__batch_is_authorized_dag(mock_get_auth_manager, True)
@@ -521,7 +523,7 @@ class TestGetImportErrors:
         session.commit()
 
         readable_dag_ids = {dag_model.dag_id for dag_model in dag_models}
-        set_mock_auth_manager__get_authorized_dag_ids(mock_get_auth_manager, readable_dag_ids)
+        set_mock_auth_manager__get_cached_authorized_dag_ids(mock_get_auth_manager, readable_dag_ids)
         mock_batch_is_authorized_dag = set_mock_auth_manager__batch_is_authorized_dag(
             mock_get_auth_manager, True
         )
@@ -565,7 +567,7 @@ class TestGetImportErrors:
         session.commit()
 
         readable_dag_ids = {dag_model.dag_id for dag_model in dag_models}
-        set_mock_auth_manager__get_authorized_dag_ids(mock_get_auth_manager, readable_dag_ids)
+        set_mock_auth_manager__get_cached_authorized_dag_ids(mock_get_auth_manager, readable_dag_ids)
         set_mock_auth_manager__batch_is_authorized_dag(mock_get_auth_manager, True)
 
         response = test_client.get(
@@ -613,7 +615,7 @@ class TestGetImportErrors:
     ):
         dag_id1 = "dag_id1"
         mock_get_dag_id_to_team_name_mapping.return_value = {dag_id1: team}
-        mock_get_authorized_dag_ids = set_mock_auth_manager__get_authorized_dag_ids(
+        mock_get_cached_authorized_dag_ids = set_mock_auth_manager__get_cached_authorized_dag_ids(
             mock_get_auth_manager, {dag_id1}
         )
         mock_batch_is_authorized_dag = set_mock_auth_manager__batch_is_authorized_dag(
@@ -622,7 +624,7 @@ class TestGetImportErrors:
         # Act
         response = test_client.get("/importErrors")
         # Assert
-        mock_get_authorized_dag_ids.assert_called_once_with(method="GET", user=mock.ANY)
+        mock_get_cached_authorized_dag_ids.assert_called_once_with(method="GET", user=mock.ANY)
         assert response.status_code == 200
         response_json = response.json()
         assert response_json == {
@@ -653,7 +655,7 @@ class TestGetImportErrors:
     ):
         """Test that the bundle_name join condition works correctly."""
         dag_id1 = "dag_id1"
-        mock_get_authorized_dag_ids = set_mock_auth_manager__get_authorized_dag_ids(
+        mock_get_cached_authorized_dag_ids = set_mock_auth_manager__get_cached_authorized_dag_ids(
             mock_get_auth_manager, {dag_id1}
         )
         set_mock_auth_manager__batch_is_authorized_dag(mock_get_auth_manager, True)
@@ -661,7 +663,7 @@ class TestGetImportErrors:
         response = test_client.get("/importErrors")
 
         # Assert
-        mock_get_authorized_dag_ids.assert_called_once_with(method="GET", user=mock.ANY)
+        mock_get_cached_authorized_dag_ids.assert_called_once_with(method="GET", user=mock.ANY)
         assert response.status_code == 200
         response_json = response.json()
 
@@ -694,7 +696,7 @@ class TestGetImportErrors:
         Proper handling of unregistered files is deferred to a follow-up issue
         that introduces a dedicated permission and respects multi-team isolation.
         """
-        set_mock_auth_manager__get_authorized_dag_ids(mock_get_auth_manager, set())
+        set_mock_auth_manager__get_cached_authorized_dag_ids(mock_get_auth_manager, set())
 
         response = test_client.get("/importErrors")
 
@@ -834,7 +836,7 @@ class TestImportErrorFileAuthorization:
         response must be 403 -- not a 200 that returns the stack trace
         verbatim via the empty-set fall-through.
         """
-        set_mock_auth_manager__get_authorized_dag_ids(mock_get_auth_manager, set())
+        set_mock_auth_manager__get_cached_authorized_dag_ids(mock_get_auth_manager, set())
         response = test_client.get(f"/importErrors/{lonely_file_import_error.id}")
         assert response.status_code == 403
 
@@ -851,7 +853,7 @@ class TestImportErrorFileAuthorization:
         Dag was defined. Proper handling of this case (dedicated permission,
         multi-team isolation) is tracked as follow-up work.
         """
-        set_mock_auth_manager__get_authorized_dag_ids(mock_get_auth_manager, set())
+        set_mock_auth_manager__get_cached_authorized_dag_ids(mock_get_auth_manager, set())
         response = test_client.get(f"/importErrors/{import_errors[0].id}")
         assert response.status_code == 200
         body = response.json()
@@ -879,7 +881,7 @@ class TestImportErrorFileAuthorization:
         call would be permitted, and the raw stacktrace would be returned.
         """
         readable, _ = mixed_file_dags
-        set_mock_auth_manager__get_authorized_dag_ids(mock_get_auth_manager, {readable.dag_id})
+        set_mock_auth_manager__get_cached_authorized_dag_ids(mock_get_auth_manager, {readable.dag_id})
 
         def permit_only_readable(requests, user):
             request_dag_ids = {req["details"].id for req in requests}
@@ -906,7 +908,7 @@ class TestImportErrorFileAuthorization:
         (dedicated permission, multi-team isolation) is tracked as follow-up
         work.
         """
-        set_mock_auth_manager__get_authorized_dag_ids(mock_get_auth_manager, set())
+        set_mock_auth_manager__get_cached_authorized_dag_ids(mock_get_auth_manager, set())
         response = test_client.get("/importErrors")
         assert response.status_code == 200
         body = response.json()
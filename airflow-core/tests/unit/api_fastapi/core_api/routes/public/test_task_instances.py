@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import datetime as dt
 import itertools
+import json
 import math
 import os
 from datetime import timedelta
@@ -1214,7 +1215,7 @@ class TestGetTaskInstances(TestTaskInstanceEndpoint):
                 "/dags/example_python_operator/dagRuns/TEST_DAG_RUN_ID/taskInstances",
                 {"duration_gte": 100, "duration_lte": 200},
                 3,
-                7,
+                8,
                 id="test duration filter",
             ),
             pytest.param(
@@ -1254,7 +1255,7 @@ class TestGetTaskInstances(TestTaskInstanceEndpoint):
                 ("/dags/example_python_operator/dagRuns/TEST_DAG_RUN_ID/taskInstances"),
                 {"state": ["running", "queued", "none"]},
                 3,
-                7,
+                8,
                 id="test state filter",
             ),
             pytest.param(
@@ -1268,7 +1269,7 @@ class TestGetTaskInstances(TestTaskInstanceEndpoint):
                 ("/dags/example_python_operator/dagRuns/TEST_DAG_RUN_ID/taskInstances"),
                 {"state": ["no_status"]},
                 1,
-                7,
+                8,
                 id="test no_status state filter",
             ),
             pytest.param(
@@ -1282,7 +1283,7 @@ class TestGetTaskInstances(TestTaskInstanceEndpoint):
                 ("/dags/example_python_operator/dagRuns/TEST_DAG_RUN_ID/taskInstances"),
                 {},
                 4,
-                7,
+                8,
                 id="test null states with no filter",
             ),
             pytest.param(
@@ -1291,7 +1292,7 @@ class TestGetTaskInstances(TestTaskInstanceEndpoint):
                 "/dags/example_python_operator/dagRuns/TEST_DAG_RUN_ID/taskInstances",
                 {"start_date_gte": DEFAULT_DATETIME_STR_1},
                 1,
-                7,
+                8,
                 id="test start_date coalesce with null",
             ),
             pytest.param(
@@ -1304,7 +1305,7 @@ class TestGetTaskInstances(TestTaskInstanceEndpoint):
                 ("/dags/example_python_operator/dagRuns/TEST_DAG_RUN_ID/taskInstances"),
                 {"pool": ["test_pool_1", "test_pool_2"]},
                 2,
-                7,
+                8,
                 id="test pool filter",
             ),
             pytest.param(
@@ -1356,7 +1357,7 @@ class TestGetTaskInstances(TestTaskInstanceEndpoint):
                 "/dags/example_python_operator/dagRuns/TEST_DAG_RUN_ID/taskInstances",
                 {"queue": ["test_queue_1", "test_queue_2"]},
                 2,
-                7,
+                8,
                 id="test queue filter",
             ),
             pytest.param(
@@ -1412,7 +1413,7 @@ class TestGetTaskInstances(TestTaskInstanceEndpoint):
                 ("/dags/example_python_operator/dagRuns/TEST_DAG_RUN_ID/taskInstances"),
                 {"executor": ["test_exec_1", "test_exec_2"]},
                 2,
-                7,
+                8,
                 id="test_executor_filter",
             ),
             pytest.param(
@@ -1460,7 +1461,7 @@ class TestGetTaskInstances(TestTaskInstanceEndpoint):
                 ("/dags/example_task_group/dagRuns/TEST_DAG_RUN_ID/taskInstances"),
                 {"task_group_id": "section_1"},
                 3,
-                7,
+                8,
                 id="test task_group filter with exact match",
             ),
             pytest.param(
@@ -1469,7 +1470,7 @@ class TestGetTaskInstances(TestTaskInstanceEndpoint):
                 ("/dags/example_task_group/dagRuns/TEST_DAG_RUN_ID/taskInstances"),
                 {"task_group_id": "section_2"},
                 4,  # section_2 has 4 tasks: task_1 + inner_section_2 (task_2, task_3, task_4)
-                7,
+                8,
                 id="test task_group filter exact match on group_id",
             ),
             pytest.param(
@@ -1521,7 +1522,7 @@ class TestGetTaskInstances(TestTaskInstanceEndpoint):
                 ("/dags/example_python_operator/dagRuns/TEST_DAG_RUN_ID/taskInstances"),
                 {"try_number": [0, 1]},
                 5,
-                7,
+                8,
                 id="test_try_number_filter",
             ),
             pytest.param(
@@ -2255,6 +2256,62 @@ class TestGetTaskInstances(TestTaskInstanceEndpoint):
         all_backward = backward_ids + [ti["id"] for ti in forward_pages[-1]["task_instances"]]
         assert all_backward == forward_ids, "Backward walk + last page must match the forward walk exactly"
 
+    @mock.patch("airflow.api_fastapi.common.streaming.STREAM_CHUNK_SIZE", 4)
+    def test_ndjson_stream(self, test_client, session):
+        self.create_task_instances(
+            session,
+            task_instances=[
+                {"start_date": DEFAULT_DATETIME_1 + dt.timedelta(minutes=(i + 1))} for i in range(13)
+            ],
+            dag_id="example_python_operator",
+        )
+        params = {"order_by": ["-start_date"]}
+        response = test_client.get(
+            "/dags/~/dagRuns/~/taskInstances",
+            params={**params, "limit": 2, "offset": 3},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        task_instances = [json.loads(line) for line in response.text.splitlines()]
+
+        expected = test_client.get("/dags/~/dagRuns/~/taskInstances", params={**params, "limit": 50}).json()
+        assert expected["total_entries"] == 13
+        assert task_instances == expected["task_instances"]
+
+    def test_arrow_stream(self, test_client, session):
+        pa = pytest.importorskip("pyarrow")
+        self.create_task_instances(session, dag_id="example_python_operator")
+        response = test_client.get(
+            "/dags/example_python_operator/dagRuns/~/taskInstances",
+            headers={"Accept": "application/vnd.apache.arrow.stream"},
+        )
+        assert response.status_code == 200
+        table = pa.ipc.open_stream(response.content).read_all()
+
+        expected = test_client.get("/dags/example_python_operator/dagRuns/~/taskInstances").json()
+        assert table.num_rows == expected["total_entries"]
+        assert table.column("task_id").to_pylist() == [ti["task_id"] for ti in expected["task_instances"]]
+        assert table.schema.field("start_date").type == pa.timestamp("us", tz="UTC")
+        assert table.schema.field("state").type == pa.string()
+        assert table.schema.field("try_number").type == pa.int64()
+        # Nested objects are JSON encoded
+        dag_version = json.loads(table.column("dag_version")[0].as_py())
+        assert dag_version == expected["task_instances"][0]["dag_version"]
+
+    def test_stream_etag_differs_from_json(self, test_client, session):
+        self.create_task_instances(session, dag_id="example_python_operator")
+        url = "/dags/example_python_operator/dagRuns/TEST_DAG_RUN_ID/taskInstances"
+        json_response = test_client.get(url)
+        stream_response = test_client.get(url, headers={"Accept": "application/x-ndjson"})
+        assert json_response.status_code == stream_response.status_code == 200
+        assert stream_response.headers["ETag"] != json_response.headers["ETag"]
+
+        response = test_client.get(
+            url, headers={"Accept": "application/x-ndjson", "If-None-Match": stream_response.headers["ETag"]}
+        )
+        assert response.status_code == 304
+
 
 class TestGetTaskDependencies(TestTaskInstanceEndpoint):
     def setup_method(self):
@@ -4228,6 +4285,38 @@ class TestPostClearTaskInstances(TestTaskInstanceEndpoint):
         ti_id = response_data["task_instances"][0]["id"]
         _check_task_instance_note(session, ti_id, {"content": "placeholder-note", "user_id": None})
 
+    def test_clear_dry_run_count_only(self, test_client, session):
+        dag_id = "example_python_operator"
+        self.create_task_instances(
+            session,
+            dag_id=dag_id,
+            task_instances=[
+                {"logical_date": DEFAULT_DATETIME_1, "state": State.FAILED},
+                {"logical_date": DEFAULT_DATETIME_1 + dt.timedelta(days=1), "state": State.FAILED},
+                {"logical_date": DEFAULT_DATETIME_1 + dt.timedelta(days=2), "state": State.SUCCESS},
+            ],
+            update_extras=False,
+        )
+        response = test_client.post(
+            f"/dags/{dag_id}/clearTaskInstances",
+            json={"dry_run": True, "only_failed": True, "count_only": True},
+        )
+        assert response.status_code == 200
+        assert response.json() == {
+            "task_instances": [],
+            "total_entries": 2,
+            "next_cursor": None,
+            "previous_cursor": None,
+        }
+
+    def test_clear_count_only_requires_dry_run(self, test_client, session):
+        self.create_task_instances(session)
+        response = test_client.post(
+            "/dags/example_python_operator/clearTaskInstances",
+            json={"dry_run": False, "count_only": True},
+        )
+        assert response.status_code == 422
+
 
 class TestGetTaskInstanceTries(TestTaskInstanceEndpoint):
     def test_should_respond_200(self, test_client, session):
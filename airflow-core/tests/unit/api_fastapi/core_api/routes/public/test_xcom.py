@@ -276,6 +276,8 @@ class TestGetXComEntries(TestXComEndpoint):
                 },
             ],
             "total_entries": 2,
+            "next_cursor": None,
+            "previous_cursor": None,
         }
         assert response_data == expected_response
 
@@ -342,6 +344,8 @@ class TestGetXComEntries(TestXComEndpoint):
                 },
             ],
             "total_entries": 4,
+            "next_cursor": None,
+            "previous_cursor": None,
         }
         assert response_data == expected_response
 
@@ -393,6 +397,8 @@ class TestGetXComEntries(TestXComEndpoint):
         assert response_data == {
             "xcom_entries": expected_entries,
             "total_entries": len(expected_entries),
+            "next_cursor": None,
+            "previous_cursor": None,
         }
 
     @pytest.mark.parametrize(
@@ -445,6 +451,8 @@ class TestGetXComEntries(TestXComEndpoint):
         assert response_data == {
             "xcom_entries": expected_entries,
             "total_entries": len(expected_entries),
+            "next_cursor": None,
+            "previous_cursor": None,
         }
 
     @provide_session
@@ -575,6 +583,49 @@ class TestPaginationGetXComEntries(TestXComEndpoint):
         conn_ids = [conn["key"] for conn in response_data["xcom_entries"] if conn]
         assert conn_ids == expected_xcom_ids
 
+    def test_cursor_pagination(self, test_client):
+        """Walk all XCom entries via next_cursor, then back via previous_cursor."""
+        for i in range(5):
+            self._create_xcom(f"TEST_XCOM_KEY{i}", TEST_XCOM_VALUE)
+
+        forward_keys: list[str] = []
+        cursor_token = ""
+        previous_cursor = None
+        while cursor_token is not None:
+            response = test_client.get(
+                "/dags/~/dagRuns/~/taskInstances/~/xcomEntries",
+                params={"limit": 2, "order_by": "key", "cursor": cursor_token},
+            )
+            assert response.status_code == 200, response.json()
+            body = response.json()
+            assert body["total_entries"] is None
+            forward_keys.extend(entry["key"] for entry in body["xcom_entries"])
+            previous_cursor = body["previous_cursor"]
+            cursor_token = body["next_cursor"]
+        assert forward_keys == [f"TEST_XCOM_KEY{i}" for i in range(5)]
+
+        response = test_client.get(
+            "/dags/~/dagRuns/~/taskInstances/~/xcomEntries",
+            params={"limit": 2, "order_by": "key", "cursor": previous_cursor},
+        )
+        assert response.status_code == 200
+        assert [entry["key"] for entry in response.json()["xcom_entries"]] == [
+            "TEST_XCOM_KEY2",
+            "TEST_XCOM_KEY3",
+        ]
+
+    def test_total_entries_mode_none(self, test_client):
+        for i in range(3):
+            self._create_xcom(f"TEST_XCOM_KEY{i}", TEST_XCOM_VALUE)
+        response = test_client.get(
+            "/dags/~/dagRuns/~/taskInstances/~/xcomEntries",
+            params={"limit": 2, "total_entries_mode": "none"},
+        )
+        assert response.status_code == 200
+        response_data = response.json()
+        assert response_data["total_entries"] is None
+        assert len(response_data["xcom_entries"]) == 2
+
 
 class TestCreateXComEntry(TestXComEndpoint):
     @pytest.mark.parametrize(
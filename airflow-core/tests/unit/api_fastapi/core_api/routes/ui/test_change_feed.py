@@ -0,0 +1,101 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+from unittest import mock
+
+import pytest
+
+from airflow.api_fastapi.core_api.datamodels.ui.change_feed import ChangeEvent
+from airflow.utils.state import DagRunState, TaskInstanceState
+
+pytestmark = pytest.mark.db_test
+
+
+class _FakeChangeFeed:
+    def __init__(self, *batches):
+        self.batches = batches
+
+    async def subscribe(self):
+        for batch in self.batches:
+            yield batch
+
+
+def _patch_change_feed(*batches):
+    return mock.patch(
+        "airflow.api_fastapi.core_api.routes.ui.change_feed.get_change_feed",
+        return_value=_FakeChangeFeed(*batches),
+    )
+
+
+class TestGetChanges:
+    @mock.patch(
+        "airflow.api_fastapi.auth.managers.base_auth_manager.BaseAuthManager.get_cached_authorized_dag_ids",
+        return_value={"readable"},
+    )
+    def test_should_drop_events_of_unreadable_dags(self, _, test_client):
+        batches = (
+            [
+                ChangeEvent(
+                    kind="dag_run",
+                    dag_id="readable",
+                    run_id="run",
+                    state=DagRunState.RUNNING,
+                    updated_at=None,
+                ),
+                ChangeEvent(
+                    kind="task_instance",
+                    dag_id="hidden",
+                    run_id="run",
+                    task_id="task",
+                    map_index=-1,
+                    state=TaskInstanceState.RUNNING,
+                    updated_at=None,
+                ),
+            ],
+            [
+                ChangeEvent(
+                    kind="dag_run", dag_id="hidden", run_id="run", state=DagRunState.SUCCESS, updated_at=None
+                )
+            ],
+            [],
+            None,
+        )
+        with _patch_change_feed(*batches):
+            response = test_client.get("/changes")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        messages = response.text.split("\n\n")[:-1]
+        assert len(messages) == 4
+        assert messages[0].startswith("data: ")
+        assert [(event["kind"], event["dag_id"]) for event in json.loads(messages[0][6:])["events"]] == [
+            ("dag_run", "readable")
+        ]
+        # Batches left empty by the filter are sent as keepalives, not as events
+        assert messages[1] == ": keepalive"
+        assert messages[2] == ": keepalive"
+        assert messages[3] == "event: resync\ndata: {}"
+
+    def test_should_response_401(self, unauthenticated_test_client):
+        response = unauthenticated_test_client.get("/changes")
+        assert response.status_code == 401
+
+    def test_should_response_403(self, unauthorized_test_client):
+        response = unauthorized_test_client.get("/changes")
+        assert response.status_code == 403
@@ -25,12 +25,14 @@ import pytest
 
 from airflow.models.dag import DagModel
 from airflow.models.dagbag import DBDagBag
+from airflow.models.state_rollup import backfill_state_rollups
 from airflow.providers.standard.operators.empty import EmptyOperator
 from airflow.utils.state import DagRunState, TaskInstanceState
 from airflow.utils.types import DagRunType
 
 from tests_common.test_utils.asserts import assert_queries_count
-from tests_common.test_utils.db import clear_db_runs
+from tests_common.test_utils.config import conf_vars
+from tests_common.test_utils.db import clear_db_runs, clear_db_state_rollups
 
 pytestmark = pytest.mark.db_test
 
@@ -43,8 +45,10 @@ def examples_dag_bag():
 @pytest.fixture(autouse=True)
 def clean():
     clear_db_runs()
+    clear_db_state_rollups()
     yield
     clear_db_runs()
+    clear_db_state_rollups()
 
 
 # freeze time fixture so that it is applied before `make_dag_runs` is!
@@ -318,11 +322,40 @@ class TestHistoricalMetricsDataEndpoint:
     )
     @pytest.mark.usefixtures("freeze_time_for_dagruns", "make_dag_runs")
     def test_should_response_200(self, test_client, params, expected):
-        with assert_queries_count(4):
+        with assert_queries_count(5):
             response = test_client.get("/dashboard/historical_metrics_data", params=params)
         assert response.status_code == 200
         assert response.json() == expected
 
+    @pytest.mark.usefixtures("freeze_time_for_dagruns", "make_dag_runs")
+    def test_state_counts_from_rollups_are_exact(self, test_client):
+        backfill_state_rollups(pendulum.datetime(2023, 1, 1))
+        with mock.patch("airflow.api_fastapi.core_api.routes.ui.dashboard.STATE_COUNT_CAP", 1):
+            response = test_client.get(
+                "/dashboard/historical_metrics_data",
+                params={"start_date": "2023-01-01T00:00", "end_date": "2023-08-02T00:00"},
+            )
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["state_count_limit"] is None
+        assert data["dag_run_states"] == {"failed": 1, "queued": 1, "running": 1, "success": 1}
+        assert data["task_instance_states"]["success"] == 2
+        assert data["task_instance_states"]["failed"] == 2
+        assert data["task_instance_states"]["no_status"] == 4
+
+    @pytest.mark.usefixtures("freeze_time_for_dagruns", "make_dag_runs")
+    @conf_vars({("scheduler", "state_rollup_refresh_interval"): "0"})
+    def test_disabled_state_rollups_are_not_used(self, test_client):
+        backfill_state_rollups(pendulum.datetime(2023, 1, 1))
+        with assert_queries_count(4):
+            response = test_client.get(
+                "/dashboard/historical_metrics_data",
+                params={"start_date": "2023-01-01T00:00", "end_date": "2023-08-02T00:00"},
+            )
+        assert response.status_code == 200
+        assert response.json()["state_count_limit"] == 1000
+
     @pytest.mark.usefixtures("freeze_time_for_dagruns", "make_dag_runs")
     def test_state_counts_are_capped(self, test_client):
         """State counts are capped at STATE_COUNT_CAP; fixture creates 4 dag runs and 8 TIs."""
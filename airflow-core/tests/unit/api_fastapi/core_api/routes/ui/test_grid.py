@@ -27,6 +27,7 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from airflow._shared.timezones import timezone
+from airflow.api_fastapi.core_api.services.ui.grid import get_grid_summary_cache
 from airflow.models.dag import DagModel
 from airflow.models.dag_version import DagVersion
 from airflow.models.dagbag import DBDagBag
@@ -379,9 +380,11 @@ def setup(dag_maker, *, session: Session = NEW_SESSION):
 def _clean():
     clear_db_runs()
     clear_db_assets()
+    get_grid_summary_cache().clear()
     yield
     clear_db_runs()
     clear_db_assets()
+    get_grid_summary_cache().clear()
 
 
 # Create this as a fixture so that it is applied before the `dag_with_runs` fixture is!
@@ -393,7 +396,7 @@ def _freeze_time_for_dagruns(time_machine):
 @pytest.mark.usefixtures("_freeze_time_for_dagruns")
 class TestGetGridDataEndpoint:
     def test_should_response_200(self, test_client):
-        with assert_queries_count(6):
+        with assert_queries_count(7):
             response = test_client.get(f"/grid/runs/{DAG_ID}")
         assert response.status_code == 200
         assert _strip_dag_version_ids(response.json()) == [
@@ -435,7 +438,7 @@ class TestGetGridDataEndpoint:
         ],
     )
     def test_should_response_200_order_by(self, test_client, order_by, expected):
-        with assert_queries_count(6):
+        with assert_queries_count(7):
             response = test_client.get(f"/grid/runs/{DAG_ID}", params={"order_by": order_by})
         assert response.status_code == 200
         assert _strip_dag_version_ids(response.json()) == expected
@@ -454,7 +457,7 @@ class TestGetGridDataEndpoint:
         ],
     )
     def test_should_response_200_limit(self, test_client, limit, expected):
-        with assert_queries_count(6):
+        with assert_queries_count(7):
             response = test_client.get(f"/grid/runs/{DAG_ID}", params={"limit": limit})
         assert response.status_code == 200
         assert _strip_dag_version_ids(response.json()) == expected
@@ -479,7 +482,7 @@ class TestGetGridDataEndpoint:
         ],
     )
     def test_runs_should_response_200_date_filters(self, test_client, params, expected):
-        with assert_queries_count(6):
+        with assert_queries_count(7):
             response = test_client.get(
                 f"/grid/runs/{DAG_ID}",
                 params=params,
@@ -542,7 +545,7 @@ class TestGetGridDataEndpoint:
         assert response.json() == [{"id": "task2", "label": "task2"}]
 
     def test_runs_should_response_200_without_dag_run(self, test_client):
-        with assert_queries_count(5):
+        with assert_queries_count(6):
             response = test_client.get(f"/grid/runs/{DAG_ID_2}")
         assert response.status_code == 200
         assert response.json() == []
@@ -571,7 +574,7 @@ class TestGetGridDataEndpoint:
         ]
 
         # Also verify that TI summaries include a leaf entry for the removed task
-        with assert_queries_count(4):
+        with assert_queries_count(5):
             ti_resp = test_client.get(f"/grid/ti_summaries/{DAG_ID_3}?run_ids=run_3")
         assert ti_resp.status_code == 200
         [ti_payload] = self._parse_ndjson(ti_resp)
@@ -641,11 +644,36 @@ class TestGetGridDataEndpoint:
 
     def test_get_grid_runs(self, session, test_client):
         session.commit()
-        with assert_queries_count(6):
+        with assert_queries_count(7):
             response = test_client.get(f"/grid/runs/{DAG_ID}?limit=5")
         assert response.status_code == 200
         assert _strip_dag_version_ids(response.json()) == [GRID_RUN_1, GRID_RUN_2]
 
+    def test_get_grid_runs_etag(self, session, test_client):
+        session.commit()
+        first = test_client.get(f"/grid/runs/{DAG_ID}")
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+
+        # Only the auth queries and the ETag version query are run
+        with assert_queries_count(3):
+            response = test_client.get(f"/grid/runs/{DAG_ID}", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+        response = test_client.get(
+            f"/grid/runs/{DAG_ID}", params={"limit": 1}, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+
+        run_1 = session.scalar(select(DagRun).where(DagRun.dag_id == DAG_ID, DagRun.run_id == "run_1"))
+        run_1.dag_run_note = DagRunNote(content="a note on run_1")
+        session.commit()
+        response = test_client.get(f"/grid/runs/{DAG_ID}", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
     def test_get_grid_runs_has_note(self, session, test_client):
         """has_note is True when a DagRunNote exists for a dag run, False otherwise."""
         run_1 = session.scalar(select(DagRun).where(DagRun.dag_id == DAG_ID, DagRun.run_id == "run_1"))
@@ -715,7 +743,7 @@ class TestGetGridDataEndpoint:
 
     def test_get_grid_runs_filter_by_run_type_and_triggering_user(self, session, test_client):
         session.commit()
-        with assert_queries_count(6):
+        with assert_queries_count(7):
             response = test_client.get(f"/grid/runs/{DAG_ID}?run_type=manual&triggering_user=user2")
         assert response.status_code == 200
         assert _strip_dag_version_ids(response.json()) == [GRID_RUN_2]
@@ -740,7 +768,7 @@ class TestGetGridDataEndpoint:
         run_id = "run_4-1"
         session.commit()
 
-        with assert_queries_count(4):
+        with assert_queries_count(5):
             response = test_client.get(f"/grid/ti_summaries/{DAG_ID_4}?run_ids={run_id}")
         assert response.status_code == 200
         [actual] = self._parse_ndjson(response)
@@ -849,7 +877,7 @@ class TestGetGridDataEndpoint:
         run_id = "run_2"
         session.commit()
 
-        with assert_queries_count(4):
+        with assert_queries_count(5):
             response = test_client.get(f"/grid/ti_summaries/{DAG_ID}?run_ids={run_id}")
         assert response.status_code == 200
         [data] = self._parse_ndjson(response)
@@ -1240,9 +1268,72 @@ class TestGetGridDataEndpoint:
         session.commit()
 
         run_ids = ["run_1", "run_2"]
-        # 2 auth queries + 1 serdag query shared across both runs
-        # + 1 TI query per run = 5 total (not 1 serdag per run which would be 6+).
-        with assert_queries_count(5):
+        # 2 auth queries + 1 ETag version query + 1 Dag run query + 1 TI query for both runs
+        # + 1 serdag query shared across both runs = 6 total.
+        with assert_queries_count(6):
             response = test_client.get(f"/grid/ti_summaries/{DAG_ID}", params={"run_ids": run_ids})
         assert response.status_code == 200
         assert len(self._parse_ndjson(response)) == len(run_ids)
+
+    def test_grid_ti_summaries_stream_etag(self, session, test_client, time_machine):
+        session.commit()
+        run_ids = ["run_1", "run_2"]
+        first = test_client.get(f"/grid/ti_summaries/{DAG_ID}", params={"run_ids": run_ids})
+        etag = first.headers["ETag"]
+
+        with assert_queries_count(3):
+            response = test_client.get(
+                f"/grid/ti_summaries/{DAG_ID}", params={"run_ids": run_ids}, headers={"If-None-Match": etag}
+            )
+        assert response.status_code == 304
+
+        # The time is frozen for the class, move it so that the update bumps ``updated_at``
+        time_machine.move_to("2024-12-31T00:01:00+00:00", tick=False)
+        ti = session.scalar(
+            select(TaskInstance).where(TaskInstance.dag_id == DAG_ID, TaskInstance.run_id == "run_2").limit(1)
+        )
+        ti.state = TaskInstanceState.UP_FOR_RETRY
+        session.commit()
+        response = test_client.get(
+            f"/grid/ti_summaries/{DAG_ID}", params={"run_ids": run_ids}, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_grid_ti_summaries_stream_caches_finished_runs(self, session, test_client):
+        """Summaries of finished runs are served from the cache until the run changes."""
+        session.commit()
+
+        run_ids = ["run_1", "run_2"]
+        first = test_client.get(f"/grid/ti_summaries/{DAG_ID}", params={"run_ids": run_ids})
+        # Both runs are finished: only the auth, ETag version and Dag run queries are left.
+        with assert_queries_count(4):
+            second = test_client.get(f"/grid/ti_summaries/{DAG_ID}", params={"run_ids": run_ids})
+        assert second.text == first.text
+
+        dag_run = session.scalar(select(DagRun).where(DagRun.dag_id == DAG_ID, DagRun.run_id == "run_1"))
+        dag_run.state = DagRunState.QUEUED
+        session.commit()
+        with assert_queries_count(6):
+            test_client.get(f"/grid/ti_summaries/{DAG_ID}", params={"run_ids": run_ids})
+
+    def test_grid_ti_summaries_stream_cache_follows_task_instance_changes(
+        self, session, test_client, time_machine
+    ):
+        """A task instance updated in a finished run is picked up without invalidating the cache."""
+        session.commit()
+
+        run_ids = ["run_1"]
+        first = test_client.get(f"/grid/ti_summaries/{DAG_ID}", params={"run_ids": run_ids})
+
+        # The time is frozen for the class, move it so that the update bumps ``updated_at``
+        time_machine.move_to("2024-12-31T00:01:00+00:00", tick=False)
+        ti = session.scalar(
+            select(TaskInstance).where(TaskInstance.dag_id == DAG_ID, TaskInstance.run_id == "run_1").limit(1)
+        )
+        ti.state = TaskInstanceState.UP_FOR_RETRY
+        session.commit()
+
+        second = test_client.get(f"/grid/ti_summaries/{DAG_ID}", params={"run_ids": run_ids})
+        assert second.text != first.text
+        assert "up_for_retry" in second.text
@@ -0,0 +1,102 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from airflow.api_fastapi.core_api.services.ui.change_feed import ChangeFeed
+from airflow.providers.standard.operators.empty import EmptyOperator
+from airflow.utils.state import DagRunState, TaskInstanceState
+
+from tests_common.test_utils.db import clear_db_runs
+
+pytestmark = pytest.mark.db_test
+
+
+def _summarize(events):
+    return [(event.kind, event.run_id, event.task_id, event.state) for event in events]
+
+
+class TestChangeFeed:
+    @pytest.fixture(autouse=True)
+    def _clean(self):
+        clear_db_runs()
+        yield
+        clear_db_runs()
+
+    @pytest.mark.asyncio
+    async def test_poll_publishes_changes_of_active_runs(self, dag_maker, session):
+        with dag_maker("change_feed_dag", session=session, serialized=True):
+            EmptyOperator(task_id="task")
+        dag_run = dag_maker.create_dagrun(run_id="run", state=DagRunState.RUNNING)
+        session.commit()
+
+        feed = ChangeFeed(interval=1)
+        # The first poll only records the current state
+        assert await feed.poll() == []
+
+        ti = dag_run.get_task_instance("task", session=session)
+        ti.state = TaskInstanceState.RUNNING
+        session.commit()
+        assert _summarize(await feed.poll()) == [("task_instance", "run", "task", TaskInstanceState.RUNNING)]
+        # Changes are only published once
+        assert await feed.poll() == []
+
+        dag_run.state = DagRunState.SUCCESS
+        session.commit()
+        assert _summarize(await feed.poll()) == [("dag_run", "run", None, DagRunState.SUCCESS)]
+
+        # Runs that just finished are still followed, so late changes are published once
+        ti.state = TaskInstanceState.SUCCESS
+        session.commit()
+        assert _summarize(await feed.poll()) == [("task_instance", "run", "task", TaskInstanceState.SUCCESS)]
+        assert await feed.poll() == []
+
+    @pytest.mark.asyncio
+    async def test_poll_publishes_new_runs(self, dag_maker, session):
+        with dag_maker("change_feed_dag", session=session, serialized=True):
+            EmptyOperator(task_id="task")
+        feed = ChangeFeed(interval=1)
+        assert await feed.poll() == []
+
+        dag_maker.create_dagrun(run_id="run", state=DagRunState.QUEUED)
+        session.commit()
+        events = await feed.poll()
+        assert ("dag_run", "run", None, DagRunState.QUEUED) in _summarize(events)
+
+    @pytest.mark.asyncio
+    async def test_poll_publishes_runs_finished_between_polls(self, dag_maker, session):
+        with dag_maker("change_feed_dag", session=session, serialized=True):
+            EmptyOperator(task_id="task")
+        feed = ChangeFeed(interval=1)
+        assert await feed.poll() == []
+
+        dag_maker.create_dagrun(run_id="run", state=DagRunState.SUCCESS)
+        session.commit()
+        assert ("dag_run", "run", None, DagRunState.SUCCESS) in _summarize(await feed.poll())
+        assert await feed.poll() == []
+
+    def test_publish_asks_slow_subscribers_to_resync(self):
+        feed = ChangeFeed(interval=1)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+        feed._subscribers.add(queue)
+        for _ in range(3):
+            feed.publish([])
+        assert queue.qsize() == 1
+        assert queue.get_nowait() is None
@@ -17,7 +17,13 @@
 
 from __future__ import annotations
 
-from airflow.api_fastapi.core_api.services.ui.grid import _merge_node_dicts
+from airflow.api_fastapi.core_api.services.ui.grid import (
+    GridNodeAgg,
+    GridPlanNode,
+    GridSummaryCache,
+    _merge_node_dicts,
+    summarize_grid_plan,
+)
 
 
 def test_merge_node_dicts_with_none_new_list():
@@ -136,3 +142,47 @@ def test_merge_node_dicts_large_merge_keeps_unique_nodes():
         "group_399.old_task",
         "group_399.new_task",
     }
+
+
+def test_summarize_grid_plan_aggregates_groups_from_their_children():
+    plan = [
+        GridPlanNode("group.a", "a", "task", "group"),
+        GridPlanNode("group.b", "b", "mapped_task", "group"),
+        GridPlanNode("group", "group", "group", None, children=(0, 1)),
+        GridPlanNode("c", "c", "task", None),
+    ]
+    ti_details = {"group.a": GridNodeAgg(), "c": GridNodeAgg()}
+    ti_details["group.a"].add_ti(state="success", start_date=None, end_date=None, dag_version_number=1)
+    ti_details["c"].add_ti(state="failed", start_date=None, end_date=None, dag_version_number=1)
+
+    nodes = {node["task_id"]: node for node in summarize_grid_plan(plan, ti_details)}
+
+    assert list(nodes) == ["group.a", "group.b", "group", "c"]
+    # The mapped task without task instances counts as a single no-status square
+    assert nodes["group.b"]["child_states"] == {"none": 1}
+    assert nodes["group"]["child_states"] == {"success": 1, "none": 1}
+    assert nodes["group"]["parent_id"] is None
+    assert nodes["c"]["state"] == "failed"
+    assert set(ti_details) == {"group.a", "c"}
+
+
+def test_grid_summary_cache_serves_entries_with_matching_token():
+    cache = GridSummaryCache(maxsize=10, ttl=0)
+    cache.set("dag", "run_1", ("success", 1), "line-1")
+    cache.set("dag", "run_2", ("success", 1), "line-2")
+    cache.set("other", "run_1", ("success", 1), "line-3")
+
+    assert cache.get("dag", "run_1", ("success", 1)) == "line-1"
+    assert cache.get("dag", "run_1", ("queued", 2)) is None
+    assert cache.get("other", "run_1", ("success", 1)) == "line-3"
+
+    cache.clear()
+
+    assert cache.get("dag", "run_2", ("success", 1)) is None
+
+
+def test_grid_summary_cache_disabled_with_zero_size():
+    cache = GridSummaryCache(maxsize=0, ttl=0)
+    cache.set("dag", "run_1", "token", "line")
+
+    assert cache.get("dag", "run_1", "token") is None
@@ -67,6 +67,12 @@ class TestStreamingEndpointSessionScope:
         allowed = {
             "airflow.api_fastapi.core_api.routes.public.log.get_log",
             "airflow.api_fastapi.core_api.routes.public.dag_run.wait_dag_run_until_finished",
+            # List endpoints streaming their results with stream_select, which fetches each chunk
+            # in its own session. The request session is only used for the non-streaming responses.
+            "airflow.api_fastapi.core_api.routes.public.dag_run.get_dag_runs",
+            "airflow.api_fastapi.core_api.routes.public.event_logs.get_event_logs",
+            "airflow.api_fastapi.core_api.routes.public.task_instances.get_task_instances",
+            "airflow.api_fastapi.core_api.routes.public.xcom.get_xcom_entries",
         }
 
         app = create_app()
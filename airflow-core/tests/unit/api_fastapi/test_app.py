@@ -21,6 +21,10 @@ from unittest import mock
 
 import pytest
 from fastapi import FastAPI
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from starlette.routing import Mount
 
 import airflow.api_fastapi.app as app_module
 import airflow.plugins_manager as plugins_manager
@@ -97,6 +101,54 @@ def test_catch_all_route_last(client):
     assert test_app.routes[-1].path == "/{rest_of_path:path}"
 
 
+def _api_routes(routes):
+    for route in routes:
+        if isinstance(route, Mount) and hasattr(route.app, "routes"):
+            yield from _api_routes(route.app.routes)
+        elif isinstance(route, APIRoute):
+            yield route
+
+
+# GET endpoints that redirect, stream, or serve html or plain text, rather than returning a JSON document
+GET_ENDPOINTS_WITHOUT_RESPONSE_MODEL = {
+    "api_not_found",
+    "get_changes",
+    "get_previous_dagrun_compat",
+    "login",
+    "login_all_admins",
+    "logout",
+    "old_api",
+    "old_health",
+    "ping",
+    "wait_dag_run_until_finished",
+    "webapp",
+}
+
+
+def test_json_routes_serialize_with_pydantic_core(client):
+    """
+    Ensure JSON responses are serialized straight to bytes by pydantic-core.
+
+    FastAPI only does so for routes that declare a response model, through their return annotation
+    or ``response_model``, and that keep the default response class. Other routes go through
+    ``jsonable_encoder`` or ``json.dumps``, which is several times slower for the same response,
+    see ``scripts/in_container/benchmark_api_serialization.py``.
+    """
+    from airflow.api_fastapi.execution_api.routes import execution_api_router
+
+    routes = [*_api_routes(client(apps="core").app.routes), *_api_routes(execution_api_router.routes)]
+
+    assert not [
+        route.path
+        for route in routes
+        if not isinstance(route.response_class, DefaultPlaceholder)
+        and issubclass(route.response_class, JSONResponse)
+    ]
+    assert {
+        route.endpoint.__name__ for route in routes if "GET" in route.methods and route.response_field is None
+    } <= GET_ENDPOINTS_WITHOUT_RESPONSE_MODEL
+
+
 @pytest.mark.parametrize(
     ("invalid_prefix", "expected_message"),
     [
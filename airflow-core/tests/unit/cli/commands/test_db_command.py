@@ -785,6 +785,19 @@ class TestCliDb:
             always_fail.assert_has_calls([call()] * (retry + 1))
             sleep.assert_has_calls([call(retry_delay)] * retry)
 
+    @patch("airflow.models.state_rollup.backfill_state_rollups")
+    def test_cli_backfill_state_rollups(self, mock_backfill_state_rollups, capsys):
+        covered_from = pendulum.datetime(2024, 1, 1, tz="UTC")
+        mock_backfill_state_rollups.return_value = covered_from
+        args = self.parser.parse_args(
+            ["db", "backfill-state-rollups", "--start-date", "2024-01-01T00:00:00+00:00"]
+        )
+
+        db_command.backfill_state_rollups(args)
+
+        mock_backfill_state_rollups.assert_called_once_with(covered_from)
+        assert covered_from.isoformat() in capsys.readouterr().out
+
 
 class TestCLIDBClean:
     @classmethod
@@ -0,0 +1,67 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from airflow.cli import cli_parser
+from airflow.cli.commands import trigger_command
+from airflow.models.trigger import Trigger
+
+from tests_common.test_utils.db import clear_db_triggers
+
+pytestmark = pytest.mark.db_test
+
+
+class TestCliTriggers:
+    @classmethod
+    def setup_class(cls):
+        cls.parser = cli_parser.get_parser()
+
+    def setup_method(self):
+        clear_db_triggers()
+
+    def teardown_method(self):
+        clear_db_triggers()
+
+    def test_triggers_top_without_loads(self, stdout_capture):
+        with stdout_capture as stdout:
+            trigger_command.triggers_top(self.parser.parse_args(["triggers", "top"]))
+
+        assert trigger_command.NO_TRIGGER_LOADS_MSG in stdout.getvalue()
+
+    def test_triggers_top_lists_heaviest_triggers_first(self, session, stdout_capture):
+        for classpath, load in [("light", 0.5), ("heavy", 12.0), ("medium", 3.0), ("unknown", None)]:
+            trigger = Trigger(classpath=f"airflow.triggers.testing.{classpath}", kwargs={})
+            trigger.load = load
+            session.add(trigger)
+        session.commit()
+
+        with stdout_capture as stdout:
+            trigger_command.triggers_top(
+                self.parser.parse_args(["triggers", "top", "--limit", "2", "--output", "json"])
+            )
+
+        listed = json.loads(stdout.getvalue())
+        assert [row["classpath"] for row in listed] == [
+            "airflow.triggers.testing.heavy",
+            "airflow.triggers.testing.medium",
+        ]
+        assert listed[0]["load (cpu s/min)"] == 12.0
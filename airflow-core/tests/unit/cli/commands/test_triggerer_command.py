@@ -17,6 +17,8 @@
 # under the License.
 from __future__ import annotations
 
+import os
+import signal
 from unittest import mock
 
 import pytest
@@ -84,6 +86,76 @@ class TestTriggererCommand:
             execute_callable=mock_trigger_job_runner.return_value._execute,
         )
 
+    @pytest.mark.parametrize(
+        ("capacity", "runners", "expected"),
+        [(10, 1, [10]), (10, 3, [4, 3, 3]), (4, 4, [1, 1, 1, 1])],
+    )
+    def test_split_capacity(self, capacity, runners, expected):
+        assert triggerer_command._split_capacity(capacity, runners) == expected
+
+    def test_split_capacity_more_runners_than_capacity(self):
+        from airflow.exceptions import AirflowConfigException
+
+        with pytest.raises(AirflowConfigException, match="Cannot start 3 triggerer runners"):
+            triggerer_command._split_capacity(2, 3)
+
+    @mock.patch("airflow.cli.commands.triggerer_command.wait")
+    @mock.patch("airflow.cli.commands.triggerer_command.Process")
+    @mock.patch("airflow.cli.commands.triggerer_command._serve_logs")
+    def test_trigger_run_multiple_runners(self, mock_serve, mock_process, mock_wait):
+        """Each runner process gets its share of the capacity, and all are stopped when one exits"""
+        processes = [mock.MagicMock(sentinel=i, exitcode=None) for i in range(3)]
+        mock_process.side_effect = processes
+        processes[1].exitcode = 1
+        processes[1].is_alive.return_value = False
+        mock_wait.return_value = [1]
+
+        with pytest.raises(SystemExit) as ctx:
+            triggerer_command.triggerer_run(
+                skip_serve_logs=False, capacity=10, triggerer_heartrate=5, queues=None, runners=3
+            )
+
+        assert ctx.value.code == 1
+        assert [c.kwargs["args"][0] for c in mock_process.call_args_list] == [4, 3, 3]
+        assert all(
+            c.kwargs["target"] is triggerer_command._run_triggerer_job for c in mock_process.call_args_list
+        )
+        for process in processes:
+            process.start.assert_called_once()
+            process.join.assert_called_once()
+        processes[0].terminate.assert_called_once()
+        processes[1].terminate.assert_not_called()
+        processes[2].terminate.assert_called_once()
+
+    @pytest.mark.parametrize("signum", [signal.SIGTERM, signal.SIGINT])
+    @mock.patch("airflow.cli.commands.triggerer_command.wait")
+    @mock.patch("airflow.cli.commands.triggerer_command.Process")
+    @mock.patch("airflow.cli.commands.triggerer_command._serve_logs")
+    def test_trigger_run_multiple_runners_stopped_by_signal(
+        self, mock_serve, mock_process, mock_wait, signum
+    ):
+        """A signal received while waiting stops and joins all runner processes before exiting"""
+        processes = [mock.MagicMock(sentinel=i, exitcode=None) for i in range(2)]
+        mock_process.side_effect = processes
+
+        def receive_signal(sentinels):
+            os.kill(os.getpid(), signum)
+            return []
+
+        mock_wait.side_effect = receive_signal
+        previous_handler = signal.getsignal(signum)
+
+        with pytest.raises(SystemExit) as ctx:
+            triggerer_command.triggerer_run(
+                skip_serve_logs=False, capacity=10, triggerer_heartrate=5, queues=None, runners=2
+            )
+
+        assert ctx.value.code == 0
+        for process in processes:
+            process.terminate.assert_called_once()
+            process.join.assert_called_once()
+        assert signal.getsignal(signum) is previous_handler
+
     @mock.patch("airflow.cli.hot_reload.run_with_reloader")
     def test_triggerer_with_dev_flag(self, mock_reloader):
         """Ensure that triggerer with --dev flag uses hot-reload"""
@@ -1700,6 +1700,44 @@ class TestSchedulerJob:
         assert [ti.key for ti in res] == [tis[1].key]
         session.rollback()
 
+    @pytest.mark.parametrize(
+        ("prioritize_resumed", "expected_index"),
+        [
+            pytest.param("False", 1, id="priority-weight-first"),
+            pytest.param("True", 0, id="resumed-first"),
+        ],
+    )
+    def test_find_executable_task_instances_order_resumed_deferred(
+        self, dag_maker, prioritize_resumed, expected_index
+    ):
+        session = settings.Session()
+        with dag_maker(dag_id="test_order_resumed_deferred_a", max_active_tasks=16, session=session):
+            EmptyOperator(task_id="resumed", priority_weight=1)
+        dr1 = dag_maker.create_dagrun()
+
+        with dag_maker(dag_id="test_order_resumed_deferred_b", max_active_tasks=16, session=session):
+            EmptyOperator(task_id="fresh", priority_weight=4)
+        dr2 = dag_maker.create_dagrun()
+
+        dr1 = session.merge(dr1, load=False)
+
+        with conf_vars({("scheduler", "prioritize_resumed_deferred_tasks"): prioritize_resumed}):
+            self.job_runner = SchedulerJobRunner(job=Job())
+
+        tis = dr1.task_instances + dr2.task_instances
+        for ti in tis:
+            ti.state = State.SCHEDULED
+            session.merge(ti)
+        # The low priority task is coming back from the triggerer
+        tis[0].next_method = "execute_complete"
+        session.merge(tis[0])
+        session.flush()
+
+        res = self.job_runner._executable_task_instances_to_queued(max_tis=1, session=session)
+        session.flush()
+        assert [ti.key for ti in res] == [tis[expected_index].key]
+        session.rollback()
+
     def test_find_executable_task_instances_executor(self, dag_maker, mock_executors):
         """
         Test that tasks for all executors are set to queued, if space allows it
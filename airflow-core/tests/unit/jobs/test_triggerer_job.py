@@ -20,10 +20,12 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import datetime
+import functools
 import itertools
 import os
 import random
 import selectors
+import sys
 import threading
 import time
 import typing
@@ -49,6 +51,7 @@ from pydantic import TypeAdapter
 from structlog.typing import FilteringBoundLogger
 
 from airflow._shared.timezones import timezone
+from airflow.exceptions import AirflowConfigException
 from airflow.executors import workloads
 from airflow.executors.workloads.task import TaskInstanceDTO
 from airflow.executors.workloads.trigger import RunTrigger
@@ -64,6 +67,7 @@ from airflow.jobs.triggerer_job_runner import (
     TriggerRunner,
     TriggerRunnerSupervisor,
     _make_trigger_span,
+    _metered,
     messages,
 )
 from airflow.models import Connection, DagModel, DagRun, Trigger, Variable
@@ -591,10 +595,8 @@ def test_create_workload_uses_supervisor_id_without_job(jobless_supervisor, mock
     )
 
     dag_bag = mocker.Mock()
-    serialized_dag_model = mocker.Mock()
     task = mocker.Mock(start_from_trigger=False)
-    serialized_dag_model.dag.get_task.return_value = task
-    dag_bag.get_serialized_dag_model.return_value = serialized_dag_model
+    dag_bag.get_dag.return_value.get_task.return_value = task
 
     render_log_fname = mocker.Mock(return_value="/logs/ti")
 
@@ -657,6 +659,62 @@ def test_create_workload_watched_assets_none_when_no_assets(jobless_supervisor,
     assert workload.watched_assets is None
 
 
+def test_create_workload_sends_each_dag_version_once(jobless_supervisor, mocker):
+    """Only the first start_from_trigger workload of a Dag version carries the serialized Dag."""
+    dag_version_id = uuid.uuid4()
+    mocker.patch(
+        "airflow.jobs.triggerer_job_runner.TaskInstanceDTO.model_validate",
+        return_value=mocker.Mock(spec=TaskInstanceDTO),
+    )
+
+    dag_bag = mocker.Mock()
+    dag_bag.get_dag.return_value.get_task.return_value = mocker.Mock(start_from_trigger=True)
+    dag_bag.get_serialized_dag_model.return_value.data = {"dag": "data"}
+
+    created = []
+    for trigger_id in (1, 2):
+        trigger = mocker.Mock(id=trigger_id, classpath="some.path.Trigger", encrypted_kwargs="")
+        trigger.task_instance.dag_version_id = dag_version_id
+        trigger.task_instance.trigger_timeout = None
+        trigger.task_instance.get_dagrun.return_value.dag_run_data.model_dump.return_value = {}
+        created.append(
+            jobless_supervisor._create_workload(
+                trigger=trigger,
+                dag_bag=dag_bag,
+                render_log_fname=mocker.Mock(return_value="/logs/ti"),
+                session=mocker.Mock(),
+            )
+        )
+
+    assert [workload.dag_data for workload in created] == [{"dag": "data"}, None]
+    assert [workload.dag_version_id for workload in created] == [dag_version_id, dag_version_id]
+    dag_bag.get_serialized_dag_model.assert_called_once()
+    assert jobless_supervisor.dag_version_triggers == {dag_version_id: {1, 2}}
+
+
+def test_dag_version_released_once_its_triggers_are_done(jobless_supervisor):
+    """A Dag version is released to the runner once every trigger using it finished or failed."""
+    dag_version_id = uuid.uuid4()
+    jobless_supervisor.dag_version_triggers[dag_version_id] = {1, 2}
+    jobless_supervisor.trigger_dag_versions.update({1: dag_version_id, 2: dag_version_id})
+
+    with mock.patch.object(TriggerRunnerSupervisor, "send_msg", autospec=True) as mock_send:
+        jobless_supervisor._handle_request(
+            messages.TriggerStateChanges(finished=[1]), log=MagicMock(spec=FilteringBoundLogger), req_id=1
+        )
+        assert mock_send.call_args.args[1].dags_released is None
+
+        jobless_supervisor._handle_request(
+            messages.TriggerStateChanges(failures=[(2, None)]),
+            log=MagicMock(spec=FilteringBoundLogger),
+            req_id=2,
+        )
+        assert mock_send.call_args.args[1].dags_released == [dag_version_id]
+
+    assert jobless_supervisor.dag_version_triggers == {}
+    assert jobless_supervisor.trigger_dag_versions == {}
+
+
 def test_run_trigger_workload_includes_watched_assets_field():
     """RunTrigger workload should accept and store watched_assets."""
     workload = RunTrigger(
@@ -1118,6 +1176,43 @@ def test_trigger_logger_fd_closed_when_upload_to_remote_raises(jobless_superviso
 
 
 class TestTriggerRunner:
+    def test_get_workload_dag_reuses_dag_of_same_version(self) -> None:
+        trigger_runner = TriggerRunner()
+        dag_version_id = uuid.uuid4()
+        first = workloads.RunTrigger(
+            id=1, classpath="a", encrypted_kwargs="", dag_data={"dag": 1}, dag_version_id=dag_version_id
+        )
+        second = workloads.RunTrigger(id=2, classpath="a", encrypted_kwargs="", dag_version_id=dag_version_id)
+
+        with patch("airflow.jobs.triggerer_job_runner.DagSerialization.from_dict") as from_dict:
+            assert trigger_runner.get_workload_dag(first) is from_dict.return_value
+            assert trigger_runner.get_workload_dag(second) is from_dict.return_value
+
+        from_dict.assert_called_once_with({"dag": 1})
+        no_dag = workloads.RunTrigger(id=3, classpath="a", encrypted_kwargs="")
+        assert trigger_runner.get_workload_dag(no_dag) is None
+
+    def test_get_workload_dag_fails_for_unknown_version(self) -> None:
+        trigger_runner = TriggerRunner()
+        workload = workloads.RunTrigger(id=1, classpath="a", encrypted_kwargs="", dag_version_id=uuid.uuid4())
+
+        with pytest.raises(RuntimeError, match="was not sent by the supervisor"):
+            trigger_runner.get_workload_dag(workload)
+
+    @pytest.mark.asyncio
+    async def test_sync_state_drops_released_dags(self) -> None:
+        trigger_runner = TriggerRunner()
+        released, kept = uuid.uuid4(), uuid.uuid4()
+        trigger_runner.dags = {released: MagicMock(), kept: MagicMock()}
+        trigger_runner.comms_decoder = AsyncMock(spec=TriggerCommsDecoder)
+        trigger_runner.comms_decoder.asend.return_value = messages.TriggerStateSync(
+            to_create=[], to_cancel=set(), dags_released=[released]
+        )
+
+        await trigger_runner.sync_state_to_supervisor(finished_ids=[])
+
+        assert list(trigger_runner.dags) == [kept]
+
     def test_blocked_main_thread_warning_threshold_decode(self) -> None:
         with conf_vars({("triggerer", "blocked_main_thread_warning_threshold"): "0.5"}):
             trigger_runner = TriggerRunner()
@@ -1647,6 +1742,50 @@ class TestTriggerRunner:
 
         await runner.cleanup_finished_triggers()
 
+    @pytest.mark.asyncio
+    async def test_collect_trigger_loads(self) -> None:
+        """CPU time used by each trigger is reported as CPU seconds per minute once per interval."""
+        with conf_vars({("triggerer", "load_report_interval"): "60"}):
+            trigger_runner = TriggerRunner()
+
+        async def busy():
+            sum(range(200_000))
+            await asyncio.sleep(0)
+
+        task = asyncio.create_task(_metered(busy(), functools.partial(trigger_runner._record_step, 1)))
+        await task
+        trigger_runner.triggers = {
+            1: {"task": task, "is_watcher": False, "name": "busy", "events": 0},
+            2: {"task": MagicMock(spec=asyncio.Task), "is_watcher": False, "name": "idle", "events": 0},
+        }
+        assert trigger_runner.trigger_cpu_time[1] > 0
+
+        # Nothing is reported until the interval has elapsed
+        assert trigger_runner.collect_trigger_loads() is None
+
+        trigger_runner._last_load_report -= 120
+        loads = dict(trigger_runner.collect_trigger_loads())
+        assert loads[1] > 0
+        assert loads[2] == 0
+        assert not trigger_runner.trigger_cpu_time
+
+    def test_record_step_names_blocking_trigger(self, cap_structlog) -> None:
+        with conf_vars({("triggerer", "blocked_main_thread_warning_threshold"): "0.5"}):
+            trigger_runner = TriggerRunner()
+        trigger_runner.triggers = {
+            1: {"task": MagicMock(spec=asyncio.Task), "is_watcher": False, "name": "slow", "events": 0}
+        }
+
+        trigger_runner._record_step(1, cpu_time=0.1, wall_time=0.2)
+        assert not [entry for entry in cap_structlog if entry["log_level"] == "warning"]
+
+        trigger_runner._record_step(1, cpu_time=0.9, wall_time=1.0)
+        assert trigger_runner.trigger_cpu_time[1] == pytest.approx(1.0)
+        warnings = [entry for entry in cap_structlog if entry["log_level"] == "warning"]
+        assert len(warnings) == 1
+        assert warnings[0]["name"] == "slow"
+        assert warnings[0]["trigger_id"] == 1
+
     @pytest.mark.asyncio
     @patch("airflow.sdk.execution_time.task_runner.SUPERVISOR_COMMS", create=True)
     async def test_sync_state_to_supervisor(self, supervisor_builder):
@@ -2563,6 +2702,41 @@ class TestTriggererJobRunner:
         # Verify env var is restored after run() returns.
         assert os.environ.get("_AIRFLOW_PROCESS_CONTEXT") is None
 
+    @pytest.mark.skipif(sys.version_info < (3, 11), reason="asyncio.Runner requires Python 3.11")
+    def test_trigger_runner_uses_configured_event_loop_factory(self):
+        """[triggerer] event_loop_factory picks the event loop triggers run in."""
+        loops = []
+
+        def loop_factory():
+            loops.append(asyncio.new_event_loop())
+            return loops[-1]
+
+        captured_loop = {}
+
+        async def capture_loop(*args, **kwargs):
+            captured_loop["value"] = asyncio.get_running_loop()
+
+        runner = TriggerRunner()
+        with (
+            conf_vars({("triggerer", "event_loop_factory"): "my_loop.new_event_loop"}),
+            patch("airflow.jobs.triggerer_job_runner.import_string", return_value=loop_factory),
+            patch.object(runner, "arun", side_effect=capture_loop),
+            patch("signal.signal"),
+        ):
+            runner.run()
+
+        assert captured_loop["value"] is loops[0]
+
+    @pytest.mark.skipif(sys.version_info < (3, 11), reason="asyncio.Runner requires Python 3.11")
+    def test_trigger_runner_rejects_missing_event_loop_factory(self):
+        runner = TriggerRunner()
+        with (
+            conf_vars({("triggerer", "event_loop_factory"): "not_installed_loop.new_event_loop"}),
+            patch("signal.signal"),
+            pytest.raises(AirflowConfigException, match="not_installed_loop.new_event_loop"),
+        ):
+            runner.run()
+
 
 class TestTriggererMessageTypes:
     def test_message_types_in_triggerer(self):
@@ -2946,24 +3120,39 @@ def test_handle_events_records_persist_confirmations(jobless_supervisor):
     jobless_supervisor.events.append(TriggerEventEntry(1, event_with_seq, 7))
     jobless_supervisor.events.append(TriggerEventEntry(2, event_without_seq, None))
 
-    with mock.patch.object(TriggerRunnerSupervisor, "on_trigger_event", autospec=True) as mock_event:
+    with mock.patch.object(TriggerRunnerSupervisor, "on_trigger_events", autospec=True) as mock_events:
         jobless_supervisor.handle_events()
 
-    assert mock_event.mock_calls == [
-        mock.call(jobless_supervisor, trigger_id=1, event=event_with_seq),
-        mock.call(jobless_supervisor, trigger_id=2, event=event_without_seq),
+    assert mock_events.mock_calls == [
+        mock.call(
+            jobless_supervisor,
+            [TriggerEventEntry(1, event_with_seq, 7), TriggerEventEntry(2, event_without_seq, None)],
+        ),
     ]
     assert list(jobless_supervisor.persisted_event_seqs) == [7]
     assert len(jobless_supervisor.events) == 0
 
 
+def test_handle_events_submits_in_batches(jobless_supervisor):
+    """handle_events submits pending events in batches of at most event_batch_size."""
+    jobless_supervisor.event_batch_size = 2
+    jobless_supervisor.events.extend(TriggerEventEntry(i, TriggerEvent(i), i) for i in range(5))
+
+    with mock.patch.object(TriggerRunnerSupervisor, "on_trigger_events", autospec=True) as mock_events:
+        jobless_supervisor.handle_events()
+
+    batches = [[entry.trigger_id for entry in c.args[1]] for c in mock_events.mock_calls]
+    assert batches == [[0, 1], [2, 3], [4]]
+    assert list(jobless_supervisor.persisted_event_seqs) == [0, 1, 2, 3, 4]
+
+
 def test_handle_events_does_not_confirm_seq_when_persist_fails(jobless_supervisor):
     """A seq whose event failed to persist is never confirmed, so the broker advance fails out."""
     jobless_supervisor.events.append(TriggerEventEntry(1, TriggerEvent(True), 7))
 
     with mock.patch.object(
         TriggerRunnerSupervisor,
-        "on_trigger_event",
+        "on_trigger_events",
         autospec=True,
         side_effect=RuntimeError("db down"),
     ):
@@ -2991,7 +3180,7 @@ def test_handle_events_emits_team_name(jobless_supervisor, team_name, expected_t
     )
 
     with (
-        mock.patch.object(TriggerRunnerSupervisor, "on_trigger_event", autospec=True),
+        mock.patch.object(TriggerRunnerSupervisor, "on_trigger_events", autospec=True),
         mock.patch("airflow.jobs.triggerer_job_runner.stats.incr") as mock_incr,
     ):
         jobless_supervisor.handle_events()
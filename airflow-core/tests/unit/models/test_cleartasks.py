@@ -23,6 +23,7 @@ import random
 import pytest
 from sqlalchemy import func, select
 
+from airflow.exceptions import AirflowClearRunningTaskException
 from airflow.models.dag_version import DagVersion
 from airflow.models.dagrun import DagRun
 from airflow.models.taskinstance import TaskInstance, TaskInstance as TI, clear_task_instances
@@ -36,6 +37,7 @@ from airflow.utils.state import DagRunState, State, TaskInstanceState
 from airflow.utils.types import DagRunTriggeredByType, DagRunType
 
 from tests_common.test_utils import db
+from tests_common.test_utils.asserts import count_queries
 from tests_common.test_utils.dag import sync_dag_to_db
 from tests_common.test_utils.taskinstance import run_task_instance
 from unit.models import DEFAULT_DATE
@@ -546,6 +548,71 @@ class TestClearTasks:
 
         assert [ti_history[0], ti_history[1]] == [str(state_recorded), str(state_recorded)]
 
+    def test_clear_task_instances_query_count_does_not_depend_on_task_instances(self, dag_maker, session):
+        """History, reschedules and states of the task instances are written with batched statements."""
+
+        def clear_queries_count(num_tasks):
+            with dag_maker(f"test_clear_task_instances_query_count_{num_tasks}", session=session):
+                for i in range(num_tasks):
+                    EmptyOperator(task_id=f"task_{i}")
+            dr = dag_maker.create_dagrun(state=DagRunState.SUCCESS)
+            for ti in dr.task_instances:
+                ti.state = TaskInstanceState.SUCCESS
+            session.flush()
+            tis = session.scalars(select(TI).where(TI.dag_id == dr.dag_id)).all()
+
+            with count_queries() as result:
+                clear_task_instances(tis, session)
+                session.flush()
+            return sum(result.values())
+
+        assert clear_queries_count(num_tasks=20) == clear_queries_count(num_tasks=2)
+        assert (
+            session.scalar(
+                select(func.count()).where(
+                    TaskInstanceHistory.dag_id.startswith("test_clear_task_instances_query_count_")
+                )
+            )
+            == 22
+        )
+
+    def test_clear_task_instances_does_not_record_history_twice(self, dag_maker, session):
+        with dag_maker("test_clear_task_instances_does_not_record_history_twice", session=session):
+            EmptyOperator(task_id="0")
+            EmptyOperator(task_id="1")
+        dr = dag_maker.create_dagrun(state=DagRunState.SUCCESS)
+        ti0, ti1 = sorted(dr.task_instances, key=lambda ti: ti.task_id)
+        ti0.state = ti1.state = TaskInstanceState.FAILED
+        session.flush()
+        TaskInstanceHistory.record_ti(ti0, session=session)
+        session.flush()
+
+        clear_task_instances([ti0, ti1], session)
+        session.flush()
+
+        history = session.execute(
+            select(TaskInstanceHistory.task_id, TaskInstanceHistory.state).where(
+                TaskInstanceHistory.dag_id == dr.dag_id
+            )
+        )
+        assert sorted(history) == [("0", TaskInstanceState.FAILED), ("1", TaskInstanceState.FAILED)]
+
+    def test_clear_running_task_instance_with_prevent_running_task(self, dag_maker, session):
+        with dag_maker("test_clear_running_task_instance_with_prevent_running_task", session=session):
+            EmptyOperator(task_id="0")
+            EmptyOperator(task_id="1")
+        dr = dag_maker.create_dagrun(state=DagRunState.RUNNING)
+        ti0, ti1 = sorted(dr.task_instances, key=lambda ti: ti.task_id)
+        ti0.state = TaskInstanceState.SUCCESS
+        ti1.state = TaskInstanceState.RUNNING
+        session.flush()
+
+        with pytest.raises(AirflowClearRunningTaskException):
+            clear_task_instances([ti0, ti1], session, prevent_running_task=True)
+
+        assert ti0.state == TaskInstanceState.SUCCESS
+        assert not session.scalar(select(func.count()).where(TaskInstanceHistory.dag_id == dr.dag_id))
+
     def test_dag_clear(self, dag_maker, session):
         with dag_maker("test_dag_clear") as dag:
             EmptyOperator(task_id="test_dag_clear_task_0")
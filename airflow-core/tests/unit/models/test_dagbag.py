@@ -95,6 +95,22 @@ class TestDBDagBag:
         entry = self.db_dag_bag._dags["v1"]
         assert (entry.dag, entry.dag_hash) == (mock_dag, "hash1")
 
+    def test_get_dags_loads_missing_versions_in_one_query(self):
+        """Versions not in the cache are loaded with a single query, cached ones are served as is."""
+        cached_dag = MagicMock(spec=SerializedDAG)
+        self.db_dag_bag._dags["v1"] = _CacheEntry(cached_dag, "hash1", time.monotonic())
+        mock_serdag = MagicMock(spec=SerializedDagModel)
+        mock_serdag.dag = MagicMock(spec=SerializedDAG)
+        mock_serdag.dag_version_id = "v2"
+        mock_serdag.dag_hash = "hash2"
+        self.session.scalars.return_value = [mock_serdag]
+
+        result = self.db_dag_bag.get_dags(["v1", "v2"], session=self.session)
+
+        assert result == {"v1": cached_dag, "v2": mock_serdag.dag}
+        self.session.scalars.assert_called_once()
+        self.session.get.assert_not_called()
+
     def test_get_dag_serves_within_revalidation_window_without_query(self):
         """A recently validated entry is served straight from cache with no DB query at all."""
         mock_dag = MagicMock(spec=SerializedDAG)
@@ -0,0 +1,246 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from unittest import mock
+
+import pytest
+from sqlalchemy import select, update
+
+from airflow._shared.timezones import timezone
+from airflow.models import state_rollup
+from airflow.models.dagrun import DagRun
+from airflow.models.state_rollup import (
+    StateRollup,
+    StateRollupWatermark,
+    backfill_state_rollups,
+    ceil_bucket,
+    floor_bucket,
+    get_state_rollup_coverage,
+    recompute_state_rollups,
+    recompute_state_rollups_before,
+    refresh_state_rollups,
+)
+from airflow.providers.standard.operators.empty import EmptyOperator
+from airflow.utils.state import DagRunState, TaskInstanceState
+
+from tests_common.test_utils.db import clear_db_runs, clear_db_state_rollups
+
+pytestmark = pytest.mark.db_test
+
+NOW = datetime(2024, 1, 10, 10, 30, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def clean():
+    clear_db_runs()
+    clear_db_state_rollups()
+    yield
+    clear_db_runs()
+    clear_db_state_rollups()
+
+
+@pytest.fixture
+def dag(dag_maker, session):
+    with dag_maker(dag_id="test_state_rollup", schedule=None, session=session):
+        EmptyOperator(task_id="task_1") >> EmptyOperator(task_id="task_2")
+    return dag_maker
+
+
+def _create_run(dag_maker, run_id: str, state: DagRunState, run_after: datetime):
+    return dag_maker.create_dagrun(run_id=run_id, state=state, logical_date=None, run_after=run_after)
+
+
+def _rollups(session) -> dict[tuple[datetime, str, str], int]:
+    return {
+        (rollup.bucket, rollup.kind, rollup.state): rollup.count
+        for rollup in session.scalars(select(StateRollup))
+    }
+
+
+def test_buckets():
+    assert floor_bucket(NOW) == datetime(2024, 1, 10, 10, tzinfo=timezone.utc)
+    assert ceil_bucket(NOW) == datetime(2024, 1, 10, 11, tzinfo=timezone.utc)
+    assert ceil_bucket(floor_bucket(NOW)) == floor_bucket(NOW)
+
+
+def test_first_refresh_starts_covering_the_current_hour(dag, session, time_machine):
+    time_machine.move_to(NOW, tick=False)
+    _create_run(dag, "old", DagRunState.SUCCESS, NOW - timedelta(hours=1))
+    _create_run(dag, "new", DagRunState.RUNNING, NOW - timedelta(minutes=10))
+    session.commit()
+
+    refresh_state_rollups(session=session)
+    session.commit()
+
+    watermark = session.scalar(select(StateRollupWatermark))
+    assert watermark.covered_from == floor_bucket(NOW)
+    assert watermark.refreshed_at == NOW
+    assert _rollups(session) == {
+        (floor_bucket(NOW), "dag_run", "running"): 1,
+        (floor_bucket(NOW), "task_instance", "no_status"): 2,
+    }
+
+
+def test_refresh_recomputes_the_hours_of_updated_runs(dag, session, time_machine):
+    time_machine.move_to(NOW, tick=False)
+    refresh_state_rollups(session=session)
+    session.commit()
+
+    time_machine.move_to(NOW + timedelta(minutes=5), tick=False)
+    dag_run = _create_run(dag, "run", DagRunState.RUNNING, NOW)
+    session.commit()
+    refresh_state_rollups(session=session)
+    session.commit()
+    assert _rollups(session) == {
+        (floor_bucket(NOW), "dag_run", "running"): 1,
+        (floor_bucket(NOW), "task_instance", "no_status"): 2,
+    }
+
+    time_machine.move_to(NOW + timedelta(minutes=10), tick=False)
+    for ti in dag_run.get_task_instances(session=session):
+        ti.state = TaskInstanceState.SUCCESS
+    dag_run.state = DagRunState.SUCCESS
+    session.commit()
+    refresh_state_rollups(session=session)
+    session.commit()
+    assert _rollups(session) == {
+        (floor_bucket(NOW), "dag_run", "success"): 1,
+        (floor_bucket(NOW), "task_instance", "success"): 2,
+    }
+
+
+def test_backfill_extends_coverage(dag, session, time_machine):
+    time_machine.move_to(NOW, tick=False)
+    _create_run(dag, "old", DagRunState.FAILED, NOW - timedelta(days=2))
+    _create_run(dag, "older", DagRunState.FAILED, NOW - timedelta(days=40))
+    session.commit()
+    refresh_state_rollups(session=session)
+    session.commit()
+    assert _rollups(session) == {}
+
+    covered_from = backfill_state_rollups(NOW - timedelta(days=3, minutes=10), session=session)
+
+    assert covered_from == floor_bucket(NOW - timedelta(days=3, minutes=10))
+    assert session.scalar(select(StateRollupWatermark.covered_from)) == covered_from
+    assert _rollups(session) == {
+        (floor_bucket(NOW - timedelta(days=2)), "dag_run", "failed"): 1,
+        (floor_bucket(NOW - timedelta(days=2)), "task_instance", "no_status"): 2,
+    }
+
+    # Backfilling hours that are already covered is a no-op
+    assert backfill_state_rollups(NOW, session=session) == covered_from
+
+
+def test_backfill_recomputes_runs_updated_while_backfilling(dag, session, time_machine):
+    time_machine.move_to(NOW, tick=False)
+    _create_run(dag, "old", DagRunState.RUNNING, NOW - timedelta(days=2))
+    session.commit()
+    refresh_state_rollups(session=session)
+    session.commit()
+    recompute = state_rollup._recompute
+
+    def recompute_then_finish_run(dag_id, start, end, *, session):
+        recompute(dag_id, start, end, session=session)
+        # The run finishes once its hours are backfilled, but before refreshes cover them
+        session.execute(
+            update(DagRun)
+            .where(DagRun.run_id == "old")
+            .values(state=DagRunState.SUCCESS, updated_at=timezone.utcnow())
+        )
+
+    with mock.patch.object(state_rollup, "_recompute", side_effect=recompute_then_finish_run):
+        backfill_state_rollups(NOW - timedelta(days=3), session=session)
+
+    assert _rollups(session) == {
+        (floor_bucket(NOW - timedelta(days=2)), "dag_run", "success"): 1,
+        (floor_bucket(NOW - timedelta(days=2)), "task_instance", "no_status"): 2,
+    }
+
+
+def test_recompute_after_deleting_a_run(dag, session, time_machine):
+    time_machine.move_to(NOW, tick=False)
+    refresh_state_rollups(session=session)
+    session.commit()
+    kept = _create_run(dag, "kept", DagRunState.SUCCESS, NOW)
+    deleted = _create_run(dag, "deleted", DagRunState.FAILED, NOW)
+    session.commit()
+    time_machine.move_to(NOW + timedelta(minutes=5), tick=False)
+    refresh_state_rollups(session=session)
+    session.commit()
+    assert _rollups(session)[(floor_bucket(NOW), "dag_run", "failed")] == 1
+
+    session.delete(deleted)
+    recompute_state_rollups([(deleted.dag_id, deleted.run_after)], session=session)
+    session.commit()
+    # Deleting a run updates no other run, the next refresh alone would not notice it
+    refresh_state_rollups(session=session)
+    session.commit()
+
+    assert _rollups(session) == {
+        (floor_bucket(NOW), "dag_run", "success"): 1,
+        (floor_bucket(NOW), "task_instance", "no_status"): 2,
+    }
+
+    session.delete(kept.get_task_instance("task_1", session=session))
+    recompute_state_rollups([(kept.dag_id, kept.run_after)], session=session)
+    session.commit()
+
+    assert _rollups(session) == {
+        (floor_bucket(NOW), "dag_run", "success"): 1,
+        (floor_bucket(NOW), "task_instance", "no_status"): 1,
+    }
+
+
+def test_recompute_before_a_date(dag, session, time_machine):
+    time_machine.move_to(NOW, tick=False)
+    _create_run(dag, "old", DagRunState.FAILED, NOW - timedelta(days=2))
+    session.commit()
+    refresh_state_rollups(session=session)
+    session.commit()
+    backfill_state_rollups(NOW - timedelta(days=3), session=session)
+    _create_run(dag, "new", DagRunState.RUNNING, NOW)
+    session.commit()
+    refresh_state_rollups(session=session)
+    session.commit()
+
+    clear_db_runs()
+    _create_run(dag, "new", DagRunState.RUNNING, NOW)
+    session.commit()
+    recompute_state_rollups_before(NOW - timedelta(days=1), session=session)
+
+    assert _rollups(session) == {
+        (floor_bucket(NOW), "dag_run", "running"): 1,
+        (floor_bucket(NOW), "task_instance", "no_status"): 2,
+    }
+
+
+def test_coverage(session, time_machine):
+    time_machine.move_to(NOW, tick=False)
+    assert get_state_rollup_coverage(max_age=timedelta(minutes=10), session=session) is None
+
+    refresh_state_rollups(session=session)
+    session.commit()
+    assert get_state_rollup_coverage(max_age=timedelta(minutes=10), session=session) == (
+        floor_bucket(NOW),
+        floor_bucket(NOW),
+    )
+
+    time_machine.move_to(NOW + timedelta(minutes=11), tick=False)
+    assert get_state_rollup_coverage(max_age=timedelta(minutes=10), session=session) is None
@@ -256,6 +256,45 @@ def test_submit_event_no_n_plus_one_for_assets(_, session, asset_count, expected
         Trigger.submit_event(trigger_id, TriggerEvent("payload"), session=session)
 
 
+def test_submit_events(session, create_task_instance):
+    """
+    Tests that a batch of events resumes the task instances of every trigger in the batch,
+    and that only the first event of a trigger is delivered to its task instances.
+    """
+    triggers = [Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={}) for _ in range(2)]
+    session.add_all(triggers)
+    session.flush()
+    task_instances = []
+    for i, trigger in enumerate(triggers):
+        task_instance = create_task_instance(
+            dag_id=f"test_submit_events_{i}",
+            session=session,
+            logical_date=timezone.utcnow(),
+            state=State.DEFERRED,
+        )
+        task_instance.trigger_id = trigger.id
+        task_instance.next_kwargs = {"index": i}
+        task_instances.append(task_instance)
+    session.commit()
+
+    Trigger.submit_events(
+        [
+            (triggers[0].id, TriggerEvent("first")),
+            (triggers[1].id, TriggerEvent("second")),
+            (triggers[0].id, TriggerEvent("ignored")),
+        ],
+        session=session,
+    )
+    session.flush()
+
+    for task_instance in task_instances:
+        session.refresh(task_instance)
+        assert task_instance.state == State.SCHEDULED
+        assert task_instance.trigger_id is None
+    assert task_instances[0].next_kwargs == {"event": "first", "index": 0}
+    assert task_instances[1].next_kwargs == {"event": "second", "index": 1}
+
+
 def test_submit_failure(session, create_task_instance):
     """
     Tests that failures submitted to a trigger fail their dependent
@@ -508,6 +547,64 @@ def test_assign_unassigned(session, create_triggerer, create_trigger, use_queues
         )
 
 
+@pytest.mark.need_serialized_dag
+def test_assign_unassigned_weighted_by_load(session, create_triggerer, create_trigger):
+    """A triggerer running more than the average load only takes its share of unassigned triggers."""
+    time_now = timezone.utcnow()
+    busy_triggerer = create_triggerer(session, State.RUNNING, latest_heartbeat=time_now)
+    idle_triggerer = create_triggerer(session, State.RUNNING, latest_heartbeat=time_now)
+    session.commit()
+    busy_trigger = create_trigger(
+        session=session, name="busy", logical_date=time_now, triggerer_id=busy_triggerer.id
+    )
+    idle_trigger = create_trigger(
+        session=session,
+        name="idle",
+        logical_date=time_now + datetime.timedelta(hours=1),
+        triggerer_id=idle_triggerer.id,
+    )
+    unassigned = [
+        create_trigger(
+            session=session,
+            name=f"unassigned_{i}",
+            logical_date=time_now + datetime.timedelta(hours=i + 2),
+        )
+        for i in range(8)
+    ]
+    session.commit()
+    Trigger.update_loads([(busy_trigger.id, 9.0), (idle_trigger.id, 1.0)], session=session)
+    session.commit()
+
+    # The busy triggerer runs 9 of the 10 CPU seconds per minute, against an average of 5: it only
+    # takes 5/9th of its free capacity of 9
+    Trigger.assign_unassigned(busy_triggerer.id, capacity=10, health_check_threshold=30)
+    Trigger.assign_unassigned(idle_triggerer.id, capacity=10, health_check_threshold=30)
+    session.expire_all()
+
+    assigned = [
+        session.scalar(select(Trigger.triggerer_id).where(Trigger.id == trigger.id)) for trigger in unassigned
+    ]
+    assert assigned.count(busy_triggerer.id) == 5
+    assert assigned.count(idle_triggerer.id) == 3
+
+
+def test_update_loads_skips_deleted_triggers(session):
+    """Loads reported for triggers that were deleted in the meantime are ignored."""
+    running = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+    deleted = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+    session.add_all([running, deleted])
+    session.commit()
+    deleted_id = deleted.id
+    session.delete(deleted)
+    session.commit()
+
+    Trigger.update_loads([(running.id, 2.5), (deleted_id, 4.0)], session=session)
+    session.commit()
+
+    assert session.scalar(select(Trigger.load).where(Trigger.id == running.id)) == 2.5
+    assert session.scalar(select(func.count()).select_from(Trigger)) == 1
+
+
 @pytest.mark.need_serialized_dag
 @conf_vars({("triggerer", "queues_enabled"): "True"})
 def test_assign_unassigned_with_qeueus(session, create_triggerer, create_trigger) -> None:
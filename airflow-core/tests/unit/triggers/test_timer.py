@@ -0,0 +1,94 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+import datetime
+import time
+
+import pytest
+
+from airflow.triggers.timer import TriggerTimer
+
+
+def _in(seconds: float) -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=seconds)
+
+
+@pytest.mark.asyncio
+async def test_past_moment_returns_immediately():
+    timer = TriggerTimer()
+    await asyncio.wait_for(timer.wait_until(_in(-10)), timeout=1)
+    assert timer._task is None
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_released_in_deadline_order():
+    timer = TriggerTimer(resolution=0.1)
+    fired = []
+
+    async def wait(name, seconds):
+        await timer.wait_until(_in(seconds))
+        fired.append(name)
+
+    await asyncio.wait_for(
+        asyncio.gather(wait("late", 0.3), wait("early", 0.1), wait("middle", 0.2)), timeout=5
+    )
+    assert fired == ["early", "middle", "late"]
+    assert not timer._heap
+
+
+@pytest.mark.asyncio
+async def test_waiters_in_the_same_tick_are_released_together():
+    timer = TriggerTimer(resolution=0.5)
+    # Align on the start of a tick so both moments round up to the same deadline
+    await asyncio.sleep(0.5 - time.time() % 0.5)
+    released = []
+
+    async def wait(seconds):
+        await timer.wait_until(_in(seconds))
+        released.append(time.monotonic())
+
+    await asyncio.wait_for(asyncio.gather(wait(0.1), wait(0.3)), timeout=5)
+    assert released[1] - released[0] < 0.05
+
+
+@pytest.mark.asyncio
+async def test_earlier_waiter_wakes_up_sleeping_timer():
+    timer = TriggerTimer(resolution=0.1)
+    late = asyncio.create_task(timer.wait_until(_in(30)))
+    await asyncio.sleep(0.05)
+
+    start = time.monotonic()
+    await asyncio.wait_for(timer.wait_until(_in(0.1)), timeout=5)
+    assert time.monotonic() - start < 1
+    assert not late.done()
+    late.cancel()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiters_are_discarded():
+    timer = TriggerTimer()
+    waiters = [asyncio.create_task(timer.wait_until(_in(3600))) for _ in range(4)]
+    await asyncio.sleep(0)
+    assert len(timer._heap) == 4
+
+    for waiter in waiters[:3]:
+        waiter.cancel()
+    await asyncio.gather(*waiters[:3], return_exceptions=True)
+    assert len(timer._heap) == 1
+    waiters[3].cancel()
@@ -17,10 +17,13 @@
 # under the License.
 from __future__ import annotations
 
+import io
+import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from airflow.utils.log.file_task_handler import FileTaskHandler
+from airflow.utils.log.log_index import LogIndex
 from airflow.utils.state import TaskInstanceState
 
 from tests_common.test_utils.file_task_handler import convert_list_to_stream, extract_events
@@ -294,3 +297,175 @@ class TestFileTaskHandlerExecutorLogs:
             "legacy log",
         ]
         assert metadata == {"end_of_log": False, "log_pos": 1}
+
+
+def _log_line(second: int, event: str) -> str:
+    return json.dumps({"timestamp": f"2026-01-01T00:00:{second:02}+00:00", "event": event}) + "\n"
+
+
+class TestFileTaskHandlerLogPositions:
+    """Tests for reading log sources from the positions reached by a previous read."""
+
+    def setup_method(self):
+        self.ti = MagicMock()
+        self.ti.state = TaskInstanceState.RUNNING
+        self.ti.try_number = 1
+
+    def _read(self, handler, metadata):
+        executor = MagicMock()
+        executor.get_streaming_task_log.return_value = ([], [])
+        with (
+            patch.object(handler, "_render_filename", return_value="dag/run/task/1.log"),
+            patch.object(handler, "_read_remote_logs", side_effect=NotImplementedError),
+            patch.object(handler, "_get_executor", return_value=executor),
+            patch.object(handler, "_read_from_logs_server", return_value=([], [])),
+        ):
+            logs, metadata = handler._read(ti=self.ti, try_number=1, metadata=metadata)
+        return extract_events(logs, skip_source_info=False), metadata
+
+    def test_read_resumes_from_log_positions(self, tmp_path):
+        log_file = tmp_path / "dag/run/task/1.log"
+        log_file.parent.mkdir(parents=True)
+        log_file.write_text(_log_line(1, "first") + _log_line(2, "second"))
+        handler = FileTaskHandler(base_log_folder=str(tmp_path))
+
+        events, metadata = self._read(handler, {"end_of_log": False, "log_positions": {}})
+
+        assert events == [
+            "::group::Log message source details",
+            str(log_file),
+            "::endgroup::",
+            "first",
+            "second",
+        ]
+        assert metadata == {
+            "end_of_log": False,
+            "log_pos": 2,
+            "log_positions": {str(log_file): log_file.stat().st_size},
+            "last_log_timestamp": "2026-01-01T00:00:02+00:00",
+        }
+
+        with log_file.open("a") as f:
+            f.write(_log_line(3, "third"))
+
+        events, metadata = self._read(handler, metadata)
+
+        assert events == ["third"]
+        assert metadata["log_positions"] == {str(log_file): log_file.stat().st_size}
+        assert metadata["log_pos"] == 3
+
+    def test_incomplete_line_is_held_back_until_written(self, tmp_path):
+        log_file = tmp_path / "dag/run/task/1.log"
+        log_file.parent.mkdir(parents=True)
+        fourth = _log_line(4, "fourth")
+        log_file.write_text(_log_line(3, "third") + fourth[:20])
+        complete_size = len(_log_line(3, "third"))
+        handler = FileTaskHandler(base_log_folder=str(tmp_path))
+
+        events, metadata = self._read(handler, {"end_of_log": False, "log_positions": {}})
+
+        assert events[3:] == ["third"]
+        assert metadata["log_positions"] == {str(log_file): complete_size}
+
+        # The rest of the line is written between two reads
+        with log_file.open("a") as f:
+            f.write(fourth[20:])
+
+        events, metadata = self._read(handler, metadata)
+
+        assert events == ["fourth"]
+        assert metadata["log_positions"] == {str(log_file): log_file.stat().st_size}
+        assert metadata["last_log_timestamp"] == "2026-01-01T00:00:04+00:00"
+
+    def test_incomplete_line_is_read_at_end_of_log(self, tmp_path):
+        log_file = tmp_path / "dag/run/task/1.log"
+        log_file.parent.mkdir(parents=True)
+        log_file.write_text(_log_line(3, "third") + "last words")
+        handler = FileTaskHandler(base_log_folder=str(tmp_path))
+        self.ti.state = TaskInstanceState.SUCCESS
+
+        events, metadata = self._read(handler, {"end_of_log": False, "log_positions": {}})
+
+        assert events[3:] == ["third", "last words"]
+        assert metadata["end_of_log"] is True
+        assert metadata["log_positions"] == {str(log_file): log_file.stat().st_size}
+
+    def test_new_log_file_is_read_from_last_log_timestamp(self, tmp_path):
+        log_file = tmp_path / "dag/run/task/1.log"
+        log_file.parent.mkdir(parents=True)
+        log_file.write_text(_log_line(1, "first") + _log_line(3, "third"))
+        handler = FileTaskHandler(base_log_folder=str(tmp_path))
+        _, metadata = self._read(handler, {"end_of_log": False, "log_positions": {}})
+
+        # e.g. the log file was rotated: the lines already read are in a new log file
+        log_file.rename(f"{log_file}.1")
+        log_file.write_text(_log_line(4, "fourth"))
+
+        events, metadata = self._read(handler, metadata)
+
+        assert events == ["third", "fourth"]
+        assert metadata["log_positions"] == {
+            str(log_file): log_file.stat().st_size,
+            f"{log_file}.1": Path(f"{log_file}.1").stat().st_size,
+        }
+
+    def test_log_index_is_only_loaded_to_read_from_timestamp(self, tmp_path):
+        log_file = tmp_path / "dag/run/task/1.log"
+        log_file.parent.mkdir(parents=True)
+        log_file.write_text(_log_line(1, "first") + _log_line(2, "second"))
+        handler = FileTaskHandler(base_log_folder=str(tmp_path))
+
+        with patch.object(LogIndex, "load", wraps=LogIndex.load) as mock_load:
+            _, metadata = self._read(handler, {"end_of_log": False, "log_positions": {}})
+            with log_file.open("a") as f:
+                f.write(_log_line(3, "third"))
+            events, _ = self._read(handler, metadata)
+
+        assert events == ["third"]
+        mock_load.assert_not_called()
+        assert sorted(path.name for path in log_file.parent.iterdir()) == ["1.log"]
+
+    def test_read_from_local_skips_log_index_files(self, tmp_path):
+        log_file = tmp_path / "1.log"
+        log_file.write_text("".join(_log_line(i % 60, f"line {i}") for i in range(5)))
+        index = LogIndex(log_file, interval=2)
+        index.update()
+        index.save()
+        handler = FileTaskHandler(base_log_folder=str(tmp_path))
+
+        sources, _ = handler._read_from_local(log_file, {})
+
+        assert index.index_path.exists()
+        assert sources == [str(log_file)]
+
+    @patch("airflow.utils.log.file_task_handler._fetch_logs_from_service")
+    @patch.object(FileTaskHandler, "_get_log_retrieval_url")
+    def test_served_logs_are_requested_from_log_position(self, mock_get_url, mock_fetch):
+        mock_get_url.return_value = ("http://worker-1/log/1.log", "1.log")
+        mock_fetch.return_value = MagicMock(
+            status_code=206, headers={"Content-Length": "12"}, raw=io.BytesIO(b"line 3\nline")
+        )
+        handler = FileTaskHandler(base_log_folder="/tmp/test_logs")
+        log_positions = {"http://worker-1/log/1.log": 14}
+
+        sources, streams = handler._read_from_logs_server(self.ti, "1.log", log_positions)
+
+        mock_fetch.assert_called_once_with("http://worker-1/log/1.log", "1.log", 14)
+        assert sources == ["http://worker-1/log/1.log"]
+        # The incomplete last line is requested again by the next read
+        assert list(streams[0]) == ["line 3"]
+        assert log_positions == {"http://worker-1/log/1.log": 21}
+
+    @patch("airflow.utils.log.file_task_handler._fetch_logs_from_service")
+    @patch.object(FileTaskHandler, "_get_log_retrieval_url")
+    def test_served_logs_without_new_lines(self, mock_get_url, mock_fetch):
+        mock_get_url.return_value = ("http://worker-1/log/1.log", "1.log")
+        mock_fetch.return_value = MagicMock(status_code=416, headers={"Content-Range": "bytes */14"})
+        handler = FileTaskHandler(base_log_folder="/tmp/test_logs")
+        log_positions = {"http://worker-1/log/1.log": 14}
+
+        sources, streams = handler._read_from_logs_server(self.ti, "1.log", log_positions)
+
+        assert sources == ["http://worker-1/log/1.log"]
+        assert streams == []
+        assert log_positions == {"http://worker-1/log/1.log": 14}
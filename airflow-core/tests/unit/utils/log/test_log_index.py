@@ -0,0 +1,133 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from airflow.utils.log.log_index import LogIndex, LogIndexEntry
+
+
+def _log_lines(start: int, stop: int) -> list[str]:
+    return [
+        json.dumps({"timestamp": f"2026-01-01T00:{i // 60:02}:{i % 60:02}+00:00", "event": f"line {i}"})
+        + "\n"
+        for i in range(start, stop)
+    ]
+
+
+def _timestamp(i: int) -> float:
+    return datetime(2026, 1, 1, 0, i // 60, i % 60, tzinfo=timezone.utc).timestamp()
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    log_file = tmp_path / "1.log"
+    log_file.write_text("".join(_log_lines(0, 10)))
+    return log_file
+
+
+class TestLogIndex:
+    def test_update_indexes_every_interval_lines(self, log_file):
+        index = LogIndex(log_file, interval=4)
+
+        assert index.update() is True
+
+        lines = _log_lines(0, 10)
+        assert index.entries == [
+            LogIndexEntry(0, 0, _timestamp(0)),
+            LogIndexEntry(4, len("".join(lines[:4])), _timestamp(4)),
+            LogIndexEntry(8, len("".join(lines[:8])), _timestamp(8)),
+        ]
+        assert index.lines == 10
+        assert index.size == log_file.stat().st_size
+        assert index.update() is False
+
+    def test_update_indexes_appended_lines_only(self, log_file):
+        index = LogIndex(log_file, interval=4)
+        index.update()
+        with log_file.open("a") as f:
+            f.write("".join(_log_lines(10, 13)) + '{"incomplete')
+
+        assert index.update() is True
+
+        lines = _log_lines(0, 13)
+        assert index.entries[-1] == LogIndexEntry(12, len("".join(lines[:12])), _timestamp(12))
+        assert index.lines == 13
+        assert index.size == len("".join(lines))
+
+    def test_update_indexes_truncated_log_file_again(self, log_file):
+        index = LogIndex(log_file, interval=4)
+        index.update()
+        log_file.write_text("".join(_log_lines(20, 25)))
+
+        assert index.update() is True
+
+        offset = len("".join(_log_lines(20, 24)))
+        assert index.entries == [
+            LogIndexEntry(0, 0, _timestamp(20)),
+            LogIndexEntry(4, offset, _timestamp(24)),
+        ]
+        assert index.lines == 5
+
+    def test_lines_without_timestamp_take_the_last_timestamp(self, tmp_path):
+        log_file = tmp_path / "1.log"
+        log_file.write_text("".join(_log_lines(0, 2)) + "Traceback\n  line\n")
+        index = LogIndex(log_file, interval=2)
+
+        index.update()
+
+        assert [entry.timestamp for entry in index.entries] == [_timestamp(0), _timestamp(0)]
+
+    def test_load_saves_and_loads_the_index(self, log_file):
+        index = LogIndex(log_file, interval=4)
+        index.update()
+        index.save()
+
+        loaded = LogIndex.load(log_file)
+
+        assert index.index_path == log_file.with_name("1.log.index")
+        assert (loaded.interval, loaded.entries, loaded.lines, loaded.size) == (
+            4,
+            index.entries,
+            10,
+            index.size,
+        )
+        # The temporary file the index is written to is replaced
+        assert sorted(path.name for path in log_file.parent.iterdir()) == ["1.log", "1.log.index"]
+
+    def test_load_does_not_save_index_of_short_log_files(self, log_file):
+        index = LogIndex.load(log_file)
+
+        assert index.lines == 10
+        assert not index.index_path.exists()
+
+    @pytest.mark.parametrize(("line", "expected"), [(0, 0), (3, 0), (4, 4), (9, 8), (100, 8)])
+    def test_seek_line(self, log_file, line, expected):
+        index = LogIndex(log_file, interval=4)
+        index.update()
+
+        assert index.seek_line(line).line == expected
+
+    @pytest.mark.parametrize(("second", "expected"), [(0, 0), (4, 0), (5, 4), (8, 4), (9, 8), (100, 8)])
+    def test_seek_timestamp(self, log_file, second, expected):
+        index = LogIndex(log_file, interval=4)
+        index.update()
+
+        assert index.seek_timestamp(datetime.fromtimestamp(_timestamp(second), timezone.utc)).line == expected
@@ -136,7 +136,12 @@ class TestLogView:
         )
         assert logs[2].event == "::endgroup::"
         assert logs[3].event == "try_number=1."
-        assert metadata == {"end_of_log": True, "log_pos": 1}
+        log_file = f"{self.log_dir}/dag_log_reader/task_log_reader/2017-09-01T00.00.00+00.00/1.log"
+        assert metadata == {
+            "end_of_log": True,
+            "log_pos": 1,
+            "log_positions": {log_file: len("try_number=1.\n")},
+        }
 
     def test_test_read_log_chunks_should_read_latest_files(self):
         task_log_reader = TaskLogReader()
@@ -151,7 +156,12 @@ class TestLogView:
         )
         assert logs[2].event == "::endgroup::"
         assert logs[3].event == f"try_number={ti.try_number}."
-        assert metadata == {"end_of_log": True, "log_pos": 1}
+        log_file = f"{self.log_dir}/dag_log_reader/task_log_reader/2017-09-01T00.00.00+00.00/3.log"
+        assert metadata == {
+            "end_of_log": True,
+            "log_pos": 1,
+            "log_positions": {log_file: len(f"try_number={ti.try_number}.\n")},
+        }
 
     def test_test_test_read_log_stream_should_read_one_try(self):
         task_log_reader = TaskLogReader()
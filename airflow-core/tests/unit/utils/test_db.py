@@ -34,7 +34,7 @@ from alembic.script import ScriptDirectory
 from sqlalchemy import Column, Integer, MetaData, Table, select
 
 from airflow import settings
-from airflow.models import Base as airflow_base
+from airflow.models import Base as airflow_base, Log
 from airflow.utils.db import (
     AutocommitEngineForMySQL,
     LazySelectSequence,
@@ -45,6 +45,8 @@ from airflow.utils.db import (
     compare_type,
     create_default_connections,
     downgrade,
+    get_query_count,
+    get_query_count_estimate,
     initdb,
     resetdb,
     upgradedb,
@@ -388,6 +390,18 @@ class TestDb:
 
         assert config.config_file_name == os.path.join(os.path.dirname(airflow.__file__), "alembic.ini")
 
+    def test_get_query_count_estimate(self, session):
+        stmt = select(Log).where(Log.event == "test_get_query_count_estimate")
+        session.add_all([Log(event="test_get_query_count_estimate") for _ in range(3)])
+        session.flush()
+
+        estimate = get_query_count_estimate(stmt, session=session)
+        if settings.engine.dialect.name == "postgresql":
+            # The planner estimate comes from table statistics, only its type is stable
+            assert isinstance(estimate, int)
+        else:
+            assert estimate == get_query_count(stmt, session=session) == 3
+
     def test_bool_lazy_select_sequence(self):
         class MockSession:
             def __init__(self):
@@ -24,7 +24,8 @@ from unittest import mock
 
 import pytest
 from kubernetes.client import Configuration, models as k8s
-from sqlalchemy import text
+from sqlalchemy import column, select, table, text
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import StatementError
 
 from airflow import settings
@@ -35,9 +36,11 @@ from airflow.serialization.serialized_objects import BaseSerialization
 from airflow.settings import Session
 from airflow.utils.sqlalchemy import (
     ExecutorConfigType,
+    ExplainJson,
     apply_regex_query_timeout,
     ensure_pod_is_valid_after_unpickling,
     get_dialect_name,
+    in_values,
     prohibit_commit,
     with_row_locks,
 )
@@ -443,3 +446,41 @@ class TestApplyRegexQueryTimeout:
             with apply_regex_query_timeout(session):
                 pass
         session.execute.assert_not_called()
+
+
+class TestInValues:
+    def test_small_sets_use_regular_in(self):
+        clause = in_values(column("dag_id"), {"a", "b"})
+        compiled = clause.compile(dialect=postgresql.dialect())
+        assert "IN" in str(compiled)
+        assert "ANY" not in str(compiled)
+
+    def test_large_sets_use_single_array_param_on_postgres(self):
+        values = {f"dag_{i}" for i in range(2000)}
+        compiled = in_values(column("dag_id"), values).compile(dialect=postgresql.dialect())
+        assert str(compiled).startswith("dag_id = ANY (")
+        (param,) = compiled.params.values()
+        assert sorted(param) == sorted(values)
+
+    def test_large_sets_use_regular_in_on_other_dialects(self):
+        values = {f"dag_{i}" for i in range(2000)}
+        compiled = in_values(column("dag_id"), values).compile(
+            dialect=sqlite.dialect(), compile_kwargs={"render_postcompile": True}
+        )
+        assert "ANY" not in str(compiled)
+        assert str(compiled).startswith("dag_id IN (")
+
+    @pytest.mark.parametrize("values", [None, set()])
+    def test_empty_values_match_nothing(self, values):
+        compiled = in_values(column("dag_id"), values).compile(
+            dialect=sqlite.dialect(), compile_kwargs={"render_postcompile": True}
+        )
+        assert "1!=1" in str(compiled).replace(" ", "")
+
+
+class TestExplainJson:
+    def test_compiles_to_explain_on_postgres(self):
+        stmt = select(column("id")).select_from(table("dag_run")).where(column("state") == "running")
+        compiled = ExplainJson(stmt).compile(dialect=postgresql.dialect())
+        assert str(compiled).startswith("EXPLAIN (FORMAT JSON) SELECT id \nFROM dag_run \nWHERE state = ")
+        assert list(compiled.params.values()) == ["running"]
@@ -301,6 +301,13 @@ class ClearTaskInstancesBody(BaseModel):
     ] = None
     prevent_running_task: Annotated[bool | None, Field(title="Prevent Running Task")] = False
     note: Annotated[Note | None, Field(title="Note")] = None
+    count_only: Annotated[
+        bool | None,
+        Field(
+            description="Only return the number of task instances that would be cleared, in ``total_entries``, with an empty ``task_instances`` list. Requires ``dry_run``.",
+            title="Count Only",
+        ),
+    ] = False
 
 
 class Value(RootModel[list[Any]]):
@@ -1147,6 +1154,16 @@ class TimeDelta(BaseModel):
     microseconds: Annotated[int, Field(title="Microseconds")]
 
 
+class TotalEntriesMode(str, Enum):
+    """
+    How ``total_entries`` of a paginated list is computed.
+    """
+
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+    NONE = "none"
+
+
 class TriggerDAGRunPostBody(BaseModel):
     """
     Trigger Dag Run Serializer for POST body.
@@ -1936,11 +1953,31 @@ class DryRunBackfillCollectionResponse(BaseModel):
 
 class EventLogCollectionResponse(BaseModel):
     """
-    Event Log Collection Response.
+    Event Log Collection Response, supporting both offset and cursor pagination.
     """
 
     event_logs: Annotated[list[EventLogResponse], Field(title="Event Logs")]
-    total_entries: Annotated[int, Field(title="Total Entries")]
+    total_entries: Annotated[
+        int | None,
+        Field(
+            description="Total number of matching items. Populated for offset pagination, ``null`` when using cursor pagination or when ``total_entries_mode`` is ``none``.",
+            title="Total Entries",
+        ),
+    ] = None
+    next_cursor: Annotated[
+        str | None,
+        Field(
+            description="Token pointing to the next page. Populated for cursor pagination, ``null`` when using offset pagination or when there is no next page.",
+            title="Next Cursor",
+        ),
+    ] = None
+    previous_cursor: Annotated[
+        str | None,
+        Field(
+            description="Token pointing to the previous page. Populated for cursor pagination, ``null`` when using offset pagination or when on the first page.",
+            title="Previous Cursor",
+        ),
+    ] = None
 
 
 class HITLDetailResponse(BaseModel):
@@ -2207,11 +2244,31 @@ class VariableCollectionResponse(BaseModel):
 
 class XComCollectionResponse(BaseModel):
     """
-    XCom Collection serializer for responses.
+    XCom Collection serializer for responses, supporting both offset and cursor pagination.
     """
 
     xcom_entries: Annotated[list[XComResponse], Field(title="Xcom Entries")]
-    total_entries: Annotated[int, Field(title="Total Entries")]
+    total_entries: Annotated[
+        int | None,
+        Field(
+            description="Total number of matching items. Populated for offset pagination, ``null`` when using cursor pagination or when ``total_entries_mode`` is ``none``.",
+            title="Total Entries",
+        ),
+    ] = None
+    next_cursor: Annotated[
+        str | None,
+        Field(
+            description="Token pointing to the next page. Populated for cursor pagination, ``null`` when using offset pagination or when there is no next page.",
+            title="Next Cursor",
+        ),
+    ] = None
+    previous_cursor: Annotated[
+        str | None,
+        Field(
+            description="Token pointing to the previous page. Populated for cursor pagination, ``null`` when using offset pagination or when on the first page.",
+            title="Previous Cursor",
+        ),
+    ] = None
 
 
 class AssetCollectionResponse(BaseModel):
@@ -2365,7 +2422,7 @@ class DAGRunCollectionResponse(BaseModel):
     total_entries: Annotated[
         int | None,
         Field(
-            description="Total number of matching items. Populated for offset pagination, ``null`` when using cursor pagination.",
+            description="Total number of matching items. Populated for offset pagination, ``null`` when using cursor pagination or when ``total_entries_mode`` is ``none``.",
             title="Total Entries",
         ),
     ] = None
@@ -2488,7 +2545,7 @@ class TaskInstanceCollectionResponse(BaseModel):
     total_entries: Annotated[
         int | None,
         Field(
-            description="Total number of matching items. Populated for offset pagination, ``null`` when using cursor pagination.",
+            description="Total number of matching items. Populated for offset pagination, ``null`` when using cursor pagination or when ``total_entries_mode`` is ``none``.",
             title="Total Entries",
         ),
     ] = None
@@ -513,6 +513,17 @@ def clear_db_connection_tests():
             pass
 
 
+def clear_db_state_rollups():
+    with create_session() as session:
+        try:
+            from airflow.models.state_rollup import StateRollup, StateRollupWatermark
+
+            session.execute(delete(StateRollup))
+            session.execute(delete(StateRollupWatermark))
+        except ImportError:
+            pass
+
+
 @_retry_db
 def clear_db_revoked_tokens():
     with create_session() as session:
@@ -1045,3 +1056,4 @@ def clear_all():
         clear_db_dag_bundles()
         clear_db_dag_parsing_requests()
     clear_db_connection_tests()
+    clear_db_state_rollups()
@@ -19,8 +19,9 @@ from __future__ import annotations
 import contextlib
 import json
 import uuid
+from collections.abc import Generator
 from functools import cache
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import IO, TYPE_CHECKING, Any, TypeVar
 from urllib.parse import urlsplit
 
 import fsspec.utils
@@ -45,6 +46,10 @@ T = TypeVar("T")
 
 SECTION = "common.io"
 
+# Marks objects written through ``XComObjectStorageBackend.stream``, whose content is raw bytes
+# rather than a JSON document.
+STREAM_SUFFIX = ".stream"
+
 
 def _get_compression_suffix(compression: str) -> str:
     """
@@ -74,6 +79,21 @@ def _get_threshold() -> int:
     return conf.getint(SECTION, "xcom_objectstorage_threshold", fallback=-1)
 
 
+def _new_path(dag_id: str | None, run_id: str | None, task_id: str | None, suffix: str) -> ObjectStoragePath:
+    base_path = _get_base_path()
+    while True:  # Safeguard against collisions.
+        p = base_path.joinpath(
+            dag_id or "NO_DAG_ID",
+            run_id or "NO_RUN_ID",
+            task_id or "NO_TASK_ID",
+            f"{uuid.uuid4()}{suffix}",
+        )
+        if not p.exists():
+            break
+    p.parent.mkdir(parents=True, exist_ok=True)
+    return p
+
+
 class XComObjectStorageBackend(BaseXCom):
     """
     XCom backend that stores data in an object store or database depending on the size of the data.
@@ -134,28 +154,63 @@ class XComObjectStorageBackend(BaseXCom):
             # This is for Airflow 2.10 where the value is expected to be bytes
             return s_val_encoded
 
-        base_path = _get_base_path()
-        while True:  # Safeguard against collisions.
-            p = base_path.joinpath(
-                dag_id or "NO_DAG_ID",
-                run_id or "NO_RUN_ID",
-                task_id or "NO_TASK_ID",
-                f"{uuid.uuid4()}{suffix}",
-            )
-            if not p.exists():
-                break
-        p.parent.mkdir(parents=True, exist_ok=True)
-
+        p = _new_path(dag_id, run_id, task_id, suffix)
         with p.open(mode="wb", compression=compression) as f:
             f.write(s_val_encoded)
         return BaseXCom.serialize_value(str(p))
 
+    @staticmethod
+    @contextlib.contextmanager
+    def stream(
+        key: str,
+        *,
+        dag_id: str,
+        task_id: str,
+        run_id: str,
+        map_index: int = -1,
+    ) -> Generator[IO[bytes], None, None]:
+        """
+        Stream an XCom value of arbitrary size to object storage.
+
+        The value is written through the returned binary file object, which the underlying filesystem
+        uploads in blocks (e.g. multipart uploads for S3), so the producer never holds the whole value in
+        memory. When the block exits, a reference to the object is pushed as the XCom. Consumers pulling
+        that XCom receive the ``ObjectStoragePath`` of the object and can read it lazily. The object is
+        removed if the block raises.
+
+        .. code-block:: python
+
+            with XComObjectStorageBackend.stream("output", dag_id=..., task_id=..., run_id=...) as sink:
+                for chunk in produce():
+                    sink.write(chunk)
+
+        :param key: Key to store the XCom.
+        :param dag_id: Dag ID.
+        :param task_id: Task ID.
+        :param run_id: Dag run ID for the task.
+        :param map_index: Optional map index to assign XCom for a mapped task.
+        """
+        if not AIRFLOW_V_3_0_PLUS:
+            raise RuntimeError("Streaming XCom values requires Airflow 3.0+")
+
+        p = _new_path(dag_id, run_id, task_id, STREAM_SUFFIX)
+        try:
+            with p.open(mode="wb") as f:
+                yield f
+        except BaseException:
+            p.unlink(missing_ok=True)
+            raise
+        # The reference goes through the plain BaseXCom serialization, so it is always stored in the
+        # database whatever the threshold is.
+        BaseXCom.set(key, str(p), dag_id=dag_id, task_id=task_id, run_id=run_id, map_index=map_index)
+
     @staticmethod
     def deserialize_value(result) -> Any:
         """
         Deserializes the value from the database or object storage.
 
-        Compression is inferred from the file extension.
+        Compression is inferred from the file extension. Values written with :meth:`stream` are not read,
+        their ``ObjectStoragePath`` is returned instead.
         """
         base_xcom_deser_result = BaseXCom.deserialize_value(result)
         data = base_xcom_deser_result
@@ -169,6 +224,8 @@ class XComObjectStorageBackend(BaseXCom):
             path = XComObjectStorageBackend._get_full_path(base_xcom_deser_result)
         except (TypeError, ValueError):  # Likely value stored directly in the database.
             return data
+        if path.name.endswith(STREAM_SUFFIX):
+            return path
         try:
             with path.open(mode="rb", compression="infer") as f:
                 return json.load(f, cls=XComDecoder)
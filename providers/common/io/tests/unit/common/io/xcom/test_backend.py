@@ -464,3 +464,36 @@ class TestXComObjectStorageBackend:
             deserialized_data = XCom.deserialize_value(mock_xcom_ser)
 
             assert deserialized_data == expected_value
+
+    @pytest.mark.skipif(not AIRFLOW_V_3_0_PLUS, reason="Streaming XCom values requires Airflow 3.0+")
+    def test_stream(self, mock_supervisor_comms):
+        with XComObjectStorageBackend.stream(
+            "output", dag_id="test-dag-id", task_id="test-task-id", run_id="test-run-id"
+        ) as sink:
+            sink.write(b"first chunk,")
+            sink.write(b"second chunk")
+
+        last_call = mock_supervisor_comms.send.call_args_list[-1]
+        reference = (last_call.kwargs.get("msg") or last_call.args[0]).value
+        path = XComObjectStorageBackend.deserialize_value(MagicMock(value=reference))
+
+        assert isinstance(path, ObjectStoragePath)
+        with path.open("rb") as f:
+            assert f.read() == b"first chunk,second chunk"
+
+    @pytest.mark.skipif(not AIRFLOW_V_3_0_PLUS, reason="Streaming XCom values requires Airflow 3.0+")
+    def test_stream_failure_removes_object(self, mock_supervisor_comms, tmp_path):
+        def produce(sink):
+            sink.write(b"partial")
+            raise RuntimeError("producer failed")
+
+        with (
+            pytest.raises(RuntimeError, match="producer failed"),
+            XComObjectStorageBackend.stream(
+                "output", dag_id="test-dag-id", task_id="test-task-id", run_id="test-run-id"
+            ) as sink,
+        ):
+            produce(sink)
+
+        mock_supervisor_comms.send.assert_not_called()
+        assert not any(p.is_file() for p in (tmp_path / "xcom").rglob("*"))
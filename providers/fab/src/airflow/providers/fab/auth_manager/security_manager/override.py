@@ -107,6 +107,7 @@ from airflow.providers.fab.version_compat import AIRFLOW_V_3_1_PLUS
 from airflow.providers.fab.www.security import permissions
 from airflow.providers.fab.www.security_manager import AirflowSecurityManagerV2
 from airflow.providers.fab.www.session import AirflowDatabaseSessionInterface
+from airflow.providers.fab.www.utils import invalidate_authorized_dag_ids_cache
 
 if TYPE_CHECKING:
     from authlib.integrations.flask_client import OAuth
@@ -1350,6 +1351,7 @@ class FabAirflowSecurityManagerOverride(AirflowSecurityManagerV2):
             self.session.execute(delete(assoc_group_role).where(assoc_group_role.c.role_id == role.id))
             self.session.execute(delete(self.role_model).where(self.role_model.id == role.id))
             self.session.commit()
+            invalidate_authorized_dag_ids_cache()
         else:
             raise FabException(f"Role named '{role_name}' does not exist")
 
@@ -1514,6 +1516,7 @@ class FabAirflowSecurityManagerOverride(AirflowSecurityManagerV2):
             merged_user = self.session.merge(user)
             self.session.commit()
             self._reset_user_permissions_cache(merged_user)
+            invalidate_authorized_dag_ids_cache(merged_user.get_id())
             log.info(const.LOGMSG_INF_SEC_UPD_USER, user)
         except Exception as e:
             log.error(const.LOGMSG_ERR_SEC_UPD_USER, e)
@@ -1838,6 +1841,7 @@ class FabAirflowSecurityManagerOverride(AirflowSecurityManagerV2):
                 role.permissions.append(permission)
                 self.session.merge(role)
                 self.session.commit()
+                invalidate_authorized_dag_ids_cache()
                 log.info(const.LOGMSG_INF_SEC_ADD_PERMROLE, permission, role.name)
             except IntegrityError as e:
                 self.session.rollback()
@@ -1879,6 +1883,7 @@ class FabAirflowSecurityManagerOverride(AirflowSecurityManagerV2):
                 role.permissions.remove(permission)
                 self.session.merge(role)
                 self.session.commit()
+                invalidate_authorized_dag_ids_cache()
                 log.info(const.LOGMSG_INF_SEC_DEL_PERMROLE, permission, role.name)
             except Exception as e:
                 log.error(const.LOGMSG_ERR_SEC_DEL_PERMROLE, e)
@@ -19,6 +19,7 @@ from __future__ import annotations
 from flask_appbuilder.security.views import RoleModelView
 
 from airflow.providers.fab.www.security import permissions
+from airflow.providers.fab.www.utils import invalidate_authorized_dag_ids_cache
 
 
 class CustomRoleModelView(RoleModelView):
@@ -40,3 +41,11 @@ class CustomRoleModelView(RoleModelView):
         permissions.ACTION_CAN_EDIT,
         permissions.ACTION_CAN_DELETE,
     ]
+
+    def post_update(self, item):
+        super().post_update(item)
+        invalidate_authorized_dag_ids_cache()
+
+    def post_delete(self, item):
+        super().post_delete(item)
+        invalidate_authorized_dag_ids_cache()
@@ -29,6 +29,7 @@ from flask_appbuilder.security.views import (
 from wtforms.validators import DataRequired
 
 from airflow.providers.fab.www.security import permissions
+from airflow.providers.fab.www.utils import invalidate_authorized_dag_ids_cache
 
 
 class MultiResourceUserMixin:
@@ -73,6 +74,14 @@ class MultiResourceUserMixin:
     def class_permission_name(self, name):
         self._class_permission_name = name
 
+    def post_update(self, item):
+        super().post_update(item)
+        invalidate_authorized_dag_ids_cache(item.get_id())
+
+    def post_delete(self, item):
+        super().post_delete(item)
+        invalidate_authorized_dag_ids_cache(item.get_id())
+
     @expose("/show/<pk>", methods=["GET"])
     @has_access
     def show(self, pk):
@@ -22,6 +22,7 @@ from typing import TYPE_CHECKING
 
 from airflow.api_fastapi.app import get_auth_manager
 from airflow.providers.common.compat.sdk import conf
+from airflow.providers.fab.version_compat import AIRFLOW_V_3_4_PLUS
 from airflow.providers.fab.www.security.permissions import (
     ACTION_CAN_ACCESS_MENU,
     ACTION_CAN_CREATE,
@@ -72,6 +73,21 @@ def get_fab_auth_manager() -> FabAuthManager:
     return auth_manager
 
 
+def invalidate_authorized_dag_ids_cache(user_id: str | None = None) -> None:
+    """
+    Forget the Dags cached as authorized for a user, or for all users, after a permission change.
+
+    Only the cache of the current process is dropped, other API server processes pick the change up
+    once their entries expire.
+
+    :param user_id: the id of the user whose roles changed, or None when roles or permissions changed
+    """
+    if AIRFLOW_V_3_4_PLUS:
+        from airflow.api_fastapi.auth.managers.base_auth_manager import BaseAuthManager
+
+        BaseAuthManager.invalidate_authorized_dag_ids_cache(user_id)
+
+
 def get_fab_action_from_method_map():
     """Return the map associating a method to a FAB action."""
     return _MAP_METHOD_NAME_TO_FAB_ACTION_NAME
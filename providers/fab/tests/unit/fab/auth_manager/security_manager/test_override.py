@@ -37,6 +37,8 @@ from airflow.providers.fab.auth_manager.security_manager.override import (
     FabException,
 )
 
+OVERRIDE_MODULE = "airflow.providers.fab.auth_manager.security_manager.override"
+
 
 class EmptySecurityManager(FabAirflowSecurityManagerOverride):
     # noinspection PyMissingConstructor
@@ -65,6 +67,29 @@ class TestFabAirflowSecurityManagerOverride:
         mock_session.commit.assert_called_once()
         mock_log.info.assert_called_once_with("Deleting role '%s'", "TestRole")
 
+    @mock.patch(f"{OVERRIDE_MODULE}.invalidate_authorized_dag_ids_cache")
+    def test_delete_role_invalidates_authorized_dag_ids_cache(self, mock_invalidate):
+        sm = EmptySecurityManager()
+        mock_session = Mock(spec=Session)
+        mock_session.scalars.return_value.first.return_value = Mock(spec=Role, id=42, name="TestRole")
+
+        with mock.patch.object(EmptySecurityManager, "session", mock_session):
+            sm.delete_role("TestRole")
+
+        mock_invalidate.assert_called_once_with()
+
+    @mock.patch(f"{OVERRIDE_MODULE}.invalidate_authorized_dag_ids_cache")
+    def test_remove_permission_from_role_invalidates_authorized_dag_ids_cache(self, mock_invalidate):
+        sm = EmptySecurityManager()
+        permission = Mock(spec=Permission)
+        role = Mock(spec=Role, permissions=[permission])
+
+        with mock.patch.object(EmptySecurityManager, "session", Mock(spec=Session)):
+            sm.remove_permission_from_role(role, permission)
+
+        assert role.permissions == []
+        mock_invalidate.assert_called_once_with()
+
     def test_delete_role_raises_for_missing_role(self):
         """delete_role must raise FabException when the role does not exist."""
         sm = EmptySecurityManager()
@@ -255,6 +280,18 @@ class TestFabAirflowSecurityManagerOverride:
         assert mock_merged_user._perms is None
         mock_session.commit.assert_called_once_with()
 
+    @mock.patch(f"{OVERRIDE_MODULE}.invalidate_authorized_dag_ids_cache")
+    def test_update_user_invalidates_authorized_dag_ids_cache(self, mock_invalidate):
+        sm = EmptySecurityManager()
+        mock_session = Mock(spec=Session)
+        mock_session.get.return_value = None
+        mock_session.merge.return_value.get_id.return_value = "1"
+
+        with mock.patch.object(EmptySecurityManager, "session", mock_session):
+            assert sm.update_user(Mock(spec=User, id=1, roles=[], groups=[]))
+
+        mock_invalidate.assert_called_once_with("1")
+
     @pytest.mark.parametrize(
         ("provider", "resp", "user_info"),
         [
@@ -57,6 +57,9 @@ class DateTimeTrigger(BaseTrigger):
             {"moment": self.moment, "end_from_trigger": self.end_from_trigger},
         )
 
+    def timer_moment(self) -> datetime.datetime:
+        return self.moment
+
     async def run(self) -> AsyncIterator[TriggerEvent]:
         """
         Loop until the relevant time is met.
@@ -60,6 +60,12 @@ def test_datetime_trigger_serialization():
     assert kwargs == {"moment": moment, "end_from_trigger": False}
 
 
+def test_datetime_trigger_timer_moment():
+    """The trigger exposes its moment so the triggerer can park it on its shared timer."""
+    moment = pendulum.instance(datetime.datetime(2020, 4, 1, 13, 0), pendulum.UTC)
+    assert DateTimeTrigger(moment).timer_moment() == moment
+
+
 def test_timedelta_trigger_serialization():
     """
     Tests that the TimeDeltaTrigger correctly serializes its arguments
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark script to measure the response serialization cost of the busiest API endpoints.
+
+This script:
+1. Looks up the routes of the Core API and the Task Execution API, and builds a sample response of
+   each route's response model, with ``--size`` items in its top-level lists
+2. Times the serialization of the sample the way FastAPI does it for routes declaring a response model
+   (validation, then JSON bytes straight from pydantic-core), the way it does it for routes with a
+   custom ``response_class`` (python values, then ``json.dumps`` or ``msgspec``), and the way it does it
+   for routes without a response model (``jsonable_encoder``, then ``json.dumps``)
+3. For the Task Execution API, also times the extra ``model_dump`` and validation round trip Cadwyn
+   adds to migrate responses between API versions
+4. Generates a markdown report with results
+
+No database is needed, the routes are not called.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+# (API, method, path) of the benchmarked endpoints: those called for every task, and those the UI polls
+ENDPOINTS: list[tuple[str, str, str]] = [
+    ("execution", "PATCH", "/task-instances/{task_instance_id}/run"),
+    ("execution", "GET", "/xcoms/{dag_id}/{run_id}/{task_id}/{key:path}"),
+    ("execution", "GET", "/xcoms/{dag_id}/{run_id}/{task_id}/{key:path}/slice"),
+    ("execution", "GET", "/variables/{variable_key:path}"),
+    ("execution", "GET", "/connections/{connection_id}"),
+    ("execution", "GET", "/task-instances/states"),
+    ("execution", "GET", "/dag-runs/{dag_id}/{run_id}/state"),
+    ("execution", "GET", "/asset-events/by-asset"),
+    ("core", "GET", "/api/v2/dags"),
+    ("core", "GET", "/api/v2/dagStats"),
+    ("core", "GET", "/api/v2/dags/{dag_id}/dagRuns"),
+    ("core", "GET", "/api/v2/dags/{dag_id}/dagRuns/{dag_run_id}/taskInstances"),
+    ("core", "GET", "/api/v2/dags/{dag_id}/dagRuns/{dag_run_id}/taskInstances/{task_id}/xcomEntries"),
+    ("core", "GET", "/api/v2/eventLogs"),
+    ("core", "GET", "/api/v2/assets"),
+    ("core", "GET", "/api/v2/importErrors"),
+    ("core", "GET", "/ui/dags"),
+    ("core", "GET", "/ui/grid/runs/{dag_id}"),
+    ("core", "GET", "/ui/grid/structure/{dag_id}"),
+    ("core", "GET", "/ui/dashboard/historical_metrics_data"),
+]
+
+# Nested objects referring to themselves (task groups, for instance) stop being expanded at this depth
+_MAX_DEPTH = 4
+
+_SAMPLE_STRINGS = {
+    "date-time": "2025-01-01T12:30:00Z",
+    "date": "2025-01-01",
+    "duration": "PT5M",
+    "uuid": "0195f2ea-0000-7000-8000-000000000000",
+}
+
+
+def sample_value(schema: dict[str, Any], definitions: dict[str, Any], size: int, depth: int = 0) -> Any:
+    """
+    Build a sample value matching a JSON schema.
+
+    Top-level arrays, and the arrays of top-level objects, get ``size`` items and nested ones two,
+    so that ``size`` is the number of objects returned by the collection endpoints. All optional
+    properties are filled in.
+    """
+    if "$ref" in schema:
+        return sample_value(definitions[schema["$ref"].rsplit("/", 1)[-1]], definitions, size, depth)
+    if "const" in schema:
+        return schema["const"]
+    if "enum" in schema:
+        return schema["enum"][0]
+    variants = schema.get("anyOf") or schema.get("oneOf")
+    if variants:
+        non_null = [variant for variant in variants if variant.get("type") != "null"]
+        if not non_null or (depth >= _MAX_DEPTH and len(non_null) < len(variants)):
+            return None
+        return sample_value(non_null[0], definitions, size, depth)
+    if "allOf" in schema:
+        return sample_value(schema["allOf"][0], definitions, size, depth)
+    schema_type = schema.get("type")
+    if isinstance(schema_type, list):
+        schema_type = next(t for t in schema_type if t != "null")
+    if schema_type == "array":
+        if "prefixItems" in schema:
+            return [sample_value(item, definitions, 2, depth + 1) for item in schema["prefixItems"]]
+        length = schema.get("minItems", 0) if depth >= _MAX_DEPTH else max(size, schema.get("minItems", 0))
+        return [sample_value(schema.get("items", {}), definitions, 2, depth + 1) for _ in range(length)]
+    if schema_type == "object" or "properties" in schema:
+        if "properties" in schema:
+            return {
+                name: sample_value(property_schema, definitions, size if depth == 0 else 2, depth + 1)
+                for name, property_schema in schema["properties"].items()
+            }
+        values = schema.get("additionalProperties")
+        if isinstance(values, dict) and values:
+            return {f"key_{i}": sample_value(values, definitions, 2, depth + 1) for i in range(min(size, 3))}
+        return {"key": "value", "number": 1}
+    if schema_type == "string":
+        return _SAMPLE_STRINGS.get(schema.get("format", ""), "sample_value")
+    if schema_type == "integer":
+        return max(1, schema.get("minimum", 1))
+    if schema_type == "number":
+        return 1.5
+    if schema_type == "boolean":
+        return True
+    if schema_type == "null":
+        return None
+    # Any
+    return {"key": "value", "number": 1}
+
+
+def find_routes() -> dict[tuple[str, str, str], Any]:
+    """Get the routes of the benchmarked endpoints, by (API, method, path)."""
+    from fastapi.routing import APIRoute
+    from starlette.routing import Mount
+
+    from airflow.api_fastapi.app import create_app
+    from airflow.api_fastapi.execution_api.routes import execution_api_router
+
+    def walk(routes, prefix=""):
+        for route in routes:
+            if isinstance(route, Mount) and hasattr(route.app, "routes"):
+                yield from walk(route.app.routes, prefix + route.path)
+            elif isinstance(route, APIRoute):
+                yield prefix + route.path, route
+
+    routes = {}
+    for path, route in walk(create_app(apps="core").routes):
+        for method in route.methods:
+            routes["core", method, path] = route
+    # The routes of the head version, Cadwyn generates the routes of each version from them
+    for path, route in walk(execution_api_router.routes):
+        for method in route.methods:
+            routes["execution", method, path] = route
+    return routes
+
+
+def measure(func: Callable[[Any], object], setup: Callable[[], Any], runs: int) -> float:
+    """Return the minimum execution time of ``func`` in seconds, called with a new ``setup()`` value each run."""
+    times = []
+    for _ in range(runs):
+        value = setup()
+        start = time.perf_counter()
+        func(value)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def benchmark_route(route: Any, api: str, size: int, runs: int) -> dict[str, Any]:
+    import msgspec
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+    from pydantic import BaseModel, TypeAdapter
+
+    field = route.response_field
+    options = {
+        "include": route.response_model_include,
+        "exclude": route.response_model_exclude,
+        "by_alias": route.response_model_by_alias,
+        "exclude_unset": route.response_model_exclude_unset,
+        "exclude_defaults": route.response_model_exclude_defaults,
+        "exclude_none": route.response_model_exclude_none,
+    }
+    adapter = TypeAdapter(route.response_model)
+    json_schema = adapter.json_schema(by_alias=True)
+    sample = sample_value(json_schema, json_schema.get("$defs", {}), size)
+
+    def new_content() -> Any:
+        # The endpoints return validated models. Those with ``Iterable`` fields can only be
+        # serialized once, so each run gets its own copy.
+        return adapter.validate_python(sample)
+
+    def validated(content: Any) -> Any:
+        value, errors = field.validate(content, {}, loc=("response",))
+        if errors:
+            raise ValueError(errors)
+        return value
+
+    def dump_json(content: Any) -> bytes:
+        return field.serialize_json(validated(content), **options)
+
+    def json_dumps(content: Any) -> bytes:
+        return JSONResponse(None).render(field.serialize(validated(content), **options))
+
+    def msgspec_encode(content: Any) -> bytes:
+        return msgspec.json.encode(field.serialize(validated(content), **options))
+
+    def encoder(content: Any) -> bytes:
+        return JSONResponse(None).render(jsonable_encoder(content))
+
+    def cadwyn(content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            content = content.model_dump(by_alias=True, exclude_unset=route.response_model_exclude_unset)
+        return dump_json(content)
+
+    return {
+        "bytes": len(dump_json(new_content())),
+        "dump_json": measure(dump_json, new_content, runs),
+        "json_dumps": measure(json_dumps, new_content, runs),
+        "msgspec": measure(msgspec_encode, new_content, runs),
+        "encoder": measure(encoder, new_content, runs),
+        "cadwyn": measure(cadwyn, new_content, runs) if api == "execution" else None,
+    }
+
+
+def generate_markdown_report(results: list[dict], size: int, runs: int) -> str:
+    """Generate markdown formatted report."""
+
+    def ms(value: float | None) -> str:
+        return "-" if value is None else f"{value * 1000:.3f}"
+
+    lines = [
+        "# Airflow API response serialization Benchmark",
+        "",
+        f"Top-level lists hold {size} items, timings are the minimum of {runs} runs.",
+        "",
+        "- **pydantic-core**: response model, JSON bytes straight from pydantic-core (FastAPI default)",
+        "- **json.dumps**: response model with a custom `response_class`, python values then `json.dumps`",
+        "- **msgspec**: response model with a custom `response_class`, python values then `msgspec`",
+        "- **no model**: no response model, `jsonable_encoder` then `json.dumps`",
+        "- **Cadwyn**: pydantic-core, after the `model_dump` and validation done by Cadwyn version migrations",
+        "",
+        (
+            "| Endpoint | Response model | Size (kB) | pydantic-core (ms) | json.dumps (ms) "
+            "| msgspec (ms) | no model (ms) | Cadwyn (ms) |"
+        ),
+        (
+            "|----------|----------------|-----------|--------------------|-----------------|"
+            "--------------|---------------|-------------|"
+        ),
+    ]
+    for result in results:
+        endpoint = f"{result['api']} {result['method']} `{result['path']}`"
+        if result.get("skipped"):
+            lines.append(f"| {endpoint} | skipped: {result['skipped']} | | | | | | |")
+            continue
+        lines.append(
+            f"| {endpoint} | {result['model']} | {result['bytes'] / 1024:.1f} "
+            f"| {ms(result['dump_json'])} | {ms(result['json_dumps'])} | {ms(result['msgspec'])} "
+            f"| {ms(result['encoder'])} "
+            f"| {ms(result['cadwyn'])} |"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    """Main function to run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--size", type=int, default=50, help="Number of items in top-level lists")
+    parser.add_argument("--runs", type=int, default=200, help="Number of runs, the minimum is reported")
+    parser.add_argument("--filter", help="Only benchmark endpoints whose path contains this string")
+    args = parser.parse_args()
+
+    routes = find_routes()
+    results = []
+    for api, method, path in ENDPOINTS:
+        if args.filter and args.filter not in path:
+            continue
+        result: dict[str, Any] = {"api": api, "method": method, "path": path}
+        results.append(result)
+        print(f"Benchmarking {api} {method} {path}...", end=" ", flush=True)
+        route = routes.get((api, method, path))
+        if route is None or route.response_field is None:
+            result["skipped"] = "route not found" if route is None else "no response model"
+            print(f"skipped ({result['skipped']})")
+            continue
+        try:
+            result.update(benchmark_route(route, api, args.size, args.runs))
+        except (TypeError, ValueError) as e:
+            # The sample cannot be generated, validated or encoded for this response model
+            result["skipped"] = f"{type(e).__name__}"
+            print(f"skipped ({e!r:.200})")
+            continue
+        result["model"] = getattr(route.response_model, "__name__", str(route.response_model))
+        print(f"{result['dump_json'] * 1000:.3f}ms")
+
+    print()
+    print(generate_markdown_report(results, args.size, args.runs))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark script to measure secret redaction throughput versus the number of registered secrets.
+
+This script:
+1. Registers an increasing number of random secrets with a ``SecretsMasker``, logging a line after each
+   one, as a task fetching connections and logging in between does
+2. Times redacting log lines, and nested structures such as rendered templates, with all secrets registered
+3. Generates a markdown report with results
+
+With ``--engine flat``, the masker uses a single ``secret1|secret2|...`` regex recompiled for every secret
+added, which is how secrets were matched before ``SecretsMatcher``, for comparison.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import string
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# Add the shared secrets masker library to path
+SECRETS_MASKER_SOURCES_DIR = Path(__file__).resolve().parents[2] / "shared" / "secrets_masker" / "src"
+sys.path.insert(0, str(SECRETS_MASKER_SOURCES_DIR))
+
+from airflow_shared.secrets_masker import SecretsMasker, SecretsMatcher  # noqa: E402
+
+
+class FlatRegexMatcher:
+    """Matches the secrets with one alternation of all of them, compiled again for every secret added."""
+
+    def __init__(self) -> None:
+        self.secrets: list[str] = []
+        self.pattern: re.Pattern | None = None
+
+    def __len__(self) -> int:
+        return len(self.secrets)
+
+    def add(self, secret: str) -> None:
+        self.secrets.append(secret)
+        self.pattern = re.compile("|".join(map(re.escape, self.secrets)))
+
+    def sub(self, repl: str, string: str) -> str:
+        return self.pattern.sub(repl, string) if self.pattern else string
+
+
+ENGINES: dict[str, type] = {"automaton": SecretsMatcher, "flat": FlatRegexMatcher}
+
+
+def random_secret(rnd: random.Random) -> str:
+    return "".join(rnd.choices(string.ascii_letters + string.digits, k=rnd.randint(8, 40)))
+
+
+def log_lines(rnd: random.Random, secrets: list[str], count: int) -> list[str]:
+    """Log lines of about 200 characters, one in ten holding a secret."""
+    lines = []
+    for i in range(count):
+        words = " ".join(random_secret(rnd) for _ in range(8))
+        if i % 10 == 0 and secrets:
+            words = f"{words} {rnd.choice(secrets)}"
+        lines.append(f"[2026-01-01T00:00:00.000+0000] {{taskinstance.py:1234}} INFO - {words}")
+    return lines
+
+
+def nested_payload(rnd: random.Random, secrets: list[str]) -> dict:
+    """A structure like rendered template fields: nested dicts and lists of short and long strings."""
+    return {
+        f"field_{i}": {
+            "sql": " ".join(random_secret(rnd) for _ in range(30)),
+            "params": [random_secret(rnd)[:6] for _ in range(20)],
+            "conn": rnd.choice(secrets) if secrets else "",
+        }
+        for i in range(20)
+    }
+
+
+def measure(func: Callable[[], object], runs: int) -> tuple[float, float]:
+    """
+    Measure the execution time of ``func``.
+
+    Returns:
+        Tuple of (average_time, min_time) in seconds
+    """
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return sum(times) / len(times), min(times)
+
+
+def benchmark(engine: type, num_secrets: int, num_lines: int, runs: int) -> dict:
+    rnd = random.Random(num_secrets)
+    secrets = [random_secret(rnd) for _ in range(num_secrets)]
+    lines = log_lines(rnd, secrets, num_lines)
+    payload = nested_payload(rnd, secrets)
+
+    masker = SecretsMasker()
+    masker.matcher_class = engine
+    masker.sensitive_variables_fields = []
+
+    start = time.perf_counter()
+    for secret in secrets:
+        masker.add_mask(secret)
+        masker.redact(lines[0])
+    register_time = time.perf_counter() - start
+
+    lines_avg, _ = measure(lambda: [masker.redact(line) for line in lines], runs)
+    nested_avg, _ = measure(lambda: masker.redact(payload, max_depth=10), runs)
+    return {
+        "secrets": num_secrets,
+        "register_ms": register_time * 1000,
+        "lines_per_s": num_lines / lines_avg,
+        "us_per_line": lines_avg / num_lines * 1_000_000,
+        "nested_ms": nested_avg * 1000,
+    }
+
+
+def generate_markdown_report(results: dict[str, list[dict]], num_lines: int, runs: int) -> str:
+    """Generate markdown formatted report."""
+    lines = [
+        "# Airflow Secrets Masker Benchmark",
+        "",
+        (
+            f"Redacting {num_lines} log lines of ~200 characters, and a nested structure of 60 strings, "
+            f"averaged over {runs} runs. Registering includes redacting a log line after each secret."
+        ),
+        "",
+        "| Engine | Secrets | Register all (ms) | Log lines/s | us/line | Nested structure (ms) |",
+        "|--------|---------|-------------------|-------------|---------|-----------------------|",
+    ]
+    for engine, engine_results in results.items():
+        for result in engine_results:
+            lines.append(
+                f"| {engine} | {result['secrets']} | {result['register_ms']:.1f} "
+                f"| {result['lines_per_s']:,.0f} | {result['us_per_line']:.1f} | {result['nested_ms']:.2f} |"
+            )
+    return "\n".join(lines)
+
+
+def main():
+    """Main function to run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument(
+        "--secrets",
+        type=int,
+        nargs="+",
+        default=[1, 10, 50, 100, 500, 1000],
+        help="Numbers of registered secrets to benchmark",
+    )
+    parser.add_argument("--lines", type=int, default=2000, help="Number of log lines to redact")
+    parser.add_argument("--runs", type=int, default=5, help="Number of runs to average")
+    parser.add_argument("--engine", action="append", choices=sorted(ENGINES), help="Engines to run")
+    args = parser.parse_args()
+
+    results: dict[str, list[dict]] = {}
+    for engine in args.engine or ENGINES:
+        for num_secrets in args.secrets:
+            print(f"Benchmarking {engine} with {num_secrets} secrets...", end=" ", flush=True)
+            result = benchmark(ENGINES[engine], num_secrets, args.lines, args.runs)
+            print(f"{result['lines_per_s']:,.0f} lines/s")
+            results.setdefault(engine, []).append(result)
+
+    print()
+    print(generate_markdown_report(results, args.lines, args.runs))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark script to measure ``airflow.sdk.serde`` serialization and deserialization throughput.
+
+This script:
+1. Builds XCom-like payloads of builtins, dataclasses, pydantic models, numpy scalars and pandas DataFrames
+2. Times ``serialize`` and ``deserialize`` round trips for each payload
+3. Generates a markdown report with results
+
+Payloads whose optional dependency is not installed are skipped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import functools
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# Add the task sdk to path
+TASK_SDK_SOURCES_DIR = Path(__file__).resolve().parents[2] / "task-sdk" / "src"
+sys.path.insert(0, str(TASK_SDK_SOURCES_DIR))
+
+
+@dataclasses.dataclass
+class Record:
+    """Small dataclass standing in for user defined XCom values."""
+
+    id: int
+    name: str
+    score: float
+
+
+def builtins_payload(size: int) -> object:
+    return [{"id": i, "name": f"name-{i}", "score": i / 3, "tags": ["a", "b"]} for i in range(size)]
+
+
+def dataclass_payload(size: int) -> object:
+    return [Record(id=i, name=f"name-{i}", score=i / 3) for i in range(size)]
+
+
+def pydantic_payload(size: int) -> object:
+    from pydantic import BaseModel
+
+    class PydanticRecord(BaseModel):
+        id: int
+        name: str
+        score: float
+
+    # pydantic models must be importable by their qualname to be deserialized
+    PydanticRecord.__module__ = __name__
+    globals()["PydanticRecord"] = PydanticRecord
+    return [PydanticRecord(id=i, name=f"name-{i}", score=i / 3) for i in range(size)]
+
+
+def numpy_payload(size: int) -> object:
+    import numpy as np
+
+    return [np.float64(i / 3) for i in range(size)]
+
+
+def pandas_payload(size: int) -> object:
+    import pandas as pd
+
+    return pd.DataFrame({"id": range(size), "name": [f"name-{i}" for i in range(size)]})
+
+
+PAYLOADS: dict[str, Callable[[int], object]] = {
+    "builtins": builtins_payload,
+    "dataclass": dataclass_payload,
+    "pydantic": pydantic_payload,
+    "numpy": numpy_payload,
+    "pandas": pandas_payload,
+}
+
+
+def measure(func: Callable[[], object], runs: int) -> tuple[float, float]:
+    """
+    Measure the execution time of ``func``.
+
+    Returns:
+        Tuple of (average_time, min_time) in seconds
+    """
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return sum(times) / len(times), min(times)
+
+
+def generate_markdown_report(results: list[dict], size: int, runs: int) -> str:
+    """Generate markdown formatted report."""
+    lines = [
+        "# Airflow serde Benchmark",
+        "",
+        f"Each payload holds {size} items, timings are averaged over {runs} runs.",
+        "",
+        "| Payload | Serialize avg (ms) | Serialize min (ms) | Deserialize avg (ms) | Deserialize min (ms) |",
+        "|---------|--------------------|--------------------|----------------------|----------------------|",
+    ]
+    for result in results:
+        if result["skipped"]:
+            lines.append(f"| {result['payload']} | skipped | skipped | skipped | skipped |")
+            continue
+        lines.append(
+            f"| {result['payload']} "
+            f"| {result['ser_avg'] * 1000:.1f} | {result['ser_min'] * 1000:.1f} "
+            f"| {result['de_avg'] * 1000:.1f} | {result['de_min'] * 1000:.1f} |"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    """Main function to run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--size", type=int, default=100_000, help="Number of items in each payload")
+    parser.add_argument("--runs", type=int, default=5, help="Number of runs to average")
+    parser.add_argument("--payload", action="append", choices=sorted(PAYLOADS), help="Payloads to run")
+    args = parser.parse_args()
+
+    from airflow.sdk.serde import _extra_allowed, deserialize, serialize
+
+    # allow the benchmark classes regardless of [core] allowed_deserialization_classes
+    _extra_allowed.update({f"{__name__}.Record", f"{__name__}.PydanticRecord"})
+
+    results = []
+    for name in args.payload or PAYLOADS:
+        print(f"Benchmarking {name}...", end=" ", flush=True)
+        try:
+            payload = PAYLOADS[name](args.size)
+        except ImportError as e:
+            print(f"skipped ({e})")
+            results.append({"payload": name, "skipped": True})
+            continue
+
+        serialized = serialize(payload)
+        ser_avg, ser_min = measure(functools.partial(serialize, payload), args.runs)
+        de_avg, de_min = measure(functools.partial(deserialize, serialized), args.runs)
+        print(f"serialize {ser_avg * 1000:.1f}ms / deserialize {de_avg * 1000:.1f}ms (avg)")
+        results.append(
+            {
+                "payload": name,
+                "skipped": False,
+                "ser_avg": ser_avg,
+                "ser_min": ser_min,
+                "de_avg": de_avg,
+                "de_min": de_min,
+            }
+        )
+
+    print()
+    print(generate_markdown_report(results, args.size, args.runs))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark script to compare event loop implementations for the triggerer.
+
+This script:
+1. Runs a large number of trigger-like coroutines, each polling on an interval and optionally doing a
+   network round trip to a local echo server on every poll, under each event loop
+2. Measures the polls handled per second and the scheduling lag: how late each poll wakes up
+3. Generates a markdown report with results
+
+Loops are given as import paths of event loop factories, as in ``[triggerer] event_loop_factory``.
+Loops whose package is not installed are skipped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+
+DEFAULT_LOOPS = ["asyncio.new_event_loop", "uvloop.new_event_loop"]
+
+
+def import_loop_factory(path: str) -> Callable[[], asyncio.AbstractEventLoop]:
+    module_name, _, name = path.rpartition(".")
+    return getattr(importlib.import_module(module_name), name)
+
+
+async def handle_echo(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    while data := await reader.readline():
+        writer.write(data)
+        await writer.drain()
+    writer.close()
+
+
+class Connection:
+    """Connection to the echo server shared by several triggers, one round trip at a time."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.lock = asyncio.Lock()
+
+    async def round_trip(self) -> None:
+        async with self.lock:
+            self.writer.write(b"ping\n")
+            await self.reader.readline()
+
+
+async def trigger(interval: float, deadline: float, connection: Connection | None, lags: list[float]) -> int:
+    """Poll like a sensor trigger until ``deadline``, recording how late each poll wakes up."""
+    loop = asyncio.get_running_loop()
+    polls = 0
+    # Spread the first polls so triggers do not all wake up at once
+    expected = loop.time() + random.uniform(0, interval)
+    while expected < deadline:
+        await asyncio.sleep(expected - loop.time())
+        lags.append(loop.time() - expected)
+        if connection is not None:
+            await connection.round_trip()
+        polls += 1
+        expected += interval
+    return polls
+
+
+async def run_triggers(args: argparse.Namespace) -> dict:
+    loop = asyncio.get_running_loop()
+    connections: list[Connection] = []
+    handlers: set[asyncio.Task] = set()
+    server = None
+
+    async def serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        handlers.add(asyncio.current_task())
+        await handle_echo(reader, writer)
+
+    if args.io:
+        server = await asyncio.start_server(serve, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        for _ in range(args.connections):
+            connections.append(Connection(*await asyncio.open_connection("127.0.0.1", port)))
+
+    lags: list[float] = []
+    start = loop.time()
+    deadline = start + args.duration
+    polls = await asyncio.gather(
+        *(
+            trigger(args.interval, deadline, connections[i % len(connections)] if connections else None, lags)
+            for i in range(args.triggers)
+        )
+    )
+    elapsed = loop.time() - start
+
+    for connection in connections:
+        connection.writer.close()
+    # Let the echo server see every connection close before the loop goes away
+    await asyncio.gather(*handlers)
+    if server is not None:
+        server.close()
+        await server.wait_closed()
+    lags.sort()
+    return {
+        "polls_per_second": sum(polls) / elapsed,
+        "lag_p50": statistics.median(lags) if lags else 0.0,
+        "lag_p99": lags[int(len(lags) * 0.99)] if lags else 0.0,
+        "lag_max": lags[-1] if lags else 0.0,
+    }
+
+
+def generate_markdown_report(results: list[dict], args: argparse.Namespace) -> str:
+    """Generate markdown formatted report."""
+    lines = [
+        "# Triggerer event loop Benchmark",
+        "",
+        f"{args.triggers} triggers polling every {args.interval}s for {args.duration}s"
+        + (f", each poll doing a round trip over {args.connections} connections." if args.io else "."),
+        "",
+        "| Loop | Polls/s | Lag p50 (ms) | Lag p99 (ms) | Lag max (ms) |",
+        "|------|---------|--------------|--------------|--------------|",
+    ]
+    for result in results:
+        if result["skipped"]:
+            lines.append(f"| {result['loop']} | skipped | skipped | skipped | skipped |")
+            continue
+        lines.append(
+            f"| {result['loop']} | {result['polls_per_second']:.0f} "
+            f"| {result['lag_p50'] * 1000:.1f} | {result['lag_p99'] * 1000:.1f} "
+            f"| {result['lag_max'] * 1000:.1f} |"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    """Main function to run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--triggers", type=int, default=50_000, help="Number of triggers to run")
+    parser.add_argument("--interval", type=float, default=5.0, help="Seconds between polls of a trigger")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run each loop for")
+    parser.add_argument("--io", action="store_true", help="Do a network round trip on every poll")
+    parser.add_argument("--connections", type=int, default=100, help="Connections shared by triggers")
+    parser.add_argument("--loop", action="append", help="Import path of an event loop factory to compare")
+    args = parser.parse_args()
+
+    if sys.version_info < (3, 11):
+        print("Comparing event loops requires Python 3.11 or later")
+        return 1
+
+    results = []
+    for path in args.loop or DEFAULT_LOOPS:
+        print(f"Benchmarking {path}...", end=" ", flush=True)
+        try:
+            loop_factory = import_loop_factory(path)
+        except ImportError as e:
+            print(f"skipped ({e})")
+            results.append({"loop": path, "skipped": True})
+            continue
+
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            started = time.monotonic()
+            result = runner.run(run_triggers(args))
+        print(f"{result['polls_per_second']:.0f} polls/s ({time.monotonic() - started:.1f}s)")
+        results.append({"loop": path, "skipped": False, **result})
+
+    print()
+    print(generate_markdown_report(results, args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,6 +16,7 @@
 # under the License.
 from __future__ import annotations
 
+from .matcher import SecretsMatcher
 from .secrets_masker import (
     DEFAULT_SENSITIVE_FIELDS,
     Redactable,
@@ -33,6 +34,7 @@ from .secrets_masker import (
 
 __all__ = [
     "SecretsMasker",
+    "SecretsMatcher",
     "mask_secret",
     "redact",
     "reset_secrets_masker",
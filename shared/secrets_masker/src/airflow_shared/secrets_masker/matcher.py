@@ -0,0 +1,157 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Find and replace many secrets in strings at once."""
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+import threading
+from re import Pattern
+
+# Secrets added since the trie was last compiled are matched with a flat alternation of their own,
+# until there are this many of them, or an eighth of the secrets in the compiled trie, whichever is more.
+MIN_SECRETS_TO_RECOMPILE = 16
+# The trie is recompiled with the recent secrets once that many strings were searched without any secret
+# being added, so that the few secrets registered last do not slow down all the searches that follow.
+SEARCHES_TO_RECOMPILE = 1000
+
+
+class _TrieNode:
+    """A node of a radix trie: edges are keyed by the first character of their label."""
+
+    __slots__ = ("edges", "is_secret")
+
+    def __init__(self) -> None:
+        self.edges: dict[str, tuple[str, _TrieNode]] = {}
+        self.is_secret = False
+
+    def insert(self, secret: str) -> bool:
+        """Add a secret to the trie rooted at this node, return whether it was not in the trie yet."""
+        node, i = self, 0
+        while i < len(secret):
+            edge = node.edges.get(secret[i])
+            if edge is None:
+                leaf = _TrieNode()
+                leaf.is_secret = True
+                node.edges[secret[i]] = (secret[i:], leaf)
+                return True
+            label, child = edge
+            common = len(os.path.commonprefix([label, secret[i : i + len(label)]]))
+            if common < len(label):
+                # The secret diverges from the label, or ends within it: split the edge
+                middle = _TrieNode()
+                middle.edges[label[common]] = (label[common:], child)
+                node.edges[secret[i]] = (label[:common], middle)
+                child = middle
+            node, i = child, i + common
+        if node.is_secret:
+            return False
+        node.is_secret = True
+        return True
+
+    def to_pattern(self) -> str:
+        """
+        Return a regular expression matching the secrets of the trie rooted at this node.
+
+        The alternatives of each group start with different characters, so the regex engine follows
+        a single branch of the trie at each position of the string, however many secrets there are.
+        A secret that is a prefix of another is an optional group, which is greedy: the longest secret
+        is matched.
+        """
+        alternatives = [re.escape(label) + child.to_pattern() for label, child in self.edges.values()]
+        if not alternatives:
+            return ""
+        if len(alternatives) == 1 and not self.is_secret:
+            return alternatives[0]
+        group = f"(?:{'|'.join(alternatives)})"
+        return f"{group}?" if self.is_secret else group
+
+
+class SecretsMatcher:
+    """
+    Replace the occurrences of a set of secrets in strings.
+
+    Secrets are added to a radix trie as they are registered, and the trie is compiled to a regular
+    expression factored by common prefixes (see :meth:`_TrieNode.to_pattern`), which matches in time
+    independent of the number of secrets, unlike a flat ``secret1|secret2|...`` alternation.
+
+    Compiling is deferred until a string is searched, and the trie is not recompiled for every secret
+    added: secrets added since the last compilation are matched by a flat alternation, which is cheap
+    to compile, until there are enough of them to recompile the trie (see ``MIN_SECRETS_TO_RECOMPILE``),
+    or until no secret was added for a while (see ``SEARCHES_TO_RECOMPILE``).
+    Strings shorter than the shortest secret are returned as is, without running any regex.
+
+    This implements the ``sub`` method of :class:`re.Pattern`, which :class:`SecretsMasker` uses
+    to redact strings.
+    """
+
+    def __init__(self) -> None:
+        self._trie = _TrieNode()
+        self._trie_pattern: Pattern | None = None
+        self._trie_secrets = 0
+        self._recent: list[str] = []
+        self._patterns: tuple[Pattern, ...] = ()
+        self._stale = False
+        self._searches_since_add = 0
+        self._lock = threading.Lock()
+        self.min_length = sys.maxsize
+
+    def __len__(self) -> int:
+        return self._trie_secrets + len(self._recent)
+
+    def add(self, secret: str) -> None:
+        """Add a secret to replace."""
+        if not secret:
+            return
+        with self._lock:
+            if self._trie.insert(secret):
+                self._recent.append(secret)
+                self.min_length = min(self.min_length, len(secret))
+                self._stale = True
+                self._searches_since_add = 0
+
+    def sub(self, repl: str, string: str) -> str:
+        """Return the string with the occurrences of the secrets replaced by ``repl``."""
+        if len(string) < self.min_length:
+            return string
+        if self._stale:
+            self._compile()
+        elif self._recent:
+            self._searches_since_add += 1
+            if self._searches_since_add >= SEARCHES_TO_RECOMPILE:
+                self._compile(recompile_trie=True)
+        for pattern in self._patterns:
+            string = pattern.sub(repl, string)
+        return string
+
+    def _compile(self, recompile_trie: bool = False) -> None:
+        with self._lock:
+            if not self._stale and not (recompile_trie and self._recent):
+                return
+            if recompile_trie or len(self._recent) >= max(MIN_SECRETS_TO_RECOMPILE, self._trie_secrets // 8):
+                self._trie_pattern = re.compile(self._trie.to_pattern())
+                self._trie_secrets += len(self._recent)
+                self._recent = []
+            patterns = [self._trie_pattern] if self._trie_pattern else []
+            if self._recent:
+                # Longest first, so that the longest of overlapping secrets is matched
+                recent = sorted(self._recent, key=len, reverse=True)
+                patterns.append(re.compile("|".join(map(re.escape, recent))))
+            self._patterns = tuple(patterns)
+            self._stale = False
@@ -28,13 +28,14 @@ import sys
 from collections.abc import Generator, Iterable, Iterator
 from enum import Enum
 from functools import cache, cached_property
-from re import Pattern
 from typing import TYPE_CHECKING, Any, Protocol, TextIO, TypeAlias, TypeVar, overload
 
 # We have to import this here, as it is used in the type annotations at runtime even if it seems it is
 # not used in the code. This is because Pydantic uses type at runtime to validate the types of the fields.
 from pydantic import JsonValue  # noqa: TC002
 
+from .matcher import SecretsMatcher
+
 if TYPE_CHECKING:
     from typing import TypeGuard
 
@@ -189,9 +190,13 @@ def _get_v1_env_var_type_cached() -> type:
 class SecretsMasker(logging.Filter):
     """Redact secrets from logs."""
 
-    replacer: Pattern | None = None
+    replacer: SecretsMatcher | None = None
     patterns: set[str]
 
+    # The engine finding the secrets in strings, subclasses can replace it with one implementing
+    # the same ``add`` and ``sub`` methods
+    matcher_class: type[SecretsMatcher] = SecretsMatcher
+
     ALREADY_FILTERED_FLAG = "__SecretsMasker_filtered"
     MAX_RECURSION_DEPTH = 5
     _has_warned_short_secret = False
@@ -610,7 +615,6 @@ class SecretsMasker(logging.Filter):
                     SecretsMasker._has_warned_short_secret = True
                 return
 
-            new_mask = False
             for s in self._adaptations(secret):
                 if s:
                     if len(s) < min_length:
@@ -622,9 +626,11 @@ class SecretsMasker(logging.Filter):
                     pattern = re.escape(s)
                     if pattern not in self.patterns and (not name or self.should_hide_value_for_key(name)):
                         self.patterns.add(pattern)
-                        new_mask = True
-            if new_mask:
-                self.replacer = re.compile("|".join(self.patterns))
+                        if self.replacer is None:
+                            self.replacer = self.matcher_class()
+                        # The matcher is updated in place, rather than recompiling a regex of all the
+                        # secrets every time one is added
+                        self.replacer.add(s)
 
         elif isinstance(secret, collections.abc.Iterable):
             for v in secret:
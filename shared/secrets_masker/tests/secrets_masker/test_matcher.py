@@ -0,0 +1,122 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import random
+import string
+from unittest.mock import patch
+
+import pytest
+
+from airflow_shared.secrets_masker.matcher import (
+    MIN_SECRETS_TO_RECOMPILE,
+    SEARCHES_TO_RECOMPILE,
+    SecretsMatcher,
+)
+
+
+def make_matcher(*secrets: str) -> SecretsMatcher:
+    matcher = SecretsMatcher()
+    for secret in secrets:
+        matcher.add(secret)
+    return matcher
+
+
+# Enough secrets for the trie to be compiled, so both the trie and the recent secrets are exercised
+MANY_SECRETS = [f"filler-secret-{i:03}" for i in range(MIN_SECRETS_TO_RECOMPILE)]
+
+
+class TestSecretsMatcher:
+    @pytest.mark.parametrize("filler", [[], MANY_SECRETS], ids=["recent", "trie"])
+    @pytest.mark.parametrize(
+        ("secrets", "value", "expected"),
+        [
+            pytest.param(["hunter2"], "password is hunter2!", "password is ***!", id="single"),
+            pytest.param(["hunter2"], "hunter2hunter2 hunter", "****** hunter", id="repeated"),
+            pytest.param(["a.b*c(d)", "x|y+z?"], "a.b*c(d) axbxc x|y+z?", "*** axbxc ***", id="regex-chars"),
+            pytest.param(["abcdef", "abcxyz", "abc"], "abcdef abcxyz abc abd", "*** *** *** abd", id="split"),
+            pytest.param(["secret", "secret-longer"], "secret-longer", "***", id="longest-wins"),
+            pytest.param(["line1\nline2"], "key: line1\nline2\n", "key: ***\n", id="multiline"),
+        ],
+    )
+    def test_sub(self, filler, secrets, value, expected):
+        matcher = make_matcher(*filler, *secrets)
+
+        assert matcher.sub("***", value) == expected
+
+    def test_secrets_are_compiled_lazily(self):
+        matcher = SecretsMatcher()
+        with patch("airflow_shared.secrets_masker.matcher.re.compile") as mock_compile:
+            for secret in MANY_SECRETS:
+                matcher.add(secret)
+            mock_compile.assert_not_called()
+
+    def test_trie_is_recompiled_once_enough_secrets_were_added(self):
+        matcher = make_matcher(*MANY_SECRETS[:-1])
+        matcher.sub("***", "a log line long enough to be searched")
+        assert matcher._trie_pattern is None
+
+        matcher.add(MANY_SECRETS[-1])
+        matcher.sub("***", "a log line long enough to be searched")
+        assert matcher._trie_pattern is not None
+        assert matcher._recent == []
+
+        matcher.add("one-more-secret")
+        assert matcher.sub("***", f"{MANY_SECRETS[0]} one-more-secret") == "*** ***"
+        assert matcher._recent == ["one-more-secret"]
+
+    def test_trie_is_recompiled_once_no_secret_was_added_for_a_while(self):
+        matcher = make_matcher(*MANY_SECRETS)
+        matcher.sub("***", "a log line long enough to be searched")
+        matcher.add("one-more-secret")
+        for _ in range(SEARCHES_TO_RECOMPILE):
+            matcher.sub("***", "a log line long enough to be searched")
+        assert matcher._recent == ["one-more-secret"]
+
+        assert matcher.sub("***", "one-more-secret") == "***"
+        assert matcher._recent == []
+        assert len(matcher._patterns) == 1
+
+    def test_strings_shorter_than_the_shortest_secret_are_not_searched(self):
+        matcher = make_matcher("longsecret", "secret")
+
+        with patch.object(matcher, "_compile") as mock_compile:
+            assert matcher.sub("***", "short") == "short"
+        mock_compile.assert_not_called()
+        assert matcher.min_length == 6
+
+    def test_duplicate_secrets_are_added_once(self):
+        matcher = make_matcher("hunter2", "hunter2", "hunter22")
+
+        assert len(matcher) == 2
+
+    def test_empty(self):
+        matcher = SecretsMatcher()
+
+        assert not matcher
+        assert matcher.sub("***", "anything") == "anything"
+
+    def test_all_secrets_are_replaced(self):
+        rnd = random.Random(42)
+        alphabet = string.ascii_lowercase[:4]
+        secrets = {"".join(rnd.choices(alphabet, k=rnd.randint(5, 10))) for _ in range(200)}
+        matcher = make_matcher(*secrets)
+
+        for _ in range(100):
+            text = " ".join(rnd.choice(sorted(secrets)) for _ in range(5))
+            redacted = matcher.sub(" ", text)
+            assert not any(secret in redacted for secret in secrets)
@@ -18,31 +18,133 @@
 from __future__ import annotations
 
 import datetime
+import hashlib
+import mmap
 import multiprocessing
+import struct
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from multiprocessing.synchronize import Lock
+
+
+class _SharedSecretTable:
+    """
+    Fixed-size hash table living in an anonymous shared memory mapping.
+
+    The mapping is created before the worker forks, so every process forked from it (DAG file processors,
+    task supervisors and their task runners) reads and writes the same memory without any IPC round trip.
+    Each slot holds a single entry; keys are placed by linear probing within a small window, and when the
+    window is full the oldest entry in it is evicted, which bounds the memory used by the cache.
+
+    Entries whose encoded key and value do not fit in a slot are simply not cached.
+    """
+
+    # key hash, monotonic write time, state, key length, value length
+    _HEADER = struct.Struct("<QdBHI")
+    _EMPTY = 0
+    _VALUE = 1
+    _NONE = 2
+    _PROBE_WINDOW = 8
+
+    def __init__(self, max_entries: int, slot_size: int) -> None:
+        self._max_entries = max(max_entries, self._PROBE_WINDOW)
+        self._slot_size = slot_size
+        self._payload_size = slot_size - self._HEADER.size
+        # Anonymous memory is zero-filled, i.e. every slot starts out as _EMPTY. Pages are only backed by
+        # physical memory once touched, so a mostly empty table is cheap.
+        self._buffer = mmap.mmap(-1, self._max_entries * slot_size)
+        self._lock: Lock = multiprocessing.Lock()
+
+    @staticmethod
+    def _hash(key: bytes) -> int:
+        # Python's builtin hash() is salted per interpreter, we need a value that is stable across processes.
+        return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+    def _slots(self, key_hash: int):
+        start = key_hash % self._max_entries
+        for i in range(self._PROBE_WINDOW):
+            yield ((start + i) % self._max_entries) * self._slot_size
+
+    def _find(self, key: bytes, key_hash: int) -> tuple[int, tuple] | None:
+        for offset in self._slots(key_hash):
+            header = self._HEADER.unpack_from(self._buffer, offset)
+            slot_hash, _, state, key_len, _ = header
+            if state == self._EMPTY or slot_hash != key_hash:
+                continue
+            start = offset + self._HEADER.size
+            if self._buffer[start : start + key_len] == key:
+                return offset, header
+        return None
+
+    def get(self, key: str, ttl: datetime.timedelta) -> tuple[bool, str | None]:
+        """
+        Look up a key.
+
+        :return: a ``(found, value)`` tuple, ``found`` being False when the key is absent or expired.
+        """
+        encoded_key = key.encode()
+        with self._lock:
+            found = self._find(encoded_key, self._hash(encoded_key))
+            if found is None:
+                return False, None
+            offset, (_, written_at, state, key_len, value_len) = found
+            if time.monotonic() - written_at > ttl.total_seconds():
+                return False, None
+            if state == self._NONE:
+                return True, None
+            start = offset + self._HEADER.size + key_len
+            return True, self._buffer[start : start + value_len].decode()
+
+    def set(self, key: str, value: str | None) -> None:
+        encoded_key = key.encode()
+        encoded_value = b"" if value is None else value.encode()
+        if len(encoded_key) + len(encoded_value) > self._payload_size:
+            # make sure we don't keep serving a previous value for that key
+            self.pop(key)
+            return
+        key_hash = self._hash(encoded_key)
+        state = self._NONE if value is None else self._VALUE
+        with self._lock:
+            found = self._find(encoded_key, key_hash)
+            if found is not None:
+                offset = found[0]
+            else:
+                offset = self._free_or_oldest_slot(key_hash)
+            self._HEADER.pack_into(
+                self._buffer, offset, key_hash, time.monotonic(), state, len(encoded_key), len(encoded_value)
+            )
+            start = offset + self._HEADER.size
+            self._buffer[start : start + len(encoded_key) + len(encoded_value)] = encoded_key + encoded_value
+
+    def _free_or_oldest_slot(self, key_hash: int) -> int:
+        oldest_offset, oldest_written_at = -1, float("inf")
+        for offset in self._slots(key_hash):
+            _, written_at, state, _, _ = self._HEADER.unpack_from(self._buffer, offset)
+            if state == self._EMPTY:
+                return offset
+            if written_at < oldest_written_at:
+                oldest_offset, oldest_written_at = offset, written_at
+        return oldest_offset
+
+    def pop(self, key: str) -> None:
+        encoded_key = key.encode()
+        with self._lock:
+            found = self._find(encoded_key, self._hash(encoded_key))
+            if found is not None:
+                self._HEADER.pack_into(self._buffer, found[0], 0, 0.0, self._EMPTY, 0, 0)
 
 
 class SecretCache:
     """A static class to manage the global secret cache."""
 
-    __manager: multiprocessing.managers.SyncManager | None = None
-    _cache: dict[str, _CacheValue] | None = None
+    _cache: _SharedSecretTable | None = None
     _ttl: datetime.timedelta
 
     class NotPresentException(Exception):
         """Raised when a key is not present in the cache."""
 
-    class _CacheValue:
-        def __init__(self, value: str | None) -> None:
-            from airflow.sdk import timezone
-
-            self.value = value
-            self.date = timezone.utcnow()
-
-        def is_expired(self, ttl: datetime.timedelta) -> bool:
-            from airflow.sdk import timezone
-
-            return timezone.utcnow() - self.date > ttl
-
     _VARIABLE_PREFIX = "__v_"
     _CONNECTION_PREFIX = "__c_"
     _TEAM_PATTERN = "_{}_"
@@ -52,7 +154,7 @@ class SecretCache:
         """
         Initialize the cache, provided the configuration allows it.
 
-        Safe to call several times.
+        Must be called before forking the processes that should share the cache. Safe to call several times.
         """
         if cls._cache is not None:
             return
@@ -61,11 +163,10 @@ class SecretCache:
         use_cache = conf.getboolean(section="secrets", key="use_cache", fallback=False)
         if not use_cache:
             return
-        if cls.__manager is None:
-            # it is not really necessary to save the manager, but doing so allows to reuse it between tests,
-            # making them run a lot faster because this operation takes ~300ms each time
-            cls.__manager = multiprocessing.Manager()
-        cls._cache = cls.__manager.dict()
+        cls._cache = _SharedSecretTable(
+            max_entries=conf.getint(section="secrets", key="cache_max_entries", fallback=4096),
+            slot_size=conf.getint(section="secrets", key="cache_entry_max_bytes", fallback=4096),
+        )
         ttl_seconds = conf.getint(section="secrets", key="cache_ttl_seconds", fallback=15 * 60)
         cls._ttl = datetime.timedelta(seconds=ttl_seconds)
 
@@ -111,9 +212,9 @@ class SecretCache:
 
         team = cls._TEAM_PATTERN.format(team_name) if team_name else ""
 
-        val = cls._cache.get(f"{prefix}{team}{key}")
-        if val and not val.is_expired(cls._ttl):
-            return val.value
+        found, val = cls._cache.get(f"{prefix}{team}{key}", cls._ttl)
+        if found:
+            return val
         raise cls.NotPresentException
 
     @classmethod
@@ -133,12 +234,11 @@ class SecretCache:
     def _save(cls, key: str, value: str | None, prefix: str, team_name: str | None = None):
         if cls._cache is not None:
             team = cls._TEAM_PATTERN.format(team_name) if team_name else ""
-            cls._cache[f"{prefix}{team}{key}"] = cls._CacheValue(value)
+            cls._cache.set(f"{prefix}{team}{key}", value)
 
     @classmethod
     def invalidate_variable(cls, key: str, team_name: str | None = None):
         """Invalidate (actually removes) the value stored in the cache for that Variable."""
         if cls._cache is not None:
             team = cls._TEAM_PATTERN.format(team_name) if team_name else ""
-            # second arg ensures no exception if key is absent
-            cls._cache.pop(f"{cls._VARIABLE_PREFIX}{team}{key}", None)
+            cls._cache.pop(f"{cls._VARIABLE_PREFIX}{team}{key}")
@@ -2533,12 +2533,14 @@ def supervise_task(
         if log_path:
             logger, log_file_descriptor = _configure_logging(log_path, client)
 
-        backends = ensure_secrets_backend_loaded()
-        log.info(
-            "Secrets backends loaded for worker",
-            count=len(backends),
-            backend_classes=[type(b).__name__ for b in backends],
-        )
+        if not conf.getboolean("workers", "lazy_startup", fallback=False):
+            # The task process loads its own backends on first use, this is only to report them early
+            backends = ensure_secrets_backend_loaded()
+            log.info(
+                "Secrets backends loaded for worker",
+                count=len(backends),
+                backend_classes=[type(b).__name__ for b in backends],
+            )
 
         reset_secrets_masker()
 
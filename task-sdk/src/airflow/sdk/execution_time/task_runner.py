@@ -1085,7 +1085,7 @@ def parse(what: StartupDetails, log: Logger) -> RuntimeTaskInstance:
         bundle_prepare_ms=bundle_prepare_ms,
         dag_file_parse_ms=dag_file_parse_ms,
     )
-    return RuntimeTaskInstance.model_construct(
+    ti = RuntimeTaskInstance.model_construct(
         **what.ti.model_dump(exclude_unset=True),
         task=task,
         bundle_instance=bundle_instance,
@@ -1095,6 +1095,14 @@ def parse(what: StartupDetails, log: Logger) -> RuntimeTaskInstance:
         state=TaskInstanceState.RUNNING,
         sentry_integration=what.sentry_integration,
     )
+    _emit_startup_timing(ti, "bundle_prepare", bundle_prepare_ms)
+    _emit_startup_timing(ti, "dag_file_parse", dag_file_parse_ms)
+    return ti
+
+
+def _emit_startup_timing(ti: RuntimeTaskInstance, phase: str, duration_ms: int) -> None:
+    """Emit the duration of one phase of the task runner startup, before the task itself runs."""
+    stats.timing("task.startup_duration", duration_ms, tags={**ti.stats_tags, "phase": phase})
 
 
 # This global variable will be used by Connection/Variable/XCom classes, or other parts of the task's execution,
@@ -1181,6 +1189,7 @@ def get_startup_details() -> StartupDetails:
 
 @detail_span("startup")
 def startup(msg: StartupDetails) -> tuple[RuntimeTaskInstance, Context, Logger]:
+    startup_start = time.monotonic()
     # setproctitle causes issue on Mac OS: https://github.com/benoitc/gunicorn/issues/3021
     os_type = sys.platform
     if os_type == "darwin":
@@ -1201,14 +1210,17 @@ def startup(msg: StartupDetails) -> tuple[RuntimeTaskInstance, Context, Logger]:
         map_index=msg.ti.map_index,
     )
 
+    listeners_start = time.monotonic()
     try:
         get_listener_manager().hook.on_starting(component=TaskRunnerMarker())
     except Exception:
         log.exception("error calling listener")
+    listeners_ms = int((time.monotonic() - listeners_start) * 1000)
 
     with _airflow_parsing_context_manager(dag_id=msg.ti.dag_id, task_id=msg.ti.task_id):
         ti = parse(msg, log)
     log.debug("Dag file parsed", file=msg.dag_rel_path)
+    _emit_startup_timing(ti, "listeners", listeners_ms)
 
     run_as_user = getattr(ti.task, "run_as_user", None) or conf.get(
         "core", "default_impersonation", fallback=None
@@ -1238,7 +1250,12 @@ def startup(msg: StartupDetails) -> tuple[RuntimeTaskInstance, Context, Logger]:
         # ideally, we should never reach here, but if we do, we should return None, None, None
         return None, None, None
 
-    return ti, ti.get_template_context(), log
+    context_start = time.monotonic()
+    context = ti.get_template_context()
+    now = time.monotonic()
+    _emit_startup_timing(ti, "template_context", int((now - context_start) * 1000))
+    _emit_startup_timing(ti, "total", int((now - startup_start) * 1000))
+    return ti, context, log
 
 
 def _serialize_template_field(
@@ -71,8 +71,11 @@ _serializers: dict[str, ModuleType] = {}
 _deserializers: dict[str, ModuleType] = {}
 _stringifiers: dict[str, ModuleType] = {}
 _extra_allowed: set[str] = set()
+# type -> (qualname used to look up a serializer, classname to encode or None), see _serialize_plan
+_serialize_plans: dict[type, tuple[str, str | None]] = {}
 
 _primitives = (int, bool, float, str)
+_primitive_types = frozenset(_primitives)
 _builtin_collections = (frozenset, list, set, tuple)  # dict is treated specially.
 
 
@@ -215,6 +218,10 @@ def serialize(o: object, depth: int = 0) -> U | None:
     if o is None:
         return o
 
+    # exact primitive types are by far the most common values, return them before any lookup
+    if type(o) in _primitive_types:
+        return o
+
     if isinstance(o, list):
         return [serialize(d, depth + 1) for d in o]
 
@@ -225,21 +232,7 @@ def serialize(o: object, depth: int = 0) -> U | None:
         return {str(k): serialize(v, depth + 1) for k, v in o.items()}
 
     cls = type(o)
-    qn = qualname(o)
-    classname = None
-
-    # Serialize namedtuple like tuples
-    # We also override the classname returned by the builtin.py serializer. The classname
-    # has to be "builtins.tuple", so that the deserializer can deserialize the object into tuple.
-    if _is_namedtuple(o):
-        qn = "builtins.tuple"
-        classname = qn
-
-    if is_pydantic_model(o):
-        # to match the generic Pydantic serializer and deserializer in _serializers and _deserializers
-        qn = PYDANTIC_MODEL_QUALNAME
-        # the actual Pydantic model class to encode
-        classname = qualname(o)
+    qn, classname = _serialize_plan(cls, o)
 
     # if there is a builtin serializer available use that
     if qn in _serializers:
@@ -288,6 +281,37 @@ def serialize(o: object, depth: int = 0) -> U | None:
     raise TypeError(f"cannot serialize object of type {cls}")
 
 
+def _serialize_plan(cls: type, o: object) -> tuple[str, str | None]:
+    """
+    Return the qualname to look up a serializer with and the classname to encode for ``o``.
+
+    Both only depend on the type of ``o``, except for callables whose qualname is their own name, so the
+    result is memoized per type to avoid recomputing it for every item of large collections.
+    """
+    if (plan := _serialize_plans.get(cls)) is not None:
+        return plan
+
+    qn = qualname(o)
+    classname = None
+
+    # Serialize namedtuple like tuples
+    # We also override the classname returned by the builtin.py serializer. The classname
+    # has to be "builtins.tuple", so that the deserializer can deserialize the object into tuple.
+    if _is_namedtuple(o):
+        qn = "builtins.tuple"
+        classname = qn
+
+    if is_pydantic_model(o):
+        # to match the generic Pydantic serializer and deserializer in _serializers and _deserializers
+        qn = PYDANTIC_MODEL_QUALNAME
+        # the actual Pydantic model class to encode
+        classname = qualname(o)
+
+    if not callable(o):
+        _serialize_plans[cls] = (qn, classname)
+    return qn, classname
+
+
 def deserialize(o: T | None, full=True, type_hint: Any = None) -> object:
     """
     Deserialize an object of primitive type and uses an allow list to determine if a class can be loaded.
@@ -464,6 +488,7 @@ def _register():
     _serializers.clear()
     _deserializers.clear()
     _stringifiers.clear()
+    _serialize_plans.clear()
 
     stats.initialize(
         factory=stats_utils.get_stats_factory(),
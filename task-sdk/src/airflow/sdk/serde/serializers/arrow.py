@@ -0,0 +1,69 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from airflow.sdk.module_loading import qualname
+
+# lazy loading for performance reasons
+serializers = [
+    "pyarrow.lib.Table",
+]
+deserializers = serializers
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from airflow.sdk.serde import U
+
+__version__ = 1
+
+
+def serialize(o: object) -> tuple[U, str, int, bool]:
+    import base64
+
+    import pyarrow as pa
+
+    if not isinstance(o, pa.Table):
+        return "", "", 0, False
+
+    # Arrow IPC keeps the in-memory columnar layout, so no conversion is needed on either side
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, o.schema) as writer:
+        writer.write_table(o)
+
+    return base64.b64encode(sink.getvalue()).decode("ascii"), qualname(o), __version__, True
+
+
+def deserialize(cls: type, version: int, data: object) -> pa.Table:
+    if version > __version__:
+        raise TypeError(f"serialized {version} of {qualname(cls)} > {__version__}")
+
+    import pyarrow as pa
+
+    if cls is not pa.Table:
+        raise TypeError(f"do not know how to deserialize {qualname(cls)}")
+
+    if not isinstance(data, str):
+        raise TypeError(f"serialized {qualname(cls)} has wrong data type {type(data)}")
+
+    import base64
+
+    # the columns of the resulting table reference the decoded payload directly instead of copying it
+    return pa.ipc.open_stream(pa.py_buffer(base64.b64decode(data))).read_all()
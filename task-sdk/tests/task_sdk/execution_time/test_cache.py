@@ -174,3 +174,34 @@ class TestSecretCache:
 
         with pytest.raises(SecretCache.NotPresentException):
             SecretCache.get_connection_uri("key")
+
+    @conf_vars({("secrets", "use_cache"): "true", ("secrets", "cache_max_entries"): "8"})
+    def test_oldest_entries_evicted_when_full(self):
+        SecretCache.reset()
+        SecretCache.init()
+
+        for i in range(20):
+            SecretCache.save_variable(f"key{i}", f"value{i}")
+
+        # the latest value is always retrievable, some of the older ones must have been evicted
+        assert SecretCache.get_variable("key19") == "value19"
+        evicted = 0
+        for i in range(19):
+            try:
+                SecretCache.get_variable(f"key{i}")
+            except SecretCache.NotPresentException:
+                evicted += 1
+        assert evicted >= 11
+
+    @conf_vars({("secrets", "use_cache"): "true", ("secrets", "cache_entry_max_bytes"): "128"})
+    def test_values_too_large_are_not_cached(self):
+        SecretCache.reset()
+        SecretCache.init()
+
+        SecretCache.save_variable("key", "small")
+        assert SecretCache.get_variable("key") == "small"
+
+        SecretCache.save_variable("key", "x" * 200)
+        # the previous value must not be served anymore
+        with pytest.raises(SecretCache.NotPresentException):
+            SecretCache.get_variable("key")
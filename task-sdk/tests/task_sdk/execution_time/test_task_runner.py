@@ -246,6 +246,57 @@ def test_parse(test_dags_dir: Path, make_ti_context):
     assert ti.task.dag
 
 
+def test_parse_emits_startup_timings(test_dags_dir: Path, make_ti_context):
+    """Test that the bundle preparation and dag file parsing phases are reported as metrics."""
+    what = StartupDetails(
+        ti=TaskInstance(
+            id=uuid7(),
+            task_id="a",
+            dag_id="super_basic",
+            run_id="c",
+            try_number=1,
+            dag_version_id=uuid7(),
+            queue="default",
+        ),
+        dag_rel_path="super_basic.py",
+        bundle_info=BundleInfo(name="my-bundle", version=None),
+        ti_context=make_ti_context(),
+        start_date=timezone.utcnow(),
+        sentry_integration="",
+    )
+
+    with (
+        patch.dict(
+            os.environ,
+            {
+                "AIRFLOW__DAG_PROCESSOR__DAG_BUNDLE_CONFIG_LIST": json.dumps(
+                    [
+                        {
+                            "name": "my-bundle",
+                            "classpath": "airflow.dag_processing.bundles.local.LocalDagBundle",
+                            "kwargs": {"path": str(test_dags_dir), "refresh_interval": 1},
+                        }
+                    ]
+                ),
+            },
+        ),
+        mock.patch("airflow.sdk._shared.observability.metrics.stats._get_backend") as mock_get_backend,
+    ):
+        backend = mock.MagicMock(spec=StatsLogger)
+        mock_get_backend.return_value = backend
+        ti = parse(what, mock.Mock())
+
+    phases = {
+        c.kwargs["tags"]["phase"]
+        for c in backend.timing.call_args_list
+        if c.args[0] == "task.startup_duration"
+    }
+    assert phases == {"bundle_prepare", "dag_file_parse"}
+    for c in backend.timing.call_args_list:
+        assert c.kwargs["tags"]["dag_id"] == ti.dag_id
+        assert c.kwargs["tags"]["task_id"] == ti.task_id
+
+
 @mock.patch("airflow.dag_processing.dagbag.BundleDagBag")
 def test_parse_dag_bag(mock_dagbag, test_dags_dir: Path, make_ti_context):
     """Test that checks that the BundleDagBag is constructed as expected during parsing"""
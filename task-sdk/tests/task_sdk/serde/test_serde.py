@@ -42,6 +42,7 @@ from airflow.sdk.serde import (
     _match,
     _match_glob,
     _match_regexp,
+    _serialize_plans,
     allow_class,
     deserialize,
     iter_pydantic_models,
@@ -335,6 +336,18 @@ class TestSerDe:
         d = deserialize(e)
         assert i.x == getattr(d, "x", None)
 
+    def test_serialize_plan_memoized_per_type(self):
+        e = serialize([W(1), W(2)])
+
+        assert [d[DATA] for d in e] == [{"x": 1}, {"x": 2}]
+        assert _serialize_plans[W] == (qualname(W), None)
+
+    def test_serialize_plan_not_memoized_for_callables(self):
+        with pytest.raises(TypeError, match="^cannot serialize"):
+            serialize(Exception)
+
+        assert type not in _serialize_plans
+
     @conf_vars(
         {
             ("core", "allowed_deserialization_classes"): "airflow.*",
@@ -286,10 +286,35 @@ class TestSerializers:
 
         assert serialize(123) == ("", "", 0, False)
 
+    def test_pandas_deserialize_hex_encoded_version_1(self):
+        import pyarrow as pa
+        from pyarrow import parquet as pq
+
+        from airflow.sdk.serde.serializers.pandas import deserialize
+
+        i = pd.DataFrame(data={"col1": [1, 2], "col2": [3, 4]})
+        buf = pa.BufferOutputStream()
+        pq.write_table(pa.Table.from_pandas(i), buf, compression="snappy")
+
+        assert i.equals(deserialize(pd.DataFrame, 1, buf.getvalue().hex().decode("utf-8")))
+
+    def test_arrow(self):
+        import pyarrow as pa
+
+        i = pa.table({"col1": [1, 2], "col2": ["a", "b"]})
+        e = serialize(i)
+        d = deserialize(e)
+        assert i.equals(d)
+
+    def test_arrow_serializers(self):
+        from airflow.sdk.serde.serializers.arrow import serialize
+
+        assert serialize(123) == ("", "", 0, False)
+
     @pytest.mark.parametrize(
         ("klass", "version", "data", "msg"),
         [
-            (pd.DataFrame, 999, "", r"serialized 999 of pandas.core.frame.DataFrame > 1"),  # version too new
+            (pd.DataFrame, 999, "", r"serialized 999 of pandas.core.frame.DataFrame > 2"),  # version too new
             (
                 pd.DataFrame,
                 1,